@@ -1,10 +1,44 @@
+from typing import Any, Dict, List
 from urllib.parse import urlparse
 
 import pytest
+from pytest_httpx import HTTPXMock
 
+import okareo.okareo as okareo_module
+from okareo import Okareo
 from okareo.common import BASE_URL
 
+BASE = "http://mocked.com"
+GLOBAL_ID = "0156f5d7-4ac4-4568-9d44-24750aa08d1a"
+PROJECTS_JSON: List[Dict[str, Any]] = [
+    {"id": GLOBAL_ID, "name": "Global", "onboarding_status": "s", "tags": []}
+]
+
 
 @pytest.fixture(scope="session")
 def non_mocked_hosts() -> list:
     return [urlparse(BASE_URL).hostname]
+
+
+def mock_projects(
+    httpx_mock: HTTPXMock, projects: List[Dict[str, Any]] = PROJECTS_JSON
+) -> None:
+    httpx_mock.add_response(url=f"{BASE}/v0/projects", json=projects, status_code=201)
+
+
+@pytest.fixture
+def okareo_kwargs() -> Dict[str, Any]:
+    """Extra `Okareo` arguments for the `okareo` fixture; override it in a module
+    that needs a Project or a cache."""
+    return {}
+
+
+@pytest.fixture
+def okareo(httpx_mock: HTTPXMock, okareo_kwargs: Dict[str, Any]) -> Okareo:
+    mock_projects(httpx_mock)
+    return Okareo("api-key", BASE, **okareo_kwargs)
+
+
+@pytest.fixture
+def fast_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(okareo_module, "_REQUEST_RETRY_DELAY", 0.01)
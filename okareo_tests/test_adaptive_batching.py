@@ -0,0 +1,119 @@
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Set
+
+from okareo_tests.conftest import BASE, GLOBAL_ID, mock_projects
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo.batching import AdaptiveBatchSize, run_adaptive_batches
+from okareo.model_under_test import CustomBatchModel, ModelInvocation
+
+SCENARIO_ID = "6b1f0c2d-8e3a-4d5b-9c7e-1a2b3c4d5e6f"
+ROWS = [
+    {"id": str(uuid.uuid4()), "input": f"row-{i}", "result": "ok"} for i in range(10)
+]
+
+
+class PoisonRowModel(CustomBatchModel):
+    """Raises for any batch holding row-7, like a provider rejecting one input."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.batches: List[int] = []
+
+    def invoke_batch(self, input_batch: list) -> list:
+        self.batches.append(len(input_batch))
+        if any(row["input_value"] == "row-7" for row in input_batch):
+            raise RuntimeError("413 payload too large")
+        return [
+            {
+                "id": row["id"],
+                "model_invocation": ModelInvocation(
+                    model_prediction=row["input_value"]
+                ),
+            }
+            for row in input_batch
+        ]
+
+
+def rows(count: int) -> List[Dict[str, Any]]:
+    return [{"id": str(i), "input_value": i} for i in range(count)]
+
+
+def test_failed_batches_only_lose_their_failing_rows(httpx_mock: HTTPXMock) -> None:
+    mock_projects(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/register_model",
+        json={
+            "id": GLOBAL_ID,
+            "project_id": GLOBAL_ID,
+            "name": "batch",
+            "tags": [],
+            "time_created": "foo",
+        },
+        status_code=201,
+    )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_data_points/{SCENARIO_ID}", json=ROWS
+    )
+    model = PoisonRowModel(name="batch", batch_size=4, adaptive_batching=True)
+    mut = Okareo("api-key", BASE).register_model(name="batch", model=model)
+
+    model_data: Dict[str, Any] = {"model_data": {}}
+    mut._custom_exec(SCENARIO_ID, model_data)
+
+    results = model_data["model_data"]
+    assert set(results) == {row["id"] for row in ROWS}
+    failed = [row["input"] for row in ROWS if "error_message" in results[row["id"]]]
+    assert failed == ["row-7"]
+    # the poison row ends up retried on its own
+    assert model.batches.count(1) >= 3
+
+
+def test_batch_size_grows_then_shrinks_on_slow_batches() -> None:
+    size = AdaptiveBatchSize(4, maximum=6, target_latency=1.0)
+
+    size.succeeded(4, 0.1)
+    size.succeeded(5, 0.1)
+    assert size.size == 6
+    size.succeeded(2, 0.1)
+    assert size.size == 6
+    size.succeeded(6, 5.0)
+    assert size.size == 3
+    size.failed(2)
+    assert size.size == 1
+
+
+def test_missing_rows_are_retried_and_batches_run_concurrently() -> None:
+    lock = threading.Lock()
+    in_flight: List[int] = [0, 0]
+    answered: Set[str] = set()
+
+    def invoke_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+            # drops row 3 the first time it is asked for
+            result = [r for r in batch if r["id"] != "3" or "3" in answered]
+            answered.update(r["id"] for r in batch)
+        return [{"id": r["id"], "model_invocation": r["input_value"]} for r in result]
+
+    recorded: List[str] = []
+    errors: List[str] = []
+    run_adaptive_batches(
+        invoke_batch,
+        rows(12),
+        lambda return_dict: recorded.append(return_dict["id"]),
+        lambda row, error: errors.append(row["id"]),
+        AdaptiveBatchSize(2),
+        max_concurrent_batches=3,
+    )
+
+    assert sorted(recorded, key=int) == [str(i) for i in range(12)]
+    assert errors == []
+    assert in_flight[1] == 3
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import uuid
+from typing import Any, Dict, List, Union
+
+from okareo_tests.conftest import BASE, GLOBAL_ID, mock_projects
+from pytest_httpx import HTTPXMock
+
+from okareo import AsyncModelUnderTest, AsyncOkareo
+from okareo.model_under_test import CustomModel, ModelInvocation
+from okareo_api_client.models.datapoint_search import DatapointSearch
+
+OTHER_ID = "8a2b45f1-9c63-4b21-b7d8-1f2e3a4b5c6d"
+SCENARIO_ID = "6b1f0c2d-8e3a-4d5b-9c7e-1a2b3c4d5e6f"
+
+PROJECTS_JSON = [
+    {"id": GLOBAL_ID, "name": "Global", "onboarding_status": "s", "tags": []},
+    {"id": OTHER_ID, "name": "Billing Agent", "onboarding_status": "s", "tags": []},
+]
+
+MUT_JSON: Dict[str, Any] = {
+    "id": GLOBAL_ID,
+    "project_id": GLOBAL_ID,
+    "version": 1,
+    "name": "async-model",
+    "tags": [],
+    "time_created": "foo",
+}
+
+TEST_RUN_JSON = {
+    "id": OTHER_ID,
+    "name": "async run",
+    "project_id": GLOBAL_ID,
+    "mut_id": GLOBAL_ID,
+    "scenario_set_id": SCENARIO_ID,
+}
+
+
+class EchoModel(CustomModel):
+    def invoke(self, input_value: Union[dict, list, str]) -> ModelInvocation:
+        return ModelInvocation(model_prediction=f"pred-{input_value}")
+
+
+class AsyncEchoModel(CustomModel):
+    async def invoke(  # type: ignore[override]
+        self, input_value: Union[dict, list, str]
+    ) -> ModelInvocation:
+        await asyncio.sleep(0)
+        return ModelInvocation(
+            model_prediction=f"pred-{input_value}", model_input=input_value
+        )
+
+
+def scenario_rows(count: int) -> List[dict]:
+    return [
+        {"id": str(uuid.uuid4()), "input": f"row-{i}", "result": "ok"}
+        for i in range(count)
+    ]
+
+
+def requests_to(httpx_mock: HTTPXMock, path: str) -> List[Any]:
+    return [r for r in httpx_mock.get_requests() if r.url.path == path]
+
+
+def register(
+    httpx_mock: HTTPXMock, okareo: AsyncOkareo, model: CustomModel
+) -> AsyncModelUnderTest:
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/register_model", json=MUT_JSON, status_code=201
+    )
+    return asyncio.run(okareo.register_model(name=MUT_JSON["name"], model=model))
+
+
+def test_construction_makes_no_request(httpx_mock: HTTPXMock) -> None:
+    AsyncOkareo("api-key", BASE, project="Billing Agent")
+
+    assert httpx_mock.get_requests() == []
+
+
+def test_project_is_resolved_on_first_call(httpx_mock: HTTPXMock) -> None:
+    mock_projects(httpx_mock, PROJECTS_JSON)
+    httpx_mock.add_response(url=f"{BASE}/v0/find_datapoints", json=[])
+    okareo = AsyncOkareo("api-key", BASE, project="billing agent")
+
+    async def search() -> None:
+        await asyncio.gather(
+            okareo.find_datapoints(DatapointSearch(context_token="a")),
+            okareo.find_datapoints(DatapointSearch(context_token="b")),
+        )
+        await okareo.aclose()
+
+    asyncio.run(search())
+
+    assert okareo.project_id == OTHER_ID
+    assert len(requests_to(httpx_mock, "/v0/projects")) == 1
+    bodies = [
+        json.loads(r.content) for r in requests_to(httpx_mock, "/v0/find_datapoints")
+    ]
+    assert [b["project_id"] for b in bodies] == [OTHER_ID, OTHER_ID]
+
+
+def test_run_test_invokes_custom_model_in_order(httpx_mock: HTTPXMock) -> None:
+    mock_projects(httpx_mock, PROJECTS_JSON)
+    okareo = AsyncOkareo("api-key", BASE)
+    mut = register(httpx_mock, okareo, EchoModel(name="echo"))
+    rows = scenario_rows(8)
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_data_points/{SCENARIO_ID}", json=rows
+    )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/test_run", json=TEST_RUN_JSON, status_code=201
+    )
+
+    test_run = asyncio.run(
+        mut.run_test(scenario=SCENARIO_ID, name="async run", max_concurrency=4)
+    )
+
+    assert str(test_run.id) == OTHER_ID
+    body = json.loads(requests_to(httpx_mock, "/v0/test_run")[0].content)
+    model_data = body["model_results"]["model_data"]
+    assert list(model_data.keys()) == [row["id"] for row in rows]
+    assert model_data[rows[2]["id"]]["actual"] == "pred-row-2"
+
+
+def test_submit_test_uploads_datapoints_before_evaluating(
+    httpx_mock: HTTPXMock,
+) -> None:
+    mock_projects(httpx_mock, PROJECTS_JSON)
+    okareo = AsyncOkareo("api-key", BASE)
+    mut = register(httpx_mock, okareo, AsyncEchoModel(name="async-echo"))
+    rows = scenario_rows(5)
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/test_run/submit", json=TEST_RUN_JSON, status_code=201
+    )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_data_points/{SCENARIO_ID}", json=rows
+    )
+    for _ in rows:
+        httpx_mock.add_response(
+            url=f"{BASE}/v0/datapoints", json={"id": GLOBAL_ID}, status_code=201
+        )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/evaluate", json=TEST_RUN_JSON, status_code=201
+    )
+
+    async def submit() -> Any:
+        test_run = await mut.submit_test(scenario=SCENARIO_ID, name="async run")
+        await mut.flush()
+        return test_run
+
+    test_run = asyncio.run(submit())
+
+    assert str(test_run.id) == OTHER_ID
+    paths = [r.url.path for r in httpx_mock.get_requests()]
+    assert paths[-1] == "/v0/evaluate"
+    assert paths.count("/v0/datapoints") == len(rows)
+    uploaded = [
+        json.loads(r.content) for r in requests_to(httpx_mock, "/v0/datapoints")
+    ]
+    assert all(b["test_run_id"] == OTHER_ID for b in uploaded)
+    assert sorted(json.loads(b["input"]) for b in uploaded) == [
+        f"row-{i}" for i in range(len(rows))
+    ]
+    evaluate_body = json.loads(requests_to(httpx_mock, "/v0/evaluate")[0].content)
+    assert evaluate_body["test_run_id"] == OTHER_ID
@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID, mock_projects
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo.audio_cache import AudioFileCache
+
+FILE_ID = "9c8b7a6d-5e4f-4a3b-8c9d-0e1f2a3b4c5d"
+FILE_URL = f"{BASE}/v0/voice/file/{GLOBAL_ID}/{FILE_ID}"
+
+
+def downloads(httpx_mock: HTTPXMock) -> List[str]:
+    return [
+        r.url.path for r in httpx_mock.get_requests() if r.url.path != "/v0/projects"
+    ]
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> AudioFileCache:
+    return AudioFileCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def okareo_kwargs(cache: AudioFileCache) -> Dict[str, Any]:
+    return {"audio_cache": cache}
+
+
+def test_voice_file_is_downloaded_once(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    httpx_mock.add_response(url=FILE_URL, content=b"mp3-bytes")
+
+    assert okareo.download_voice(FILE_URL) == b"mp3-bytes"
+    target = tmp_path / "copy.mp3"
+    assert okareo.download_voice(FILE_URL, to_path=target) == str(target)
+
+    assert target.read_bytes() == b"mp3-bytes"
+    assert len(downloads(httpx_mock)) == 1
+    okareo.download_voice(FILE_URL, use_cache=False)
+    assert len(downloads(httpx_mock)) == 2
+
+
+def test_to_path_streams_without_a_cache(httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+    mock_projects(httpx_mock)
+    httpx_mock.add_response(url=f"{BASE}/v0/voice/call_sid/CA1", content=b"wav")
+    okareo = Okareo("api-key", BASE)
+
+    target = tmp_path / "call.wav"
+    okareo.download_call_recording("CA1", to_path=target)
+
+    assert target.read_bytes() == b"wav"
+    assert [p.name for p in tmp_path.iterdir()] == ["call.wav"]
+
+
+def test_bulk_recordings_share_the_cache(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    call_sids = [f"CA{i}" for i in range(5)]
+    for call_sid in call_sids:
+        httpx_mock.add_response(
+            url=f"{BASE}/v0/voice/call_sid/{call_sid}", content=call_sid.encode()
+        )
+
+    recordings = okareo.download_call_recordings(call_sids + ["CA0"])
+    saved = okareo.download_call_recordings(call_sids, to_dir=tmp_path / "calls")
+
+    assert recordings == {call_sid: call_sid.encode() for call_sid in call_sids}
+    assert Path(str(saved["CA3"])).read_bytes() == b"CA3"
+    assert sorted(downloads(httpx_mock)) == [
+        f"/v0/voice/call_sid/{c}" for c in call_sids
+    ]
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = AudioFileCache(tmp_path, max_disk_bytes=10)
+
+    for mtime, key in enumerate(["a", "b"], start=1000):
+        os.utime(cache.put(BASE, key, [key.encode() * 4]), (mtime, mtime))
+    assert cache.get(BASE, "a") is not None
+    cache.put(BASE, "c", [b"cccc"])
+
+    assert cache.get(BASE, "b") is None
+    assert cache.get(BASE, "a") is not None and cache.get(BASE, "c") is not None
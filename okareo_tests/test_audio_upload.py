@@ -0,0 +1,130 @@
+import base64
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+
+SCENARIO_JSON = {
+    "project_id": GLOBAL_ID,
+    "scenario_id": "6b1f0c2d-8e3a-4d5b-9c7e-1a2b3c4d5e6f",
+    "time_created": "2024-01-01T00:00:00",
+    "type": "SEED",
+}
+
+
+pytestmark = pytest.mark.usefixtures("fast_retries")
+
+
+def audio_files(tmp_path: Path, contents: List[bytes]) -> List[str]:
+    paths = []
+    for i, content in enumerate(contents):
+        path = tmp_path / f"call-{i}.wav"
+        path.write_bytes(content)
+        paths.append(str(path))
+    return paths
+
+
+def mock_uploads(httpx_mock: HTTPXMock, fail_first: int = 0) -> List[bytes]:
+    """Serves /v0/voice/upload, answering 503 to the first `fail_first` calls."""
+    uploaded: List[bytes] = []
+    calls: List[int] = []
+    lock = threading.Lock()
+
+    def upload(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.read())
+        assert int(request.headers["content-length"]) == len(request.content)
+        with lock:
+            calls.append(1)
+            if len(calls) <= fail_first:
+                return httpx.Response(503)
+            audio = base64.b64decode(body["audio"])
+            uploaded.append(audio)
+        file_id = hashlib.sha256(audio).hexdigest()
+        return httpx.Response(
+            201,
+            json={
+                "file_id": "9c8b7a6d-5e4f-4a3b-8c9d-0e1f2a3b4c5d",
+                "file_url": f"https://example.com/{file_id}.mp3",
+                "file_duration": 1000.0,
+                "time_created": "2024-01-01T00:00:00",
+            },
+        )
+
+    httpx_mock.add_callback(upload, url=f"{BASE}/v0/voice/upload")
+    return uploaded
+
+
+def seed_inputs(httpx_mock: HTTPXMock) -> List[str]:
+    (request,) = [
+        r for r in httpx_mock.get_requests() if r.url.path == "/v0/scenario_sets"
+    ]
+    return [row["input"] for row in json.loads(request.read())["seed_data"]]
+
+
+def test_identical_files_are_uploaded_once_with_retries(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    paths = audio_files(tmp_path, [b"hello", b"world", b"hello"])
+    uploaded = mock_uploads(httpx_mock, fail_first=1)
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_sets", json=SCENARIO_JSON, status_code=201
+    )
+
+    okareo.create_scenario_set_with_audio_files(
+        "calls", [{"input": path, "result": "ok"} for path in paths]
+    )
+
+    assert sorted(uploaded) == [b"hello", b"world"]
+    inputs = seed_inputs(httpx_mock)
+    assert inputs[0] == inputs[2] != inputs[1]
+    assert inputs[1].endswith(hashlib.sha256(b"world").hexdigest() + ".mp3")
+
+
+def test_manifest_resumes_after_a_failed_upload(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    paths = audio_files(tmp_path, [b"one", b"two", b"three"])
+    manifest_path = str(tmp_path / "uploads.jsonl")
+    data_list = [{"input": path, "result": "ok"} for path in paths]
+    uploaded: Dict[str, int] = {}
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        audio = base64.b64decode(json.loads(request.read())["audio"])
+        uploaded[audio.decode()] = uploaded.get(audio.decode(), 0) + 1
+        if audio == b"two" and uploaded["two"] == 1:
+            return httpx.Response(422, json={"detail": []})
+        return httpx.Response(
+            201,
+            json={
+                "file_id": "9c8b7a6d-5e4f-4a3b-8c9d-0e1f2a3b4c5d",
+                "file_url": f"https://example.com/{audio.decode()}.mp3",
+                "file_duration": 1.0,
+                "time_created": "2024-01-01T00:00:00",
+            },
+        )
+
+    httpx_mock.add_callback(flaky, url=f"{BASE}/v0/voice/upload")
+    with pytest.raises(AssertionError):
+        okareo.create_scenario_set_with_audio_files(
+            "calls", data_list, manifest_path=manifest_path
+        )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_sets", json=SCENARIO_JSON, status_code=201
+    )
+
+    okareo.create_scenario_set_with_audio_files(
+        "calls", data_list, manifest_path=manifest_path
+    )
+
+    assert uploaded == {"one": 1, "two": 2, "three": 1}
+    assert seed_inputs(httpx_mock) == [
+        f"https://example.com/{name}.mp3" for name in ["one", "two", "three"]
+    ]
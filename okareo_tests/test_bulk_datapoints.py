@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+import uuid
+from typing import Any, List
+from unittest import mock
+from unittest.mock import Mock
+
+from okareo_tests.conftest import BASE, GLOBAL_ID, mock_projects
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo.async_utils import AsyncCallBuffer, BulkCallBuffer
+from okareo.model_under_test import CustomModel, ModelInvocation
+from okareo_api_client.client import Client
+from okareo_api_client.models import DatapointResponse
+from okareo_api_client.models.error_response import ErrorResponse
+from okareo_api_client.models.scenario_data_poin_response import (
+    ScenarioDataPoinResponse,
+)
+
+MOCK_UUID = GLOBAL_ID
+
+
+def raise_on_error(response: Any) -> None:
+    if isinstance(response, ErrorResponse):
+        raise TypeError(response.detail)
+
+
+class InFlightCounter:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.bodies: List[Any] = []
+        self.delay = delay
+
+    def __call__(self, client: Any, api_key: str, body: Any) -> Any:
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.bodies.append(body)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if body == "bad":
+            return ErrorResponse(detail="rejected")
+        return f"ok-{body}"
+
+
+def test_flush_waits_for_every_call() -> None:
+    func = InFlightCounter(delay=0.01)
+    writer = BulkCallBuffer(func, Client(base_url=BASE), "key", chunk_size=4)
+    for i in range(10):
+        writer.add(i)
+
+    errors = writer.flush()
+
+    assert errors == []
+    assert sorted(func.bodies) == list(range(10))
+    assert func.peak > 1
+    # finished calls are not held on to
+    assert not writer._in_flight
+    writer.close()
+
+
+def test_backpressure_bounds_in_flight_calls() -> None:
+    func = InFlightCounter(delay=0.02)
+    writer = BulkCallBuffer(
+        func,
+        Client(base_url=BASE),
+        "key",
+        chunk_size=2,
+        max_workers=8,
+        max_pending=3,
+    )
+    for i in range(12):
+        writer.add(i)
+    writer.close()
+
+    assert len(func.bodies) == 12
+    assert func.peak <= 3
+
+
+def test_rejected_body_sends_fallback_once() -> None:
+    func = InFlightCounter()
+    writer = BulkCallBuffer(func, Client(base_url=BASE), "key", validate=raise_on_error)
+    writer.add("bad", on_error=lambda e: f"fallback-{e}")
+    writer.add("bad")
+
+    errors = writer.flush()
+    writer.close()
+
+    assert func.bodies == ["bad", "fallback-rejected", "bad"] or func.bodies == [
+        "bad",
+        "bad",
+        "fallback-rejected",
+    ]
+    assert len(errors) == 1
+    assert writer.errors == errors
+
+
+class AsyncInFlightCounter(InFlightCounter):
+    async def __call__(self, client: Any, api_key: str, body: Any) -> Any:  # type: ignore[override]
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.bodies.append(body)
+        await asyncio.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return f"ok-{body}"
+
+
+def test_async_buffer_sends_chunks_with_backpressure() -> None:
+    func = AsyncInFlightCounter(delay=0.02)
+
+    async def run() -> List[Exception]:
+        writer = AsyncCallBuffer(
+            func,
+            Client(base_url=BASE),
+            "key",
+            chunk_size=2,
+            max_pending=3,
+        )
+        for i in range(6):
+            await writer.put(i)
+        # calls went out before the flush
+        assert func.bodies
+        for i in range(6, 9):
+            await asyncio.to_thread(writer.add, i)
+        writer.add(9)
+        errors = await writer.flush()
+        assert not writer._tasks
+        return errors
+
+    errors = asyncio.run(run())
+
+    assert errors == []
+    assert sorted(func.bodies) == list(range(10))
+    assert 1 < func.peak <= 3
+
+
+class EchoModel(CustomModel):
+    def invoke(self, input_value: Any) -> ModelInvocation:
+        if input_value == "row-1":
+            # lists are not accepted by add_data_point and become error datapoints
+            return ModelInvocation(model_prediction=["a", "list"], model_input="row-1")
+        return ModelInvocation(model_prediction="pred", model_input=input_value)
+
+
+def test_custom_exec_uploads_every_datapoint_before_returning(
+    httpx_mock: HTTPXMock,
+) -> None:
+    mock_projects(httpx_mock)
+    httpx_mock.add_response(
+        json={
+            "id": MOCK_UUID,
+            "project_id": MOCK_UUID,
+            "name": "bulk-model",
+            "tags": [],
+            "time_created": "foo",
+        },
+        status_code=201,
+    )
+    mut = Okareo("api-key", BASE).register_model(
+        name="bulk-model", model=EchoModel(name="echo")
+    )
+    rows = [
+        ScenarioDataPoinResponse(id=uuid.uuid4(), input_=f"row-{i}", result="")
+        for i in range(100)
+    ]
+
+    with mock.patch.object(
+        mut, "_get_scenario_data_points", return_value=rows
+    ), mock.patch("okareo.model_under_test.add_datapoint_v0_datapoints_post") as post:
+        post.sync = Mock(return_value=DatapointResponse(id=uuid.UUID(MOCK_UUID)))
+        model_data: dict = {"model_data": {}}
+        mut._custom_exec(MOCK_UUID, model_data, test_run_id=MOCK_UUID)
+
+        assert post.sync.call_count == 100
+        bodies = [c.kwargs["body"] for c in post.sync.call_args_list]
+        assert all(str(b.test_run_id) == MOCK_UUID for b in bodies)
+        errors = [b for b in bodies if b.error_message]
+        assert len(errors) == 1
+        assert "Unexpected model_prediction type" in errors[0].error_message
+    assert list(model_data["model_data"].keys()) == [str(r.id) for r in rows]
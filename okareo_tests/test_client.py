@@ -1,3 +1,4 @@
+import importlib.util
 import os
 import uuid
 from datetime import datetime
@@ -20,6 +21,42 @@ def test_can_instantiate() -> None:
     Okareo(API_KEY)
 
 
+def test_pool_settings_reach_sync_and_async_clients() -> None:
+    okareo = Okareo(
+        "foo",
+        "http://mocked.com",
+        timeout=12,
+        max_connections=7,
+        max_keepalive_connections=3,
+        keepalive_expiry=9,
+        lazy=True,
+    )
+
+    for httpx_client in (
+        okareo.client.get_httpx_client(),
+        okareo.client.get_async_httpx_client(),
+    ):
+        assert httpx_client.timeout.read == 12
+        pool = httpx_client._transport._pool  # type: ignore[union-attr]
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 9
+
+
+def test_requests_have_no_timeout_by_default() -> None:
+    httpx_client = Okareo("foo", "http://mocked.com", lazy=True).client
+    assert httpx_client.get_httpx_client().timeout.read is None
+
+
+def test_http2_without_h2_names_the_install_extra(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+
+    with pytest.raises(ImportError, match=r"pip install 'httpx\[http2\]'"):
+        Okareo("foo", "http://mocked.com", http2=True, lazy=True)
+
+
 @pytest.fixture
 def okareo_client(httpx_mock: HTTPXMock) -> Okareo:
     httpx_mock.add_response(
@@ -19,6 +19,7 @@ import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
+import okareo.okareo as okareo_module
 from okareo import Okareo
 from okareo_api_client.models.datapoint_filter_search_payload import (
     DatapointFilterSearchPayload,
@@ -518,3 +519,53 @@ class TestIngestConversationsGuard:
             client.ingest_conversations(
                 conversations=[{"source_platform": "custom", "call_id": "c"}]
             )
+
+
+class TestLazyClient:
+    @pytest.fixture(autouse=True)
+    def _empty_projects_cache(self) -> None:
+        okareo_module._projects_cache.clear()
+
+    def test_construction_makes_no_request(self, httpx_mock: HTTPXMock) -> None:
+        client = Okareo("k", "http://mocked.com", project="Billing Agent", lazy=True)
+
+        assert httpx_mock.get_requests() == []
+        _mock_projects(httpx_mock)
+        assert client.project_id == OTHER_ID
+
+    def test_first_call_resolves_the_project(self, httpx_mock: HTTPXMock) -> None:
+        client = Okareo("k", "http://mocked.com", project="billing agent", lazy=True)
+        _mock_projects(httpx_mock)
+        httpx_mock.add_response(json=[], status_code=200)
+
+        client.find_datapoints(DatapointSearch(context_token="tok"))
+
+        assert _sent_body(httpx_mock)["project_id"] == OTHER_ID
+
+    def test_cached_projects_are_shared_by_clients(self, httpx_mock: HTTPXMock) -> None:
+        _mock_projects(httpx_mock)
+        Okareo("k", "http://mocked.com")
+
+        lazy = Okareo("k", "http://mocked.com", project="Billing Agent", lazy=True)
+
+        assert lazy.project_id == OTHER_ID
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_expired_cache_is_refetched(self, httpx_mock: HTTPXMock) -> None:
+        _mock_projects(httpx_mock)
+        _mock_projects(httpx_mock)
+        Okareo("k", "http://mocked.com")
+
+        lazy = Okareo(
+            "k", "http://mocked.com", project=OTHER_ID, lazy=True, projects_ttl=0
+        )
+
+        assert lazy.project_id == OTHER_ID
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_unknown_project_fails_on_first_use(self, httpx_mock: HTTPXMock) -> None:
+        client = Okareo("k", "http://mocked.com", project="Nope", lazy=True)
+        _mock_projects(httpx_mock)
+
+        with pytest.raises(ValueError, match="Unknown project 'Nope'"):
+            _ = client.project_id
@@ -1,12 +1,145 @@
 import json
-from typing import Any
+import threading
+from typing import Any, Dict, List, Optional
 
 from okareo_tests.common import API_KEY, random_string
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import SpanContext
 
 from okareo import Okareo
-from okareo.crewai_logger import CrewAILogger
+from okareo.crewai_logger import CrewAILogger, CrewAISpanProcessor
 from okareo_api_client.models.datapoint_search import DatapointSearch
 
+CREW = {
+    "crew_agents": [{"role": "researcher"}, {"role": "writer"}],
+    "crew_tasks": [
+        {"id": "task-1-abc", "agent_role": "researcher"},
+        {"id": "task-2-def", "agent_role": "writer"},
+        {"id": "task-3-ghi", "agent_role": "researcher"},
+    ],
+}
+
+
+class FakeModel:
+    def __init__(self, name: str, calls: List[str]) -> None:
+        self.name = name
+        self.calls = calls
+
+    def add_data_point_async(self, **kwargs: Any) -> bool:
+        self.calls.append(f"datapoint:{self.name}")
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        self.calls.append(f"flush:{self.name}")
+        return True
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        return True
+
+
+class FakeOkareo:
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+        self.thread_ids: List[int] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def create_group(self, **kwargs: Any) -> Dict[str, str]:
+        return {"id": "group-1"}
+
+    def register_model(self, name: str) -> FakeModel:
+        self.release.wait(5)
+        self.thread_ids.append(threading.get_ident())
+        self.calls.append(f"register:{name}")
+        return FakeModel(name, self.calls)
+
+    def add_model_to_group(self, group: Any, model: FakeModel) -> None:
+        self.calls.append(f"group:{model.name}")
+
+    def create_trace_eval(self, group: Any, context_token: str) -> None:
+        self.calls.append("trace_eval")
+
+
+def span(name: str, attributes: Dict[str, Any]) -> ReadableSpan:
+    return ReadableSpan(
+        name=name,
+        context=SpanContext(trace_id=1, span_id=2, is_remote=False),
+        attributes={
+            k: v if isinstance(v, str) else json.dumps(v) for k, v in attributes.items()
+        },
+        start_time=1_700_000_000_000_000_000,
+        end_time=1_700_000_001_000_000_000,
+    )
+
+
+def crew_spans() -> List[ReadableSpan]:
+    spans = [span("Crew Created", CREW)]
+    for task in CREW["crew_tasks"]:
+        spans.append(span("Task Created", {"task_id": task["id"][:6]}))
+        spans.append(span("Task Execution", {"task_id": task["id"][:6]}))
+    return spans
+
+
+def test_spans_are_exported_off_the_calling_thread() -> None:
+    okareo = FakeOkareo()
+    processor = CrewAISpanProcessor({"okareo": okareo, "context_token": "ctx"})
+    okareo.release.clear()
+
+    for s in crew_spans():
+        processor.on_end(s)
+    assert okareo.calls == []
+    okareo.release.set()
+
+    assert processor.force_flush(5000)
+    assert threading.get_ident() not in okareo.thread_ids
+    registered = [c for c in okareo.calls if c.startswith(("register", "group"))]
+    assert registered == [
+        "register:researcher",
+        "group:researcher",
+        "register:writer",
+        "group:writer",
+    ]
+    assert okareo.calls.count("datapoint:researcher") == 1 + 2 * 2
+    # every data point is sent before the trace eval reads them back
+    trace_eval = okareo.calls.index("trace_eval")
+    assert okareo.calls[trace_eval - 2 : trace_eval] == [
+        "flush:researcher",
+        "flush:writer",
+    ]
+    processor.shutdown()
+
+
+def test_shutdown_flushes_and_ignores_later_spans() -> None:
+    okareo = FakeOkareo()
+    processor = CrewAISpanProcessor({"okareo": okareo})
+
+    processor.on_end(span("Crew Created", CREW))
+    processor.shutdown()
+    calls = list(okareo.calls)
+    processor.on_end(span("Task Created", {"task_id": "task-1"}))
+    processor.shutdown()
+
+    assert "datapoint:researcher" in calls and "datapoint:writer" in calls
+    assert okareo.calls == calls
+    assert processor.force_flush(100)
+
+
+def test_roles_are_looked_up_from_the_crew_index() -> None:
+    okareo = FakeOkareo()
+    processor = CrewAISpanProcessor({"okareo": okareo})
+
+    for s in crew_spans() + crew_spans():
+        processor.on_end(s)
+    processor.on_end(span("Task Created", {"task_id": "unknown"}))
+    processor.shutdown()
+
+    registrations = [c for c in okareo.calls if c.startswith("register:")]
+    assert registrations == ["register:researcher", "register:writer"]
+    assert okareo.calls.count("trace_eval") == 2
+    assert processor._task_role("task-3") == "researcher"
+    assert processor._task_role("task-2-def") == "writer"
+    assert processor._task_role("unknown") is None
+
 
 def get_logger_config() -> dict[str, Any]:
     logger_config = {
@@ -0,0 +1,136 @@
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Union
+from unittest import mock
+
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID, mock_projects
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo.model_under_test import CustomModel, ModelInvocation, ModelUnderTest
+from okareo_api_client.models.scenario_data_poin_response import (
+    ScenarioDataPoinResponse,
+)
+
+MOCK_UUID = GLOBAL_ID
+
+MUT_FIXTURE: Dict[str, Any] = {
+    "id": MOCK_UUID,
+    "project_id": MOCK_UUID,
+    "version": 1,
+    "name": "concurrency-model",
+    "tags": ["ci-testing"],
+    "time_created": "foo",
+}
+
+TEST_RUN_FIXTURE = {
+    "id": MOCK_UUID,
+    "name": "concurrency run",
+    "project_id": MOCK_UUID,
+    "mut_id": MOCK_UUID,
+    "scenario_set_id": MOCK_UUID,
+}
+
+
+def scenario_rows(count: int) -> List[ScenarioDataPoinResponse]:
+    return [
+        ScenarioDataPoinResponse(id=uuid.uuid4(), input_=f"row-{i}", result="ok")
+        for i in range(count)
+    ]
+
+
+class SlowModel(CustomModel):
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def invoke(self, input_value: Union[dict, list, str]) -> ModelInvocation:
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        # finish out of order on purpose
+        time.sleep(random.uniform(0.01, 0.05))
+        with self.lock:
+            self.in_flight -= 1
+        if input_value == "row-3":
+            raise ValueError("boom")
+        return ModelInvocation(model_prediction=f"pred-{input_value}")
+
+
+class AsyncSlowModel(CustomModel):
+    async def invoke(  # type: ignore[override]
+        self, input_value: Union[dict, list, str]
+    ) -> ModelInvocation:
+        await asyncio.sleep(random.uniform(0.01, 0.05))
+        return ModelInvocation(model_prediction=f"pred-{input_value}")
+
+
+def register(httpx_mock: HTTPXMock, model: CustomModel) -> ModelUnderTest:
+    mock_projects(httpx_mock)
+    httpx_mock.add_response(json=MUT_FIXTURE, status_code=201)
+    okareo = Okareo("api-key", BASE)
+    return okareo.register_model(name=MUT_FIXTURE["name"], model=model)
+
+
+def run(
+    httpx_mock: HTTPXMock,
+    mut: ModelUnderTest,
+    rows: List[ScenarioDataPoinResponse],
+    max_concurrency: int,
+) -> Any:
+    httpx_mock.add_response(json=TEST_RUN_FIXTURE, status_code=201)
+    with mock.patch.object(mut, "_get_scenario_data_points", return_value=rows):
+        mut.run_test(
+            scenario=MOCK_UUID, name="concurrency run", max_concurrency=max_concurrency
+        )
+    return json.loads(httpx_mock.get_requests()[-1].content)["model_results"][
+        "model_data"
+    ]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_sync_invoker_keeps_scenario_order(
+    httpx_mock: HTTPXMock, max_concurrency: int
+) -> None:
+    model = SlowModel(name="slow")
+    mut = register(httpx_mock, model)
+    rows = scenario_rows(12)
+
+    model_data = run(httpx_mock, mut, rows, max_concurrency)
+
+    assert list(model_data.keys()) == [str(row.id) for row in rows]
+    assert model.peak <= max_concurrency
+    if max_concurrency > 1:
+        assert model.peak > 1
+
+
+def test_sync_invoker_isolates_errors(httpx_mock: HTTPXMock) -> None:
+    mut = register(httpx_mock, SlowModel(name="slow"))
+    rows = scenario_rows(6)
+
+    model_data = run(httpx_mock, mut, rows, 4)
+
+    failed = model_data[str(rows[3].id)]
+    assert failed["actual"] is None
+    assert failed["model_input"] == "row-3"
+    assert failed["error_message"] == {"message": "boom"}
+    assert model_data[str(rows[4].id)]["actual"] == "pred-row-4"
+
+
+def test_async_invoker_is_awaited_concurrently(httpx_mock: HTTPXMock) -> None:
+    mut = register(httpx_mock, AsyncSlowModel(name="async-slow"))
+    rows = scenario_rows(10)
+
+    model_data = run(httpx_mock, mut, rows, 5)
+
+    assert list(model_data.keys()) == [str(row.id) for row in rows]
+    assert [v["actual"] for v in model_data.values()] == [
+        f"pred-row-{i}" for i in range(10)
+    ]
@@ -0,0 +1,172 @@
+import asyncio
+import concurrent.futures
+import json
+import time
+import uuid
+from typing import Any, List, Tuple
+from unittest import mock
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo.model_under_test import (
+    CustomMultiturnTarget,
+    ModelInvocation,
+    ModelUnderTest,
+)
+from okareo_api_client.client import Client
+from okareo_api_client.models import ModelUnderTestResponse
+
+TURN_DELAY = 0.2
+
+
+class Message:
+    def __init__(self, payload: dict, reply: str) -> None:
+        self.data = json.dumps(payload).encode()
+        self.reply = reply
+
+
+class FakeNats:
+    def __init__(self) -> None:
+        self.published: List[Tuple[str, Any]] = []
+
+    async def publish(self, subject: str, payload: bytes) -> None:
+        self.published.append((subject, json.loads(payload)))
+
+
+def slow_invoke(
+    messages: list, scenario_input: Any, session_id: Any
+) -> ModelInvocation:
+    time.sleep(TURN_DELAY)
+    return ModelInvocation(model_prediction=f"reply to {scenario_input}")
+
+
+def custom_target_mut(invoker: Any = slow_invoke) -> ModelUnderTest:
+    response = ModelUnderTestResponse(
+        id=uuid.uuid4(),
+        project_id=uuid.uuid4(),
+        name="custom-target",
+        tags=[],
+        time_created="foo",
+    )
+    return ModelUnderTest(
+        client=Client(base_url="http://mocked.com"),
+        api_key="api-key",
+        mut=response,
+        models={"custom_target": {"type": "custom_target", "model_invoker": invoker}},
+    )
+
+
+def turn(index: int) -> Message:
+    payload = {
+        "message_history": [{"role": "user", "content": "hi"}],
+        "scenario_input": f"turn-{index}",
+        "call_type": "invoke",
+    }
+    return Message(payload, reply=f"reply-{index}")
+
+
+async def serve_turns(
+    mut: ModelUnderTest,
+    turns: int,
+    max_concurrent_turns: int,
+    turn_timeout: Any = None,
+) -> Tuple[FakeNats, int]:
+    nats = FakeNats()
+    turn_slots = asyncio.Semaphore(max_concurrent_turns)
+    ticks = 0
+
+    async def heartbeat() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    beat = asyncio.create_task(heartbeat())
+    with concurrent.futures.ThreadPoolExecutor(max_concurrent_turns) as executor:
+        await asyncio.gather(
+            *(
+                mut.process_single_message(
+                    turn(i),
+                    nats,
+                    asyncio.Event(),
+                    turn_slots,
+                    executor,
+                    turn_timeout,
+                )
+                for i in range(turns)
+            )
+        )
+    beat.cancel()
+    return nats, ticks
+
+
+def test_sync_turns_run_in_parallel_off_the_loop() -> None:
+    start = time.monotonic()
+    nats, ticks = asyncio.run(serve_turns(custom_target_mut(), 4, 4))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 4 * TURN_DELAY
+    # the loop kept serving other work while the invokers ran
+    assert ticks >= 5
+    replies = dict(nats.published)
+    assert replies["reply-2"]["actual"] == "reply to turn-2"
+
+
+def test_semaphore_bounds_concurrent_turns() -> None:
+    start = time.monotonic()
+    asyncio.run(serve_turns(custom_target_mut(), 4, 2))
+
+    assert time.monotonic() - start >= 2 * TURN_DELAY
+
+
+def test_turn_timeout_reports_an_error() -> None:
+    nats, _ = asyncio.run(serve_turns(custom_target_mut(), 1, 1, turn_timeout=0.05))
+
+    ((subject, reply),) = nats.published
+    assert subject == "reply-0"
+    assert "TimeoutError" in reply["error"]
+
+
+def test_invoker_signature_is_not_inspected_per_turn() -> None:
+    mut = custom_target_mut(lambda messages, scenario_input, session_id: "new")
+
+    with mock.patch("inspect.signature") as signature:
+        for i in range(3):
+            assert mut.call_custom_invoker({}, [], f"turn-{i}", None) == "new"
+
+    signature.assert_not_called()
+
+
+def test_legacy_invoker_receives_args() -> None:
+    mut = custom_target_mut(lambda args: args)
+
+    assert mut.call_custom_invoker({"a": 1}, [], "turn-0", None) == {"a": 1}
+
+
+class TwoArgTarget(CustomMultiturnTarget):
+    def invoke(  # type: ignore[override]
+        self, messages: list, scenario_input: Any
+    ) -> ModelInvocation:
+        return ModelInvocation(model_prediction="never")
+
+
+def test_misconfigured_invoker_fails_at_registration(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        json=[
+            {
+                "id": str(uuid.uuid4()),
+                "name": "Global",
+                "onboarding_status": "s",
+                "tags": [],
+            }
+        ],
+        status_code=201,
+    )
+    okareo = Okareo("api-key", "http://mocked.com")
+
+    with pytest.raises(TypeError, match="model_invoker"):
+        okareo.register_model(name="bad", model=TwoArgTarget(name="bad"))
+
+    assert [r.url.path for r in httpx_mock.get_requests()] == ["/v0/projects"]
@@ -0,0 +1,125 @@
+import datetime
+import json
+import uuid
+from typing import Any, Dict, List
+from unittest import mock
+from uuid import UUID
+
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo_api_client.models.datapoint_filter_search_payload import (
+    DatapointFilterSearchPayload,
+)
+from okareo_api_client.models.datapoint_search import DatapointSearch
+from okareo_api_client.models.find_test_data_point_payload import (
+    FindTestDataPointPayload,
+)
+from okareo_api_client.models.full_data_point_item import FullDataPointItem
+from okareo_api_client.types import Unset
+
+ROWS: List[Dict[str, Any]] = [
+    {
+        "id": str(uuid.uuid4()),
+        "input": f"question {i}",
+        "result": f"answer {i}",
+        "latency": 10 * i,
+        "time_created": "2024-01-01T00:00:00",
+    }
+    for i in range(3)
+]
+
+
+@pytest.fixture
+def okareo_kwargs() -> Dict[str, Any]:
+    return {"project": GLOBAL_ID}
+
+
+def test_columns_skip_per_row_objects(okareo: Okareo, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=f"{BASE}/v0/find_datapoints", json=ROWS)
+
+    with mock.patch(
+        "okareo_api_client.models.datapoint_list_item.DatapointListItem.from_dict"
+    ) as from_dict:
+        columns = okareo.find_datapoints_columns(DatapointSearch(context_token="t"))
+        assert columns["input_"] == [r["input"] for r in ROWS]
+        assert columns["latency"] == [0, 10, 20]
+        assert columns["feedback"] == [None, None, None]
+    from_dict.assert_not_called()
+
+    assert len(columns) == 3
+    assert columns.fields == ["id", "input_", "result", "latency", "time_created"]
+    body = json.loads(httpx_mock.get_requests()[-1].content)
+    assert body["project_id"] == GLOBAL_ID
+
+
+def test_fields_are_parsed_on_request(okareo: Okareo, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=f"{BASE}/v0/find_datapoints_filter", json=ROWS)
+
+    columns = okareo.find_datapoints_filter_columns(
+        DatapointFilterSearchPayload(filters=[])
+    )
+
+    assert columns["time_created"][0] == "2024-01-01T00:00:00"
+    assert columns.column("time_created", parse=True)[0] == datetime.datetime(
+        2024, 1, 1
+    )
+    assert columns.to_dict(["id"], parse=True)["id"] == [UUID(r["id"]) for r in ROWS]
+    assert columns.row(1).result == "answer 1"
+
+
+def test_error_response_raises(okareo: Okareo, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/find_datapoints", json={"detail": "bad search"}, status_code=400
+    )
+
+    with pytest.raises(TypeError, match="bad search"):
+        okareo.find_datapoints_columns(DatapointSearch())
+
+
+def test_projection_decodes_only_requested_fields(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=f"{BASE}/v0/find_datapoints_filter", json=ROWS)
+
+    items = okareo.find_datapoints_filter(
+        DatapointFilterSearchPayload(filters=[]), fields=["input_", "latency"]
+    )
+
+    assert [str(i.id) for i in items] == [r["id"] for r in ROWS]
+    assert items[2].input_ == "question 2"
+    assert items[2].latency == 20
+    assert isinstance(items[2].result, Unset)
+    assert isinstance(items[2].time_created, Unset)
+
+
+def test_projection_keeps_required_fields(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    row = {
+        "id": ROWS[0]["id"],
+        "test_run_id": GLOBAL_ID,
+        "metric_type": "QA",
+        "metric_value": {"key": "value"},
+        "model_result": "answer",
+        "model_input": "a long prompt",
+    }
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/find_test_data_points", json=[row], status_code=201
+    )
+
+    (item,) = okareo.find_test_data_points(
+        FindTestDataPointPayload(test_run_id=UUID(GLOBAL_ID)), fields=["model_result"]
+    )
+
+    assert isinstance(item, FullDataPointItem)
+    assert item.model_result == "answer"
+    assert str(item.test_run_id) == GLOBAL_ID
+    assert isinstance(item.model_input, Unset)
+
+
+def test_unknown_projection_field_is_rejected(okareo: Okareo) -> None:
+    with pytest.raises(ValueError, match="latancy"):
+        okareo.find_datapoints(DatapointSearch(), fields=["latancy"])
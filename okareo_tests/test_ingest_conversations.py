@@ -0,0 +1,108 @@
+import json
+import threading
+from typing import Any, Dict, Iterator, List
+
+import httpx
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+
+MUT_ID = "3f2b9a1c-5d6e-4f80-9a1b-2c3d4e5f6a7b"
+INGEST_URL = f"{BASE}/v0/conversations/ingest"
+
+
+pytestmark = pytest.mark.usefixtures("fast_retries")
+
+
+@pytest.fixture
+def okareo_kwargs() -> Dict[str, Any]:
+    return {"project": GLOBAL_ID}
+
+
+def conversations(count: int, audio: str = "") -> Iterator[Dict[str, Any]]:
+    for i in range(count):
+        yield {"source_platform": "custom", "call_id": f"call-{i}", "audio": audio}
+
+
+def mock_ingest(
+    httpx_mock: HTTPXMock, failures: Dict[str, int]
+) -> List[Dict[str, Any]]:
+    """Accepts every request, except that a request holding a call_id in
+    `failures` gets a 503 that many times."""
+    bodies: List[Dict[str, Any]] = []
+    lock = threading.Lock()
+
+    def ingest(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.read())
+        call_ids = [c["call_id"] for c in body["conversations"]]
+        with lock:
+            bodies.append(body)
+            for call_id in call_ids:
+                if failures.get(call_id, 0) > 0:
+                    failures[call_id] -= 1
+                    return httpx.Response(503)
+        return httpx.Response(
+            200,
+            json={
+                "status": "accepted",
+                "conversations": [{"call_id": call_id} for call_id in call_ids],
+            },
+        )
+
+    httpx_mock.add_callback(ingest, url=INGEST_URL)
+    return bodies
+
+
+def test_conversations_are_split_by_count_and_size(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    bodies = mock_ingest(httpx_mock, {"call-1": 1})
+
+    report = okareo.ingest_conversations(
+        conversations=list(conversations(5)), mut_id=MUT_ID, max_chunk_size=2
+    )
+
+    assert set(report) == {"status", "conversations"}
+    assert report["status"] == "accepted"
+    assert sorted(c["call_id"] for c in report["conversations"]) == [
+        f"call-{i}" for i in range(5)
+    ]
+    # three chunks, one of them retried
+    assert len(bodies) == 4
+    assert all(b["project_id"] == GLOBAL_ID and b["mut_id"] == MUT_ID for b in bodies)
+
+    bodies.clear()
+    okareo.ingest_conversations(
+        conversations=conversations(4, audio="x" * 1000), max_chunk_bytes=2500
+    )
+    assert [len(b["conversations"]) for b in bodies] == [2, 2]
+
+
+def test_failed_chunks_and_duplicates_are_reported(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    mock_ingest(httpx_mock, {"call-2": 5})
+    rows = list(conversations(4)) + [{"source_platform": "custom", "call_id": "call-0"}]
+
+    report = okareo.ingest_conversations(
+        conversations=iter(rows), max_chunk_size=1, max_attempts=2
+    )
+
+    assert report["status"] == "partial"
+    statuses = {(c["call_id"], c["status"]) for c in report["conversations"]}
+    assert statuses == {
+        ("call-0", "accepted"),
+        ("call-1", "accepted"),
+        ("call-2", "failed"),
+        ("call-3", "accepted"),
+        ("call-0", "duplicate"),
+    }
+
+
+def test_raises_when_every_request_fails(okareo: Okareo, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=INGEST_URL, status_code=400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        okareo.ingest_conversations(conversations=conversations(3))
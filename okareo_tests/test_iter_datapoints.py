@@ -0,0 +1,84 @@
+import json
+import uuid
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo_api_client.errors import UnexpectedStatus
+from okareo_api_client.models.datapoint_search import DatapointSearch
+
+DATAPOINT_IDS = [str(uuid.uuid4()) for _ in range(25)]
+
+
+def serve_datapoints(httpx_mock: HTTPXMock, fail_at_offset: int = -1) -> List[dict]:
+    """Answer find_datapoints by slicing DATAPOINT_IDS with the request's
+    offset/limit; returns the bodies that were sent."""
+    bodies: List[dict] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        bodies.append(body)
+        if body["offset"] == fail_at_offset:
+            return httpx.Response(500, json={"detail": "boom"})
+        page = DATAPOINT_IDS[body["offset"] : body["offset"] + body["limit"]]
+        return httpx.Response(200, json=[{"id": i} for i in page])
+
+    httpx_mock.add_callback(respond, url=f"{BASE}/v0/find_datapoints")
+    return bodies
+
+
+@pytest.fixture
+def okareo_kwargs() -> Dict[str, Any]:
+    return {"project": GLOBAL_ID}
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_pages_through_every_datapoint(
+    okareo: Okareo, httpx_mock: HTTPXMock, prefetch: bool
+) -> None:
+    bodies = serve_datapoints(httpx_mock)
+
+    pages = okareo.iter_datapoints(
+        DatapointSearch(context_token="tok"), page_size=10, prefetch=prefetch
+    )
+
+    assert [str(dp.id) for dp in pages] == DATAPOINT_IDS
+    assert [(b["offset"], b["limit"]) for b in bodies] == [(0, 10), (10, 10), (20, 10)]
+    assert all(b["project_id"] == GLOBAL_ID for b in bodies)
+    assert pages.cursor == len(DATAPOINT_IDS)
+
+
+def test_search_offset_and_limit_bound_the_iteration(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    bodies = serve_datapoints(httpx_mock)
+
+    pages = okareo.iter_datapoints(DatapointSearch(offset=3, limit=12), page_size=5)
+
+    assert [str(dp.id) for dp in pages] == DATAPOINT_IDS[3:15]
+    assert [(b["offset"], b["limit"]) for b in bodies] == [(3, 5), (8, 5), (13, 2)]
+
+
+def test_resumes_from_cursor_after_a_failure(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    serve_datapoints(httpx_mock, fail_at_offset=10)
+    search = DatapointSearch(context_token="tok")
+    seen: List[str] = []
+
+    pages = okareo.iter_datapoints(search, page_size=10)
+    with pytest.raises(UnexpectedStatus):
+        for dp in pages:
+            seen.append(str(dp.id))
+    assert pages.cursor == 10
+
+    serve_datapoints(httpx_mock)
+    seen.extend(
+        str(dp.id) for dp in okareo.iter_datapoints(search, 10, cursor=pages.cursor)
+    )
+
+    assert seen == DATAPOINT_IDS
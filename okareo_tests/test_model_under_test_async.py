@@ -1,4 +1,9 @@
+import subprocess
+import sys
+import textwrap
+import threading
 import time
+from pathlib import Path
 from typing import Any, Optional
 from unittest import mock
 from unittest.mock import Mock
@@ -8,6 +13,8 @@ from okareo_tests.common import random_string
 from pytest_httpx import HTTPXMock
 
 from okareo import Okareo
+from okareo.async_utils import BatchExporter
+from okareo_api_client.client import Client
 
 GLOBAL_PROJECT_RESPONSE = [
     {
@@ -141,3 +148,144 @@ def test_send_once_above_queue_size_threshold(
             )
 
             assert not endpoint.sync.called
+
+
+def test_flush_keeps_exporter_running(
+    okareo_client: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    fixture = get_mut_fixture()
+    httpx_mock.add_response(status_code=201, json=fixture)
+
+    mut = okareo_client.register_model(name=fixture["name"], tags=fixture["tags"])
+
+    with mock.patch(
+        "okareo.model_under_test.add_datapoint_v0_datapoints_post"
+    ) as endpoint:
+        endpoint.sync = Mock()
+        mut.add_data_point_async(feedback=0, context_token="SOME_CONTEXT_TOKEN")
+        assert mut.flush(timeout=5)
+        assert endpoint.sync.call_count == 1
+
+        mut.add_data_point_async(feedback=1, context_token="SOME_CONTEXT_TOKEN")
+        assert mut.flush(timeout=5)
+        assert endpoint.sync.call_count == 2
+        assert mut.get_async_metrics()["exported"] == 2
+    mut.shutdown()
+
+
+def make_exporter(**kwargs: Any) -> BatchExporter:
+    return BatchExporter(Client(base_url="http://mocked.com"), "foo", **kwargs)
+
+
+def test_full_queue_counts_drops() -> None:
+    exporter = make_exporter(
+        max_queue_size=2, max_batch_size=1, schedule_delay_millis=10, max_workers=1
+    )
+    func = Mock(side_effect=long_add_data_point)
+
+    results = [exporter.submit(func, i) for i in range(6)]
+
+    # at most one batch in flight plus a full queue
+    assert results.count(False) >= 3
+    assert exporter.metrics()["dropped"] == results.count(False)
+    exporter.shutdown()
+
+
+def test_failing_batch_does_not_stall_others(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    exporter = make_exporter(
+        max_batch_size=1,
+        schedule_delay_millis=10,
+        max_workers=2,
+        retry_base_delay_millis=1_000,
+    )
+    failing = Mock(side_effect=Exception("Test"))
+    healthy = Mock()
+
+    exporter.submit(failing, "bad")
+    exporter.submit(healthy, "good")
+    time.sleep(0.3)
+
+    # the failed call waits for its backoff without blocking the healthy one
+    assert healthy.call_count == 1
+    assert failing.call_count == 1
+    assert exporter.metrics()["retried"] == 1
+    assert "Okareo export call failed (attempt 1" in caplog.text
+    assert not exporter.flush(timeout=0.1)
+    exporter.shutdown(timeout=0.1)
+
+
+def test_senders_run_in_parallel() -> None:
+    exporter = make_exporter(max_batch_size=1, schedule_delay_millis=10, max_workers=4)
+    func = Mock(side_effect=long_add_data_point)
+
+    start = time.time()
+    for i in range(4):
+        exporter.submit(func, i)
+    assert exporter.flush(timeout=5)
+
+    assert func.call_count == 4
+    assert time.time() - start < 2
+    exporter.shutdown()
+
+
+def test_muts_share_one_lazily_started_exporter(
+    okareo_client: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    fixture = get_mut_fixture()
+    httpx_mock.add_response(status_code=201, json=fixture)
+    httpx_mock.add_response(status_code=201, json=fixture)
+
+    threads_before = threading.active_count()
+    first = okareo_client.register_model(name=fixture["name"], tags=fixture["tags"])
+    second = okareo_client.register_model(name=fixture["name"], tags=fixture["tags"])
+    assert threading.active_count() == threads_before
+
+    with mock.patch(
+        "okareo.model_under_test.add_datapoint_v0_datapoints_post"
+    ) as endpoint:
+        endpoint.sync = Mock()
+        first.add_data_point_async(feedback=0, context_token="SOME_CONTEXT_TOKEN")
+        second.add_data_point_async(feedback=1, context_token="SOME_CONTEXT_TOKEN")
+        exporter = first.exporter
+        assert second.exporter is exporter
+        assert exporter.worker_thread.is_alive()
+
+        assert first.shutdown(timeout=5)
+        assert endpoint.sync.call_count == 2
+        assert not exporter.done
+
+        assert second.shutdown(timeout=5)
+    exporter.worker_thread.join(timeout=5)
+    assert exporter.done
+    assert not exporter.worker_thread.is_alive()
+
+
+def test_queued_calls_are_flushed_at_interpreter_exit(tmp_path: Path) -> None:
+    sent = tmp_path / "sent.txt"
+    script = textwrap.dedent(f"""
+        from okareo.async_utils import AsyncProcessorMixin
+        from okareo_api_client.client import Client
+
+        client = Client(base_url="http://mocked.com")
+
+        class Processor(AsyncProcessorMixin):
+            def get_client(self):
+                return client
+
+            def get_api_key(self):
+                return "key"
+
+        def record(client, api_key, body):
+            with open({str(sent)!r}, "a") as out:
+                out.write(f"{{body}}\\n")
+
+        processor = Processor()
+        for i in range(5):
+            processor.async_call(record, i)
+        """)
+
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+
+    assert sorted(sent.read_text().split()) == ["0", "1", "2", "3", "4"]
@@ -0,0 +1,153 @@
+import json
+import re
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Set
+
+import httpx
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo.model_under_test import CustomModel, ModelInvocation, ModelUnderTest
+
+SCENARIO_ID = "6b1f0c2d-8e3a-4d5b-9c7e-1a2b3c4d5e6f"
+ROWS = [
+    {"id": str(uuid.uuid4()), "input": f"row-{i}", "result": "ok"} for i in range(6)
+]
+MUT_IDS = [str(uuid.uuid4()), str(uuid.uuid4())]
+# test run id per model, so responses do not depend on submission order
+RUN_IDS = {mut_id: str(uuid.uuid4()) for mut_id in MUT_IDS}
+
+
+class SlowModel(CustomModel):
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def invoke(self, input_value: Any) -> ModelInvocation:
+        with SlowModel.lock:
+            SlowModel.in_flight += 1
+            SlowModel.peak = max(SlowModel.peak, SlowModel.in_flight)
+        time.sleep(0.02)
+        with SlowModel.lock:
+            SlowModel.in_flight -= 1
+        return ModelInvocation(model_prediction=f"{self.name}-{input_value}")
+
+
+def run_json(mut_id: str, status: str = "RUNNING") -> Dict[str, Any]:
+    return {
+        "id": RUN_IDS[mut_id],
+        "name": f"run {mut_id}",
+        "project_id": GLOBAL_ID,
+        "mut_id": mut_id,
+        "scenario_set_id": SCENARIO_ID,
+        "status": status,
+    }
+
+
+@pytest.fixture
+def muts(okareo: Okareo, httpx_mock: HTTPXMock) -> List[ModelUnderTest]:
+    for mut_id in MUT_IDS:
+        httpx_mock.add_response(
+            url=f"{BASE}/v0/register_model",
+            json={
+                "id": mut_id,
+                "project_id": GLOBAL_ID,
+                "name": mut_id,
+                "tags": [],
+                "time_created": "foo",
+            },
+            status_code=201,
+        )
+    return [
+        okareo.register_model(name=mut_id, model=SlowModel(name=mut_id))
+        for mut_id in MUT_IDS
+    ]
+
+
+def mock_server(httpx_mock: HTTPXMock, finish: bool = True) -> Set[str]:
+    evaluated: Set[str] = set()
+
+    def by_mut_id(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.read())
+        return httpx.Response(201, json=run_json(body["mut_id"]))
+
+    def evaluate(request: httpx.Request) -> httpx.Response:
+        run_id = json.loads(request.read())["test_run_id"]
+        evaluated.add(run_id)
+        return httpx.Response(201, json=run_json(MUT_IDS[0]))
+
+    def test_run(request: httpx.Request) -> httpx.Response:
+        run_id = request.url.path.rsplit("/", 1)[1]
+        (mut_id,) = [m for m in MUT_IDS if RUN_IDS[m] == run_id]
+        # like the server, a run finishes once its evaluation was requested
+        done = finish and run_id in evaluated
+        return httpx.Response(
+            201, json=run_json(mut_id, "FINISHED" if done else "RUNNING")
+        )
+
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_data_points/{SCENARIO_ID}", json=ROWS
+    )
+    httpx_mock.add_callback(by_mut_id, url=f"{BASE}/v0/test_run/submit")
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/datapoints", json={"id": GLOBAL_ID}, status_code=201
+    )
+    httpx_mock.add_callback(evaluate, url=f"{BASE}/v0/evaluate")
+    httpx_mock.add_callback(test_run, url=re.compile(f"{BASE}/v0/test_runs/.*"))
+    return evaluated
+
+
+def paths(httpx_mock: HTTPXMock) -> List[str]:
+    return [r.url.path for r in httpx_mock.get_requests()]
+
+
+def test_runs_share_the_scenario_and_one_invocation_budget(
+    okareo: Okareo, muts: List[ModelUnderTest], httpx_mock: HTTPXMock
+) -> None:
+    mock_server(httpx_mock)
+    SlowModel.peak = 0
+
+    test_runs = okareo.run_tests_parallel(
+        [
+            (mut, {"scenario": SCENARIO_ID, "name": "compare", "max_concurrency": 4})
+            for mut in muts
+        ],
+        max_concurrency=2,
+        poll_interval=0.01,
+    )
+
+    assert [str(t.mut_id) for t in test_runs] == MUT_IDS
+    assert all(t.status == "FINISHED" for t in test_runs)
+    assert paths(httpx_mock).count(f"/v0/scenario_data_points/{SCENARIO_ID}") == 1
+    assert paths(httpx_mock).count("/v0/evaluate") == 2
+    assert SlowModel.peak == 2
+
+
+def test_timeout_names_the_unfinished_runs(
+    okareo: Okareo, muts: List[ModelUnderTest], httpx_mock: HTTPXMock
+) -> None:
+    evaluated = mock_server(httpx_mock, finish=False)
+
+    with pytest.raises(TimeoutError, match=RUN_IDS[MUT_IDS[0]]):
+        okareo.run_tests_parallel(
+            [(mut, {"scenario": SCENARIO_ID, "name": "compare"}) for mut in muts],
+            poll_interval=0.01,
+            timeout=0.1,
+        )
+    # let the background invocations finish while this test's mocks are live
+    while len(evaluated) < len(muts):
+        time.sleep(0.01)
+
+
+def test_bad_arguments_fail_before_any_request(
+    okareo: Okareo, muts: List[ModelUnderTest], httpx_mock: HTTPXMock
+) -> None:
+    requests_before = len(httpx_mock.get_requests())
+
+    with pytest.raises(TypeError, match="scenario"):
+        okareo.run_tests_parallel([(muts[0], {"scenerio": SCENARIO_ID, "name": "x"})])
+    assert len(httpx_mock.get_requests()) == requests_before
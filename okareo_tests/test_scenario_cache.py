@@ -0,0 +1,160 @@
+import asyncio
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID, mock_projects
+from pytest_httpx import HTTPXMock
+
+from okareo import AsyncOkareo, Okareo
+from okareo.model_under_test import CustomModel, ModelInvocation
+from okareo.scenario_cache import ScenarioDataPointCache
+
+SCENARIO_ID = "6b1f0c2d-8e3a-4d5b-9c7e-1a2b3c4d5e6f"
+POINTS_URL = f"{BASE}/v0/scenario_data_points/{SCENARIO_ID}"
+ROWS = [
+    {"id": str(uuid.uuid4()), "input": f"row-{i}", "result": "ok"} for i in range(5)
+]
+MUT_JSON = {
+    "id": GLOBAL_ID,
+    "project_id": GLOBAL_ID,
+    "name": "echo",
+    "tags": [],
+    "time_created": "foo",
+}
+
+
+def downloads(httpx_mock: HTTPXMock) -> List[object]:
+    return [r for r in httpx_mock.get_requests() if r.url == POINTS_URL]
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ScenarioDataPointCache:
+    return ScenarioDataPointCache(tmp_path)
+
+
+@pytest.fixture
+def okareo_kwargs(cache: ScenarioDataPointCache) -> Dict[str, Any]:
+    return {"scenario_cache": cache}
+
+
+def test_second_fetch_is_served_from_cache(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+
+    first = okareo.get_scenario_data_points(SCENARIO_ID)
+    second = okareo.get_scenario_data_points(SCENARIO_ID)
+
+    assert len(downloads(httpx_mock)) == 1
+    assert [p.input_ for p in second] == [p.input_ for p in first]
+
+
+def test_use_cache_false_downloads_again(okareo: Okareo, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS[:2])
+
+    okareo.get_scenario_data_points(SCENARIO_ID)
+    fresh = okareo.get_scenario_data_points(SCENARIO_ID, use_cache=False)
+
+    assert len(downloads(httpx_mock)) == 2
+    assert len(fresh) == 2
+    assert len(okareo.get_scenario_data_points(SCENARIO_ID)) == 2
+
+
+def test_disk_cache_outlives_the_client(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+    okareo.get_scenario_data_points(SCENARIO_ID)
+
+    later = AsyncOkareo(
+        "api-key", BASE, scenario_cache=ScenarioDataPointCache(tmp_path)
+    )
+    points = asyncio.run(later.get_scenario_data_points(SCENARIO_ID))
+
+    assert len(downloads(httpx_mock)) == 1
+    assert [str(p.id) for p in points] == [r["id"] for r in ROWS]
+
+
+def test_no_cache_by_default(httpx_mock: HTTPXMock) -> None:
+    mock_projects(httpx_mock)
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+    okareo = Okareo("api-key", BASE)
+
+    okareo.get_scenario_data_points(SCENARIO_ID)
+    okareo.get_scenario_data_points(SCENARIO_ID)
+
+    assert okareo.scenario_cache is None
+    assert len(downloads(httpx_mock)) == 2
+
+
+class EchoModel(CustomModel):
+    def invoke(self, input_value: Any) -> ModelInvocation:
+        return ModelInvocation(model_prediction=input_value)
+
+
+def test_registered_model_shares_the_client_cache(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/register_model", json=MUT_JSON, status_code=201
+    )
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+    okareo.get_scenario_data_points(SCENARIO_ID)
+
+    mut = okareo.register_model(name="echo", model=EchoModel(name="echo"))
+    points = mut._get_scenario_data_points(SCENARIO_ID)
+
+    assert len(points) == len(ROWS)
+    assert len(downloads(httpx_mock)) == 1
+
+
+def test_least_recently_used_files_are_evicted(
+    cache: ScenarioDataPointCache, okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+    points = okareo.get_scenario_data_points(SCENARIO_ID)
+    (first_file,) = cache.directory.glob("scenarios/*/*/*.json.gz")
+    cache.max_disk_bytes = first_file.stat().st_size
+
+    cache.put(BASE, "api-key", str(uuid.uuid4()), points)
+
+    assert not first_file.exists()
+    assert len(list(cache.directory.glob("scenarios/*/*/*.json.gz"))) == 1
+
+
+def test_clients_with_other_api_keys_do_not_share_entries(
+    okareo: Okareo, cache: ScenarioDataPointCache, httpx_mock: HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+    okareo.get_scenario_data_points(SCENARIO_ID)
+
+    other = Okareo("other-key", BASE, scenario_cache=cache, lazy=True)
+    other.get_scenario_data_points(SCENARIO_ID)
+
+    assert len(downloads(httpx_mock)) == 2
+    assert not any("api-key" in str(path) for path in cache.directory.rglob("*"))
+
+
+def test_run_test_can_bypass_the_cache(okareo: Okareo, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/register_model", json=MUT_JSON, status_code=201
+    )
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS)
+    httpx_mock.add_response(url=POINTS_URL, json=ROWS[:2])
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/test_run",
+        json={"id": GLOBAL_ID, "name": "run", "project_id": GLOBAL_ID},
+        status_code=201,
+    )
+    okareo.get_scenario_data_points(SCENARIO_ID)
+    mut = okareo.register_model(name="echo", model=EchoModel(name="echo"))
+
+    mut.run_test(scenario=SCENARIO_ID, name="run", use_cache=False)
+
+    assert len(downloads(httpx_mock)) == 2
+    assert len(okareo.get_scenario_data_points(SCENARIO_ID)) == 2
@@ -0,0 +1,90 @@
+import gzip
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+from okareo_tests.conftest import BASE
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+
+SCENARIO_ID = "6b1f0c2d-8e3a-4d5b-9c7e-1a2b3c4d5e6f"
+DOWNLOAD_URL = f"{BASE}/v0/scenario_sets_download/{SCENARIO_ID}"
+JSONL = b"".join(
+    json.dumps({"input": f"q{i}", "result": f"a{i}"}).encode() + b"\n"
+    for i in range(200)
+)
+DISPOSITION = {"content-disposition": 'attachment; filename="my set.jsonl"'}
+
+
+def test_download_streams_gzip_to_the_named_file(
+    okareo: Okareo,
+    httpx_mock: HTTPXMock,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(
+            200,
+            stream=httpx.ByteStream(gzip.compress(JSONL)),
+            headers={**DISPOSITION, "content-encoding": "gzip"},
+        ),
+        url=DOWNLOAD_URL,
+    )
+
+    downloaded = okareo.download_scenario_set(SCENARIO_ID)
+
+    assert downloaded == "my set.jsonl"
+    assert downloaded.name == "my set.jsonl"
+    assert (tmp_path / "my set.jsonl").read_bytes() == JSONL
+
+
+def test_resume_requests_only_the_missing_bytes(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    target = tmp_path / "partial.jsonl"
+    target.write_bytes(JSONL[:1000])
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        start = int(request.headers["range"].split("=")[1].rstrip("-"))
+        assert request.headers["accept-encoding"] == "identity"
+        return httpx.Response(206, content=JSONL[start:], headers=DISPOSITION)
+
+    httpx_mock.add_callback(respond, url=DOWNLOAD_URL)
+
+    downloaded = okareo.download_scenario_set(SCENARIO_ID, str(target), resume=True)
+
+    assert downloaded == str(target)
+    assert target.read_bytes() == JSONL
+
+
+def test_resume_restarts_when_range_is_ignored(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    target = tmp_path / "partial.jsonl"
+    target.write_bytes(b"stale")
+    httpx_mock.add_response(url=DOWNLOAD_URL, content=JSONL, headers=DISPOSITION)
+
+    okareo.download_scenario_set(SCENARIO_ID, str(target), resume=True)
+
+    assert target.read_bytes() == JSONL
+
+
+def test_iter_scenario_set_rows_parses_jsonl(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    httpx_mock.add_response(url=DOWNLOAD_URL, content=JSONL, headers=DISPOSITION)
+
+    rows = list(okareo.iter_scenario_set_rows(SCENARIO_ID))
+
+    assert len(rows) == 200
+    assert rows[7] == {"input": "q7", "result": "a7"}
+
+
+def test_failed_download_raises(okareo: Okareo, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=DOWNLOAD_URL, status_code=404, text="not found")
+
+    with pytest.raises(ValueError, match="404 not found"):
+        list(okareo.iter_scenario_set_rows(SCENARIO_ID))
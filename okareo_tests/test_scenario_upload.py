@@ -0,0 +1,188 @@
+import gzip
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import httpx
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo.okareo import SeedDataRow
+
+SCENARIO_JSON = {
+    "project_id": GLOBAL_ID,
+    "scenario_id": "6b1f0c2d-8e3a-4d5b-9c7e-1a2b3c4d5e6f",
+    "time_created": "2024-01-01T00:00:00",
+    "type": "SEED",
+}
+ROWS: List[SeedDataRow] = [{"input": f"q{i}", "result": f"a{i}"} for i in range(500)]
+JSONL = "".join(json.dumps(row) + "\n" for row in ROWS).encode()
+
+
+def mock_upload(httpx_mock: HTTPXMock) -> List[Dict[str, bytes]]:
+    uploads: List[Dict[str, bytes]] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        uploads.append({"content": request.read()})
+        return httpx.Response(200, json=SCENARIO_JSON)
+
+    httpx_mock.add_callback(respond, url=f"{BASE}/v0/scenario_sets_upload")
+    return uploads
+
+
+def test_gzip_file_is_uploaded_decompressed(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    uploads = mock_upload(httpx_mock)
+    path = tmp_path / "rows.jsonl.gz"
+    path.write_bytes(gzip.compress(JSONL))
+
+    okareo.upload_scenario_set(scenario_name="gz", file_path=str(path))
+
+    (upload,) = uploads
+    assert b'filename="rows.jsonl"' in upload["content"]
+    assert JSONL in upload["content"]
+
+
+@pytest.mark.parametrize(
+    "bad_line, reason",
+    [
+        ("{not json", "not valid JSON"),
+        ('["a list"]', 'an "input" key'),
+        ('{"result": "no input"}', 'an "input" key'),
+    ],
+)
+def test_invalid_row_fails_with_its_line_number(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path, bad_line: str, reason: str
+) -> None:
+    uploads = mock_upload(httpx_mock)
+    path = tmp_path / "rows.jsonl"
+    path.write_bytes(JSONL + bad_line.encode() + b"\n")
+
+    with pytest.raises(ValueError, match=f"line {len(ROWS) + 1}: .*{reason}"):
+        okareo.upload_scenario_set(scenario_name="bad", file_path=str(path))
+    assert uploads == []
+
+
+def test_row_size_limit(okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path) -> None:
+    mock_upload(httpx_mock)
+    path = tmp_path / "rows.jsonl"
+    path.write_bytes(JSONL + json.dumps({"input": "x" * 5000}).encode())
+
+    with pytest.raises(ValueError, match="longer than 1000 bytes"):
+        okareo.upload_scenario_set(
+            scenario_name="big", file_path=str(path), max_line_bytes=1000
+        )
+
+
+def test_validation_can_be_skipped(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    uploads = mock_upload(httpx_mock)
+    path = tmp_path / "rows.jsonl"
+    path.write_bytes(b"{not json\n")
+
+    okareo.upload_scenario_set(scenario_name="raw", file_path=str(path), validate=False)
+
+    assert b"{not json" in uploads[0]["content"]
+
+
+def test_large_file_is_split_into_ordered_appends(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    uploads = mock_upload(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_sets/{SCENARIO_JSON['scenario_id']}",
+        json=SCENARIO_JSON,
+        status_code=201,
+    )
+    path = tmp_path / "rows.jsonl.gz"
+    path.write_bytes(gzip.compress(JSONL))
+
+    okareo.upload_scenario_set(scenario_name="big", file_path=str(path), chunk_rows=200)
+
+    (upload,) = uploads
+    first = "".join(json.dumps(row) + "\n" for row in ROWS[:200]).encode()
+    assert first in upload["content"]
+    assert json.dumps(ROWS[200]).encode() not in upload["content"]
+    appends = [r for r in httpx_mock.get_requests() if r.method == "PUT"]
+    assert [
+        [row["input"] for row in json.loads(r.content)["seed_data"]] for r in appends
+    ] == [[row["input"] for row in ROWS[start : start + 200]] for start in (200, 400)]
+
+
+def test_unvalidated_append_row_fails_with_its_line_number(
+    okareo: Okareo, httpx_mock: HTTPXMock, tmp_path: Path
+) -> None:
+    mock_upload(httpx_mock)
+    path = tmp_path / "rows.jsonl"
+    path.write_bytes(JSONL[: JSONL.index(b"\n", 0) + 1] + b"{not json\n")
+
+    with pytest.raises(ValueError, match="rows.jsonl, line 2: not valid JSON"):
+        okareo.upload_scenario_set(
+            scenario_name="raw", file_path=str(path), validate=False, chunk_rows=1
+        )
+
+
+def test_chunk_rows_needs_a_jsonl_file(okareo: Okareo, tmp_path: Path) -> None:
+    path = tmp_path / "rows.json"
+    path.write_text(json.dumps(ROWS))
+
+    with pytest.raises(ValueError, match="chunk_rows"):
+        okareo.upload_scenario_set(
+            scenario_name="json", file_path=str(path), chunk_rows=200
+        )
+
+
+def test_create_from_iterable_appends_chunks(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    scenario_url = f"{BASE}/v0/scenario_sets/{SCENARIO_JSON['scenario_id']}"
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_sets", json=SCENARIO_JSON, status_code=201
+    )
+    httpx_mock.add_response(url=scenario_url, json=SCENARIO_JSON, status_code=201)
+    pulled = 0
+
+    def rows() -> Iterator[SeedDataRow]:
+        nonlocal pulled
+        for row in ROWS:
+            pulled += 1
+            yield row
+
+    scenario = okareo.create_scenario_set_from_iterable(
+        "generated", rows(), chunk_size=200, max_workers=2
+    )
+
+    assert str(scenario.scenario_id) == SCENARIO_JSON["scenario_id"]
+    assert pulled == len(ROWS)
+    (create,) = [r for r in httpx_mock.get_requests() if r.method == "POST"]
+    appends = [r for r in httpx_mock.get_requests() if r.method == "PUT"]
+    sent = json.loads(create.content)["seed_data"]
+    for request in appends:
+        sent += json.loads(request.content)["seed_data"]
+    assert len(appends) == 2
+    assert [row["input"] for row in sent] == [r["input"] for r in ROWS]
+
+
+def test_create_from_iterable_raises_on_a_failed_append(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_sets", json=SCENARIO_JSON, status_code=201
+    )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_sets/{SCENARIO_JSON['scenario_id']}",
+        json={"detail": "too big"},
+        status_code=400,
+    )
+
+    with pytest.raises(TypeError, match="too big"):
+        okareo.create_scenario_set_from_iterable("generated", ROWS, chunk_size=400)
+
+
+def test_create_from_empty_iterable_is_rejected(okareo: Okareo) -> None:
+    with pytest.raises(ValueError, match="Non-empty seed data"):
+        okareo.create_scenario_set_from_iterable("empty", iter([]))
@@ -0,0 +1,140 @@
+import concurrent.futures
+import logging
+import threading
+import time
+import uuid
+from typing import Any, List
+
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID, mock_projects
+from pytest_httpx import HTTPXMock
+
+from okareo import Okareo
+from okareo.model_under_test import (
+    CustomModel,
+    ModelInvocation,
+    ModelUnderTest,
+    SubmittedTestRun,
+)
+from okareo_api_client.models.test_run_item import TestRunItem
+
+RUN_ID = "8a2b45f1-9c63-4b21-b7d8-1f2e3a4b5c6d"
+SCENARIO_ID = "6b1f0c2d-8e3a-4d5b-9c7e-1a2b3c4d5e6f"
+ROWS = [
+    {"id": str(uuid.uuid4()), "input": f"row-{i}", "result": "ok"} for i in range(5)
+]
+
+
+def run_json(status: str) -> dict:
+    return {"id": RUN_ID, "name": "run", "project_id": GLOBAL_ID, "status": status}
+
+
+class FlakyModel(CustomModel):
+    def invoke(self, input_value: Any) -> ModelInvocation:
+        if input_value == "row-3":
+            raise RuntimeError("model down")
+        return ModelInvocation(model_prediction=input_value)
+
+
+class GatedModel(CustomModel):
+    started = threading.Event()
+    release = threading.Event()
+
+    def invoke(self, input_value: Any) -> ModelInvocation:
+        GatedModel.started.set()
+        GatedModel.release.wait(5)
+        return ModelInvocation(model_prediction=input_value)
+
+
+def register(httpx_mock: HTTPXMock, model: CustomModel) -> ModelUnderTest:
+    mock_projects(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/register_model",
+        json={
+            "id": GLOBAL_ID,
+            "project_id": GLOBAL_ID,
+            "name": model.name,
+            "tags": [],
+            "time_created": "foo",
+        },
+        status_code=201,
+    )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/test_run/submit", json=run_json("RUNNING"), status_code=201
+    )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/scenario_data_points/{SCENARIO_ID}", json=ROWS
+    )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/datapoints", json={"id": GLOBAL_ID}, status_code=201
+    )
+    return Okareo("api-key", BASE).register_model(name=model.name, model=model)
+
+
+def test_result_waits_for_invocations_and_evaluation(httpx_mock: HTTPXMock) -> None:
+    mut = register(httpx_mock, FlakyModel(name="flaky"))
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/evaluate", json=run_json("RUNNING"), status_code=201
+    )
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/test_runs/{RUN_ID}",
+        json=run_json("FINISHED"),
+        status_code=201,
+    )
+
+    submitted = mut.submit_test(scenario=SCENARIO_ID, name="run")
+
+    assert isinstance(submitted, TestRunItem) and isinstance(
+        submitted, SubmittedTestRun
+    )
+    assert str(submitted.id) == RUN_ID
+    final = submitted.result(timeout=10, poll_interval=0.01)
+    assert final.status == "FINISHED"
+    assert submitted.done() and submitted.exception() is None
+    progress = submitted.invocations
+    assert (progress.total, progress.invoked, progress.failed) == (5, 5, 1)
+
+
+def run_failures(caplog: pytest.LogCaptureFixture) -> List[logging.LogRecord]:
+    return [r for r in caplog.records if r.name == "okareo.model_under_test"]
+
+
+def test_background_errors_surface(
+    httpx_mock: HTTPXMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    mut = register(httpx_mock, FlakyModel(name="flaky"))
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/evaluate", json={"detail": "bad checks"}, status_code=400
+    )
+
+    submitted = mut.submit_test(scenario=SCENARIO_ID, name="run")
+
+    with pytest.raises(TypeError, match="bad checks"):
+        submitted.result(timeout=10)
+    assert isinstance(submitted.exception(), TypeError)
+    assert not submitted.cancelled()
+    # the done-callback may still be running on the worker thread
+    deadline = time.monotonic() + 5
+    while not run_failures(caplog) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    (record,) = run_failures(caplog)
+    assert record.getMessage().startswith(f"Submitted test run {RUN_ID} failed")
+
+
+def test_cancel_stops_invoking_and_skips_evaluation(httpx_mock: HTTPXMock) -> None:
+    mut = register(httpx_mock, GatedModel(name="gated"))
+    GatedModel.started.clear()
+    GatedModel.release.clear()
+
+    submitted = mut.submit_test(scenario=SCENARIO_ID, name="run")
+    assert GatedModel.started.wait(5)
+    assert submitted.running()
+
+    assert submitted.cancel()
+    GatedModel.release.set()
+
+    with pytest.raises(concurrent.futures.CancelledError):
+        submitted.result(timeout=10)
+    assert submitted.cancelled()
+    assert submitted.invocations.invoked == 1
+    assert not [r for r in httpx_mock.get_requests() if r.url.path == "/v0/evaluate"]
@@ -0,0 +1,166 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from okareo_tests.conftest import BASE, GLOBAL_ID, mock_projects
+from pytest_httpx import HTTPXMock
+
+from okareo import AsyncOkareo, Okareo
+from okareo.model_under_test import CustomModel, ModelInvocation
+from okareo.polling import Backoff
+
+RUN_A = "8a2b45f1-9c63-4b21-b7d8-1f2e3a4b5c6d"
+RUN_B = "6b1f0c2d-8e3a-4d5b-9c7e-1a2b3c4d5e6f"
+MUT_JSON = {
+    "id": GLOBAL_ID,
+    "project_id": GLOBAL_ID,
+    "name": "echo",
+    "tags": [],
+    "time_created": "foo",
+}
+
+
+class EchoModel(CustomModel):
+    def invoke(self, input_value: Any) -> ModelInvocation:
+        return ModelInvocation(model_prediction=input_value)
+
+
+def run_json(test_run_id: str, status: str) -> Dict[str, Any]:
+    return {
+        "id": test_run_id,
+        "name": "run",
+        "project_id": GLOBAL_ID,
+        "mut_id": GLOBAL_ID,
+        "status": status,
+    }
+
+
+def mock_test_run(httpx_mock: HTTPXMock, test_run_id: str, *statuses: str) -> None:
+    for status in statuses:
+        httpx_mock.add_response(
+            url=f"{BASE}/v0/test_runs/{test_run_id}",
+            json=run_json(test_run_id, status),
+            status_code=201,
+        )
+
+
+def mock_conditional_polls(httpx_mock: HTTPXMock) -> List[httpx.Request]:
+    """RUNNING with an ETag, then unchanged (304) once, then FINISHED."""
+    requests: List[httpx.Request] = []
+    responses = [
+        httpx.Response(201, json=run_json(RUN_A, "RUNNING"), headers={"etag": "v1"}),
+        httpx.Response(304),
+        httpx.Response(201, json=run_json(RUN_A, "FINISHED"), headers={"etag": "v2"}),
+    ]
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    httpx_mock.add_callback(respond, url=f"{BASE}/v0/test_runs/{RUN_A}")
+    return requests
+
+
+def test_wait_uses_conditional_requests(okareo: Okareo, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/register_model", json=MUT_JSON, status_code=201
+    )
+    mut = okareo.register_model(name="echo", model=EchoModel(name="echo"))
+    requests = mock_conditional_polls(httpx_mock)
+
+    test_run = mut.wait_for_test_run(RUN_A, poll_interval=0.01)
+
+    assert test_run.status == "FINISHED"
+    assert [r.headers.get("if-none-match") for r in requests] == [None, "v1", "v1"]
+
+
+def test_wait_times_out(okareo: Okareo, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/register_model", json=MUT_JSON, status_code=201
+    )
+    mut = okareo.register_model(name="echo", model=EchoModel(name="echo"))
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/test_runs/{RUN_A}",
+        json=run_json(RUN_A, "RUNNING"),
+        status_code=201,
+    )
+
+    with pytest.raises(TimeoutError, match=RUN_A):
+        mut.wait_for_test_run(RUN_A, timeout=0.05, poll_interval=0.01)
+
+
+def test_async_wait(httpx_mock: HTTPXMock) -> None:
+    mock_projects(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/register_model", json=MUT_JSON, status_code=201
+    )
+    requests = mock_conditional_polls(httpx_mock)
+
+    async def wait() -> Any:
+        okareo = AsyncOkareo("api-key", BASE)
+        mut = await okareo.register_model(name="echo", model=EchoModel(name="echo"))
+        return await mut.wait_for_test_run(RUN_A, poll_interval=0.01)
+
+    test_run = asyncio.run(wait())
+
+    assert test_run.status == "FINISHED"
+    assert len(requests) == 3
+
+
+def test_wait_for_test_runs_checks_all_runs_per_request(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    mock_test_run(httpx_mock, RUN_A, "RUNNING", "FINISHED")
+    mock_test_run(httpx_mock, RUN_B, "RUNNING", "FAILED")
+    rounds = [
+        [run_json(RUN_A, "FINISHED"), run_json(RUN_B, "RUNNING")],
+        [run_json(RUN_A, "FINISHED"), run_json(RUN_B, "FAILED")],
+    ]
+    for rows in rounds:
+        httpx_mock.add_response(url=f"{BASE}/v0/find_test_runs", json=rows)
+
+    test_runs = okareo.wait_for_test_runs([RUN_B, RUN_A], poll_interval=0.01)
+
+    assert [(str(t.id), t.status) for t in test_runs] == [
+        (RUN_B, "FAILED"),
+        (RUN_A, "FINISHED"),
+    ]
+    requests = httpx_mock.get_requests()
+    listings = [r for r in requests if r.url.path == "/v0/find_test_runs"]
+    assert len(listings) == 2
+    assert all(json.loads(r.read())["mut_id"] == GLOBAL_ID for r in listings)
+    assert [r.url.path for r in requests].count(f"/v0/test_runs/{RUN_A}") == 2
+
+
+def test_wait_for_test_runs_fetches_runs_missing_from_the_listing(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    mock_test_run(httpx_mock, RUN_A, "RUNNING", "FINISHED")
+    httpx_mock.add_response(url=f"{BASE}/v0/find_test_runs", json=[])
+
+    (test_run,) = okareo.wait_for_test_runs([RUN_A], poll_interval=0.01)
+
+    assert test_run.status == "FINISHED"
+
+
+def test_wait_for_test_runs_raises_on_an_unknown_run(
+    okareo: Okareo, httpx_mock: HTTPXMock
+) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE}/v0/test_runs/{RUN_A}", status_code=404, json={"detail": "no"}
+    )
+
+    with pytest.raises(TypeError, match="no"):
+        okareo.wait_for_test_runs([RUN_A], poll_interval=0.01)
+
+
+def test_backoff_doubles_up_to_the_maximum() -> None:
+    backoff = Backoff(1.0, 5.0, jitter=0.1)
+
+    delays = [backoff.next_delay() for _ in range(5)]
+
+    for delay, expected in zip(delays, [1, 2, 4, 5, 5]):
+        assert delay is not None and 0.9 * expected <= delay <= 1.1 * expected
+    assert Backoff(1.0, 5.0, timeout=0).next_delay() is None
@@ -1,4 +1,10 @@
-from .model_under_test import ModelUnderTest
-from .okareo import BaseGenerationSchema, Okareo
+from .model_under_test import AsyncModelUnderTest, ModelUnderTest
+from .okareo import AsyncOkareo, BaseGenerationSchema, Okareo
 
-__all__ = ("Okareo", "ModelUnderTest", "BaseGenerationSchema")
+__all__ = (
+    "Okareo",
+    "AsyncOkareo",
+    "ModelUnderTest",
+    "AsyncModelUnderTest",
+    "BaseGenerationSchema",
+)
@@ -1,29 +1,310 @@
+import asyncio
+import atexit
 import collections
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import random
 import threading
 import time
+import weakref
 from abc import abstractmethod
-from typing import Any, Callable, Deque, Tuple, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from okareo_api_client.client import Client
 
+logger = logging.getLogger(__name__)
+
 _DEFAULT_MAX_QUEUE_SIZE = 2048
 _DEFAULT_SCHEDULE_DELAY_MILLIS = 1000
 _DEFAULT_MAX_BATCH_SIZE = 512
 _DEFAULT_ASYNC_CALL_RETRIES = 5
+_DEFAULT_RETRY_BASE_DELAY_MILLIS = 100
+_DEFAULT_EXPORT_WORKERS = 2
+_DEFAULT_BULK_CHUNK_SIZE = 64
+_DEFAULT_BULK_MAX_WORKERS = 8
+_ATEXIT_FLUSH_TIMEOUT = 10.0
 
+Entry = Tuple[Callable, Any]
 
-class AsyncProcessorMixin:
-    def __init__(self, name: str = "AsyncProcessor") -> None:
-        self.queue: Deque[Tuple[Callable, Any]] = collections.deque(
-            [], _DEFAULT_MAX_QUEUE_SIZE
-        )
+
+class BatchExporter:
+    """Background exporter for fire-and-forget API calls, modeled on
+    OpenTelemetry's BatchSpanProcessor.
+
+    Calls are queued (up to `max_queue_size`; anything beyond is dropped and
+    counted) and a scheduler thread hands them to `max_workers` sender threads in
+    batches of up to `max_batch_size` — as soon as a full batch is queued, and at
+    least every `schedule_delay_millis` otherwise. A batch is only taken off the
+    queue when a sender is idle, so memory stays bounded. Failed calls of a batch are
+    re-queued with jittered exponential backoff instead of sleeping in the sender,
+    so one bad batch never stalls the rest; a call is given up after
+    `max_attempts`. Counters are available from `metrics()`. No thread is started
+    until the first `submit`.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        api_key: str,
+        name: str = "AsyncProcessor",
+        max_queue_size: int = _DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = _DEFAULT_MAX_BATCH_SIZE,
+        schedule_delay_millis: float = _DEFAULT_SCHEDULE_DELAY_MILLIS,
+        max_workers: int = _DEFAULT_EXPORT_WORKERS,
+        max_attempts: int = _DEFAULT_ASYNC_CALL_RETRIES,
+        retry_base_delay_millis: float = _DEFAULT_RETRY_BASE_DELAY_MILLIS,
+    ) -> None:
+        if max_batch_size > max_queue_size:
+            raise ValueError(
+                "max_batch_size must be less than or equal to max_queue_size"
+            )
+        self.client = client
+        self.api_key = api_key
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.schedule_delay = schedule_delay_millis / 1e3
+        self.max_workers = max(1, max_workers)
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay_millis / 1e3
+
+        self.queue: Deque[Entry] = collections.deque()
+        # (ready_at, tiebreak, attempt, batch) for batches waiting on a retry
+        self._retries: List[Tuple[float, int, int, List[Entry]]] = []
+        self._retry_seq = itertools.count()
+        self._in_flight = 0
+        self._busy_senders = 0
+        self._flush_requests = 0
         self.done = False
-        self._data_dropped = False
+        self._counters: Dict[str, int] = collections.Counter()
+        self._drop_warned = False
+        self.condition = threading.Condition(threading.Lock())
+        self._senders = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"{name}-sender"
+        )
         self.worker_thread = threading.Thread(
             name=name, target=self.worker, daemon=True
         )
-        self.condition = threading.Condition(threading.Lock())
-        self.worker_thread.start()
+
+    def metrics(self) -> Dict[str, int]:
+        """Snapshot of the exporter counters: enqueued, exported, dropped, retried,
+        failed (given up after the last attempt) and queued (waiting right now)."""
+        with self.condition:
+            snapshot = {
+                key: self._counters[key]
+                for key in ("enqueued", "exported", "dropped", "retried", "failed")
+            }
+            snapshot["queued"] = (
+                len(self.queue)
+                + sum(len(batch) for *_, batch in self._retries)
+                + self._in_flight
+            )
+        return snapshot
+
+    def submit(self, func: Callable, data: Any) -> bool:
+        """Queue one call. Returns False when the queue is full and it was dropped."""
+        with self.condition:
+            if self.done:
+                self._counters["dropped"] += 1
+                return False
+            if len(self.queue) >= self.max_queue_size:
+                self._counters["dropped"] += 1
+                if not self._drop_warned:
+                    logger.warning(
+                        "Okareo export queue is full (%d); data points are being dropped.",
+                        self.max_queue_size,
+                    )
+                    self._drop_warned = True
+                return False
+            if not self.worker_thread.is_alive():
+                self.worker_thread.start()
+            self.queue.append((func, data))
+            self._counters["enqueued"] += 1
+            if len(self.queue) >= self.max_batch_size:
+                self.condition.notify_all()
+        return True
+
+    def _perform_call(self, func: Callable, data: Any) -> Any:
+        return func(client=self.client, api_key=self.api_key, body=data)
+
+    def _backoff(self, attempt: int) -> float:
+        # .1, .2, .4, .8, ... with jitter so a burst of failures spreads out
+        return self.retry_base_delay * 2.0 ** (attempt - 1) * random.uniform(0.5, 1.0)
+
+    def _export(self, batch: List[Entry], attempt: int) -> None:
+        failed: List[Entry] = []
+        for func, data in batch:
+            try:
+                self._perform_call(func, data)
+            except Exception as e:
+                logger.warning(
+                    "Okareo export call failed (attempt %d of %d): %s",
+                    attempt,
+                    self.max_attempts,
+                    e,
+                )
+                failed.append((func, data))
+        with self.condition:
+            self._counters["exported"] += len(batch) - len(failed)
+            if failed and attempt < self.max_attempts:
+                self._counters["retried"] += len(failed)
+                heapq.heappush(
+                    self._retries,
+                    (
+                        time.monotonic() + self._backoff(attempt),
+                        next(self._retry_seq),
+                        attempt + 1,
+                        failed,
+                    ),
+                )
+            else:
+                self._counters["failed"] += len(failed)
+            self._in_flight -= len(batch)
+            self._busy_senders -= 1
+            self.condition.notify_all()
+
+    def _ready(self, now: float) -> bool:
+        if self._busy_senders >= self.max_workers:
+            return False
+        if len(self.queue) >= self.max_batch_size:
+            return True
+        if self.queue and (self._flush_requests or self.done):
+            return True
+        return bool(self._retries) and self._retries[0][0] <= now
+
+    def _take_batches(self, now: float) -> List[Tuple[int, List[Entry]]]:
+        # never hand out more batches than there are idle senders, so memory
+        # stays bounded by the queue plus one batch per sender
+        idle = self.max_workers - self._busy_senders
+        batches: List[Tuple[int, List[Entry]]] = []
+        while len(batches) < idle and self._retries and self._retries[0][0] <= now:
+            _, _, attempt, batch = heapq.heappop(self._retries)
+            batches.append((attempt, batch))
+        while len(batches) < idle and self.queue:
+            size = min(self.max_batch_size, len(self.queue))
+            batches.append((1, [self.queue.popleft() for _ in range(size)]))
+        self._in_flight += sum(len(batch) for _, batch in batches)
+        self._busy_senders += len(batches)
+        return batches
+
+    def worker(self) -> None:
+        next_export = time.monotonic() + self.schedule_delay
+        while True:
+            with self.condition:
+                now = time.monotonic()
+                while not self._ready(now) and now < next_export:
+                    if self.done and not self.queue and not self._retries:
+                        return
+                    timeout = next_export - now
+                    if self._retries:
+                        timeout = min(timeout, self._retries[0][0] - now)
+                    self.condition.wait(max(timeout, 0))
+                    now = time.monotonic()
+                if now >= next_export:
+                    next_export = now + self.schedule_delay
+                batches = self._take_batches(now)
+            for attempt, batch in batches:
+                try:
+                    self._senders.submit(self._export, batch, attempt)
+                except RuntimeError:
+                    # the sender pool refuses work once the interpreter is shutting
+                    # down; drain in this thread so the atexit flush still completes
+                    self._export(batch, attempt)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Export everything queued so far and wait for it, without stopping the
+        exporter. Returns False if `timeout` (seconds) expired first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            self._flush_requests += 1
+            self.condition.notify_all()
+            try:
+                while self.queue or self._retries or self._in_flight:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self.condition.wait(remaining)
+                return True
+            finally:
+                self._flush_requests -= 1
+
+    def stop(self) -> None:
+        """Stop accepting calls without waiting; the scheduler sends what is
+        already queued and then exits."""
+        with self.condition:
+            self.done = True
+            self.condition.notify_all()
+        self._senders.shutdown(wait=False)
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Flush, then stop the scheduler and sender threads."""
+        flushed = self.flush(timeout)
+        with self.condition:
+            self.done = True
+            self.condition.notify_all()
+        if self.worker_thread.is_alive():
+            self.worker_thread.join(timeout)
+        self._senders.shutdown(wait=flushed)
+        return flushed
+
+
+# One exporter per (client, api key), shared by every ModelUnderTest using them.
+# Each entry is [exporter, reference count].
+_shared_exporters: Dict[Tuple[int, str], List[Any]] = {}
+_shared_exporters_lock = threading.Lock()
+
+
+def acquire_exporter(client: Client, api_key: str) -> BatchExporter:
+    """Return the process-wide exporter for `client` and `api_key`, creating it
+    if needed. Every call must be paired with `release_exporter`."""
+    key = (id(client), api_key)
+    with _shared_exporters_lock:
+        entry = _shared_exporters.get(key)
+        if entry is None or entry[0].done:
+            entry = [BatchExporter(client, api_key, name="OkareoExporter"), 0]
+            _shared_exporters[key] = entry
+        entry[1] += 1
+        exporter: BatchExporter = entry[0]
+        return exporter
+
+
+def release_exporter(exporter: BatchExporter) -> None:
+    """Drop one reference to a shared exporter; the last one stops it."""
+    key = (id(exporter.client), exporter.api_key)
+    with _shared_exporters_lock:
+        entry = _shared_exporters.get(key)
+        if entry is None or entry[0] is not exporter:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _shared_exporters[key]
+    exporter.stop()
+
+
+@atexit.register
+def _shutdown_shared_exporters() -> None:
+    with _shared_exporters_lock:
+        exporters = [entry[0] for entry in _shared_exporters.values()]
+        _shared_exporters.clear()
+    deadline = time.monotonic() + _ATEXIT_FLUSH_TIMEOUT
+    for exporter in exporters:
+        exporter.shutdown(max(deadline - time.monotonic(), 0))
+
+
+class AsyncProcessorMixin:
+    """Fire-and-forget API calls through the exporter shared by every user of the
+    same client and API key. The exporter is acquired on the first `async_call`
+    and released by `shutdown` (or when the object is garbage collected), so
+    creating an instance costs no thread."""
+
+    def __init__(self) -> None:
+        self._exporter: Optional[BatchExporter] = None
+        self._exporter_lock = threading.Lock()
+        self._exporter_finalizer: Optional[weakref.finalize] = None
 
     @abstractmethod
     def get_client(self) -> Client:
@@ -33,58 +314,256 @@ class AsyncProcessorMixin:
     def get_api_key(self) -> str:
         """Get Okareo API key to use"""
 
+    @property
+    def exporter(self) -> BatchExporter:
+        with self._exporter_lock:
+            if self._exporter is None:
+                self._exporter = acquire_exporter(self.get_client(), self.get_api_key())
+                self._exporter_finalizer = weakref.finalize(
+                    self, release_exporter, self._exporter
+                )
+                # at exit, leave the exporter to _shutdown_shared_exporters,
+                # which flushes it; this finalizer would stop it first
+                self._exporter_finalizer.atexit = False
+            return self._exporter
+
     def async_call(self, func: Callable, data: Any) -> bool:
-        if len(self.queue) == _DEFAULT_MAX_QUEUE_SIZE:
-            if not self._data_dropped:
-                print("Queue is full, data points might get dropped.")
-            self._data_dropped = True
-        self.queue.append((func, data))
+        return self.exporter.submit(func, data)
 
-        if len(self.queue) >= int(_DEFAULT_MAX_BATCH_SIZE):
-            with self.condition:
-                self.condition.notify()
-        return True
+    def get_async_metrics(self) -> Dict[str, int]:
+        """Counters of the shared background exporter (see
+        `BatchExporter.metrics`)."""
+        return self.exporter.metrics()
 
-    def _perform_call(self, func: Callable, data: Any) -> Union[Any, None]:
-        attempts = 0
-        while attempts < _DEFAULT_ASYNC_CALL_RETRIES:
-            try:
-                return func(
-                    client=self.get_client(),
-                    api_key=self.get_api_key(),
-                    body=data,
-                )
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued call has been sent. The exporter keeps running,
+        so this can be called any number of times."""
+        if self._exporter is None:
+            return True
+        return self._exporter.flush(timeout)
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Flush and release the shared exporter; it stops once no one else
+        holds it. A later `async_call` acquires it again."""
+        with self._exporter_lock:
+            exporter, finalizer = self._exporter, self._exporter_finalizer
+            self._exporter = self._exporter_finalizer = None
+        if exporter is None:
+            return True
+        flushed = exporter.flush(timeout)
+        if finalizer is not None:
+            finalizer()
+        return flushed
+
+
+class BulkCallBuffer:
+    """Buffers request bodies for `func` and sends them in chunks.
+
+    The API has no bulk endpoint for these calls, so each flushed chunk fans out
+    over a bounded thread pool that shares the client's pooled connections. At most
+    `max_pending` bodies are in flight; `add` blocks past that (backpressure).
+    `flush` sends what is left and waits for everything, so it is the barrier to
+    call before anything that reads the uploaded data back. `validate` may raise
+    to mark a response as failed. Responses are not kept; failures are collected
+    in `errors`.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        client: Client,
+        api_key: str,
+        chunk_size: int = _DEFAULT_BULK_CHUNK_SIZE,
+        max_workers: int = _DEFAULT_BULK_MAX_WORKERS,
+        max_pending: Optional[int] = None,
+        validate: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self.func = func
+        self.validate = validate
+        self.client = client
+        self.api_key = api_key
+        self.chunk_size = max(1, chunk_size)
+        self.buffer: List[Tuple[Any, Optional[Callable[[Exception], Any]]]] = []
+        self.errors: List[Exception] = []
+        self._in_flight: Set[concurrent.futures.Future] = set()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(
+            max_pending if max_pending else 4 * self.chunk_size
+        )
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="okareo-bulk"
+        )
+
+    def add(
+        self, data: Any, on_error: Optional[Callable[[Exception], Any]] = None
+    ) -> None:
+        """Queue one body. `on_error` builds a replacement body to send once when
+        the original is rejected."""
+        self.buffer.append((data, on_error))
+        if len(self.buffer) >= self.chunk_size:
+            self._send_chunk()
+
+    def _send_chunk(self) -> None:
+        chunk, self.buffer = self.buffer, []
+        for data, on_error in chunk:
+            self._slots.acquire()
+            future = self._executor.submit(self._send, data, on_error)
+            with self._lock:
+                self._in_flight.add(future)
+            future.add_done_callback(self._discard)
 
+    def _discard(self, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._in_flight.discard(future)
+
+    def _call(self, data: Any) -> Any:
+        response = self.func(client=self.client, api_key=self.api_key, body=data)
+        if self.validate is not None:
+            self.validate(response)
+        return response
+
+    def _send(self, data: Any, on_error: Optional[Callable[[Exception], Any]]) -> None:
+        try:
+            try:
+                self._call(data)
             except Exception as e:
-                print("Error performing async call", e)
-                attempts += 1
-            # .1, .2, .4, .8, 1.6, 3.2, ...
-            time.sleep(0.1 * 2 ** (attempts - 1))
-        return None
+                if on_error is None:
+                    raise
+                logger.warning("Bulk call failed: %s. Sending fallback.", e)
+                self._call(on_error(e))
+        except Exception as e:
+            logger.warning("Bulk call failed: %s", e)
+            with self._lock:
+                self.errors.append(e)
+        finally:
+            self._slots.release()
 
-    def worker(self) -> None:
-        timeout = _DEFAULT_SCHEDULE_DELAY_MILLIS / 1e3
+    def flush(self) -> List[Exception]:
+        """Send any buffered bodies and wait until every call has finished.
 
-        while not self.done:
-            with self.condition:
-                if self.done:
-                    break  # if flag has changed
-                if not self.queue:
-                    self.condition.wait(timeout)
-
-            idx = 0
-            entries = []
-            while idx < _DEFAULT_MAX_BATCH_SIZE and self.queue:
-                entries.append(self.queue.popleft())
-
-            for entry in entries:
-                func, data = entry
-                self._perform_call(func, data)
+        Returns:
+            The exceptions of the calls that failed so far, as in `errors`.
+        """
+        if self.buffer:
+            self._send_chunk()
+        with self._lock:
+            in_flight = list(self._in_flight)
+        concurrent.futures.wait(in_flight)
+        with self._lock:
+            return list(self.errors)
 
-    def flush(self) -> None:
-        # signal the worker thread to finish and then wait for it
-        print("Shutting down")
-        self.done = True
-        with self.condition:
-            self.condition.notify_all()
-        self.worker_thread.join()
+    def close(self) -> None:
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+class AsyncCallBuffer:
+    """`BulkCallBuffer` for an event loop: `func` is a generated `asyncio`
+    endpoint, sent on the client's async connection pool.
+
+    Bodies are buffered and each full chunk of `chunk_size` is started as tasks
+    on the loop the buffer was created on, sending at most `max_workers` requests
+    at once. At most `max_pending` bodies are in flight; `await put(...)` waits
+    for room past that (backpressure). `add` is
+    for synchronous code: on the loop it only buffers, and `await drain()`
+    starts the full chunks; from another thread it blocks until there is room,
+    like `BulkCallBuffer.add`. `await flush()` sends what is left and waits for
+    everything. As there, responses are not kept and failures go to `errors`.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        client: Client,
+        api_key: str,
+        chunk_size: int = _DEFAULT_BULK_CHUNK_SIZE,
+        max_workers: int = _DEFAULT_BULK_MAX_WORKERS,
+        max_pending: Optional[int] = None,
+        validate: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self.func = func
+        self.validate = validate
+        self.client = client
+        self.api_key = api_key
+        self.chunk_size = max(1, chunk_size)
+        self.buffer: List[Tuple[Any, Optional[Callable[[Exception], Any]]]] = []
+        self.errors: List[Exception] = []
+        self._tasks: Set[asyncio.Task] = set()
+        self._loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(
+            max_pending if max_pending else 4 * self.chunk_size
+        )
+        self._workers = asyncio.Semaphore(max(1, max_workers))
+
+    def _on_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def add(
+        self, data: Any, on_error: Optional[Callable[[Exception], Any]] = None
+    ) -> None:
+        """Queue one body. `on_error` builds a replacement body to send once when
+        the original is rejected."""
+        if self._on_loop():
+            self.buffer.append((data, on_error))
+        else:
+            asyncio.run_coroutine_threadsafe(
+                self.put(data, on_error), self._loop
+            ).result()
+
+    async def put(
+        self, data: Any, on_error: Optional[Callable[[Exception], Any]] = None
+    ) -> None:
+        """Queue one body, waiting for room once its chunk is full."""
+        self.buffer.append((data, on_error))
+        await self.drain()
+
+    async def drain(self) -> None:
+        """Start every full chunk in the buffer, waiting for room as needed."""
+        while len(self.buffer) >= self.chunk_size:
+            await self._send_chunk(self.chunk_size)
+
+    async def _send_chunk(self, size: int) -> None:
+        chunk, self.buffer = self.buffer[:size], self.buffer[size:]
+        for data, on_error in chunk:
+            await self._slots.acquire()
+            task = asyncio.create_task(self._send(data, on_error))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _call(self, data: Any) -> Any:
+        response = await self.func(client=self.client, api_key=self.api_key, body=data)
+        if self.validate is not None:
+            self.validate(response)
+        return response
+
+    async def _send(
+        self, data: Any, on_error: Optional[Callable[[Exception], Any]]
+    ) -> None:
+        try:
+            async with self._workers:
+                try:
+                    await self._call(data)
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    logger.warning("Bulk call failed: %s. Sending fallback.", e)
+                    await self._call(on_error(e))
+        except Exception as e:
+            logger.warning("Bulk call failed: %s", e)
+            self.errors.append(e)
+        finally:
+            self._slots.release()
+
+    async def flush(self) -> List[Exception]:
+        """Send any buffered bodies and wait until every call has finished.
+
+        Returns:
+            The exceptions of the calls that failed so far, as in `errors`.
+        """
+        if self.buffer:
+            await self._send_chunk(len(self.buffer))
+        await asyncio.gather(*list(self._tasks))
+        return list(self.errors)
@@ -0,0 +1,105 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from .scenario_cache import _default_directory
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_DISK_BYTES = 2 * 1024 * 1024 * 1024
+
+
+def write_stream(path: Union[str, "os.PathLike[str]"], chunks: Iterable[bytes]) -> None:
+    """Write `chunks` to `path` through a temporary file in the same directory,
+    so the file only appears once it is complete."""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            for chunk in chunks:
+                tmp_file.write(chunk)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class AudioFileCache:
+    """Downloaded audio (voice files, call recordings) on disk under `directory`
+    (default `$OKAREO_CACHE_DIR`, else `~/.cache/okareo`), one file per file id
+    or CallSid.
+
+    Uploaded audio does not change, so an entry never expires; the least recently
+    used files are removed once they take more than `max_disk_bytes`. Entries are
+    kept apart per API base URL. Downloads are streamed to disk, never buffered.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        max_disk_bytes: int = _DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        self.directory = Path(directory) if directory else _default_directory()
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, base_url: str, key: str) -> Path:
+        server = hashlib.sha256(base_url.encode()).hexdigest()[:16]
+        name = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self.directory / "audio" / server / name
+
+    def get(self, base_url: str, key: str) -> Optional[Path]:
+        """The cached file for `key`, or None on a miss."""
+        path = self._path(base_url, key)
+        try:
+            os.utime(path)  # recency for eviction
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, base_url: str, key: str, chunks: Iterable[bytes]) -> Path:
+        """Stream `chunks` into the cache file for `key` and return its path."""
+        path = self._path(base_url, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_stream(path, chunks)
+        try:
+            self._evict(keep=path)
+        except OSError as e:
+            logger.warning("Could not trim audio cache %s: %s", self.directory, e)
+        return path
+
+    def _evict(self, keep: Path) -> None:
+        with self._lock:
+            files = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry)
+                for entry in (self.directory / "audio").glob("*/*")
+                if not entry.name.endswith(".tmp")
+            ]
+            total = sum(size for _, size, _ in files)
+            for _, size, entry in sorted(files, key=lambda f: f[0]):
+                if total <= self.max_disk_bytes:
+                    break
+                if entry != keep:
+                    entry.unlink(missing_ok=True)
+                    total -= size
+
+    def invalidate(self, base_url: str, key: str) -> None:
+        """Drop one file from the cache."""
+        self._path(base_url, key).unlink(missing_ok=True)
+
+
+_default_cache: Optional[AudioFileCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_audio_cache() -> AudioFileCache:
+    """The process-wide cache used by `Okareo(..., audio_cache=True)`."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = AudioFileCache()
+        return _default_cache
@@ -47,14 +47,18 @@ class OkareoLogger(BaseLogger):  # type: ignore
         self,
         config: dict[str, Any],
     ) -> None:
-        assert "api_key" in config, "api_key is required in the config"
-        api_key = config["api_key"]
-        base_path = config.get("base_path", None)
-
-        if base_path and len(base_path) > 0:
-            self.okareo = Okareo(api_key, base_path=base_path)
+        if "okareo" in config:
+            # share one client (e.g. a lazy one) instead of building another
+            self.okareo = config["okareo"]
         else:
-            self.okareo = Okareo(api_key)
+            assert "api_key" in config, "api_key is required in the config"
+            api_key = config["api_key"]
+            base_path = config.get("base_path", None)
+
+            if base_path and len(base_path) > 0:
+                self.okareo = Okareo(api_key, base_path=base_path)
+            else:
+                self.okareo = Okareo(api_key)
 
         self.context_token = str(config.get("context_token", ""))
 
@@ -0,0 +1,159 @@
+import collections
+import concurrent.futures
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+_DEFAULT_MAX_BATCH_SIZE_FACTOR = 4
+_DEFAULT_MAX_ROW_RETRIES = 2
+
+Row = Dict[str, Any]
+
+
+class AdaptiveBatchSize:
+    """Batch size controller: additive increase, multiplicative decrease.
+
+    After a full batch that came back within `target_latency` seconds (or any
+    full batch when no target is set) the size grows by a quarter, at least one
+    row, up to `maximum`. A batch over the target halves the size; a batch that
+    raised (out of memory, payload too large, ...) halves the size of that batch,
+    so the next ones are smaller than the one that failed.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        maximum: Optional[int] = None,
+        target_latency: Optional[float] = None,
+        minimum: int = 1,
+    ) -> None:
+        if maximum is None:
+            maximum = initial * _DEFAULT_MAX_BATCH_SIZE_FACTOR
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError(
+                f"need 1 <= minimum <= initial <= maximum, got minimum={minimum}, "
+                f"initial={initial}, maximum={maximum}"
+            )
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+
+    def succeeded(self, batch_len: int, latency: float) -> None:
+        if self.target_latency is not None and latency > self.target_latency:
+            self.size = max(self.minimum, self.size // 2)
+        elif batch_len >= self.size:
+            self.size = min(self.maximum, self.size + max(1, self.size // 4))
+
+    def failed(self, batch_len: int) -> None:
+        self.size = max(self.minimum, min(self.size, batch_len // 2))
+
+
+Batch = List[Tuple[Row, int]]
+
+
+class _AdaptiveBatchRun:
+    def __init__(
+        self,
+        invoke_batch: Callable[[List[Row]], List[Row]],
+        rows: List[Row],
+        record: Callable[[Row], None],
+        on_error: Callable[[Row, Exception], None],
+        batch_size: AdaptiveBatchSize,
+        max_row_retries: int,
+    ) -> None:
+        self.invoke_batch = invoke_batch
+        self.record = record
+        self.on_error = on_error
+        self.batch_size = batch_size
+        self.max_row_retries = max_row_retries
+        # rows with their attempt count
+        self.pending: Deque[Tuple[Row, int]] = collections.deque(
+            (row, 0) for row in rows
+        )
+        # halves of failed batches are retried before any new rows are started
+        self.retries: Deque[Batch] = collections.deque()
+
+    def has_work(self) -> bool:
+        return bool(self.pending or self.retries)
+
+    def next_batch(self) -> Batch:
+        if self.retries:
+            return self.retries.popleft()
+        size = min(self.batch_size.size, len(self.pending))
+        return [self.pending.popleft() for _ in range(size)]
+
+    def timed(self, batch: Batch) -> Tuple[List[Row], float]:
+        start = time.monotonic()
+        result = self.invoke_batch([row for row, _ in batch])
+        return result, time.monotonic() - start
+
+    def retry_rows(self, batch: Batch, error: Exception) -> None:
+        for row, attempts in batch:
+            if attempts < self.max_row_retries:
+                self.retries.append([(row, attempts + 1)])
+            else:
+                self.on_error(row, error)
+
+    def completed(self, future: concurrent.futures.Future, batch: Batch) -> None:
+        try:
+            results, latency = future.result()
+        except concurrent.futures.CancelledError:
+            raise
+        except Exception as e:
+            self.batch_size.failed(len(batch))
+            if len(batch) == 1:
+                self.retry_rows(batch, e)
+            else:
+                middle = len(batch) // 2
+                self.retries.extend([batch[:middle], batch[middle:]])
+            return
+        self.batch_size.succeeded(len(batch), latency)
+        returned = set()
+        for return_dict in results:
+            returned.add(str(return_dict["id"]))
+            self.record(return_dict)
+        missing = [entry for entry in batch if str(entry[0]["id"]) not in returned]
+        if missing:
+            self.retry_rows(missing, ValueError("invoke_batch returned no result"))
+
+
+def run_adaptive_batches(
+    invoke_batch: Callable[[List[Row]], List[Row]],
+    rows: List[Row],
+    record: Callable[[Row], None],
+    on_error: Callable[[Row, Exception], None],
+    batch_size: AdaptiveBatchSize,
+    max_concurrent_batches: int = 1,
+    max_row_retries: int = _DEFAULT_MAX_ROW_RETRIES,
+) -> None:
+    """Invoke `invoke_batch` on `rows` ({'id', 'input_value'} dicts) in batches
+    sized by `batch_size`, with up to `max_concurrent_batches` in flight.
+
+    Every returned `{'id', 'model_invocation'}` dict is passed to `record` on the
+    calling thread. A batch that raises is split in half and each half retried,
+    which narrows the failure down to the rows that cause it; a single row that
+    raises, or that is missing from a returned batch, is retried up to
+    `max_row_retries` times and then handed to `on_error` with the last exception.
+    CancelledError is never retried.
+    """
+    run = _AdaptiveBatchRun(
+        invoke_batch, rows, record, on_error, batch_size, max_row_retries
+    )
+    max_concurrent_batches = max(1, max_concurrent_batches)
+    in_flight: Dict[concurrent.futures.Future, Batch] = {}
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_concurrent_batches, thread_name_prefix="adaptive-batch"
+    ) as executor:
+        try:
+            while run.has_work() or in_flight:
+                while run.has_work() and len(in_flight) < max_concurrent_batches:
+                    batch = run.next_batch()
+                    in_flight[executor.submit(run.timed, batch)] = batch
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    run.completed(future, in_flight.pop(future))
+        finally:
+            for future in in_flight:
+                future.cancel()
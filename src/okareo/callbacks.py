@@ -23,6 +23,7 @@ class CallbackHandler(BaseCallbackHandler):
         mut_name: Optional[str] = None,
         context_token: Optional[str] = None,
         base_path: Optional[str] = None,
+        okareo: Optional[Okareo] = None,
     ) -> None:
         """Initialize callback handler.
 
@@ -31,9 +32,14 @@ class CallbackHandler(BaseCallbackHandler):
             mut_name: Name of the model to register datapoints against.
             context_token: Token that ties the datapoints of one run together.
             base_path: Okareo API base URL. Defaults to the SDK's own default.
+            okareo: An existing client to share, e.g. ``Okareo(key, lazy=True)``;
+                ``api_key`` and ``base_path`` are then ignored.
         """
-        key = api_key or os.environ["OKAREO_API_KEY"]
-        self.okareo = Okareo(key, base_path) if base_path else Okareo(key)
+        if okareo is not None:
+            self.okareo = okareo
+        else:
+            key = api_key or os.environ["OKAREO_API_KEY"]
+            self.okareo = Okareo(key, base_path) if base_path else Okareo(key)
         self.inputs: List[Dict[str, Any]] = []
         self.context_token = context_token or "".join(
             random.choices(string.ascii_letters, k=10)
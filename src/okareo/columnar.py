@@ -0,0 +1,138 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set
+from uuid import UUID
+
+import attrs
+from dateutil.parser import isoparse
+
+from okareo_api_client.models.datapoint_list_item import DatapointListItem
+
+# DatapointListItem attribute -> JSON key, where they differ
+_FIELD_KEYS = {"input_": "input"}
+
+_DATETIME_FIELDS = {"input_datetime", "result_datetime", "time_created"}
+_UUID_FIELDS = {
+    "id",
+    "project_id",
+    "mut_id",
+    "test_run_id",
+    "test_data_point_id",
+    "group_id",
+    "scenario_data_point_id",
+}
+
+
+def _parser(field: str) -> Optional[Callable[[Any], Any]]:
+    if field in _DATETIME_FIELDS:
+        return isoparse
+    if field in _UUID_FIELDS:
+        return UUID
+    return None
+
+
+class DatapointColumns:
+    """Column-oriented view of a datapoint search response.
+
+    Rows are kept as the decoded JSON and a column is only materialized (and
+    cached) when it is first read, so selecting a few fields of many datapoints
+    skips the per-row `DatapointListItem` construction. Field names are the
+    `DatapointListItem` attribute names (`input_` or `input`); missing values are
+    None. Datetime and UUID fields are parsed only when `parse=True`.
+
+    Example:
+    ```python
+    columns = okareo_client.find_datapoints_columns(search)
+    latencies = columns["latency"]
+    frame = pandas.DataFrame(columns.to_dict(["input_", "result", "latency"]))
+    ```
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self._rows = rows
+        self._columns: Dict[Any, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, field: str) -> List[Any]:
+        return self.column(field)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.fields)
+
+    @property
+    def fields(self) -> List[str]:
+        """Every field present in at least one row, in first-seen order."""
+        keys: Dict[str, None] = {}
+        for row in self._rows:
+            keys.update(dict.fromkeys(row))
+        inverse = {key: field for field, key in _FIELD_KEYS.items()}
+        return [inverse.get(key, key) for key in keys]
+
+    def column(self, field: str, parse: bool = False) -> List[Any]:
+        """
+        Values of one field across all rows.
+
+        Arguments:
+            field: A `DatapointListItem` attribute name, e.g. "latency".
+            parse: Turn datetime strings into `datetime` and ids into `UUID`.
+
+        Returns:
+            A list with one value per row (None where the row lacks the field).
+        """
+        key = _FIELD_KEYS.get(field, field)
+        parser = _parser(field) if parse else None
+        cached = self._columns.get((key, parser is not None))
+        if cached is not None:
+            return cached
+        values = [row.get(key) for row in self._rows]
+        if parser is not None:
+            values = [None if v is None else parser(v) for v in values]
+        self._columns[(key, parser is not None)] = values
+        return values
+
+    def to_dict(
+        self, fields: Optional[List[str]] = None, parse: bool = False
+    ) -> Dict[str, List[Any]]:
+        """Columns by field name — accepted as-is by `pandas.DataFrame` and
+        `pyarrow.Table.from_pydict`. Defaults to every field."""
+        return {f: self.column(f, parse) for f in fields or self.fields}
+
+    def row(self, index: int) -> DatapointListItem:
+        """Decode one row into a full `DatapointListItem`."""
+        return DatapointListItem.from_dict(self._rows[index])
+
+
+def projection_keys(model: Any, fields: Sequence[str]) -> Set[str]:
+    """
+    The JSON keys to decode for a `fields` projection of `model` (a generated
+    attrs model): `fields` plus the model's required attributes.
+
+    Arguments:
+        model: The generated model class, e.g. `DatapointListItem`.
+        fields: Attribute names of `model` to keep.
+
+    Returns:
+        The JSON keys to keep.
+
+    Raises:
+        ValueError: If a field is not an attribute of `model`.
+    """
+    model_fields = [f for f in attrs.fields(model) if f.name != "additional_properties"]
+    unknown = set(fields) - {f.name for f in model_fields}
+    if unknown:
+        raise ValueError(
+            f"Unknown {model.__name__} field(s) {sorted(unknown)}; "
+            f"available: {[f.name for f in model_fields]}"
+        )
+    required = [f.name for f in model_fields if f.default is attrs.NOTHING]
+    # the generator appends "_" to attribute names that shadow builtins
+    return {f.rstrip("_") for f in [*required, *fields]}
+
+
+def decode_projected(
+    model: Any, rows: List[Dict[str, Any]], keys: Set[str]
+) -> List[Any]:
+    """Decode each row into `model` from only `keys` (see `projection_keys`);
+    every other field is left UNSET, so the blobs a caller did not ask for are
+    never parsed."""
+    return [model.from_dict({k: row[k] for k in keys if k in row}) for row in rows]
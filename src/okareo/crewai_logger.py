@@ -1,11 +1,14 @@
+import collections
 import datetime
 import importlib.metadata
 import json
 import logging
 import random
 import string
+import threading
+import time
 import uuid
-from typing import Any, Collection, Optional
+from typing import Any, Collection, Deque, Dict, List, Optional
 
 from opentelemetry import trace
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor  # type: ignore
@@ -16,6 +19,10 @@ from wrapt import wrap_function_wrapper  # type: ignore
 from okareo import Okareo
 
 logging.basicConfig(level=logging.FATAL)
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_QUEUE_SIZE = 2048
+_DEFAULT_FLUSH_TIMEOUT_MILLIS = 30000
 
 
 def get_agent_names(json_data: Any) -> Any:
@@ -36,16 +43,30 @@ def find_agent_role(json_data: Any, id_prefix: Any) -> Any:
 
 
 class CrewAISpanProcessor(SpanProcessor):
-    def __init__(self, config: dict[str, Any]) -> None:
-        if "api_key" not in config:
-            raise ValueError("api_key is required in the config")
-        base_path = config.get("base_path", None)
-        api_key = config["api_key"]
+    """Logs CrewAI spans to Okareo without blocking the agents.
 
-        if base_path and len(base_path) > 0:
-            self.okareo = Okareo(api_key, base_path=base_path)
+    `on_end` only queues the span (up to `max_queue_size` in the config; further
+    spans are dropped and counted in `dropped_spans`). A background thread
+    registers one model per agent role — once, then memoized — and hands the
+    data points to the client's background exporter (`add_data_point_async`).
+    `force_flush` waits until every queued span has been sent and `shutdown`
+    flushes, then stops the thread and ignores later spans.
+    """
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        if "okareo" in config:
+            # share one client (e.g. a lazy one) instead of building another
+            self.okareo = config["okareo"]
         else:
-            self.okareo = Okareo(api_key)
+            if "api_key" not in config:
+                raise ValueError("api_key is required in the config")
+            base_path = config.get("base_path", None)
+            api_key = config["api_key"]
+
+            if base_path and len(base_path) > 0:
+                self.okareo = Okareo(api_key, base_path=base_path)
+            else:
+                self.okareo = Okareo(api_key)
         self.is_context_set = "context_token" in config
         self.context_id = str(config.get("context_token", uuid.uuid4()))
         self.tags = config.get("tags", [])
@@ -59,8 +80,27 @@ class CrewAISpanProcessor(SpanProcessor):
         )
         self.created_obj: Any = {}
         self.cur_model: Any = None
+        self.models: list = []
         self.total_task_count = 0
         self.task_count = 0
+        # role -> registered model, so a role is registered and grouped once
+        self._models_by_role: Dict[str, Any] = {}
+        # the current crew, indexed once per "Crew Created" span
+        self._agent_roles: List[str] = []
+        self._task_roles: Dict[str, str] = {}
+        # task id prefix (as spans report it) -> role, filled on first lookup
+        self._task_roles_by_prefix: Dict[str, Optional[str]] = {}
+
+        self.max_queue_size = config.get("max_queue_size", _DEFAULT_MAX_QUEUE_SIZE)
+        self.dropped_spans = 0
+        self._queue: Deque[ReadableSpan] = collections.deque()
+        # spans queued or being exported
+        self._pending = 0
+        self._done = False
+        self._condition = threading.Condition(threading.Lock())
+        self._worker = threading.Thread(
+            name="OkareoCrewAI", target=self._work, daemon=True
+        )
 
     def _format_span_data(self, span: ReadableSpan) -> dict:
         if span.attributes is None:
@@ -83,29 +123,98 @@ class CrewAISpanProcessor(SpanProcessor):
         return timestamp
 
     def on_end(self, span: ReadableSpan) -> None:
+        with self._condition:
+            if self._done:
+                return
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped_spans += 1
+                if self.dropped_spans == 1:
+                    logger.warning(
+                        "Okareo CrewAI span queue is full (%d); spans are being dropped.",
+                        self.max_queue_size,
+                    )
+                return
+            if not self._worker.is_alive():
+                self._worker.start()
+            self._queue.append(span)
+            self._pending += 1
+            self._condition.notify_all()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._done:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                span = self._queue.popleft()
+            try:
+                self._export(span)
+            except Exception as e:
+                logger.warning("Failed to log CrewAI span %s: %s", span.name, e)
+            finally:
+                with self._condition:
+                    self._pending -= 1
+                    self._condition.notify_all()
+
+    def _model_for_role(self, role: Optional[str]) -> Any:
+        """The model registered for an agent role, registering and adding it to
+        the group the first time the role is seen."""
+        if role is None:
+            return None
+        model = self._models_by_role.get(role)
+        if model is None:
+            model = self.okareo.register_model(name=role)
+            self.okareo.add_model_to_group(self.group, model)
+            self._models_by_role[role] = model
+        return model
+
+    def _index_crew(self, created_obj: Any) -> None:
+        self._agent_roles = [
+            agent["role"] for agent in created_obj.get("crew_agents", [])
+        ]
+        self._task_roles = {
+            str(task["id"]): task["agent_role"]
+            for task in created_obj.get("crew_tasks", [])
+        }
+        self._task_roles_by_prefix = {}
+
+    def _task_role(self, task_id: Any) -> Optional[str]:
+        """Role of the crew task whose id starts with `task_id`, like
+        `find_agent_role`, with each answer memoized."""
+        if task_id is None:
+            return None
+        task_id = str(task_id)
+        if task_id in self._task_roles:
+            return self._task_roles[task_id]
+        if task_id not in self._task_roles_by_prefix:
+            self._task_roles_by_prefix[task_id] = next(
+                (
+                    role
+                    for full_id, role in self._task_roles.items()
+                    if full_id.startswith(task_id)
+                ),
+                None,
+            )
+        return self._task_roles_by_prefix[task_id]
+
+    def _export(self, span: ReadableSpan) -> None:
+        span_data = self._format_span_data(span)
         if span.name == "Crew Created":
             self.task_count = 0
             self.total_task_count = 0
             if not self.is_context_set:
                 self.context_id = str(uuid.uuid4())
-            self.created_obj = self._format_span_data(span)
+            self.created_obj = span_data
             self.total_task_count = len(self.created_obj["crew_tasks"])
+            self._index_crew(self.created_obj)
 
-            agent_names = get_agent_names(json.dumps(self.created_obj))
-            self.models = []
-            for agent_name in agent_names:
-                model = self.okareo.register_model(name=agent_name)
-                self.models.append(model)
-                self.okareo.add_model_to_group(self.group, model)
-        models_to_add = []
-        span_data = self._format_span_data(span)
-        if span.name == "Crew Created":
+            self.models = [self._model_for_role(role) for role in self._agent_roles]
             models_to_add = self.models
         elif span.name == "Task Created":
-            role = find_agent_role(
-                json.dumps(self.created_obj), span_data.get("task_id")
+            self.cur_model = self._model_for_role(
+                self._task_role(span_data.get("task_id"))
             )
-            self.cur_model = self.okareo.register_model(name=role)
             models_to_add = [self.cur_model]
         else:
             models_to_add = [self.cur_model]
@@ -117,7 +226,7 @@ class CrewAISpanProcessor(SpanProcessor):
         }
         for cur_model in models_to_add:
             if cur_model:
-                cur_model.add_data_point(
+                cur_model.add_data_point_async(
                     input_obj=span_data,
                     input_datetime=self._get_timestamp_iso(span.start_time),
                     result_obj=json.dumps(result_obj),
@@ -129,8 +238,46 @@ class CrewAISpanProcessor(SpanProcessor):
         if span.name == "Task Execution":
             self.task_count += 1
             if self.task_count == self.total_task_count:
+                # the trace eval reads the crew's data points back
+                self._flush_models(None)
                 self.okareo.create_trace_eval(self.group, self.context_id)
 
+    def _flush_models(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = True
+        for model in list(self._models_by_role.values()):
+            remaining = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            flushed = model.flush(remaining) and flushed
+        return flushed
+
+    def force_flush(self, timeout_millis: int = _DEFAULT_FLUSH_TIMEOUT_MILLIS) -> bool:
+        """Wait until every span queued so far has been sent to Okareo. Returns
+        False if `timeout_millis` expired first."""
+        deadline = time.monotonic() + timeout_millis / 1e3
+        with self._condition:
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return self._flush_models(max(deadline - time.monotonic(), 0))
+
+    def shutdown(self) -> None:
+        """Flush, then stop the background thread. Later spans are ignored."""
+        with self._condition:
+            if self._done:
+                return
+        self.force_flush()
+        with self._condition:
+            self._done = True
+            self._condition.notify_all()
+        if self._worker.is_alive():
+            self._worker.join(_DEFAULT_FLUSH_TIMEOUT_MILLIS / 1e3)
+        for model in self._models_by_role.values():
+            model.shutdown()
+
     @staticmethod
     def safe_loads(data: Any) -> Any:
         try:
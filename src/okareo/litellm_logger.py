@@ -18,8 +18,12 @@ class LiteLLMLogger(CustomLogger):  # type: ignore
         context_token: str,
         tags: Optional[List[str]] = None,
         host_address: Optional[str] = None,
+        okareo: Optional[Okareo] = None,
     ) -> None:
-        if host_address and len(host_address) > 0:
+        if okareo is not None:
+            # share one client (e.g. a lazy one) instead of building another
+            self.okareo = okareo
+        elif host_address and len(host_address) > 0:
             self.okareo = Okareo(api_key, base_path=host_address)
         else:
             self.okareo = Okareo(api_key)
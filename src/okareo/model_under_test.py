@@ -1,23 +1,39 @@
 import asyncio
+import concurrent.futures
+import contextlib
+import functools
 import inspect
 import json
 import logging
 import ssl
 import threading
+import time
 import urllib
 from abc import abstractmethod
 from base64 import b64encode
 from datetime import datetime
-from typing import Any, Awaitable, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import UUID, uuid4
 
 import aiohttp
+import httpx
 from attrs import define
 from attrs import define as _attrs_define
 from attrs import field
 from nkeys import from_seed  # type: ignore
 from tqdm import tqdm  # type: ignore
 
+from okareo.batching import AdaptiveBatchSize, run_adaptive_batches
 from okareo.error import MissingApiKeyError, MissingVectorDbError, TestRunError
 from okareo_api_client.api.default import (
     add_datapoint_v0_datapoints_post,
@@ -64,8 +80,16 @@ from okareo_api_client.models.voice_driver_model_response import (
 )
 from okareo_api_client.types import UNSET, Unset
 
-from .async_utils import AsyncProcessorMixin
+from .async_utils import AsyncCallBuffer, AsyncProcessorMixin, BulkCallBuffer
 from .augmentations import Augmentation
+from .polling import (
+    TEST_RUN_DONE_STATUSES,
+    TEST_RUN_MAX_POLL_INTERVAL,
+    TEST_RUN_POLL_INTERVAL,
+    Backoff,
+    poll_timeout_error,
+)
+from .scenario_cache import ScenarioDataPointCache
 
 ## BEGIN Monkey Patch for nats to use proxy env vars (via aiohttp)
 #  Apply monkey patch at module level to allow aiohttp client session to pull proxy env vars
@@ -88,6 +112,94 @@ import nats  # type: ignore # noqa: E402
 
 ## END Monkey Patch for nats to use proxy env vars (via aiohttp)
 
+logger = logging.getLogger(__name__)
+
+# Number of CustomModel invocations allowed in flight at once. 1 keeps the
+# historical one-row-at-a-time behavior.
+_DEFAULT_MAX_CONCURRENCY = 1
+# Same for CustomMultiturnTarget turns, which may keep state between calls
+_DEFAULT_MAX_CONCURRENT_TURNS = 1
+# CustomModel runs started by submit_test that execute at once; later ones queue
+_DEFAULT_MAX_SUBMITTED_RUNS = 4
+
+DatapointWriter = Union[BulkCallBuffer, AsyncCallBuffer]
+
+CUSTOM_TARGET_KEYS = ("custom_target", "custom_target_async")
+
+# (args, message_history, scenario_input, session_id) -> result or awaitable
+TurnDispatch = Callable[[Any, Any, Any, Any], Any]
+
+
+def _check_invoker_arity(func: Any, num_args: int, role: str) -> None:
+    """Raise TypeError unless `func` can be called with `num_args` positional
+    arguments, so a misconfigured model fails when it is registered."""
+    if not callable(func):
+        raise TypeError(f"{role} must be callable, got {type(func).__name__}")
+    try:
+        sig = inspect.signature(func)
+    except (TypeError, ValueError):
+        # some builtins and C callables have no signature; nothing to check
+        return
+    try:
+        sig.bind(*([None] * num_args))
+    except TypeError as e:
+        raise TypeError(
+            f"{role} {getattr(func, '__qualname__', func)!r} cannot be called with "
+            f"{num_args} positional argument(s): {e}"
+        ) from e
+
+
+def _compile_custom_target_dispatch(
+    model_invoker: Any, session_starter: Any = None, session_ender: Any = None
+) -> Dict[str, TurnDispatch]:
+    """Resolve the calling convention of a custom target's callables once, so
+    no turn pays for signature introspection. Returns one callable per call type;
+    for an async target they return the coroutine to await."""
+    dispatch: Dict[str, TurnDispatch] = {}
+    if model_invoker is not None:
+        num_positional = sum(
+            1
+            for param in inspect.signature(model_invoker).parameters.values()
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+        )
+        if num_positional > 1:
+            # new impl; first pos arg is message_history, second is scenario_input
+            _check_invoker_arity(model_invoker, 3, "model_invoker")
+
+            def invoke(
+                args: Any, message_history: Any, scenario_input: Any, session_id: Any
+            ) -> Any:
+                if scenario_input is None:
+                    return model_invoker(args)
+                messages = message_history if message_history is not None else args
+                return model_invoker(messages, scenario_input, session_id)
+
+        else:
+            # legacy impl; first pos arg is message_history (named args)
+            _check_invoker_arity(model_invoker, 1, "model_invoker")
+
+            def invoke(
+                args: Any, message_history: Any, scenario_input: Any, session_id: Any
+            ) -> Any:
+                return model_invoker(args)
+
+        dispatch["invoke"] = invoke
+    if callable(session_starter):
+        _check_invoker_arity(session_starter, 1, "session_starter")
+        dispatch["start_session"] = (
+            lambda args, message_history, scenario_input, session_id: session_starter(
+                scenario_input
+            )
+        )
+    if callable(session_ender):
+        _check_invoker_arity(session_ender, 1, "session_ender")
+        dispatch["end_session"] = (
+            lambda args, message_history, scenario_input, session_id: (
+                session_ender(session_id) if session_id is not None else None
+            )
+        )
+    return dispatch
+
 
 class BaseModel:
     type: str
@@ -101,20 +213,150 @@ class BaseModel:
         return []
 
 
+class RunProgress:
+    """CustomModel invocations recorded so far for a submitted test run.
+    `total` is None until the scenario has been fetched."""
+
+    def __init__(self) -> None:
+        self.total: Optional[int] = None
+        self.invoked = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._cancel_requested = threading.Event()
+
+    def _record(self, failed: bool) -> None:
+        with self._lock:
+            self.invoked += 1
+            self.failed += int(failed)
+
+    def __repr__(self) -> str:
+        return f"RunProgress(invoked={self.invoked}, failed={self.failed}, total={self.total})"
+
+
+class SubmittedTestRun(TestRunItem):
+    """The `TestRunItem` returned by `submit_test`, which also tracks the client-side
+    work of a CustomModel run: invoking the model on every scenario row, uploading the
+    datapoints and requesting the evaluation. The interface follows
+    `concurrent.futures.Future`. For other models the server does all the work and
+    `done()` is always True.
+    """
+
+    _mut: "ModelUnderTest"
+    _future: Optional[concurrent.futures.Future]
+    _invocations: RunProgress
+
+    @classmethod
+    def _wrap(
+        cls,
+        test_run: TestRunItem,
+        mut: "ModelUnderTest",
+        future: Optional[concurrent.futures.Future] = None,
+        invocations: Optional[RunProgress] = None,
+    ) -> "SubmittedTestRun":
+        submitted = cls.from_dict(test_run.to_dict())
+        submitted._mut = mut
+        submitted._future = future
+        submitted._invocations = invocations or RunProgress()
+        if future is not None:
+            future.add_done_callback(submitted._report_failure)
+        return submitted
+
+    def _report_failure(self, future: concurrent.futures.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(
+                "Submitted test run %s failed: %s",
+                self.id,
+                future.exception(),
+                exc_info=future.exception(),
+            )
+
+    @property
+    def invocations(self) -> RunProgress:
+        """Counts of the CustomModel invocations recorded so far."""
+        return self._invocations
+
+    def done(self) -> bool:
+        return self._future is None or self._future.done()
+
+    def running(self) -> bool:
+        return self._future is not None and self._future.running()
+
+    def cancel(self) -> bool:
+        """Stop the client-side work. A queued run never starts; a running one invokes
+        no further rows and is not submitted for evaluation. Returns False when there
+        is nothing left to cancel."""
+        if self._future is None or self._future.done():
+            return False
+        if not self._future.cancel():
+            self._invocations._cancel_requested.set()
+        return True
+
+    def cancelled(self) -> bool:
+        if self._future is None:
+            return False
+        if self._future.cancelled():
+            return True
+        return self._future.done() and isinstance(
+            self._future.exception(), concurrent.futures.CancelledError
+        )
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """The error the client-side work raised, waiting up to `timeout` seconds."""
+        return None if self._future is None else self._future.exception(timeout)
+
+    def result(
+        self,
+        timeout: Optional[float] = None,
+        poll_interval: float = TEST_RUN_POLL_INTERVAL,
+        max_poll_interval: float = TEST_RUN_MAX_POLL_INTERVAL,
+    ) -> TestRunItem:
+        """Wait for the client-side work, then for the server to finish the run
+        (see `ModelUnderTest.wait_for_test_run`).
+
+        Returns:
+            TestRunItem: The evaluated test run, with status FINISHED or FAILED.
+
+        Raises:
+            The error the client-side work hit, `concurrent.futures.CancelledError`
+            after `cancel()`, or TimeoutError after `timeout` seconds.
+        """
+        started = time.monotonic()
+        if self._future is not None:
+            try:
+                self._future.result(timeout)
+            except concurrent.futures.TimeoutError:
+                raise poll_timeout_error([self.id])
+        remaining = (
+            None
+            if timeout is None
+            else max(0.0, timeout - (time.monotonic() - started))
+        )
+        return self._mut.wait_for_test_run(
+            self.id, remaining, poll_interval, max_poll_interval
+        )
+
+
 class ModelUnderTest(AsyncProcessorMixin):
     """A class for managing a Model Under Test (MUT) in Okareo.
     Returned by [okareo.register_model()](/docs/reference/python-sdk/okareo#register_model)
     """
 
+    # shared by every model, so set it before the first submit_test
+    max_submitted_runs = _DEFAULT_MAX_SUBMITTED_RUNS
+    _submit_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    _submit_executor_lock = threading.Lock()
+
     def __init__(
         self,
         client: Client,
         api_key: str,
         mut: ModelUnderTestResponse,
         models: Optional[Dict[str, Any]] = None,
+        scenario_cache: Optional[ScenarioDataPointCache] = None,
     ):
         self.client = client
         self.api_key = api_key
+        self.scenario_cache = scenario_cache
 
         self.version = mut.version
         self.mut_id = mut.id
@@ -124,7 +366,24 @@ class ModelUnderTest(AsyncProcessorMixin):
         self.models = models
         self.app_link = mut.app_link
         self.model_key: Optional[str] = None
-        super().__init__(name="OkareoDatapointsProcessor")
+        self._turn_dispatch: Dict[str, TurnDispatch] = {}
+        if isinstance(models, dict):
+            self.model_key = next(
+                (
+                    k
+                    for k in [*CUSTOM_TARGET_KEYS, "custom", "custom_batch"]
+                    if k in models.keys()
+                ),
+                None,
+            )
+            if self.model_key in CUSTOM_TARGET_KEYS:
+                target = models[self.model_key]
+                self._turn_dispatch = _compile_custom_target_dispatch(
+                    target.get("model_invoker"),
+                    target.get("session_starter"),
+                    target.get("session_ender"),
+                )
+        super().__init__()
 
     def get_client(self) -> Client:
         return self.client
@@ -132,7 +391,7 @@ class ModelUnderTest(AsyncProcessorMixin):
     def get_api_key(self) -> str:
         return self.api_key
 
-    def add_data_point(
+    def _datapoint_body(
         self,
         input_obj: Union[dict, str, None] = None,
         result_obj: Union[dict, str, None] = None,
@@ -142,12 +401,11 @@ class ModelUnderTest(AsyncProcessorMixin):
         error_code: Union[str, None] = None,
         input_datetime: Union[str, Unset] = UNSET,
         result_datetime: Union[str, Unset] = UNSET,
-        project_id: Union[str, None] = None,
         tags: Union[List[str], None] = None,
         test_run_id: Union[None, str] = None,
         group_id: Union[None, str] = None,
-    ) -> Union[DatapointResponse, ErrorResponse]:
-        body = {
+    ) -> DatapointSchema:
+        body: Dict[str, Any] = {
             "tags": tags or [],
             "input": json.dumps(input_obj, default=str),
             "result": json.dumps(result_obj, default=str),
@@ -172,10 +430,40 @@ class ModelUnderTest(AsyncProcessorMixin):
             body["test_run_id"] = test_run_id
         if group_id is not None:
             body["group_id"] = group_id
+        return DatapointSchema.from_dict(body)
+
+    def add_data_point(
+        self,
+        input_obj: Union[dict, str, None] = None,
+        result_obj: Union[dict, str, None] = None,
+        feedback: Union[float, None] = None,
+        context_token: Union[str, None] = None,
+        error_message: Union[str, None] = None,
+        error_code: Union[str, None] = None,
+        input_datetime: Union[str, Unset] = UNSET,
+        result_datetime: Union[str, Unset] = UNSET,
+        project_id: Union[str, None] = None,
+        tags: Union[List[str], None] = None,
+        test_run_id: Union[None, str] = None,
+        group_id: Union[None, str] = None,
+    ) -> Union[DatapointResponse, ErrorResponse]:
+        body = self._datapoint_body(
+            input_obj=input_obj,
+            result_obj=result_obj,
+            feedback=feedback,
+            context_token=context_token,
+            error_message=error_message,
+            error_code=error_code,
+            input_datetime=input_datetime,
+            result_datetime=result_datetime,
+            tags=tags,
+            test_run_id=test_run_id,
+            group_id=group_id,
+        )
         response = add_datapoint_v0_datapoints_post.sync(
             client=self.client,
             api_key=self.api_key,
-            body=DatapointSchema.from_dict(body),
+            body=body,
         )
         if not response:
             print("Empty response from API")
@@ -198,36 +486,22 @@ class ModelUnderTest(AsyncProcessorMixin):
         test_run_id: Union[None, str] = None,
         group_id: Union[None, str] = None,
     ) -> bool:
-        body = {
-            "tags": tags or [],
-            "input": json.dumps(input_obj, default=str),
-            "result": json.dumps(result_obj, default=str),
-            "context_token": context_token,
-            "feedback": feedback,
-            "error_message": error_message,
-            "error_code": error_code,
-            "input_datetime": (
-                datetime.now().isoformat()
-                if input_datetime == UNSET and input_obj is not None
-                else input_datetime
-            ),
-            "result_datetime": (
-                datetime.now().isoformat()
-                if result_datetime == UNSET and result_obj is not None
-                else result_datetime
-            ),
-            "project_id": str(self.project_id),
-            "mut_id": str(self.mut_id),
-        }
-        if test_run_id is not None:
-            body["test_run_id"] = test_run_id
-        if group_id is not None:
-            body["group_id"] = group_id
-
-        return self.async_call(
-            add_datapoint_v0_datapoints_post.sync, DatapointSchema.from_dict(body)
+        body = self._datapoint_body(
+            input_obj=input_obj,
+            result_obj=result_obj,
+            feedback=feedback,
+            context_token=context_token,
+            error_message=error_message,
+            error_code=error_code,
+            input_datetime=input_datetime,
+            result_datetime=result_datetime,
+            tags=tags,
+            test_run_id=test_run_id,
+            group_id=group_id,
         )
 
+        return self.async_call(add_datapoint_v0_datapoints_post.sync, body)
+
     def _validate_run_test_params(
         self,
         api_key: Optional[str],
@@ -277,6 +551,12 @@ class ModelUnderTest(AsyncProcessorMixin):
     def _get_scenario_data_points(
         self, scenario_id: Union[str, UUID]
     ) -> List[ScenarioDataPoinResponse]:
+        if self.scenario_cache is not None:
+            cached = self.scenario_cache.get(
+                self.client._base_url, self.api_key, scenario_id
+            )
+            if cached is not None:
+                return cached
         scenario_data_points = (
             get_scenario_set_data_points_v0_scenario_data_points_scenario_id_get.sync(
                 client=self.client,
@@ -289,6 +569,10 @@ class ModelUnderTest(AsyncProcessorMixin):
         scenario_data_points = (
             scenario_data_points if isinstance(scenario_data_points, List) else []
         )
+        if self.scenario_cache is not None and scenario_data_points:
+            self.scenario_cache.put(
+                self.client._base_url, self.api_key, scenario_id, scenario_data_points
+            )
         return scenario_data_points
 
     def _add_model_invocation_for_scenario(
@@ -297,6 +581,8 @@ class ModelUnderTest(AsyncProcessorMixin):
         model_data: dict,
         scenario_data_point_id: Union[str, UUID],
         test_run_id: Optional[str] = None,
+        datapoint_writer: Optional[DatapointWriter] = None,
+        invocations: Optional[RunProgress] = None,
     ) -> None:
         scenario_data_point_id = str(scenario_data_point_id)
         if isinstance(custom_model_return_value, ModelInvocation):
@@ -318,30 +604,43 @@ class ModelUnderTest(AsyncProcessorMixin):
             "model_response": model_output_metadata,
             "model_input": model_input,
             "tool_calls": tool_calls,
+            **({"error_message": {"message": error_message}} if error_message else {}),
         }
-        if error_message:
-            model_data["model_data"][scenario_data_point_id]["error_message"] = {
-                "message": error_message
-            }
-        if test_run_id is not None:
+        if invocations is not None:
+            invocations._record(failed=bool(error_message))
+        if test_run_id is not None and datapoint_writer is not None:
+            scenario_label = scenario_data_point_id
+
+            def error_body(e: Exception) -> DatapointSchema:
+                # Log the error but continue processing other datapoints
+                print(
+                    f"Failed to add datapoint for scenario_data_point_id {scenario_label}: {str(e)}. Adding error data point."
+                )
+                return self._datapoint_body(
+                    input_obj=model_input,  # type: ignore
+                    test_run_id=test_run_id,
+                    error_message=str(e),
+                )
+
+            try:
+                self._assert_datapoint_types(model_input, model_prediction)
+                body = self._datapoint_body(
+                    input_obj=model_input,  # type: ignore
+                    result_obj=model_prediction,  # type: ignore
+                    test_run_id=test_run_id,
+                    error_message=error_message,
+                )
+            except AssertionError as e:
+                datapoint_writer.add(error_body(e))
+            else:
+                datapoint_writer.add(body, on_error=error_body)
+        elif test_run_id is not None:
             # add a data point for the invocation
             try:
-                # Type checking inputs/predictions.
-                # Seems that `add_data_point` interface accepts only str/dict/None,
-                # but model_input and model_prediction can also be list.
-                assert (
-                    isinstance(model_input, str)
-                    or isinstance(model_input, dict)
-                    or model_input is None
-                ), f"Unexpected model_input type: {type(model_input)}"
-                assert (
-                    isinstance(model_prediction, str)
-                    or isinstance(model_prediction, dict)
-                    or model_prediction is None
-                ), f"Unexpected model_prediction type: {type(model_prediction)}"
+                self._assert_datapoint_types(model_input, model_prediction)
                 datapoint_response = self.add_data_point(
-                    input_obj=model_input,
-                    result_obj=model_prediction,
+                    input_obj=model_input,  # type: ignore
+                    result_obj=model_prediction,  # type: ignore
                     project_id=str(self.project_id),
                     test_run_id=test_run_id,
                     error_message=error_message,
@@ -363,6 +662,22 @@ class ModelUnderTest(AsyncProcessorMixin):
                 self.validate_response(datapoint_response)
                 assert isinstance(datapoint_response, DatapointResponse)
 
+    @staticmethod
+    def _assert_datapoint_types(model_input: Any, model_prediction: Any) -> None:
+        # Type checking inputs/predictions.
+        # Seems that `add_data_point` interface accepts only str/dict/None,
+        # but model_input and model_prediction can also be list.
+        assert (
+            isinstance(model_input, str)
+            or isinstance(model_input, dict)
+            or model_input is None
+        ), f"Unexpected model_input type: {type(model_input)}"
+        assert (
+            isinstance(model_prediction, str)
+            or isinstance(model_prediction, dict)
+            or model_prediction is None
+        ), f"Unexpected model_prediction type: {type(model_prediction)}"
+
     def _get_test_run_payload(
         self,
         scenario_id: Any,
@@ -458,6 +773,14 @@ class ModelUnderTest(AsyncProcessorMixin):
             )
         return nc
 
+    @staticmethod
+    def _check_session_start(result: Any) -> Any:
+        if not isinstance(result, tuple):
+            raise TypeError(
+                "session_starter must return a tuple (session_id, ModelInvocation)"
+            )
+        return result
+
     async def call_custom_invoker_async(
         self,
         args: Any,
@@ -466,54 +789,15 @@ class ModelUnderTest(AsyncProcessorMixin):
         session_id: Optional[str] = None,
         call_type: str = "invoke",
     ) -> Any:
-        assert isinstance(self.models, dict)
-        if not self.model_key:
-            self.model_key = next(
-                (
-                    k
-                    for k in [
-                        "custom_target",
-                        "custom_target_async",
-                        "custom",
-                        "custom_batch",
-                    ]
-                    if k in self.models.keys()
-                ),
-                None,
-            )
-        assert self.model_key is not None
-        if call_type == "invoke":
-            messages = message_history if message_history is not None else args
-            invoker = self.models[self.model_key]["model_invoker"]
-            sig = inspect.signature(invoker)
-            num_positional = sum(
-                1
-                for param in sig.parameters.values()
-                if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
-            )
-            if num_positional > 1 and scenario_input is not None:
-                # new impl; first pos arg is message_history, second is scenario_input
-                return await invoker(messages, scenario_input, session_id)
-            else:
-                # legacy impl; first pos arg is message_history (named args)
-                return await invoker(args)
-        elif call_type == "start_session":
-            if "session_starter" in self.models[self.model_key]:
-                message_history if message_history is not None else args
-                invoker = self.models[self.model_key]["session_starter"]
-                result = await invoker(scenario_input)
-                if not isinstance(result, tuple):
-                    raise TypeError(
-                        "session_starter must return a tuple (session_id, ModelInvocation)"
-                    )
-                return result
-        elif call_type == "end_session":
-            if (
-                "session_ender" in self.models[self.model_key]
-                and session_id is not None
-            ):
-                return await self.models[self.model_key]["session_ender"](session_id)
-        return None
+        dispatch = self._turn_dispatch.get(call_type)
+        if dispatch is None:
+            return None
+        result = dispatch(args, message_history, scenario_input, session_id)
+        if inspect.isawaitable(result):
+            result = await result
+        if call_type == "start_session":
+            return self._check_session_start(result)
+        return result
 
     def call_custom_invoker(
         self,
@@ -528,40 +812,13 @@ class ModelUnderTest(AsyncProcessorMixin):
             return self.models["custom"]["model_invoker"](args)
         elif self.models.get("custom_batch"):
             return self.models["custom_batch"]["model_invoker"](args)
-        else:
-            if call_type == "invoke":
-                messages = message_history if message_history is not None else args
-                invoker = self.models["custom_target"]["model_invoker"]
-                sig = inspect.signature(invoker)
-                num_positional = sum(
-                    1
-                    for param in sig.parameters.values()
-                    if param.kind
-                    in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
-                )
-                if num_positional > 1 and scenario_input is not None:
-                    # new impl; first pos arg is message_history, second is scenario_input
-                    return invoker(messages, scenario_input, session_id)
-                else:
-                    # legacy impl; first pos arg is message_history (named args)
-                    return invoker(args)
-            elif call_type == "start_session":
-                if "session_starter" in self.models["custom_target"]:
-                    message_history if message_history is not None else args
-                    invoker = self.models["custom_target"]["session_starter"]
-                    result = invoker(scenario_input)
-                    if not isinstance(result, tuple):
-                        raise TypeError(
-                            "session_starter must return a tuple (session_id, ModelInvocation)"
-                        )
-                    return result
-            elif call_type == "end_session":
-                if (
-                    "session_ender" in self.models["custom_target"]
-                    and session_id is not None
-                ):
-                    return self.models["custom_target"]["session_ender"](session_id)
-        return None
+        dispatch = self._turn_dispatch.get(call_type)
+        if dispatch is None:
+            return None
+        result = dispatch(args, message_history, scenario_input, session_id)
+        if call_type == "start_session":
+            return self._check_session_start(result)
+        return result
 
     def get_params_from_custom_result(self, result: Any) -> Any:
         if isinstance(result, tuple):
@@ -589,11 +846,41 @@ class ModelUnderTest(AsyncProcessorMixin):
             result = [r["model_invocation"].params() for r in result]
         return result
 
+    async def _invoke_turn(
+        self,
+        executor: Optional[concurrent.futures.Executor],
+        args: Any,
+        message_history: Optional[list[dict[str, str]]],
+        scenario_input: Optional[Union[str, dict, list]],
+        session_id: Optional[str],
+        call_type: str,
+    ) -> Any:
+        if self._has_async_custom_model():
+            return await self.call_custom_invoker_async(
+                args, message_history, scenario_input, session_id, call_type
+            )
+        # a sync invoker would block the loop that serves every other turn and
+        # the NATS heartbeats, so it runs on the executor instead
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(
+                self.call_custom_invoker,
+                args,
+                message_history,
+                scenario_input,
+                session_id,
+                call_type,
+            ),
+        )
+
     async def process_single_message(
         self,
         msg: Any,
         nats_connection: Any,
         stop_event: Any,
+        turn_slots: Optional[asyncio.Semaphore] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+        turn_timeout: Optional[float] = None,
     ) -> None:
         try:
             data = json.loads(msg.data.decode())
@@ -609,13 +896,17 @@ class ModelUnderTest(AsyncProcessorMixin):
             session_id = data.get("session_id", None)
             call_type = data.get("call_type", "invoke")
 
-            if not self._has_async_custom_model():
-                result = self.call_custom_invoker(
-                    args, message_history, scenario_input, session_id, call_type
-                )
-            else:
-                result = await self.call_custom_invoker_async(
-                    args, message_history, scenario_input, session_id, call_type
+            async with turn_slots or contextlib.nullcontext():
+                result = await asyncio.wait_for(
+                    self._invoke_turn(
+                        executor,
+                        args,
+                        message_history,
+                        scenario_input,
+                        session_id,
+                        call_type,
+                    ),
+                    turn_timeout,
                 )
 
             json_encodable_result = self.get_params_from_custom_result(result)
@@ -631,18 +922,38 @@ class ModelUnderTest(AsyncProcessorMixin):
             )
 
     async def _internal_run_custom_model_listener(
-        self, stop_event: Any, nats_jwt: str, seed: str, local_nats: str, invoke_id: str
+        self,
+        stop_event: Any,
+        nats_jwt: str,
+        seed: str,
+        local_nats: str,
+        invoke_id: str,
+        max_concurrent_turns: int = _DEFAULT_MAX_CONCURRENT_TURNS,
+        turn_timeout: Optional[float] = None,
     ) -> None:
         nats_connection = await self.connect_nats(nats_jwt, seed, local_nats)
         # Track active tasks for proper cleanup
         active_tasks: set[asyncio.Task] = set()
+        # turns of every simulation on this subject share these limits
+        turn_slots = asyncio.Semaphore(max(1, max_concurrent_turns))
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_concurrent_turns),
+            thread_name_prefix="okareo-custom-target",
+        )
 
         try:
 
             async def message_handler_custom_model(msg: Any) -> None:
                 # Create task and track it
                 task = asyncio.create_task(
-                    self.process_single_message(msg, nats_connection, stop_event)
+                    self.process_single_message(
+                        msg,
+                        nats_connection,
+                        stop_event,
+                        turn_slots,
+                        executor,
+                        turn_timeout,
+                    )
                 )
                 active_tasks.add(task)
 
@@ -667,6 +978,8 @@ class ModelUnderTest(AsyncProcessorMixin):
             if active_tasks:
                 await asyncio.gather(*active_tasks, return_exceptions=True)
             await nats_connection.close()
+            # don't wait on invocations that already timed out
+            executor.shutdown(wait=False)
 
     def _internal_run_custom_model_thread(self, coro: Any) -> Any:
         loop = asyncio.new_event_loop()
@@ -677,7 +990,13 @@ class ModelUnderTest(AsyncProcessorMixin):
             loop.close()
 
     def _internal_start_custom_model_thread(
-        self, nats_jwt: str, seed: str, local_nats: str, invoke_id: str
+        self,
+        nats_jwt: str,
+        seed: str,
+        local_nats: str,
+        invoke_id: str,
+        max_concurrent_turns: int = _DEFAULT_MAX_CONCURRENT_TURNS,
+        turn_timeout: Optional[float] = None,
     ) -> tuple:
         custom_model_thread_stop_event = threading.Event()
         custom_model_thread = threading.Thread(
@@ -689,6 +1008,8 @@ class ModelUnderTest(AsyncProcessorMixin):
                     seed,
                     local_nats,
                     invoke_id,
+                    max_concurrent_turns,
+                    turn_timeout,
                 ),
             ),
         )
@@ -718,22 +1039,24 @@ class ModelUnderTest(AsyncProcessorMixin):
         run_test_method: Any = None,
         simulation_params: Optional[Any] = None,
         driver_id: Optional[str] = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_concurrent_turns: int = _DEFAULT_MAX_CONCURRENT_TURNS,
+        turn_timeout: Optional[float] = None,
+        scenario_data_points: Optional[List[ScenarioDataPoinResponse]] = None,
+        invocation_limit: Optional[threading.Semaphore] = None,
+        use_cache: bool = True,
     ) -> TestRunItem:
-        """Internal method to run a test. This method is used by both run_test and submit_test."""
+        """Internal method to run a test. This method is used by both run_test and submit_test.
+        `scenario_data_points` skips the scenario download and `invocation_limit` caps CustomModel
+        invocations across runs (see `Okareo.run_tests_parallel`)."""
         self.custom_model_thread: Any = None
         self.custom_model_thread_stop_event: Any = None
 
         try:
             assert isinstance(self.models, dict)
-            _raw_scenario_id = (
-                scenario.scenario_id
-                if isinstance(scenario, ScenarioSetResponse)
-                else scenario
-            )
-            assert _raw_scenario_id is not None and not isinstance(
-                _raw_scenario_id, Unset
-            )
-            scenario_id: Union[str, UUID] = _raw_scenario_id
+            scenario_id = self._scenario_id(scenario)
+            if not use_cache and scenario_data_points is None:
+                self._drop_cached_scenario(scenario_id)
             run_api_keys = self._validate_run_test_params(
                 api_key, api_keys, test_run_type
             )
@@ -759,7 +1082,12 @@ class ModelUnderTest(AsyncProcessorMixin):
                     self.custom_model_thread,
                     self.custom_model_thread_stop_event,
                 ) = self._internal_start_custom_model_thread(
-                    nats_jwt, seed, local_nats, nats_invoke_id
+                    nats_jwt,
+                    seed,
+                    local_nats,
+                    nats_invoke_id,
+                    max_concurrent_turns,
+                    turn_timeout,
                 )
                 self.custom_model_thread.start()
             elif self._has_custom_model():
@@ -783,31 +1111,38 @@ class ModelUnderTest(AsyncProcessorMixin):
                     )
                     assert isinstance(submit_response, TestRunItem)
                     test_run_id = submit_response.id
-                    # run _custom_exec + _evaluate_internal in a background thread
-                    # if/when we make this method fully async, then we should use asyncio.create_task
-                    # since this is sync, we use use threading.Thread (which does not require an event loop)
-                    thread = threading.Thread(
-                        target=self._run_custom_exec_then_evaluate,
-                        args=(
-                            scenario_id,
-                            model_data,
-                            test_run_id,
-                            name,
-                            test_run_type,
-                            metrics_kwargs or UNSET,
-                            checks or UNSET,
-                        ),
-                        name=f"submit-testrun-custommodel-{test_run_id}",
-                        daemon=False,  # Important: don't use daemon thread to ensure task runs in background
+                    # run _custom_exec + _evaluate_internal on the shared submit pool;
+                    # its worker threads are joined at interpreter exit, so a
+                    # submitted run still completes when the script ends first
+                    invocations = RunProgress()
+                    future = self._submit_pool().submit(
+                        self._run_custom_exec_then_evaluate,
+                        scenario_id,
+                        model_data,
+                        str(test_run_id),
+                        name,
+                        test_run_type,
+                        metrics_kwargs or UNSET,
+                        checks or UNSET,
+                        max_concurrency,
+                        scenario_data_points,
+                        invocation_limit,
+                        invocations,
                     )
-                    thread.start()
                     # return the submit response immediately, allowing the user to access the test run ID
-                    self.validate_response(submit_response)
-                    assert isinstance(submit_response, TestRunItem)
-                    return submit_response
+                    return SubmittedTestRun._wrap(
+                        submit_response, self, future, invocations
+                    )
                 else:
                     # run the custom exec synchronously
-                    self._custom_exec(scenario_id, model_data, None)
+                    self._custom_exec(
+                        scenario_id,
+                        model_data,
+                        None,
+                        max_concurrency,
+                        scenario_data_points,
+                        invocation_limit,
+                    )
 
             response: TestRunItem = self._call_run_test_method(
                 run_test_method,
@@ -835,7 +1170,1093 @@ class ModelUnderTest(AsyncProcessorMixin):
                 self.custom_model_thread_stop_event, self.custom_model_thread
             )
 
-    def _call_run_test_method(
+    @staticmethod
+    def _scenario_id(
+        scenario: Union[ScenarioSetResponse, str, UUID],
+    ) -> Union[str, UUID]:
+        raw_scenario_id = (
+            scenario.scenario_id
+            if isinstance(scenario, ScenarioSetResponse)
+            else scenario
+        )
+        assert raw_scenario_id is not None and not isinstance(raw_scenario_id, Unset)
+        return raw_scenario_id
+
+    def _drop_cached_scenario(self, scenario_id: Union[str, UUID]) -> None:
+        """Make the next read of a scenario download it again."""
+        if self.scenario_cache is not None:
+            self.scenario_cache.invalidate(self.client._base_url, scenario_id)
+
+    def _call_run_test_method(
+        self,
+        run_test_method: Any,
+        scenario_id: Union[str, UUID],
+        name: str,
+        api_key: Optional[str],
+        api_keys: Optional[dict],
+        run_api_keys: dict,
+        metrics_kwargs: Optional[dict],
+        test_run_type: TestRunType,
+        calculate_metrics: bool,
+        model_data: dict,
+        checks: Optional[List[str]],
+        simulation_params: Optional[Any],
+        driver_id: Optional[str],
+        nats_invoke_id: Optional[str],
+    ) -> TestRunItem:
+        response: TestRunItem = run_test_method(
+            client=self.client,
+            api_key=self.api_key,
+            body=self._get_test_run_payload(
+                scenario_id,
+                name,
+                api_key,
+                api_keys,
+                run_api_keys,
+                metrics_kwargs,
+                test_run_type,
+                calculate_metrics,
+                model_data,
+                checks,
+                simulation_params,
+                driver_id,
+                nats_invoke_id,
+            ),
+        )
+        if isinstance(response, ErrorResponse):
+            error_message = f"error: {response}, {response.detail}"
+            print(error_message)
+            raise TestRunError(str(response.detail))
+        if not response:
+            print("Empty response from API")
+        assert response is not None
+        return response
+
+    def _run_custom_exec_then_evaluate(
+        self,
+        scenario_id: Union[str, UUID],
+        model_data: dict,
+        test_run_id: str,
+        name: str,
+        test_run_type: TestRunType,
+        metrics_kwargs: Union[dict, Unset] = UNSET,
+        checks: Union[List[str], Unset] = UNSET,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        scenario_data_points: Optional[List[ScenarioDataPoinResponse]] = None,
+        invocation_limit: Optional[threading.Semaphore] = None,
+        invocations: Optional[RunProgress] = None,
+    ) -> TestRunItem:
+        """Run custom exec, then evaluate once complete"""
+        self._custom_exec(
+            scenario_id,
+            model_data,
+            test_run_id,
+            max_concurrency,
+            scenario_data_points,
+            invocation_limit,
+            invocations,
+        )
+        if invocations is not None and invocations._cancel_requested.is_set():
+            raise concurrent.futures.CancelledError()
+        # pull datapoint IDs from test_run_id
+        print(
+            f"Submitting evaluation for test_run_id {test_run_id} after custom model invocations."
+        )
+        response = self._evaluate_internal(
+            self.client,
+            self.api_key,
+            name=name,
+            test_run_type=test_run_type,
+            scenario_id=scenario_id,
+            metrics_kwargs=metrics_kwargs,
+            test_run_id=test_run_id,
+            checks=checks,
+        )
+        self.validate_response(response)
+        assert isinstance(response, TestRunItem)
+        return response
+
+    def _check_multiturn_submit_safe(self, test_run_type: TestRunType) -> bool:
+        """Check if the test_run_type is MULTI_TURN and if the model is a CustomMultiturnTarget.
+        If so, return False to indicate that submit_test should not be used."""
+        if (
+            test_run_type == TestRunType.MULTI_TURN
+            and self.models is not None
+            and isinstance(self.models, dict)
+            and "custom_target" in self.models
+        ):
+            return False
+        return True
+
+    @classmethod
+    def _submit_pool(cls) -> concurrent.futures.ThreadPoolExecutor:
+        with cls._submit_executor_lock:
+            if ModelUnderTest._submit_executor is None:
+                ModelUnderTest._submit_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=cls.max_submitted_runs,
+                    thread_name_prefix="submit-testrun-custommodel",
+                )
+            return ModelUnderTest._submit_executor
+
+    def _submit_endpoint(self, test_run_type: TestRunType) -> Any:
+        if not self._check_multiturn_submit_safe(test_run_type):
+            print(
+                "WARNING: CustomMultiturnTarget models are not supported in submit_test. "
+                + "Falling back to run_test instead."
+            )
+            return run_test_v0_test_run_post.sync
+        return submit_test_v0_test_run_submit_post.sync
+
+    def submit_test(
+        self,
+        scenario: Union[ScenarioSetResponse, str, UUID],
+        name: str,
+        api_key: Optional[str] = None,
+        api_keys: Optional[dict] = None,
+        metrics_kwargs: Optional[dict] = None,
+        test_run_type: TestRunType = TestRunType.MULTI_CLASS_CLASSIFICATION,
+        calculate_metrics: bool = True,
+        checks: Optional[List[str]] = None,
+        simulation_params: Optional[Any] = None,
+        driver_id: Optional[str] = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_concurrent_turns: int = _DEFAULT_MAX_CONCURRENT_TURNS,
+        turn_timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> SubmittedTestRun:
+        """Asynchronous server-based version of test-run execution. For CustomModels, model
+        invocations are handled client-side in a background thread then evaluated server-side asynchronously.
+        At most `ModelUnderTest.max_submitted_runs` such runs execute at once; later ones queue.
+        For other models, model invocations and evaluation are both handled server-side asynchronously.
+
+        Arguments:
+            scenario (Union[ScenarioSetResponse, str]): The scenario set or identifier to use for the test run.
+            name (str): The name to assign to the test run.
+            api_key (Optional[str]): Optional API key for authentication.
+            api_keys (Optional[dict]): Optional dictionary of API keys for different services.
+            metrics_kwargs (Optional[dict]): Optional dictionary of keyword arguments for metrics calculation.
+            test_run_type (TestRunType): The type of test run to execute. Defaults to MULTI_CLASS_CLASSIFICATION.
+            calculate_metrics (bool): Whether to calculate metrics after the test run. Defaults to True.
+            checks (Optional[List[str]]): Optional list of checks to perform during the test run.
+            max_concurrency (int): Maximum number of CustomModel invocations in flight at once. Sync invokers
+                run on a thread pool of this size; `async def` invokers are awaited concurrently up to this limit.
+                Results are recorded in scenario order regardless of completion order. Defaults to 1.
+            max_concurrent_turns (int): For a CustomMultiturnTarget, the maximum number of simulation turns
+                invoked at once across all conversations of the run. Sync invokers run on a thread pool of this
+                size, off the NATS event loop. Defaults to 1, one turn at a time, so the target need not be
+                thread-safe; raise it for a thread-safe target so a slow turn does not hold up the others.
+            turn_timeout (Optional[float]): For a CustomMultiturnTarget, seconds to wait for a single turn before
+                reporting it as failed. A timed-out sync invoker keeps its worker thread until it returns.
+                Defaults to None (no timeout).
+            use_cache (bool): With a `scenario_cache`, pass False to download the scenario again instead
+                of reading it from the cache. Defaults to True.
+
+        Returns:
+            SubmittedTestRun: The submitted test run item. The `id` field can be used to retrieve the test run;
+                for a CustomModel, `result()` waits for the client-side invocations and the evaluation.
+        """
+        test_run = self._run_test_internal(
+            scenario,
+            name,
+            api_key,
+            api_keys,
+            metrics_kwargs,
+            test_run_type,
+            calculate_metrics,
+            checks,
+            self._submit_endpoint(test_run_type),
+            simulation_params,
+            driver_id,
+            max_concurrency,
+            max_concurrent_turns,
+            turn_timeout,
+            use_cache=use_cache,
+        )
+        if isinstance(test_run, SubmittedTestRun):
+            return test_run
+        return SubmittedTestRun._wrap(test_run, self)
+
+    def run_test(
+        self,
+        scenario: Union[ScenarioSetResponse, str, UUID],
+        name: str,
+        api_key: Optional[str] = None,
+        api_keys: Optional[dict] = None,
+        metrics_kwargs: Optional[dict] = None,
+        test_run_type: TestRunType = TestRunType.MULTI_CLASS_CLASSIFICATION,
+        calculate_metrics: bool = True,
+        checks: Optional[List[str]] = None,
+        simulation_params: Optional[Any] = None,
+        driver_id: Optional[str] = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_concurrent_turns: int = _DEFAULT_MAX_CONCURRENT_TURNS,
+        turn_timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> TestRunItem:
+        """Server-based version of test-run execution. For CustomModels, model
+        invocations are handled client-side then evaluated server-side. For other models,
+        model invocations and evaluations handled server-side.
+
+        Arguments:
+            scenario (Union[ScenarioSetResponse, str]): The scenario set or identifier to use for the test run.
+            name (str): The name to assign to the test run.
+            api_key (Optional[str]): Optional API key for authentication.
+            api_keys (Optional[dict]): Optional dictionary of API keys for different services.
+            metrics_kwargs (Optional[dict]): Optional dictionary of keyword arguments for metrics calculation.
+            test_run_type (TestRunType): The type of test run to execute. Defaults to MULTI_CLASS_CLASSIFICATION.
+            calculate_metrics (bool): Whether to calculate metrics after the test run. Defaults to True.
+            checks (Optional[List[str]]): Optional list of checks to perform during the test run.
+            max_concurrency (int): Maximum number of CustomModel invocations in flight at once. Sync invokers
+                run on a thread pool of this size; `async def` invokers are awaited concurrently up to this limit.
+                Results are recorded in scenario order regardless of completion order. Defaults to 1.
+            max_concurrent_turns (int): For a CustomMultiturnTarget, the maximum number of simulation turns
+                invoked at once across all conversations of the run. Sync invokers run on a thread pool of this
+                size, off the NATS event loop. Defaults to 1, one turn at a time, so the target need not be
+                thread-safe; raise it for a thread-safe target so a slow turn does not hold up the others.
+            turn_timeout (Optional[float]): For a CustomMultiturnTarget, seconds to wait for a single turn before
+                reporting it as failed. A timed-out sync invoker keeps its worker thread until it returns.
+                Defaults to None (no timeout).
+            use_cache (bool): With a `scenario_cache`, pass False to download the scenario again instead
+                of reading it from the cache. Defaults to True.
+
+        Returns:
+            TestRunItem: The resulting test run item for the completed test run.
+        """
+        try:
+            return self._run_test_internal(
+                scenario,
+                name,
+                api_key,
+                api_keys,
+                metrics_kwargs,
+                test_run_type,
+                calculate_metrics,
+                checks,
+                run_test_v0_test_run_post.sync,
+                simulation_params,
+                driver_id,
+                max_concurrency,
+                max_concurrent_turns,
+                turn_timeout,
+                use_cache=use_cache,
+            )
+        except Exception as e:
+            raise TestRunError(str(e)) from e
+
+    def get_test_run(self, test_run_id: Union[str, UUID]) -> TestRunItem:
+        """Retrieve a test run by its ID.
+
+        Arguments:
+            test_run_id (str): The ID of the test run to retrieve.
+
+        Returns:
+            TestRunItem: The test run item corresponding to the provided ID.
+        """
+        try:
+            response = get_test_run_v0_test_runs_test_run_id_get.sync(
+                client=self.client,
+                api_key=self.api_key,
+                test_run_id=(
+                    UUID(test_run_id) if isinstance(test_run_id, str) else test_run_id
+                ),
+            )
+            self.validate_response(response)
+            assert isinstance(response, TestRunItem)
+
+            return response
+        except UnexpectedStatus as e:
+            print(e.content)
+            raise
+
+    @staticmethod
+    def _test_run_request(
+        test_run_id: Union[str, UUID], api_key: str, etag: Optional[str]
+    ) -> Dict[str, Any]:
+        kwargs = get_test_run_v0_test_runs_test_run_id_get._get_kwargs(
+            test_run_id=(
+                UUID(test_run_id) if isinstance(test_run_id, str) else test_run_id
+            ),
+            api_key=api_key,
+        )
+        if etag is not None:
+            kwargs["headers"]["If-None-Match"] = etag
+        return kwargs
+
+    def _parse_polled_test_run(
+        self, response: httpx.Response, etag: Optional[str]
+    ) -> Tuple[Optional[TestRunItem], Optional[str]]:
+        """(test run, ETag) of a status check; (None, etag) when 304 Not Modified."""
+        if response.status_code == 304:
+            return None, etag
+        parsed = get_test_run_v0_test_runs_test_run_id_get._parse_response(
+            client=self.client, response=response
+        )
+        self.validate_response(parsed)
+        assert isinstance(parsed, TestRunItem)
+        return parsed, response.headers.get("etag")
+
+    def _poll_test_run(
+        self, test_run_id: Union[str, UUID], etag: Optional[str] = None
+    ) -> Tuple[Optional[TestRunItem], Optional[str]]:
+        response = self.client.get_httpx_client().request(
+            **self._test_run_request(test_run_id, self.api_key, etag)
+        )
+        return self._parse_polled_test_run(response, etag)
+
+    def wait_for_test_run(
+        self,
+        test_run_id: Union[str, UUID],
+        timeout: Optional[float] = None,
+        poll_interval: float = TEST_RUN_POLL_INTERVAL,
+        max_poll_interval: float = TEST_RUN_MAX_POLL_INTERVAL,
+    ) -> TestRunItem:
+        """Wait for a test run, e.g. one started with `submit_test`, to finish.
+
+        The run is checked at once, then after `poll_interval` seconds, doubling up to
+        `max_poll_interval`, each wait jittered slightly. When the server sends an
+        `ETag`, later checks are conditional and an unchanged run costs no body.
+
+        Arguments:
+            test_run_id (str): The ID of the test run to wait for.
+            timeout (Optional[float]): Seconds to wait before raising TimeoutError. Defaults to None (no limit).
+            poll_interval (float): Seconds before the second check.
+            max_poll_interval (float): Longest wait between checks.
+
+        Returns:
+            TestRunItem: The test run, with status FINISHED or FAILED.
+        """
+        backoff = Backoff(poll_interval, max_poll_interval, timeout)
+        test_run, etag = self._poll_test_run(test_run_id)
+        assert test_run is not None
+        while test_run.status not in TEST_RUN_DONE_STATUSES:
+            delay = backoff.next_delay()
+            if delay is None:
+                raise poll_timeout_error([test_run_id])
+            time.sleep(delay)
+            polled, etag = self._poll_test_run(test_run_id, etag)
+            test_run = polled or test_run
+        return test_run
+
+    @classmethod
+    def validate_response(cls, response: Any) -> None:
+        if isinstance(response, ErrorResponse):
+            error_message = f"error: {response}, {response.detail}"
+            print(error_message)
+            raise TypeError(error_message)
+        if response is None:
+            print("Received no response (None) from the API")
+            raise ValueError("No response received")
+
+    def _extract_input_from_scenario_data_point(
+        self, scenario_data_point: ScenarioDataPoinResponse
+    ) -> Any:
+        """helper method to handle different scenario data point formats"""
+        scenario_input = scenario_data_point.input_
+        return scenario_input
+
+    def _safe_invoke_custom_model(
+        self, custom_model_invoker: Any, scenario_data_point: ScenarioDataPoinResponse
+    ) -> Any:
+        """Invoke a sync CustomModel on one scenario row, turning an exception
+        into an error ModelInvocation so that one bad row never aborts the run."""
+        scenario_input = self._extract_input_from_scenario_data_point(
+            scenario_data_point
+        )
+        try:
+            return custom_model_invoker(scenario_input)
+        except concurrent.futures.CancelledError:
+            raise
+        except Exception as e:
+            return self._custom_model_error_invocation(
+                scenario_data_point, scenario_input, e
+            )
+
+    async def _safe_invoke_custom_model_async(
+        self,
+        custom_model_invoker: Any,
+        scenario_data_point: ScenarioDataPoinResponse,
+        semaphore: asyncio.Semaphore,
+    ) -> Any:
+        """Async counterpart of `_safe_invoke_custom_model` for `async def` invokers."""
+        scenario_input = self._extract_input_from_scenario_data_point(
+            scenario_data_point
+        )
+        async with semaphore:
+            try:
+                return await custom_model_invoker(scenario_input)
+            except concurrent.futures.CancelledError:
+                raise
+            except Exception as e:
+                return self._custom_model_error_invocation(
+                    scenario_data_point, scenario_input, e
+                )
+
+    @staticmethod
+    def _custom_model_error_invocation(
+        scenario_data_point: ScenarioDataPoinResponse,
+        scenario_input: Any,
+        error: Exception,
+    ) -> "ModelInvocation":
+        # Log the error but continue processing other datapoints
+        print(
+            f"An error occurred while invoking the custom model for scenario_data_point ID {scenario_data_point.id}: {str(error)}"
+        )
+        # Create a ModelInvocation with error details
+        return ModelInvocation(
+            model_prediction=None,
+            model_input=scenario_input,
+            tool_calls=None,
+            error={"error_message": str(error)},
+        )
+
+    async def _gather_custom_model_async(
+        self,
+        custom_model_invoker: Any,
+        scenario_data_points: List[ScenarioDataPoinResponse],
+        max_concurrency: int,
+        progress: Any,
+    ) -> List[Any]:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def invoke(scenario_data_point: ScenarioDataPoinResponse) -> Any:
+            result = await self._safe_invoke_custom_model_async(
+                custom_model_invoker, scenario_data_point, semaphore
+            )
+            progress.update(1)
+            return result
+
+        # gather preserves the order of its arguments, not of completion
+        return await asyncio.gather(
+            *(
+                invoke(scenario_data_point)
+                for scenario_data_point in scenario_data_points
+            )
+        )
+
+    def _custom_exec_rows(
+        self,
+        scenario_data_points: List[ScenarioDataPoinResponse],
+        model_data: Any,
+        test_run_id: Optional[str],
+        max_concurrency: int,
+        datapoint_writer: Optional[DatapointWriter],
+        invocation_limit: Optional[threading.Semaphore] = None,
+        invocations: Optional[RunProgress] = None,
+    ) -> None:
+        assert isinstance(self.models, dict)
+        custom_model_invoker = self._wrap_invoker(
+            self.models["custom"]["model_invoker"], invocation_limit, invocations
+        )
+        with tqdm(
+            total=len(scenario_data_points),
+            desc="Invoking CustomModel",
+            unit="datapoint",
+        ) as progress:
+            if inspect.iscoroutinefunction(custom_model_invoker):
+                # run on a private event loop so this works even when the
+                # caller is already inside one (e.g. a notebook)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as runner:
+                    return_values = runner.submit(
+                        asyncio.run,
+                        self._gather_custom_model_async(
+                            custom_model_invoker,
+                            scenario_data_points,
+                            max_concurrency,
+                            progress,
+                        ),
+                    ).result()
+                for scenario_data_point, custom_model_return_value in zip(
+                    scenario_data_points, return_values
+                ):
+                    self._add_model_invocation_for_scenario(
+                        custom_model_return_value,
+                        model_data,
+                        scenario_data_point.id,
+                        test_run_id,
+                        datapoint_writer,
+                        invocations,
+                    )
+            elif max_concurrency <= 1:
+                for scenario_data_point in scenario_data_points:
+                    custom_model_return_value = self._safe_invoke_custom_model(
+                        custom_model_invoker, scenario_data_point
+                    )
+                    self._add_model_invocation_for_scenario(
+                        custom_model_return_value,
+                        model_data,
+                        scenario_data_point.id,
+                        test_run_id,
+                        datapoint_writer,
+                        invocations,
+                    )
+                    progress.update(1)
+            else:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_concurrency,
+                    thread_name_prefix="okareo-custom-model",
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            self._safe_invoke_custom_model,
+                            custom_model_invoker,
+                            scenario_data_point,
+                        )
+                        for scenario_data_point in scenario_data_points
+                    ]
+                    # consume in scenario order so model_data is deterministic
+                    # regardless of which invocation finishes first
+                    for scenario_data_point, future in zip(
+                        scenario_data_points, futures
+                    ):
+                        self._add_model_invocation_for_scenario(
+                            future.result(),
+                            model_data,
+                            scenario_data_point.id,
+                            test_run_id,
+                            datapoint_writer,
+                            invocations,
+                        )
+                        progress.update(1)
+
+    @staticmethod
+    def _wrap_invoker(
+        custom_model_invoker: Any,
+        invocation_limit: Optional[threading.Semaphore],
+        invocations: Optional[RunProgress],
+    ) -> Any:
+        """Wrap an invoker so that each call holds one slot of `invocation_limit`
+        and, once the run is cancelled, raises CancelledError instead of invoking."""
+        if invocation_limit is None and invocations is None:
+            return custom_model_invoker
+        limit: Any = invocation_limit or contextlib.nullcontext()
+
+        def check_cancelled() -> None:
+            if invocations is not None and invocations._cancel_requested.is_set():
+                raise concurrent.futures.CancelledError()
+
+        if inspect.iscoroutinefunction(custom_model_invoker):
+
+            async def limited_async(*args: Any) -> Any:
+                check_cancelled()
+                # acquire off the event loop so waiting never blocks other rows
+                await asyncio.to_thread(limit.__enter__)
+                try:
+                    check_cancelled()
+                    return await custom_model_invoker(*args)
+                finally:
+                    limit.__exit__(None, None, None)
+
+            return limited_async
+
+        def limited(*args: Any) -> Any:
+            check_cancelled()
+            with limit:
+                check_cancelled()
+                return custom_model_invoker(*args)
+
+        return limited
+
+    def _custom_exec_batches(
+        self,
+        scenario_data_points: List[ScenarioDataPoinResponse],
+        model_data: Any,
+        test_run_id: Optional[str],
+        datapoint_writer: Optional[DatapointWriter],
+        invocation_limit: Optional[threading.Semaphore] = None,
+        invocations: Optional[RunProgress] = None,
+    ) -> None:
+        assert isinstance(self.models, dict)
+        datapoint_len = len(scenario_data_points)
+        # batch inputs to the custom model
+        custom_model_invoker = self._wrap_invoker(
+            self.models["custom_batch"]["model_invoker"], invocation_limit, invocations
+        )
+        if self.models["custom_batch"].get("adaptive_batching"):
+            self._custom_exec_adaptive_batches(
+                custom_model_invoker,
+                scenario_data_points,
+                model_data,
+                test_run_id,
+                datapoint_writer,
+                invocations,
+            )
+            return
+        batch_size = self.models["custom_batch"]["batch_size"]
+        for index in tqdm(
+            range(0, datapoint_len, batch_size),
+            desc="Invoking CustomModel",
+            unit="batch",
+        ):
+            end_index = min(index + batch_size, datapoint_len)
+            scenario_data_points_batch = scenario_data_points[index:end_index]
+            scenario_inputs = [
+                {
+                    "id": str(sdp.id),
+                    "input_value": self._extract_input_from_scenario_data_point(sdp),
+                }
+                for sdp in scenario_data_points_batch
+            ]
+            custom_model_return_batch = custom_model_invoker(scenario_inputs)
+
+            for return_dict in custom_model_return_batch:
+                self._add_model_invocation_for_scenario(
+                    return_dict["model_invocation"],
+                    model_data,
+                    return_dict["id"],
+                    test_run_id,
+                    datapoint_writer,
+                    invocations,
+                )
+
+    def _custom_exec_adaptive_batches(
+        self,
+        custom_model_invoker: Any,
+        scenario_data_points: List[ScenarioDataPoinResponse],
+        model_data: Any,
+        test_run_id: Optional[str],
+        datapoint_writer: Optional[DatapointWriter],
+        invocations: Optional[RunProgress],
+    ) -> None:
+        """Invoke a CustomBatchModel with `adaptive_batching`: batch sizes follow
+        the observed latency and failures, and a failing batch is narrowed down to
+        its failing rows, which get error invocations instead of aborting the run."""
+        assert isinstance(self.models, dict)
+        config = self.models["custom_batch"]
+        by_id = {str(sdp.id): sdp for sdp in scenario_data_points}
+        progress = tqdm(
+            total=len(scenario_data_points), desc="Invoking CustomModel", unit="row"
+        )
+
+        def record(return_dict: Dict[str, Any]) -> None:
+            self._add_model_invocation_for_scenario(
+                return_dict["model_invocation"],
+                model_data,
+                return_dict["id"],
+                test_run_id,
+                datapoint_writer,
+                invocations,
+            )
+            progress.update(1)
+
+        def on_error(row: Dict[str, Any], error: Exception) -> None:
+            error_invocation = self._custom_model_error_invocation(
+                by_id[row["id"]], row["input_value"], error
+            )
+            record({"id": row["id"], "model_invocation": error_invocation})
+
+        with progress:
+            run_adaptive_batches(
+                custom_model_invoker,
+                [
+                    {
+                        "id": str(sdp.id),
+                        "input_value": self._extract_input_from_scenario_data_point(
+                            sdp
+                        ),
+                    }
+                    for sdp in scenario_data_points
+                ],
+                record,
+                on_error,
+                AdaptiveBatchSize(
+                    config["batch_size"],
+                    config.get("max_batch_size"),
+                    config.get("target_batch_latency"),
+                ),
+                config.get("max_concurrent_batches", 1),
+            )
+
+    def _custom_exec(
+        self,
+        scenario_id: Any,
+        model_data: Any,
+        test_run_id: Optional[str] = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        scenario_data_points: Optional[List[ScenarioDataPoinResponse]] = None,
+        invocation_limit: Optional[threading.Semaphore] = None,
+        invocations: Optional[RunProgress] = None,
+    ) -> Any:
+        assert isinstance(self.models, dict)
+
+        assert scenario_id
+        if scenario_data_points is None:
+            scenario_data_points = self._get_scenario_data_points(scenario_id)
+        if invocations is not None:
+            invocations.total = len(scenario_data_points)
+
+        # datapoints for a submitted run are uploaded in chunks alongside the
+        # invocations instead of one blocking POST per row
+        datapoint_writer = (
+            BulkCallBuffer(
+                add_datapoint_v0_datapoints_post.sync,
+                self.client,
+                self.api_key,
+                validate=self.validate_response,
+            )
+            if test_run_id is not None
+            else None
+        )
+        try:
+            if not self._has_custom_batch_model():
+                self._custom_exec_rows(
+                    scenario_data_points,
+                    model_data,
+                    test_run_id,
+                    max_concurrency,
+                    datapoint_writer,
+                    invocation_limit,
+                    invocations,
+                )
+            else:
+                self._custom_exec_batches(
+                    scenario_data_points,
+                    model_data,
+                    test_run_id,
+                    datapoint_writer,
+                    invocation_limit,
+                    invocations,
+                )
+        finally:
+            if datapoint_writer is not None:
+                # barrier: every datapoint is stored before evaluation reads them
+                datapoint_writer.close()
+
+    @classmethod
+    def _evaluate_internal(
+        cls,
+        client: Client,
+        api_key: str,
+        name: str,
+        test_run_type: TestRunType,
+        scenario_id: Union[Unset, str, UUID] = UNSET,
+        datapoint_ids: Union[Unset, list[str], list[UUID]] = UNSET,
+        filter_group_id: Union[Unset, str, UUID] = UNSET,
+        tags: Union[Unset, list[str]] = UNSET,
+        metrics_kwargs: Union[Dict[str, Any], Unset] = UNSET,
+        checks: Union[Unset, list[str]] = UNSET,
+        test_run_id: Union[Unset, str, UUID] = UNSET,
+    ) -> TestRunItem:
+        """Run an 'online' evaluation on already uploaded datapoints.
+        Also used to handle 'submit_test' for CustomModel (requires a `test_run_id`$).
+        """
+        response = evaluate_v0_evaluate_post.sync(
+            client=client,
+            body=cls._evaluation_payload(
+                name,
+                test_run_type,
+                scenario_id,
+                datapoint_ids,
+                filter_group_id,
+                tags,
+                metrics_kwargs,
+                checks,
+                test_run_id,
+            ),
+            api_key=api_key,
+        )
+        cls.validate_response(response)
+        assert response is not None and not isinstance(response, ErrorResponse)
+        return response
+
+    @staticmethod
+    def _evaluation_payload(
+        name: str,
+        test_run_type: TestRunType,
+        scenario_id: Union[Unset, str, UUID] = UNSET,
+        datapoint_ids: Union[Unset, list[str], list[UUID]] = UNSET,
+        filter_group_id: Union[Unset, str, UUID] = UNSET,
+        tags: Union[Unset, list[str]] = UNSET,
+        metrics_kwargs: Union[Dict[str, Any], Unset] = UNSET,
+        checks: Union[Unset, list[str]] = UNSET,
+        test_run_id: Union[Unset, str, UUID] = UNSET,
+    ) -> EvaluationPayload:
+        _scenario_id: Union[Unset, UUID, None] = (
+            UNSET
+            if isinstance(scenario_id, Unset)
+            else UUID(scenario_id) if isinstance(scenario_id, str) else scenario_id
+        )
+        _datapoint_ids: Union[Unset, list[UUID], None] = (
+            UNSET
+            if isinstance(datapoint_ids, Unset)
+            else [UUID(d) if isinstance(d, str) else d for d in datapoint_ids]
+        )
+        _filter_group_id: Union[Unset, UUID, None] = (
+            UNSET
+            if isinstance(filter_group_id, Unset)
+            else (
+                UUID(filter_group_id)
+                if isinstance(filter_group_id, str)
+                else filter_group_id
+            )
+        )
+        _test_run_id: Union[Unset, UUID, None] = (
+            UNSET
+            if isinstance(test_run_id, Unset)
+            else UUID(test_run_id) if isinstance(test_run_id, str) else test_run_id
+        )
+        return EvaluationPayload(
+            metrics_kwargs=EvaluationPayloadMetricsKwargs.from_dict(
+                metrics_kwargs or {}
+            ),
+            name=name,
+            type_=test_run_type,
+            tags=tags,
+            checks=checks,
+            scenario_id=_scenario_id,
+            datapoint_ids=_datapoint_ids,
+            filter_group_id=_filter_group_id,
+            test_run_id=_test_run_id,
+        )
+
+
+class AsyncModelUnderTest:
+    """asyncio counterpart of `ModelUnderTest`, returned by
+    [AsyncOkareo.register_model()](/docs/reference/python-sdk/okareo#register_model).
+
+    Every request goes through the client's `httpx.AsyncClient`, so many test runs
+    can share one event loop. Sync CustomModel invokers run on the loop's default
+    executor and `async def` invokers are awaited directly. CustomMultiturnTarget
+    runs need the NATS listener thread, so they run `ModelUnderTest` in a worker
+    thread instead.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        api_key: str,
+        mut: ModelUnderTestResponse,
+        models: Optional[Dict[str, Any]] = None,
+        scenario_cache: Optional[ScenarioDataPointCache] = None,
+    ):
+        self.client = client
+        self.api_key = api_key
+        self.scenario_cache = scenario_cache
+
+        self.version = mut.version
+        self.mut_id = mut.id
+        self.project_id = mut.project_id
+        self.name = mut.name
+        self.tags = mut.tags
+        self.models = models
+        self.app_link = mut.app_link
+        # request building and the CustomModel plumbing are shared with the
+        # sync class; it performs no I/O unless a call is delegated to it
+        self._sync = ModelUnderTest(client, api_key, mut, models, scenario_cache)
+        self._submitted: Set[asyncio.Task] = set()
+
+    async def add_data_point(
+        self,
+        input_obj: Union[dict, str, None] = None,
+        result_obj: Union[dict, str, None] = None,
+        feedback: Union[float, None] = None,
+        context_token: Union[str, None] = None,
+        error_message: Union[str, None] = None,
+        error_code: Union[str, None] = None,
+        input_datetime: Union[str, Unset] = UNSET,
+        result_datetime: Union[str, Unset] = UNSET,
+        tags: Union[List[str], None] = None,
+        test_run_id: Union[None, str] = None,
+        group_id: Union[None, str] = None,
+    ) -> Union[DatapointResponse, ErrorResponse]:
+        body = self._sync._datapoint_body(
+            input_obj=input_obj,
+            result_obj=result_obj,
+            feedback=feedback,
+            context_token=context_token,
+            error_message=error_message,
+            error_code=error_code,
+            input_datetime=input_datetime,
+            result_datetime=result_datetime,
+            tags=tags,
+            test_run_id=test_run_id,
+            group_id=group_id,
+        )
+        response = await add_datapoint_v0_datapoints_post.asyncio(
+            client=self.client,
+            api_key=self.api_key,
+            body=body,
+        )
+        if not response:
+            print("Empty response from API")
+        assert response is not None
+
+        return response
+
+    async def get_test_run(self, test_run_id: Union[str, UUID]) -> TestRunItem:
+        """Retrieve a test run by its ID.
+
+        Arguments:
+            test_run_id (str): The ID of the test run to retrieve.
+
+        Returns:
+            TestRunItem: The test run item corresponding to the provided ID.
+        """
+        try:
+            response = await get_test_run_v0_test_runs_test_run_id_get.asyncio(
+                client=self.client,
+                api_key=self.api_key,
+                test_run_id=(
+                    UUID(test_run_id) if isinstance(test_run_id, str) else test_run_id
+                ),
+            )
+            self.validate_response(response)
+            assert isinstance(response, TestRunItem)
+
+            return response
+        except UnexpectedStatus as e:
+            print(e.content)
+            raise
+
+    async def _poll_test_run(
+        self, test_run_id: Union[str, UUID], etag: Optional[str] = None
+    ) -> Tuple[Optional[TestRunItem], Optional[str]]:
+        response = await self.client.get_async_httpx_client().request(
+            **ModelUnderTest._test_run_request(test_run_id, self.api_key, etag)
+        )
+        return self._sync._parse_polled_test_run(response, etag)
+
+    async def wait_for_test_run(
+        self,
+        test_run_id: Union[str, UUID],
+        timeout: Optional[float] = None,
+        poll_interval: float = TEST_RUN_POLL_INTERVAL,
+        max_poll_interval: float = TEST_RUN_MAX_POLL_INTERVAL,
+    ) -> TestRunItem:
+        """Wait for a test run to finish without blocking the event loop.
+        See `ModelUnderTest.wait_for_test_run`."""
+        backoff = Backoff(poll_interval, max_poll_interval, timeout)
+        test_run, etag = await self._poll_test_run(test_run_id)
+        assert test_run is not None
+        while test_run.status not in TEST_RUN_DONE_STATUSES:
+            delay = backoff.next_delay()
+            if delay is None:
+                raise poll_timeout_error([test_run_id])
+            await asyncio.sleep(delay)
+            polled, etag = await self._poll_test_run(test_run_id, etag)
+            test_run = polled or test_run
+        return test_run
+
+    def validate_response(self, response: Any) -> None:
+        self._sync.validate_response(response)
+
+    def _uses_custom_target(self, test_run_type: TestRunType) -> bool:
+        return (
+            self._sync._has_custom_model() and test_run_type == TestRunType.MULTI_TURN
+        )
+
+    async def _get_scenario_data_points(
+        self, scenario_id: Union[str, UUID]
+    ) -> List[ScenarioDataPoinResponse]:
+        if self.scenario_cache is not None:
+            cached = await asyncio.to_thread(
+                self.scenario_cache.get,
+                self.client._base_url,
+                self.api_key,
+                scenario_id,
+            )
+            if cached is not None:
+                return cached
+        scenario_data_points = await get_scenario_set_data_points_v0_scenario_data_points_scenario_id_get.asyncio(
+            client=self.client,
+            api_key=self.api_key,
+            scenario_id=(
+                UUID(scenario_id) if isinstance(scenario_id, str) else scenario_id
+            ),
+        )
+        if not isinstance(scenario_data_points, List):
+            return []
+        if self.scenario_cache is not None and scenario_data_points:
+            await asyncio.to_thread(
+                self.scenario_cache.put,
+                self.client._base_url,
+                self.api_key,
+                scenario_id,
+                scenario_data_points,
+            )
+        return scenario_data_points
+
+    async def _invoke_custom_model(
+        self,
+        scenario_data_points: List[ScenarioDataPoinResponse],
+        max_concurrency: int,
+    ) -> List[Any]:
+        assert isinstance(self.models, dict)
+        custom_model_invoker = self.models["custom"]["model_invoker"]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        if inspect.iscoroutinefunction(custom_model_invoker):
+            return await asyncio.gather(
+                *(
+                    self._sync._safe_invoke_custom_model_async(
+                        custom_model_invoker, scenario_data_point, semaphore
+                    )
+                    for scenario_data_point in scenario_data_points
+                )
+            )
+
+        async def invoke(scenario_data_point: ScenarioDataPoinResponse) -> Any:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._sync._safe_invoke_custom_model,
+                    custom_model_invoker,
+                    scenario_data_point,
+                )
+
+        # gather preserves the order of its arguments, not of completion
+        return await asyncio.gather(
+            *(
+                invoke(scenario_data_point)
+                for scenario_data_point in scenario_data_points
+            )
+        )
+
+    async def _custom_exec(
+        self,
+        scenario_id: Union[str, UUID],
+        model_data: Any,
+        test_run_id: Optional[str] = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        scenario_data_points = await self._get_scenario_data_points(scenario_id)
+        datapoint_writer = (
+            AsyncCallBuffer(
+                add_datapoint_v0_datapoints_post.asyncio,
+                self.client,
+                self.api_key,
+                validate=self.validate_response,
+            )
+            if test_run_id is not None
+            else None
+        )
+        if self._sync._has_custom_batch_model():
+            # invoke_batch is a blocking call; keep it off the event loop
+            await asyncio.to_thread(
+                self._sync._custom_exec_batches,
+                scenario_data_points,
+                model_data,
+                test_run_id,
+                datapoint_writer,
+            )
+        else:
+            return_values = await self._invoke_custom_model(
+                scenario_data_points, max_concurrency
+            )
+            for scenario_data_point, custom_model_return_value in zip(
+                scenario_data_points, return_values
+            ):
+                self._sync._add_model_invocation_for_scenario(
+                    custom_model_return_value,
+                    model_data,
+                    scenario_data_point.id,
+                    test_run_id,
+                    datapoint_writer,
+                )
+                if datapoint_writer is not None:
+                    await datapoint_writer.drain()
+        if datapoint_writer is not None:
+            # barrier: every datapoint is stored before evaluation reads them
+            await datapoint_writer.flush()
+
+    async def _call_run_test_method(
         self,
         run_test_method: Any,
         scenario_id: Union[str, UUID],
@@ -850,12 +2271,11 @@ class ModelUnderTest(AsyncProcessorMixin):
         checks: Optional[List[str]],
         simulation_params: Optional[Any],
         driver_id: Optional[str],
-        nats_invoke_id: Optional[str],
     ) -> TestRunItem:
-        response: TestRunItem = run_test_method(
+        response = await run_test_method(
             client=self.client,
             api_key=self.api_key,
-            body=self._get_test_run_payload(
+            body=self._sync._get_test_run_payload(
                 scenario_id,
                 name,
                 api_key,
@@ -868,7 +2288,7 @@ class ModelUnderTest(AsyncProcessorMixin):
                 checks,
                 simulation_params,
                 driver_id,
-                nats_invoke_id,
+                None,
             ),
         )
         if isinstance(response, ErrorResponse):
@@ -877,26 +2297,26 @@ class ModelUnderTest(AsyncProcessorMixin):
             raise TestRunError(str(response.detail))
         if not response:
             print("Empty response from API")
-        assert response is not None
+        assert isinstance(response, TestRunItem)
         return response
 
-    def _run_custom_exec_then_evaluate(
+    async def _custom_exec_then_evaluate(
         self,
-        scenario_id: str,
+        scenario_id: Union[str, UUID],
         model_data: dict,
         test_run_id: str,
         name: str,
         test_run_type: TestRunType,
         metrics_kwargs: Union[dict, Unset] = UNSET,
         checks: Union[List[str], Unset] = UNSET,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
     ) -> TestRunItem:
         """Run custom exec, then evaluate once complete"""
-        self._custom_exec(scenario_id, model_data, test_run_id)
-        # pull datapoint IDs from test_run_id
+        await self._custom_exec(scenario_id, model_data, test_run_id, max_concurrency)
         print(
             f"Submitting evaluation for test_run_id {test_run_id} after custom model invocations."
         )
-        response = self._evaluate_internal(
+        return await self._evaluate_internal(
             self.client,
             self.api_key,
             name=name,
@@ -906,23 +2326,79 @@ class ModelUnderTest(AsyncProcessorMixin):
             test_run_id=test_run_id,
             checks=checks,
         )
-        self.validate_response(response)
-        assert isinstance(response, TestRunItem)
-        return response
 
-    def _check_multiturn_submit_safe(self, test_run_type: TestRunType) -> bool:
-        """Check if the test_run_type is MULTI_TURN and if the model is a CustomMultiturnTarget.
-        If so, return False to indicate that submit_test should not be used."""
-        if (
-            test_run_type == TestRunType.MULTI_TURN
-            and self.models is not None
-            and isinstance(self.models, dict)
-            and "custom_target" in self.models
-        ):
-            return False
-        return True
+    async def _run_test_internal(
+        self,
+        scenario: Union[ScenarioSetResponse, str, UUID],
+        name: str,
+        api_key: Optional[str],
+        api_keys: Optional[dict],
+        metrics_kwargs: Optional[dict],
+        test_run_type: TestRunType,
+        calculate_metrics: bool,
+        checks: Optional[List[str]],
+        submit: bool,
+        simulation_params: Optional[Any],
+        driver_id: Optional[str],
+        max_concurrency: int,
+    ) -> TestRunItem:
+        try:
+            scenario_id = ModelUnderTest._scenario_id(scenario)
+            run_api_keys = self._sync._validate_run_test_params(
+                api_key, api_keys, test_run_type
+            )
+            model_data: dict = {"model_data": {}}
+            run_test_method = (
+                submit_test_v0_test_run_submit_post.asyncio
+                if submit
+                else run_test_v0_test_run_post.asyncio
+            )
+            call_args = (
+                scenario_id,
+                name,
+                api_key,
+                api_keys,
+                run_api_keys,
+                metrics_kwargs,
+                test_run_type,
+                calculate_metrics,
+                model_data,
+                checks,
+                simulation_params,
+                driver_id,
+            )
+            if self._sync._has_custom_model() and submit:
+                # fetch the test_run_id first, then invoke, upload and evaluate
+                # in a task on this loop
+                submit_response = await self._call_run_test_method(
+                    run_test_method, *call_args
+                )
+                test_run_id = str(submit_response.id)
+                task = asyncio.create_task(
+                    self._custom_exec_then_evaluate(
+                        scenario_id,
+                        model_data,
+                        test_run_id,
+                        name,
+                        test_run_type,
+                        metrics_kwargs or UNSET,
+                        checks or UNSET,
+                        max_concurrency,
+                    ),
+                    name=f"submit-testrun-custommodel-{test_run_id}",
+                )
+                # the loop only keeps weak references to tasks
+                self._submitted.add(task)
+                task.add_done_callback(self._submitted.discard)
+                return submit_response
+            if self._sync._has_custom_model():
+                await self._custom_exec(scenario_id, model_data, None, max_concurrency)
+            return await self._call_run_test_method(run_test_method, *call_args)
+        except UnexpectedStatus as e:
+            print(f"Unexpected status {e=}, {e.content=}")
+            raise
 
-    def submit_test(
+    async def submit_test(
         self,
         scenario: Union[ScenarioSetResponse, str, UUID],
         name: str,
@@ -934,32 +2410,42 @@ class ModelUnderTest(AsyncProcessorMixin):
         checks: Optional[List[str]] = None,
         simulation_params: Optional[Any] = None,
         driver_id: Optional[str] = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_concurrent_turns: int = _DEFAULT_MAX_CONCURRENT_TURNS,
+        turn_timeout: Optional[float] = None,
+        use_cache: bool = True,
     ) -> TestRunItem:
-        """Asynchronous server-based version of test-run execution. For CustomModels, model
-        invocations are handled client-side in a background thread then evaluated server-side asynchronously.
-        For other models, model invocations and evaluation are both handled server-side asynchronously.
+        """Asynchronous server-based version of test-run execution. For CustomModels,
+        model invocations run in a task on the current event loop and are then
+        evaluated server-side; `await flush()` waits for those tasks.
 
-        Arguments:
-            scenario (Union[ScenarioSetResponse, str]): The scenario set or identifier to use for the test run.
-            name (str): The name to assign to the test run.
-            api_key (Optional[str]): Optional API key for authentication.
-            api_keys (Optional[dict]): Optional dictionary of API keys for different services.
-            metrics_kwargs (Optional[dict]): Optional dictionary of keyword arguments for metrics calculation.
-            test_run_type (TestRunType): The type of test run to execute. Defaults to MULTI_CLASS_CLASSIFICATION.
-            calculate_metrics (bool): Whether to calculate metrics after the test run. Defaults to True.
-            checks (Optional[List[str]]): Optional list of checks to perform during the test run.
+        Arguments: see `ModelUnderTest.submit_test`.
 
         Returns:
             TestRunItem: The resulting test run item for the submitted test run. The `id` field can be used to retrieve the test run.
         """
-        endpoint = submit_test_v0_test_run_submit_post.sync
-        if not self._check_multiturn_submit_safe(test_run_type):
-            print(
-                "WARNING: CustomMultiturnTarget models are not supported in submit_test. "
-                + "Falling back to run_test instead."
+        if not use_cache:
+            await asyncio.to_thread(
+                self._sync._drop_cached_scenario, self._sync._scenario_id(scenario)
+            )
+        if self._uses_custom_target(test_run_type):
+            return await asyncio.to_thread(
+                self._sync.submit_test,
+                scenario,
+                name,
+                api_key,
+                api_keys,
+                metrics_kwargs,
+                test_run_type,
+                calculate_metrics,
+                checks,
+                simulation_params,
+                driver_id,
+                max_concurrency,
+                max_concurrent_turns,
+                turn_timeout,
             )
-            endpoint = run_test_v0_test_run_post.sync
-        return self._run_test_internal(
+        return await self._run_test_internal(
             scenario,
             name,
             api_key,
@@ -968,12 +2454,13 @@ class ModelUnderTest(AsyncProcessorMixin):
             test_run_type,
             calculate_metrics,
             checks,
-            endpoint,
+            True,
             simulation_params,
             driver_id,
+            max_concurrency,
         )
 
-    def run_test(
+    async def run_test(
         self,
         scenario: Union[ScenarioSetResponse, str, UUID],
         name: str,
@@ -985,26 +2472,42 @@ class ModelUnderTest(AsyncProcessorMixin):
         checks: Optional[List[str]] = None,
         simulation_params: Optional[Any] = None,
         driver_id: Optional[str] = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_concurrent_turns: int = _DEFAULT_MAX_CONCURRENT_TURNS,
+        turn_timeout: Optional[float] = None,
+        use_cache: bool = True,
     ) -> TestRunItem:
         """Server-based version of test-run execution. For CustomModels, model
-        invocations are handled client-side then evaluated server-side. For other models,
-        model invocations and evaluations handled server-side.
+        invocations are handled client-side then evaluated server-side.
 
-        Arguments:
-            scenario (Union[ScenarioSetResponse, str]): The scenario set or identifier to use for the test run.
-            name (str): The name to assign to the test run.
-            api_key (Optional[str]): Optional API key for authentication.
-            api_keys (Optional[dict]): Optional dictionary of API keys for different services.
-            metrics_kwargs (Optional[dict]): Optional dictionary of keyword arguments for metrics calculation.
-            test_run_type (TestRunType): The type of test run to execute. Defaults to MULTI_CLASS_CLASSIFICATION.
-            calculate_metrics (bool): Whether to calculate metrics after the test run. Defaults to True.
-            checks (Optional[List[str]]): Optional list of checks to perform during the test run.
+        Arguments: see `ModelUnderTest.run_test`.
 
         Returns:
             TestRunItem: The resulting test run item for the completed test run.
         """
+        if not use_cache:
+            await asyncio.to_thread(
+                self._sync._drop_cached_scenario, self._sync._scenario_id(scenario)
+            )
+        if self._uses_custom_target(test_run_type):
+            return await asyncio.to_thread(
+                self._sync.run_test,
+                scenario,
+                name,
+                api_key,
+                api_keys,
+                metrics_kwargs,
+                test_run_type,
+                calculate_metrics,
+                checks,
+                simulation_params,
+                driver_id,
+                max_concurrency,
+                max_concurrent_turns,
+                turn_timeout,
+            )
         try:
-            return self._run_test_internal(
+            return await self._run_test_internal(
                 scenario,
                 name,
                 api_key,
@@ -1013,125 +2516,23 @@ class ModelUnderTest(AsyncProcessorMixin):
                 test_run_type,
                 calculate_metrics,
                 checks,
-                run_test_v0_test_run_post.sync,
+                False,
                 simulation_params,
                 driver_id,
+                max_concurrency,
             )
         except Exception as e:
             raise TestRunError(str(e)) from e
 
-    def get_test_run(self, test_run_id: Union[str, UUID]) -> TestRunItem:
-        """Retrieve a test run by its ID.
-
-        Arguments:
-            test_run_id (str): The ID of the test run to retrieve.
-
-        Returns:
-            TestRunItem: The test run item corresponding to the provided ID.
-        """
-        try:
-            response = get_test_run_v0_test_runs_test_run_id_get.sync(
-                client=self.client,
-                api_key=self.api_key,
-                test_run_id=(
-                    UUID(test_run_id) if isinstance(test_run_id, str) else test_run_id
-                ),
-            )
-            self.validate_response(response)
-            assert isinstance(response, TestRunItem)
-
-            return response
-        except UnexpectedStatus as e:
-            print(e.content)
-            raise
-
-    @classmethod
-    def validate_response(cls, response: Any) -> None:
-        if isinstance(response, ErrorResponse):
-            error_message = f"error: {response}, {response.detail}"
-            print(error_message)
-            raise TypeError(error_message)
-        if response is None:
-            print("Received no response (None) from the API")
-            raise ValueError("No response received")
-
-    def _extract_input_from_scenario_data_point(
-        self, scenario_data_point: ScenarioDataPoinResponse
-    ) -> Any:
-        """helper method to handle different scenario data point formats"""
-        scenario_input = scenario_data_point.input_
-        return scenario_input
-
-    def _custom_exec(
-        self, scenario_id: Any, model_data: Any, test_run_id: Optional[str] = None
-    ) -> Any:
-        assert isinstance(self.models, dict)
-
-        assert scenario_id
-        scenario_data_points = self._get_scenario_data_points(scenario_id)
-        datapoint_len = len(scenario_data_points)
-
-        if not self._has_custom_batch_model():
-            custom_model_invoker = self.models["custom"]["model_invoker"]
-            for scenario_data_point in tqdm(
-                scenario_data_points, desc="Invoking CustomModel", unit="datapoint"
-            ):
-                scenario_input = self._extract_input_from_scenario_data_point(
-                    scenario_data_point
-                )
-
-                try:
-                    custom_model_return_value = custom_model_invoker(scenario_input)
-                except Exception as e:
-                    # Log the error but continue processing other datapoints
-                    print(
-                        f"An error occurred while invoking the custom model for scenario_data_point ID {scenario_data_point.id}: {str(e)}"
-                    )
-                    # Create a ModelInvocation with error details
-                    custom_model_return_value = ModelInvocation(
-                        model_prediction=None,
-                        model_input=scenario_input,
-                        tool_calls=None,
-                        error={"error_message": str(e)},
-                    )
-                self._add_model_invocation_for_scenario(
-                    custom_model_return_value,
-                    model_data,
-                    scenario_data_point.id,
-                    test_run_id,
-                )
-        else:
-            # batch inputs to the custom model
-            custom_model_invoker = self.models["custom_batch"]["model_invoker"]
-            batch_size = self.models["custom_batch"]["batch_size"]
-            for index in tqdm(
-                range(0, datapoint_len, batch_size),
-                desc="Invoking CustomModel",
-                unit="batch",
-            ):
-                end_index = min(index + batch_size, datapoint_len)
-                scenario_data_points_batch = scenario_data_points[index:end_index]
-                scenario_inputs = [
-                    {
-                        "id": str(sdp.id),
-                        "input_value": self._extract_input_from_scenario_data_point(
-                            sdp
-                        ),
-                    }
-                    for sdp in scenario_data_points_batch
-                ]
-                custom_model_return_batch = custom_model_invoker(scenario_inputs)
-
-                for return_dict in custom_model_return_batch:
-                    self._add_model_invocation_for_scenario(
-                        return_dict["model_invocation"],
-                        model_data,
-                        return_dict["id"],
-                        test_run_id,
-                    )
+    async def flush(self) -> None:
+        """Wait for the CustomModel runs started by `submit_test` to finish
+        uploading their datapoints and be submitted for evaluation. Raises the
+        first error any of them hit."""
+        if self._submitted:
+            await asyncio.gather(*self._submitted)
 
     @classmethod
-    def _evaluate_internal(
+    async def _evaluate_internal(
         cls,
         client: Client,
         api_key: str,
@@ -1145,53 +2546,22 @@ class ModelUnderTest(AsyncProcessorMixin):
         checks: Union[Unset, list[str]] = UNSET,
         test_run_id: Union[Unset, str, UUID] = UNSET,
     ) -> TestRunItem:
-        """Run an 'online' evaluation on already uploaded datapoints.
-        Also used to handle 'submit_test' for CustomModel (requires a `test_run_id`$).
-        """
-        _scenario_id: Union[Unset, UUID, None] = (
-            UNSET
-            if isinstance(scenario_id, Unset)
-            else UUID(scenario_id) if isinstance(scenario_id, str) else scenario_id
-        )
-        _datapoint_ids: Union[Unset, list[UUID], None] = (
-            UNSET
-            if isinstance(datapoint_ids, Unset)
-            else [UUID(d) if isinstance(d, str) else d for d in datapoint_ids]
-        )
-        _filter_group_id: Union[Unset, UUID, None] = (
-            UNSET
-            if isinstance(filter_group_id, Unset)
-            else (
-                UUID(filter_group_id)
-                if isinstance(filter_group_id, str)
-                else filter_group_id
-            )
-        )
-        _test_run_id: Union[Unset, UUID, None] = (
-            UNSET
-            if isinstance(test_run_id, Unset)
-            else UUID(test_run_id) if isinstance(test_run_id, str) else test_run_id
-        )
-        payload = EvaluationPayload(
-            metrics_kwargs=EvaluationPayloadMetricsKwargs.from_dict(
-                metrics_kwargs or {}
-            ),
-            name=name,
-            type_=test_run_type,
-            tags=tags,
-            checks=checks,
-            scenario_id=_scenario_id,
-            datapoint_ids=_datapoint_ids,
-            filter_group_id=_filter_group_id,
-            test_run_id=_test_run_id,
-        )
-
-        response = evaluate_v0_evaluate_post.sync(
+        response = await evaluate_v0_evaluate_post.asyncio(
             client=client,
-            body=payload,
+            body=ModelUnderTest._evaluation_payload(
+                name,
+                test_run_type,
+                scenario_id,
+                datapoint_ids,
+                filter_group_id,
+                tags,
+                metrics_kwargs,
+                checks,
+                test_run_id,
+            ),
             api_key=api_key,
         )
-        cls.validate_response(response)
+        ModelUnderTest.validate_response(response)
         assert response is not None and not isinstance(response, ErrorResponse)
         return response
 
@@ -2379,11 +3749,22 @@ class MultiTurnDriver(BaseModel):
 class CustomBatchModel(BaseModel):
     """A custom batch model definition for an Okareo evaluation.
     Requires a valid `invoke_batch` definition that operates on a single input.
+
+    With `adaptive_batching`, `batch_size` is only the starting size: it grows up to
+    `max_batch_size` (default 4 x `batch_size`) while batches return within
+    `target_batch_latency` seconds, and shrinks on slow or failing batches. Up to
+    `max_concurrent_batches` batches are invoked at once, so `invoke_batch` must be
+    thread-safe when that is above 1. When `invoke_batch` raises, the batch is split
+    and retried so that only the failing rows end up with an error invocation.
     """
 
     type = "custom_batch"
     name: str
     batch_size: int = 1
+    adaptive_batching: bool = False
+    max_batch_size: Optional[int] = None
+    max_concurrent_batches: int = 1
+    target_batch_latency: Optional[float] = None
 
     @abstractmethod
     def invoke_batch(
@@ -2405,5 +3786,15 @@ class CustomBatchModel(BaseModel):
             "name": self.name,
             "type": self.type,
             "batch_size": self.batch_size,
+            **(
+                {
+                    "adaptive_batching": True,
+                    "max_batch_size": self.max_batch_size,
+                    "max_concurrent_batches": self.max_concurrent_batches,
+                    "target_batch_latency": self.target_batch_latency,
+                }
+                if self.adaptive_batching
+                else {}
+            ),
             "model_invoker": self.invoke_batch,
         }
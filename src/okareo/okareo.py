@@ -1,12 +1,41 @@
+import asyncio
 import base64
+import collections
+import concurrent.futures
+import contextlib
 import copy
 import datetime
+import importlib.util
+import inspect
+import itertools
 import json
 import os
+import shutil
+import threading
+import time
 import warnings
-from typing import Any, Dict, List, Optional, Protocol, TypedDict, TypeVar, Union, cast
+from typing import (
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 from uuid import UUID
 
+import httpx
 import pydantic
 from pydantic import BaseModel as PydanticBaseModel
 from tqdm import tqdm  # type: ignore
@@ -37,11 +66,13 @@ from okareo_api_client.api.default import (
     get_project_v0_projects_project_id_get,
     get_scenario_set_data_points_v0_scenario_data_points_scenario_id_get,
     get_target_model_by_name_v0_target_target_model_name_get,
+    get_test_run_v0_test_runs_test_run_id_get,
     patch_project_v0_projects_project_id_patch,
     re_evaluate_v0_test_runs_test_run_id_re_evaluate_post,
     register_driver_model_v0_driver_post,
     register_model_v0_register_model_post,
     scenario_sets_upload_v0_scenario_sets_upload_post,
+    update_scenario_set_v0_scenario_sets_scenario_id_put,
     upload_voice_file_v0_voice_upload_post,
 )
 from okareo_api_client.errors import UnexpectedStatus
@@ -99,6 +130,7 @@ from okareo_api_client.models.scenario_set_generate_generation_schema_type_0 imp
     ScenarioSetGenerateGenerationSchemaType0,
 )
 from okareo_api_client.models.scenario_set_response import ScenarioSetResponse
+from okareo_api_client.models.scenario_set_update import ScenarioSetUpdate
 from okareo_api_client.models.scenario_type import ScenarioType
 from okareo_api_client.models.seed_data import SeedData
 from okareo_api_client.models.target_model_response import TargetModelResponse
@@ -112,8 +144,34 @@ from okareo_api_client.models.voice_upload_request import VoiceUploadRequest
 from okareo_api_client.models.voice_upload_response import VoiceUploadResponse
 from okareo_api_client.types import UNSET, File, Unset
 
-from .common import BASE_URL, HTTPX_TIME_OUT
-from .model_under_test import BaseModel, ModelUnderTest
+from .audio_cache import AudioFileCache, default_audio_cache, write_stream
+from .columnar import DatapointColumns, decode_projected, projection_keys
+from .common import BASE_URL
+from .model_under_test import (
+    _DEFAULT_MAX_CONCURRENT_TURNS,
+    AsyncModelUnderTest,
+    BaseModel,
+    ModelUnderTest,
+    SubmittedTestRun,
+    _check_invoker_arity,
+    _compile_custom_target_dispatch,
+)
+from .pagination import DEFAULT_PAGE_SIZE, OffsetPager
+from .polling import (
+    TEST_RUN_DONE_STATUSES,
+    TEST_RUN_MAX_POLL_INTERVAL,
+    TEST_RUN_POLL_INTERVAL,
+    Backoff,
+    poll_timeout_error,
+)
+from .scenario_cache import ScenarioDataPointCache, default_scenario_cache
+from .uploads import (
+    Base64JsonBody,
+    JsonlUploadReader,
+    UploadManifest,
+    file_digest,
+    json_chunks,
+)
 
 CHECK_DEPRECATION_WARNING = (
     "The `evaluator` naming convention is deprecated and will not be supported in a future release. "
@@ -126,6 +184,38 @@ _EMPTY_GENERATION_MESSAGE = "No scenario rows generated for scenario_id"
 
 CUSTOM_MODEL_STRS = ["custom", "custom_batch"]
 
+PROJECTS_CACHE_TTL = 300.0
+
+DEFAULT_SCENARIO_CHUNK_SIZE = 1000
+DEFAULT_SCENARIO_APPEND_WORKERS = 4
+
+DEFAULT_PARALLEL_RUN_CONCURRENCY = 8
+
+DEFAULT_AUDIO_UPLOAD_WORKERS = 4
+DEFAULT_AUDIO_UPLOAD_ATTEMPTS = 3
+# backoff between attempts of a retried upload or ingest request
+_REQUEST_RETRY_DELAY = 1.0
+_REQUEST_MAX_RETRY_DELAY = 10.0
+DEFAULT_AUDIO_DOWNLOAD_WORKERS = 8
+_AUDIO_DOWNLOAD_TIMEOUT = 120
+
+DEFAULT_INGEST_CHUNK_SIZE = 100
+DEFAULT_INGEST_CHUNK_BYTES = 8 * 1024 * 1024
+DEFAULT_INGEST_WORKERS = 4
+DEFAULT_INGEST_ATTEMPTS = 3
+_INGEST_TIMEOUT = 120
+
+# httpx's own pool defaults, spelled out so they show up in the signature
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+# (base URL, API key) -> (monotonic fetch time, projects). Process-wide, so a
+# warm serverless worker or several loggers resolve their Project without
+# another round trip.
+_projects_cache: Dict[Tuple[str, str], Tuple[float, List[ProjectResponse]]] = {}
+_projects_cache_lock = threading.Lock()
+
 
 class ProjectScopedPayload(Protocol):
     """Any generated request body that carries a ``project_id`` field."""
@@ -149,6 +239,16 @@ class SeedDataRow(TypedDict):
     result: Union[dict, list, str]
 
 
+class DownloadedFile(str):
+    """Path of a downloaded file. `name` returns the same path, so code written
+    for the closed file object `download_scenario_set` used to return
+    (`open(response_file.name)`) keeps working."""
+
+    @property
+    def name(self) -> str:
+        return str(self)
+
+
 class BaseGenerationSchema(PydanticBaseModel):
     """A base schema class for specifying structured outputs to synthetic data generators."""
 
@@ -162,55 +262,22 @@ class BaseGenerationSchema(PydanticBaseModel):
             return cls.schema()
 
 
-class Okareo:
-    """A class for interacting with Okareo API and for formatting request data."""
-
-    def __init__(
-        self,
-        api_key: str,
-        base_path: str = BASE_URL,  # type: ignore
-        timeout: float = HTTPX_TIME_OUT,
-        project: Union[str, UUID, None] = None,
-    ):
-        """
-        Args:
-            api_key: Your Okareo API key.
-            base_path: Okareo API base URL.
-            timeout: HTTP timeout in seconds.
-            project: The Project this client works in — its **name** or its id.
-                Omit to keep the server's default Project (the pre-Projects
-                behavior). Resolved and validated here, at construction.
-        """
-        self.api_key = api_key
-        self.client = Client(
-            base_url=base_path, raise_on_unexpected_status=True
-        )  # otherwise everything except 201 and 422 is swallowed
-        response = get_all_projects_v0_projects_get.sync(
-            client=self.client,
-            api_key=self.api_key,
-        )
-        self.validate_response(response)
-        # Client-level Project (G5): applied wherever a per-call value is not given.
-        # Precedence everywhere: per-call / explicitly-set field > client-level >
-        # server default. Resolved against the projects list the connectivity
-        # check just fetched, so a bad name or id fails HERE with a clear message
-        # instead of silently scattering data — and a name costs no extra call.
-        # Archived Projects resolve on purpose — they stay fully usable.
-        self.project_id: Optional[str] = None
-        if project is not None:
-            assert isinstance(response, list)
-            self.project_id = self._resolve_project(project, response)
+class _OkareoBase:
+    """Request building and validation shared by `Okareo` and `AsyncOkareo`.
+    Nothing here performs I/O."""
 
-    def set_project(self, project: Union[str, UUID, None]) -> None:
-        """Switch the client-level Project mid-script by name or id (None clears it).
+    api_key: str
+    client: Client
+    project_id: Optional[str]
+    scenario_cache: Optional[ScenarioDataPointCache]
 
-        Fetches a fresh Project list to resolve against — freshness over the cost
-        of one extra call on an infrequent operation.
-        """
-        if project is None:
-            self.project_id = None
-            return
-        self.project_id = self._resolve_project(project, self.get_projects())
+    @staticmethod
+    def _resolve_scenario_cache(
+        scenario_cache: Union[bool, ScenarioDataPointCache],
+    ) -> Optional[ScenarioDataPointCache]:
+        if isinstance(scenario_cache, ScenarioDataPointCache):
+            return scenario_cache
+        return default_scenario_cache() if scenario_cache else None
 
     @staticmethod
     def _resolve_project(
@@ -283,170 +350,54 @@ class Okareo:
         return filled
 
     @staticmethod
-    def seed_data_from_list(data_list: List[SeedDataRow]) -> List[SeedData]:
-        """
-        Create a list of SeedData objects from a list of dictionaries.
-
-        Each dictionary in the input list must have 'input' and 'result' keys.
-
-        Args:
-            data_list (List[SeedDataRow]): A list of dictionaries, where each dictionary
-                                        contains 'input' and 'result' keys.
-
-        Returns:
-            List[SeedData]: A list of SeedData objects created from the input dictionaries.
-        """
-        seed_data_list = []
-        for data in data_list:
-            seed_input: Union[dict, list, str] = data["input"]
-            seed_result: Union[dict, list, str] = data["result"]
-            seed_data = SeedData(input_=seed_input, result=seed_result)
-            seed_data_list.append(seed_data)
-
-        return seed_data_list
-
-    def get_projects(self) -> List[ProjectResponse]:
-        """
-        Get a list of all Okareo projects available to the user.
-
-        Returns:
-            List[ProjectResponse]: A list of ProjectResponse objects accessible to the user.
-
-        Raises:
-            TypeError: If the API response is an error.
-            ValueError: If no response is received from the API.
-        """
-        response = get_all_projects_v0_projects_get.sync(
-            client=self.client,
-            api_key=self.api_key,
-        )
-        self.validate_response(response)
-        assert isinstance(response, List)
-
-        return response
-
-    def create_project(
-        self, name: str, tags: Union[Unset, List[str]] = UNSET
-    ) -> ProjectResponse:
-        """
-        Create a new Okareo project.
-
-        Args:
-            name (str): The name of the new project.
-            tags (Union[Unset, List[str]], optional): Optional list of tags to associate with the project.
-
-        Returns:
-            ProjectResponse: The created ProjectResponse object.
-
-        Raises:
-            TypeError: If the API response is an error.
-            ValueError: If the name has leading or trailing whitespace, or if no
-                response is received from the API.
-        """
-        self._validate_project_name(name)
-        response = create_project_v0_projects_post.sync(
-            client=self.client,
-            api_key=self.api_key,
-            body=ProjectSchema(name=name, tags=tags),
-        )
-        self.validate_response(response)
-        assert isinstance(response, ProjectResponse)
-
-        return response
-
-    def get_project(self, project_id: Union[str, UUID]) -> ProjectResponse:
-        """
-        Get a single project by id.
-
-        Args:
-            project_id (Union[str, UUID]): The ID of the project to fetch.
-
-        Returns:
-            ProjectResponse: The requested project.
-
-        Raises:
-            TypeError: If the API response is an error.
-            ValueError: If no response is received from the API.
-        """
-        response = get_project_v0_projects_project_id_get.sync(
-            project_id=UUID(str(project_id)),
-            client=self.client,
-            api_key=self.api_key,
-        )
-        self.validate_response(response)
-        assert isinstance(response, ProjectResponse)
-
-        return response
-
-    def update_project(
-        self,
-        project_id: Union[str, UUID],
-        name: Union[Unset, str] = UNSET,
-        tags: Union[Unset, List[str]] = UNSET,
-    ) -> ProjectResponse:
-        """
-        Update a project's name and/or tags. Only the fields you pass are changed.
-
-        Args:
-            project_id (Union[str, UUID]): The ID of the project to update.
-            name (Union[Unset, str], optional): New name for the project.
-            tags (Union[Unset, List[str]], optional): Replacement tag list.
-
-        Returns:
-            ProjectResponse: The updated project.
-
-        Raises:
-            ValueError: If the name has leading or trailing whitespace.
-        """
-        if not isinstance(name, Unset):
-            self._validate_project_name(name)
-        response = patch_project_v0_projects_project_id_patch.sync(
-            project_id=UUID(str(project_id)),
-            client=self.client,
-            api_key=self.api_key,
-            body=ProjectPatchSchema(name=name, tags=tags),
+    def _build_client(
+        base_path: str,
+        timeout: Optional[float],
+        max_connections: Optional[int],
+        max_keepalive_connections: Optional[int],
+        keepalive_expiry: Optional[float],
+        http2: bool,
+    ) -> Client:
+        """The generated `Client`, with the pool settings passed to both the
+        sync and the async httpx client it builds."""
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "http2=True requires the h2 package: pip install 'httpx[http2]'"
+            )
+        return Client(
+            base_url=base_path,
+            # otherwise everything except 201 and 422 is swallowed
+            raise_on_unexpected_status=True,
+            timeout=httpx.Timeout(timeout),
+            httpx_args={
+                "limits": httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                "http2": http2,
+            },
         )
-        self.validate_response(response)
-        assert isinstance(response, ProjectResponse)
-        return response
 
-    def archive_project(self, project_id: Union[str, UUID]) -> ProjectResponse:
-        """
-        Archive a project. Archiving is reversible and restricts nothing — an
-        archived project stays fully usable; it is only hidden from the project
-        picker. The default ("Global") project cannot be archived.
+    def _projects_cache_key(self) -> Tuple[str, str]:
+        return (self.client._base_url, self.api_key)
 
-        Note: until the generated client is regenerated, the returned
-        ProjectResponse carries the archive state in
-        ``additional_properties["is_archived"]``.
-        """
-        response = patch_project_v0_projects_project_id_patch.sync(
-            project_id=UUID(str(project_id)),
-            client=self.client,
-            api_key=self.api_key,
-            body=ProjectPatchSchema(is_archived=True),
-        )
-        self.validate_response(response)
-        assert isinstance(response, ProjectResponse)
-        return response
+    def _cache_projects(self, projects: List[ProjectResponse]) -> None:
+        with _projects_cache_lock:
+            _projects_cache[self._projects_cache_key()] = (time.monotonic(), projects)
 
-    def unarchive_project(self, project_id: Union[str, UUID]) -> ProjectResponse:
-        """
-        Unarchive a project, restoring it to the project picker.
+    def _cached_projects(self, ttl: float) -> Optional[List[ProjectResponse]]:
+        """The cached Project list for this key, or None if missing or older
+        than `ttl` seconds."""
+        with _projects_cache_lock:
+            cached = _projects_cache.get(self._projects_cache_key())
+        if cached is None or time.monotonic() - cached[0] > ttl:
+            return None
+        return cached[1]
 
-        Note: until the generated client is regenerated, the returned
-        ProjectResponse carries the archive state in
-        ``additional_properties["is_archived"]``.
-        """
-        response = patch_project_v0_projects_project_id_patch.sync(
-            project_id=UUID(str(project_id)),
-            client=self.client,
-            api_key=self.api_key,
-            body=ProjectPatchSchema(is_archived=False),
-        )
-        self.validate_response(response)
-        assert isinstance(response, ProjectResponse)
-        return response
+    def _invalidate_projects_cache(self) -> None:
+        with _projects_cache_lock:
+            _projects_cache.pop(self._projects_cache_key(), None)
 
     def _get_custom_model_invoker(
         self, data: Dict[str, Any]
@@ -454,6 +405,7 @@ class Okareo:
         for custom_model_str in CUSTOM_MODEL_STRS:
             if custom_model_str in data["models"].keys():
                 model_invoker = data["models"][custom_model_str]["model_invoker"]
+                _check_invoker_arity(model_invoker, 1, f"{custom_model_str} invoke")
                 del data["models"][custom_model_str]["model_invoker"]
                 return data, model_invoker, None, None
         for model_key in ["custom_target", "custom_target_async"]:
@@ -461,69 +413,37 @@ class Okareo:
                 model_invoker = data["models"][model_key]["model_invoker"]
                 session_starter = data["models"][model_key]["session_starter"]
                 session_ender = data["models"][model_key]["session_ender"]
+                # fail at registration, not mid-simulation, on a bad signature
+                _compile_custom_target_dispatch(
+                    model_invoker, session_starter, session_ender
+                )
                 del data["models"][model_key]["model_invoker"]
                 data["models"][model_key]["session_starter"] = True
                 data["models"][model_key]["session_ender"] = True
                 return data, model_invoker, session_starter, session_ender
         return data, None, None, None
 
-    def _set_custom_model_invoker(
-        self,
-        data: Dict[str, Any],
-        model_invoker: Any,
-        session_starter: Any,
-        session_ender: Any,
-    ) -> Any:
-        for custom_model_str in CUSTOM_MODEL_STRS:
-            if custom_model_str in data.keys():
-                data[custom_model_str]["model_invoker"] = model_invoker
-        for model_key in ["custom_target", "custom_target_async"]:
-            if model_key in data.keys():
-                data[model_key]["model_invoker"] = model_invoker
-                data[model_key]["session_starter"] = session_starter
-                data[model_key]["session_ender"] = session_ender
-        return data
-
-    def register_model(
+    def _register_model_data(
         self,
         name: str,
-        tags: Union[List[str], None] = None,
-        project_id: Union[str, UUID, None] = None,
-        model: Union[None, BaseModel, List[BaseModel]] = None,
-        update: bool = False,
-        sensitive_fields: Union[List[str], None] = None,
-    ) -> ModelUnderTest:
-        """
-        Register a new Model Under Test (MUT) to use in an Okareo evaluation.
-
-        Args:
-            name (str): The name of the model. Model names must be unique within a project. Using the same name will return or update the existing model.
-            tags (Union[List[str], None], optional): Optional list of tags to associate with the model.
-            project_id (Union[str, None], optional): The project ID to associate the model with.
-            model (Union[None, BaseModel, List[BaseModel]], optional): The model or list of models to register.
-            update (bool, optional): Whether to update an existing model with the same name. Defaults to False.
-            sensitive_fields (List[str], optional): A list of sensitive fields to mask in the model parameters. Defaults to None.
-
-        Returns:
-            ModelUnderTest: The registered ModelUnderTest object.
-
-        Raises:
-            TypeError: If the API response is an error.
-            ValueError: If no response is received from the API.
-        """
+        tags: Union[List[str], None],
+        project_id: Union[str, UUID, None],
+        model: Union[None, BaseModel, List[BaseModel]],
+        update: bool,
+        sensitive_fields: Union[List[str], None],
+    ) -> tuple[Dict[str, Any], tuple[Any, Any, Any]]:
+        """Build the register_model request data. Client-side callables (custom
+        model invokers and session hooks) are split off, since they never go over
+        the wire; `_registered_model_data` puts them back after the call."""
         project_id = self._resolved_project_id(project_id)
-        if tags is None:
-            tags = []
         data: Dict[str, Any] = {
             "name": name,
-            "tags": tags,
+            "tags": tags or [],
             "update": update,
             "sensitive_fields": sensitive_fields,
         }
         # will rename name to model in the future api-breaking release
-        model_invoker = None
-        session_starter = None
-        session_ender = None
+        invokers: tuple[Any, Any, Any] = (None, None, None)
         if isinstance(model, BaseModel) or (
             isinstance(model, list) and all(isinstance(x, BaseModel) for x in model)
         ):
@@ -535,1144 +455,2035 @@ class Okareo:
                     data["models"][params["type"]] = params
                 else:
                     data["models"][model.type] = model.params()
-            (
-                data,
-                model_invoker,
-                session_starter,
-                session_ender,
-            ) = self._get_custom_model_invoker(data)
+            data, model_invoker, session_starter, session_ender = (
+                self._get_custom_model_invoker(data)
+            )
+            invokers = (model_invoker, session_starter, session_ender)
         if project_id is not None:
             data["project_id"] = project_id
-        request_body = ModelUnderTestSchema.from_dict(data)
-        response = register_model_v0_register_model_post.sync(
-            client=self.client, api_key=self.api_key, body=request_body
-        )
+        return data, invokers
 
-        self.validate_response(response)
-        assert isinstance(response, ModelUnderTestResponse)
+    def _registered_model_data(
+        self, data: Dict[str, Any], invokers: tuple[Any, Any, Any]
+    ) -> Any:
         model_data = data.get("models")
+        model_invoker, session_starter, session_ender = invokers
         if model_invoker and isinstance(model_data, dict):
             model_data = self._set_custom_model_invoker(
                 model_data, model_invoker, session_starter, session_ender
             )
-        if response.warning:
-            print(response.warning)
-        return ModelUnderTest(
-            client=self.client,
-            api_key=self.api_key,
-            mut=response,
-            models=model_data,
-        )
+        return model_data
 
-    def get_model(self, name: str, version: str | int = "latest") -> ModelUnderTest:
-        """Fetch a model under test based on the name and version.
+    def _driver_request(self, driver: Driver) -> DriverModelSchema:
+        try:
+            if driver.temperature is not None:
+                driver.temperature = float(driver.temperature)
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid driver_temperature value: {driver.temperature}. Must be a number."
+            ) from e
+        request_body = DriverModelSchema.from_dict(driver.to_dict())
+        # Provenance: Drivers are shared org-wide; the column records authorship.
+        # Fill the wire schema, not the Driver — Driver.to_dict() drops project_id.
+        return self._with_client_project(request_body, as_uuid=True)
 
-        Args:
-            name (str): The name of the model to fetch.
-            version (str | int, optional): The version of the model to fetch. Defaults to "latest".
-        """
-        response = get_model_under_test_by_name_and_version_v0_models_under_test_name_version_get.sync(
-            client=self.client, api_key=self.api_key, name=name, version=version
+    def _driver_from_response(self, response: Any) -> Driver:
+        self.validate_response(response)
+        if not response:
+            print("Empty response from API")
+        assert (
+            response is not None
+            and not isinstance(response, HTTPValidationError)
+            and not isinstance(response, ErrorResponse)
+            and any(
+                isinstance(response, r)
+                for r in [DriverModelResponse, VoiceDriverModelResponse]
+            )
         )
+        assert response.name
 
-        self.validate_response(response)
-        assert isinstance(response, ModelUnderTestResponse)
+        # Explicitly construct driver response to avoid backwards compatibility issues
+        return Driver.from_response(response)
 
-        if isinstance(response.models, ModelUnderTestResponseModelsType0):
-            model_data = response.models.to_dict()
-        else:
-            model_data = {}
+    def _target_data(
+        self,
+        target: Target,
+        tags: Optional[List[str]],
+        project_id: Optional[str],
+        sensitive_fields: Union[List[str], None],
+    ) -> tuple[Dict[str, Any], str, tuple[Any, Any, Any]]:
+        data: dict[str, Any] = {
+            "models": {},
+            "name": target.name,
+            "tags": tags or [],
+            "update": True,
+            "sensitive_fields": sensitive_fields,
+        }
+        model = (
+            target.target if isinstance(target.target, dict) else target.target.params()
+        )
+        data["models"][model["type"]] = model
+        (
+            data,
+            model_invoker,
+            session_starter,
+            session_ender,
+        ) = self._get_custom_model_invoker(data)
+        project_id = self._resolved_project_id(project_id)
+        if project_id is not None:
+            data["project_id"] = project_id
+        return data, model["type"], (model_invoker, session_starter, session_ender)
 
+    def _target_from_response(
+        self,
+        response: Any,
+        data: Dict[str, Any],
+        model_type: str,
+        invokers: tuple[Any, Any, Any],
+    ) -> Target:
+        self.validate_response(response)
+        assert isinstance(response, ModelUnderTestResponse) and response.name
         if response.warning:
             print(response.warning)
 
-        return ModelUnderTest(
-            client=self.client,
-            api_key=self.api_key,
-            mut=response,
-            models=model_data,
-        )
+        model_data = self._registered_model_data(data, invokers)
 
-    def create_scenario_set(
-        self, create_request: ScenarioSetCreate
-    ) -> ScenarioSetResponse:
-        """
-        Create a new scenario set to use in an Okareo evaluation or as a seed for synthetic data generation.
+        # Explicitly construct target response to avoid backwards compatibility issues
+        assert isinstance(model_data, dict)
+        target_data = model_data[model_type]
+        assert isinstance(target_data, dict)
 
-        Args:
-            create_request (ScenarioSetCreate): The request object containing scenario set details and seed data. The ScenarioSetCreate object should include:
+        return Target.from_response(response, target_data)
 
-        Returns:
-            ScenarioSetResponse: The created ScenarioSetResponse object.
+    @staticmethod
+    def _simulation_mut_response(
+        target_model: Target,
+        project_id: Union[str, UUID, None],
+        tags: Optional[list[str]],
+    ) -> ModelUnderTestResponse:
+        return ModelUnderTestResponse(
+            id=(
+                UUID(target_model.id)
+                if isinstance(target_model.id, str)
+                else (target_model.id if target_model.id else UUID(int=0))
+            ),
+            project_id=(
+                UUID(project_id)
+                if isinstance(project_id, str)
+                else (project_id if project_id else UUID(int=0))
+            ),
+            name=target_model.name,
+            tags=tags or [],
+            time_created=datetime.datetime.now().isoformat(),
+            version=1,
+        )
 
-        Raises:
-            ValueError: If the seed data is empty or if no response is received from the API.
-            TypeError: If the API response is an error.
+    def _set_custom_model_invoker(
+        self,
+        data: Dict[str, Any],
+        model_invoker: Any,
+        session_starter: Any,
+        session_ender: Any,
+    ) -> Any:
+        for custom_model_str in CUSTOM_MODEL_STRS:
+            if custom_model_str in data.keys():
+                data[custom_model_str]["model_invoker"] = model_invoker
+        for model_key in ["custom_target", "custom_target_async"]:
+            if model_key in data.keys():
+                data[model_key]["model_invoker"] = model_invoker
+                data[model_key]["session_starter"] = session_starter
+                data[model_key]["session_ender"] = session_ender
+        return data
 
-        Example:
-        ```python
-        seed_data = okareo_client.seed_data_from_list([
-            {"input": {"animal": "fish", "color": "red"}, "result": "red"},
-            {"input": {"animal": "dog", "color": "blue"}, "result": "blue"},
-            {"input": {"animal": "cat", "color": "green"}, "result": "green"}
-        ])
-        create_request = ScenarioSetCreate(name="My Scenario Set", seed_data=seed_data)
-        okareo_client.create_scenario_set(create_request)
-        ```
-        """
-        if create_request.seed_data == [] or create_request.seed_data is None:
-            raise ValueError("Non-empty seed data is required to create a scenario set")
+    def validate_response(self, response: Any) -> None:
+        if isinstance(response, ErrorResponse):
+            error_message = f"error: {response.detail}"
+            print(error_message)
+            raise TypeError(error_message)
+        if response is None:
+            print("Received no response (None) from the API")
+            raise ValueError("No response received")
 
-        create_request = self._with_client_project(create_request, as_uuid=True)
-        response = create_scenario_set_v0_scenario_sets_post.sync(
-            client=self.client, api_key=self.api_key, body=create_request
+    def _check_request(
+        self,
+        name: str,
+        description: str,
+        check: BaseCheck,
+        tags: Optional[List[str]],
+    ) -> CheckCreateUpdateSchema:
+        check_config = CheckCreateUpdateSchemaCheckConfigType0.from_dict(
+            check.check_config()
+        )
+        body = CheckCreateUpdateSchema(
+            name=name, description=description, check_config=check_config
         )
+        # Provenance: Checks are shared org-wide, but the column records where the
+        # Check was authored — fill it from the client-level Project when set.
+        body = self._with_client_project(body, as_uuid=True)
+        if tags is not None:
+            body["tags"] = tags
+        return body
 
-        self.validate_response(response)
-        assert isinstance(response, ScenarioSetResponse)
-        if response.warning:
-            print(response.warning)
-        return response
+    def _read_check_version(self, row: EvaluatorBriefResponse) -> Optional[int]:
+        if isinstance(row.version, int):
+            return row.version
+        legacy = row.additional_properties.get("version")
+        if isinstance(legacy, int):
+            return legacy
+        return None
 
-    def upload_scenario_set(
+    def _select_check_by_version(
         self,
-        scenario_name: str,
-        file_path: str,
-        project_id: Union[Unset, str, UUID] = UNSET,
-    ) -> ScenarioSetResponse:
-        """
-        Upload a file as a scenario set to use in an Okareo evaluation or as a seed for synthetic data generation.
+        name: str,
+        matches: List[EvaluatorBriefResponse],
+        version: Optional[int],
+    ) -> EvaluatorBriefResponse:
+        if version is None:
+            return max(
+                matches,
+                key=lambda row: self._read_check_version(row) or 0,
+            )
 
-        Args:
-            scenario_name (str): The name to assign to the uploaded scenario set.
-            file_path (str): The path to the file to upload.
-            project_id (Union[Unset, str], optional): The project ID to associate with the scenario set.
+        exact = [c for c in matches if self._read_check_version(c) == version]
+        if exact:
+            return exact[0]
 
-        Returns:
-            ScenarioSetResponse: The created ScenarioSetResponse object.
+        available_versions = sorted(
+            value
+            for value in (self._read_check_version(c) for c in matches)
+            if value is not None
+        )
+        raise ValueError(
+            f"No check found with name '{name}' and version {version}. "
+            f"Available versions: {available_versions}"
+        )
 
-        Raises:
-            UnexpectedStatus: If the API returns an unexpected status.
-            TypeError: If the API response is an error.
-            ValueError: If no response is received from the API.
+    def _check_brief_id(
+        self, brief: EvaluatorBriefResponse, name: str
+    ) -> Union[str, UUID]:
+        if isinstance(brief.id, (UUID, str)):
+            return brief.id
+        raise ValueError(f"Check '{name}' has no id")
 
-        Example:
-        ```python
-        project_id = "your_project_id"  # Optional, can be None
-        okareo_client.upload_scenario_set(
-            scenario_name="My Uploaded Scenario Set",
-            file_path="/path/to/scenario_set_file.json",
-            project_id=project_id or None,
-        )
-        ```
-        """
-        project_id = self._resolved_project_id(project_id)
-        try:
-            file_name = os.path.basename(file_path)
 
-            with open(file_path, "rb") as binary_io:
-                multipart_body = BodyScenarioSetsUploadV0ScenarioSetsUploadPost(
-                    name=scenario_name,
-                    project_id=(
-                        UUID(project_id)
-                        if isinstance(project_id, str)
-                        and not isinstance(project_id, Unset)
-                        else project_id
-                    ),
-                    file=File(file_name=file_name, payload=binary_io),
-                )
-                response = scenario_sets_upload_v0_scenario_sets_upload_post.sync(
-                    client=self.client,
-                    api_key=self.api_key,
-                    body=multipart_body,
-                )
-
-            self.validate_response(response)
-            assert isinstance(response, ScenarioSetResponse)
-            if response.warning:
-                print(response.warning)
-            return response
-        except UnexpectedStatus as e:
-            print(e.content)
-            raise
+class Okareo(_OkareoBase):
+    """A class for interacting with Okareo API and for formatting request data."""
 
-    def download_scenario_set(
+    def __init__(
         self,
-        scenario: Union[ScenarioSetResponse, str],
-        file_path: str = "",
-    ) -> Any:
+        api_key: str,
+        base_path: str = BASE_URL,  # type: ignore
+        timeout: Optional[float] = None,
+        project: Union[str, UUID, None] = None,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        scenario_cache: Union[bool, ScenarioDataPointCache] = False,
+        lazy: bool = False,
+        projects_ttl: float = PROJECTS_CACHE_TTL,
+        audio_cache: Union[bool, AudioFileCache] = False,
+    ):
         """
-        Download a scenario set from Okareo to the client's local filesystem.
-
         Args:
-            scenario_set (ScenarioSetResponse): The scenario set to download.
-            file_path (str, optional): The path where the file will be saved. If not provided, uses scenario set name.
-
-        Returns:
-            File: The downloaded file object.
-
-        Example:
-        ```python
-        response_file = okareo_client.download_scenario_set(create_scenario_set)
-        with open(response_file.name) as scenario_file:
-            for line in scenario_file:
-                print(line)
-        ```
+            api_key: Your Okareo API key.
+            base_path: Okareo API base URL.
+            timeout: HTTP timeout in seconds. Defaults to None (no limit), since
+                calls such as `run_test` block until the server is done.
+            project: The Project this client works in — its **name** or its id.
+                Omit to keep the server's default Project (the pre-Projects
+                behavior). Resolved and validated here, at construction.
+            lazy: Skip the projects check at construction, for short-lived
+                workers and serverless functions. `project` is then resolved on
+                the first call that uses it, against a Project list cached per
+                API key for `projects_ttl` seconds.
+            projects_ttl: How long, in seconds, a fetched Project list may be
+                reused to resolve `project` in lazy mode.
+            max_connections: Most connections open at once (None: unlimited).
+            max_keepalive_connections: Most idle connections kept for reuse, so
+                repeated calls skip the TCP and TLS handshake (None: unlimited).
+            keepalive_expiry: Seconds an idle connection is kept.
+            http2: Negotiate HTTP/2, multiplexing concurrent requests over one
+                connection. Requires ``pip install 'httpx[http2]'``.
+            scenario_cache: Keep downloaded scenario data points in a local
+                cache (True for the default one under ``~/.cache/okareo``, or a
+                `ScenarioDataPointCache`), so repeated test runs on a scenario
+                skip the download.
+            audio_cache: Keep downloaded voice files and call recordings in a
+                local cache (True for the default one under ``~/.cache/okareo``,
+                or an `AudioFileCache`), so they are fetched once.
         """
-        try:
-            scenario_id = (
-                scenario if isinstance(scenario, str) else scenario.scenario_id
-            )
-            response = self.client.get_httpx_client().request(
-                method="get",
-                url=f"/v0/scenario_sets_download/{scenario_id}",
-                headers={
-                    "accept": "application/json",
-                    "api-key": self.api_key,
-                },
-            )
-            filename = response.headers["content-disposition"].split('"')[1]
-            if file_path != "":
-                filename = file_path
-            binary_file = open(filename, "wb")
-            binary_file.write(response.content)
-            binary_file.close()
-            return binary_file
-        except Exception as e:
-            print(e)
-            raise
+        self.api_key = api_key
+        self.client = self._build_client(
+            base_path,
+            timeout,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            http2,
+        )
+        self.scenario_cache = self._resolve_scenario_cache(scenario_cache)
+        self.audio_cache = (
+            audio_cache
+            if isinstance(audio_cache, AudioFileCache)
+            else default_audio_cache() if audio_cache else None
+        )
+        self._projects_ttl = projects_ttl
+        self._project_lock = threading.Lock()
+        self._pending_project: Union[str, UUID, None] = None
+        self._project_id: Optional[str] = None
+        if lazy:
+            self._pending_project = project
+            return
+        response = get_all_projects_v0_projects_get.sync(
+            client=self.client,
+            api_key=self.api_key,
+        )
+        self.validate_response(response)
+        assert isinstance(response, list)
+        self._cache_projects(response)
+        # Client-level Project (G5): applied wherever a per-call value is not given.
+        # Precedence everywhere: per-call / explicitly-set field > client-level >
+        # server default. Resolved against the projects list the connectivity
+        # check just fetched, so a bad name or id fails HERE with a clear message
+        # instead of silently scattering data — and a name costs no extra call.
+        # Archived Projects resolve on purpose — they stay fully usable.
+        if project is not None:
+            self.project_id = self._resolve_project(project, response)
 
-    def generate_scenarios(
-        self,
-        source_scenario: Union[str, UUID, ScenarioSetResponse],
-        name: str,
-        number_examples: int,
-        project_id: Union[Unset, str, UUID] = UNSET,
-        generation_type: Union[Unset, ScenarioType] = ScenarioType.REPHRASE_INVARIANT,
-    ) -> ScenarioSetResponse:
-        """
-        Generate a synthetic scenario set based on an existing seed scenario.
+    @property
+    def project_id(self) -> Optional[str]:
+        """The client-level Project id. In lazy mode the first read resolves the
+        `project` given at construction."""
+        if self._pending_project is not None:
+            with self._project_lock:
+                if self._pending_project is not None:
+                    self._project_id = self._resolve_project_cached(
+                        self._pending_project
+                    )
+                    self._pending_project = None
+        return self._project_id
 
-        Args:
-            source_scenario (Union[str, ScenarioSetResponse]): The source scenario set or its ID to generate from.
-            name (str): The name for the new generated scenario set.
-            number_examples (int): The number of synthetic examples to generate per seed scenario row.
-            project_id (Union[Unset, str], optional): The project ID to associate with the generated scenario set.
-            generation_type (Union[Unset, ScenarioType], optional): The type of scenario generation to use.
+    @project_id.setter
+    def project_id(self, value: Optional[str]) -> None:
+        self._pending_project = None
+        self._project_id = value
 
-        Returns:
-            ScenarioSetResponse: The generated synthetic scenario set.
+    def _resolve_project_cached(self, project: Union[str, UUID]) -> str:
+        cached = self._cached_projects(self._projects_ttl)
+        if cached is not None:
+            try:
+                return self._resolve_project(project, cached)
+            except ValueError:
+                pass  # possibly created after the list was cached; refetch
+        return self._resolve_project(project, self.get_projects())
 
-        Raises:
-            TypeError: If the API response is an error.
-            ValueError: If no response is received from the API.
+    def set_project(self, project: Union[str, UUID, None]) -> None:
+        """Switch the client-level Project mid-script by name or id (None clears it).
 
-        Example:
-        ```python
-        source_scenario = "source_scenario_id"  # or ScenarioSetResponse object
-        generated_set = okareo_client.generate_scenarios(
-            source_scenario=source_scenario,
-            name="Generated Scenario Set",
-            number_examples=100,
-            project_id="your_project_id",
-            generation_type=ScenarioType.REPHRASE_INVARIANT
-        )
-        print(generated_set.app_link) # Prints the link to the generated scenario set
-        ```
+        Fetches a fresh Project list to resolve against — freshness over the cost
+        of one extra call on an infrequent operation.
         """
-        project_id = self._resolved_project_id(project_id)
-        scenario_id = (
-            source_scenario.scenario_id
-            if isinstance(source_scenario, ScenarioSetResponse)
-            else source_scenario
-        )
-        return self.generate_scenario_set(
-            ScenarioSetGenerate(
-                source_scenario_id=(
-                    UUID(scenario_id) if isinstance(scenario_id, str) else scenario_id
-                ),
-                name=name,
-                number_examples=number_examples,
-                project_id=(
-                    UUID(project_id) if isinstance(project_id, str) else project_id
-                ),
-                generation_type=generation_type,
-            )
-        )
+        if project is None:
+            self.project_id = None
+            return
+        self.project_id = self._resolve_project(project, self.get_projects())
 
-    def generate_scenario_set(
-        self, create_request: ScenarioSetGenerate
-    ) -> ScenarioSetResponse:
+    @staticmethod
+    def seed_data_from_list(data_list: List[SeedDataRow]) -> List[SeedData]:
         """
-        Generate a synthetic scenario set based on an existing seed scenario and a ScenarioSetGenerate object. Offers more controls than the comparable `generate_scenarios` method.
+        Create a list of SeedData objects from a list of dictionaries.
+
+        Each dictionary in the input list must have 'input' and 'result' keys.
 
         Args:
-            create_request (ScenarioSetGenerate): The request object specifying scenario generation parameters.
+            data_list (List[SeedDataRow]): A list of dictionaries, where each dictionary
+                                        contains 'input' and 'result' keys.
 
         Returns:
-            ScenarioSetResponse: The generated synthetic scenario set.
-
-        Example:
-        ```python
-        generate_request = ScenarioSetGenerate(
-            source_scenario_id="seed_scenario_id",
-            name="My Synthetic Scenario Set",
-            number_examples=50,
-            project_id="your_project_id",
-            generation_type=ScenarioType.REPHRASE_INVARIANT,
-        )
-        generated_set = okareo_client.generate_scenario_set(generate_request)
-        print(generated_set.app_link)  # Prints the link to the generated scenario set
-        ```
+            List[SeedData]: A list of SeedData objects created from the input dictionaries.
         """
-        # Convert BaseGenerationSchema class to the generated model type
-        if (
-            hasattr(create_request, "generation_schema")
-            and isinstance(create_request.generation_schema, type)
-            and hasattr(create_request.generation_schema, "to_dict")
-        ):
-            create_request.generation_schema = (
-                ScenarioSetGenerateGenerationSchemaType0.from_dict(
-                    create_request.generation_schema.to_dict()
-                )
-            )
-
-        create_request = self._with_client_project(create_request, as_uuid=True)
-        response = generate_scenario_set_v0_scenario_sets_generate_post.sync(
-            client=self.client, api_key=self.api_key, body=create_request
-        )
-
-        if self.validate_generate_scenario_response(response):
-            self.validate_response(response)
-            assert isinstance(response, ScenarioSetResponse)
-        else:
-            # return empty response
-            return ScenarioSetResponse(
-                project_id=(
-                    create_request.project_id
-                    if create_request.project_id
-                    else UUID(int=0)
-                ),
-                scenario_id=UNSET,
-                time_created=datetime.datetime.now(),
-                type_=(
-                    create_request.generation_type.value
-                    if create_request.generation_type
-                    else ""
-                ),
-            )
+        seed_data_list = []
+        for data in data_list:
+            seed_input: Union[dict, list, str] = data["input"]
+            seed_result: Union[dict, list, str] = data["result"]
+            seed_data = SeedData(input_=seed_input, result=seed_result)
+            seed_data_list.append(seed_data)
 
-        return response
+        return seed_data_list
 
-    def get_scenario_data_points(
-        self, scenario_id: Union[str, UUID]
-    ) -> List[ScenarioDataPoinResponse]:
+    def get_projects(self) -> List[ProjectResponse]:
         """
-        Fetch the scenario data points associated with a scenario set with scenario_id.
-
-        Args:
-            scenario_id (str): The ID of the scenario set to fetch data points for.
+        Get a list of all Okareo projects available to the user.
 
         Returns:
-            List[ScenarioDataPoinResponse]: A list of scenario data point responses associated with the scenario set.
+            List[ProjectResponse]: A list of ProjectResponse objects accessible to the user.
 
-        Example:
-        ```python
-        okareo_client = Okareo(api_key="your_api_key")
-        scenario_id = "your_scenario_id"
-        data_points = okareo_client.get_scenario_data_points(scenario_id)
-        for dp in data_points:
-            print(dp.input_, dp.result)
-        ```
+        Raises:
+            TypeError: If the API response is an error.
+            ValueError: If no response is received from the API.
         """
-        response = (
-            get_scenario_set_data_points_v0_scenario_data_points_scenario_id_get.sync(
-                client=self.client,
-                api_key=self.api_key,
-                scenario_id=(
-                    UUID(scenario_id) if isinstance(scenario_id, str) else scenario_id
-                ),
-            )
+        response = get_all_projects_v0_projects_get.sync(
+            client=self.client,
+            api_key=self.api_key,
         )
-
         self.validate_response(response)
         assert isinstance(response, List)
+        self._cache_projects(response)
 
         return response
 
-    def find_test_data_points(
-        self, test_data_point_payload: FindTestDataPointPayload
-    ) -> List[Union[TestDataPointItem, FullDataPointItem]]:
+    def create_project(
+        self, name: str, tags: Union[Unset, List[str]] = UNSET
+    ) -> ProjectResponse:
         """
-        Fetch the test run data points associated as specified in the payload.
+        Create a new Okareo project.
 
         Args:
-            test_data_point_payload (FindTestDataPointPayload): The payload specifying the test data point search criteria.
+            name (str): The name of the new project.
+            tags (Union[Unset, List[str]], optional): Optional list of tags to associate with the project.
 
         Returns:
-            List[Union[TestDataPointItem, FullDataPointItem]]:
-                A list of test or full data point items.
+            ProjectResponse: The created ProjectResponse object.
 
         Raises:
             TypeError: If the API response is an error.
-
-        Example:
-        ```python
-        from okareo_api_client.models.find_test_data_point_payload import (
-            FindTestDataPointPayload,
+            ValueError: If the name has leading or trailing whitespace, or if no
+                response is received from the API.
+        """
+        self._validate_project_name(name)
+        response = create_project_v0_projects_post.sync(
+            client=self.client,
+            api_key=self.api_key,
+            body=ProjectSchema(name=name, tags=tags),
         )
+        self.validate_response(response)
+        assert isinstance(response, ProjectResponse)
 
-        test_run_id = "your_test_run_id"  # Replace with your actual test run ID
-        payload = FindTestDataPointPayload(
-            test_run_id=test_run_id,
-        )
-        data_points = okareo_client.find_test_data_points(payload)
-        for dp in data_points:
-            print(dp)
-        ```
-        """
-        data = find_test_data_points_v0_find_test_data_points_post.sync(
-            client=self.client, api_key=self.api_key, body=test_data_point_payload
-        )
-        if not data:
-            return []
-        self.validate_response(data)
-        assert isinstance(data, list)
-        # TODO: Narrow this method return type to List[FullDataPointItem]
-        # and update downstream annotations/tests that still expect TestDataPointItem.
-        return cast(List[Union[TestDataPointItem, FullDataPointItem]], data)
-
-    def validate_response(self, response: Any) -> None:
-        if isinstance(response, ErrorResponse):
-            error_message = f"error: {response.detail}"
-            print(error_message)
-            raise TypeError(error_message)
-        if response is None:
-            print("Received no response (None) from the API")
-            raise ValueError("No response received")
-
-    def validate_generate_scenario_response(self, response: Any) -> bool:
-        if (
-            isinstance(response, ErrorResponse)
-            and _EMPTY_GENERATION_MESSAGE in response.detail[0]
-        ):
-            # TODO: parse 422 status code rather than string matching
-            # Generated scenario is empty. Raise warning rather than error.
-            warning_message = f"warning: {response.detail}"
-            print(warning_message)
-            warnings.warn(
-                warning_message,
-                category=UserWarning,
-                stacklevel=2,
-            )
-            return False
-        return True
+        return response
 
-    def find_datapoints(
-        self, datapoint_search: DatapointSearch
-    ) -> List[DatapointListItem]:
+    def get_project(self, project_id: Union[str, UUID]) -> ProjectResponse:
         """
-        Fetch the datapoints specified by a Datapoint Search.
+        Get a single project by id.
 
         Args:
-            datapoint_search (DatapointSearch): The search criteria for fetching datapoints.
+            project_id (Union[str, UUID]): The ID of the project to fetch.
 
         Returns:
-            List[DatapointListItem]: A list of datapoint items matching the search.
+            ProjectResponse: The requested project.
 
         Raises:
             TypeError: If the API response is an error.
-
-        Example:
-        ```python
-        from okareo_api_client.models.datapoint_search import DatapointSearch
-
-        ### Search based on a test run ID
-        test_run__id = "your_test_run_id"  # Replace with your actual test run ID
-        search = DatapointSearch(
-            test_run_id=test_run__id,
-        )
-        datapoints = okareo_client.find_datapoints(search)
-        for dp in datapoints:
-            print(dp)
-
-        ### Search based on a context token from a logger
-        logger_config = {
-            "api_key": "<API_KEY>",
-            "tags": ["logger-test"],
-            "context_token": random_string(10),
-        }
-        # Use the logger config to log completions from CrewAI or Autogen
-        ...
-
-        # Search for the logged datapoints by the context token
-        search = DatapointSearch(
-            context_token=context_token,
-        )
-        datapoints = okareo_client.find_datapoints(search)
-        for dp in datapoints:
-            print(dp)
-        ```
+            ValueError: If no response is received from the API.
         """
-        datapoint_search = self._with_client_project(datapoint_search)
-        data = get_datapoints_v0_find_datapoints_post.sync(
+        response = get_project_v0_projects_project_id_get.sync(
+            project_id=UUID(str(project_id)),
             client=self.client,
             api_key=self.api_key,
-            body=datapoint_search,
         )
-        if not data:
-            return []
-        self.validate_response(data)
-        assert isinstance(data, list)
-        return data
+        self.validate_response(response)
+        assert isinstance(response, ProjectResponse)
 
-    def find_datapoints_filter(
-        self, datapoint_search: DatapointFilterSearchPayload
-    ) -> List[DatapointListItem]:
+        return response
+
+    def update_project(
+        self,
+        project_id: Union[str, UUID],
+        name: Union[Unset, str] = UNSET,
+        tags: Union[Unset, List[str]] = UNSET,
+    ) -> ProjectResponse:
         """
-        Fetch the datapoints specified by a Datapoint Search.
+        Update a project's name and/or tags. Only the fields you pass are changed.
 
         Args:
-            datapoint_search (DatapointFilterSearchPayload): The search criteria for fetching datapoints.
+            project_id (Union[str, UUID]): The ID of the project to update.
+            name (Union[Unset, str], optional): New name for the project.
+            tags (Union[Unset, List[str]], optional): Replacement tag list.
 
         Returns:
-            List[DatapointListItem]: A list of datapoint items matching the search.
+            ProjectResponse: The updated project.
 
         Raises:
-            TypeError: If the API response is an error.
+            ValueError: If the name has leading or trailing whitespace.
+        """
+        if not isinstance(name, Unset):
+            self._validate_project_name(name)
+        response = patch_project_v0_projects_project_id_patch.sync(
+            project_id=UUID(str(project_id)),
+            client=self.client,
+            api_key=self.api_key,
+            body=ProjectPatchSchema(name=name, tags=tags),
+        )
+        self.validate_response(response)
+        assert isinstance(response, ProjectResponse)
+        # a rename must not keep resolving through a cached list
+        self._invalidate_projects_cache()
+        return response
 
-        Example:
-        ```python
-        from okareo_api_client.models.datapoint_filter_search_payload import DatapointFilterSearchPayload
+    def archive_project(self, project_id: Union[str, UUID]) -> ProjectResponse:
+        """
+        Archive a project. Archiving is reversible and restricts nothing — an
+        archived project stays fully usable; it is only hidden from the project
+        picker. The default ("Global") project cannot be archived.
 
-        ### Search based on a test run ID
-        test_run__id = "your_test_run_id"  # Replace with your actual test run ID
-        search = DatapointFilterSearchPayload(
-            test_run_id=test_run__id,
+        Note: until the generated client is regenerated, the returned
+        ProjectResponse carries the archive state in
+        ``additional_properties["is_archived"]``.
+        """
+        response = patch_project_v0_projects_project_id_patch.sync(
+            project_id=UUID(str(project_id)),
+            client=self.client,
+            api_key=self.api_key,
+            body=ProjectPatchSchema(is_archived=True),
         )
-        datapoints = okareo_client.find_datapoints(search)
-        for dp in datapoints:
-            print(dp)
+        self.validate_response(response)
+        assert isinstance(response, ProjectResponse)
+        return response
 
-        ### Find datapoints based on filters on datapoints fields
-        from okareo_api_client.models.datapoint_filter_search_payload import DatapointFilterSearchPayload
-        from okareo_api_client.models.filter_condition import FilterCondition
-        from okareo_api_client.models.comparison_operator import ComparisonOperator
+    def unarchive_project(self, project_id: Union[str, UUID]) -> ProjectResponse:
+        """
+        Unarchive a project, restoring it to the project picker.
 
-        search = DatapointFilterSearchPayload(
-            filters=[FilterCondition(
-                field=DatapointField.TEST_RUN_ID,
-                operator=ComparisonOperator.EQUAL,
-                value="France"
-            )]
-        )
-        datapoints = okareo_client.find_datapoints_filter(search)
-        for dp in datapoints:
-            print(dp)
-        ```
+        Note: until the generated client is regenerated, the returned
+        ProjectResponse carries the archive state in
+        ``additional_properties["is_archived"]``.
         """
-        datapoint_search = self._with_client_project(datapoint_search, as_uuid=True)
-        data = get_datapoints_filter_v0_find_datapoints_filter_post.sync(
+        response = patch_project_v0_projects_project_id_patch.sync(
+            project_id=UUID(str(project_id)),
             client=self.client,
             api_key=self.api_key,
-            body=datapoint_search,
+            body=ProjectPatchSchema(is_archived=False),
         )
-        if not data:
-            return []
-        self.validate_response(data)
-        assert isinstance(data, list)
-        return data
-
-    def generate_evaluator(
-        self, create_evaluator: EvaluatorSpecRequest
-    ) -> EvaluatorGenerateResponse:
-        check_deprecation_warning()
-        return self.generate_check(create_evaluator)
+        self.validate_response(response)
+        assert isinstance(response, ProjectResponse)
+        return response
 
-    def generate_check(
-        self, create_check: EvaluatorSpecRequest
-    ) -> EvaluatorGenerateResponse:
+    def register_model(
+        self,
+        name: str,
+        tags: Union[List[str], None] = None,
+        project_id: Union[str, UUID, None] = None,
+        model: Union[None, BaseModel, List[BaseModel]] = None,
+        update: bool = False,
+        sensitive_fields: Union[List[str], None] = None,
+    ) -> ModelUnderTest:
         """
-        Generate the contents of a Check based on an EvaluatorSpecRequest. Can be used to generate a behavioral (model-based) or a deterministic (code-based) check. Check names must be unique within a project.
+        Register a new Model Under Test (MUT) to use in an Okareo evaluation.
 
         Args:
-            create_check (EvaluatorSpecRequest): The specification for the check to generate.
+            name (str): The name of the model. Model names must be unique within a project. Using the same name will return or update the existing model.
+            tags (Union[List[str], None], optional): Optional list of tags to associate with the model.
+            project_id (Union[str, None], optional): The project ID to associate the model with.
+            model (Union[None, BaseModel, List[BaseModel]], optional): The model or list of models to register.
+            update (bool, optional): Whether to update an existing model with the same name. Defaults to False.
+            sensitive_fields (List[str], optional): A list of sensitive fields to mask in the model parameters. Defaults to None.
 
         Returns:
-            EvaluatorGenerateResponse: The generated check response.
+            ModelUnderTest: The registered ModelUnderTest object.
 
-        Example:
-        ```python
-        from okareo_api_client.models.evaluator_spec_request import EvaluatorSpecRequest
-        from okareo.okareo import OkareoClient, BaseCheck
+        Raises:
+            TypeError: If the API response is an error.
+            ValueError: If no response is received from the API.
+        """
+        data, invokers = self._register_model_data(
+            name, tags, project_id, model, update, sensitive_fields
+        )
+        request_body = ModelUnderTestSchema.from_dict(data)
+        response = register_model_v0_register_model_post.sync(
+            client=self.client, api_key=self.api_key, body=request_body
+        )
 
-        # Generate a behavioral model-based check
-        spec = EvaluatorSpecRequest(
-            description="Checks if the output contains toxic language.",
-            requires_scenario_input=False,
-            requires_scenario_result=False,
-            output_data_type="bool", # bool, int, float
+        self.validate_response(response)
+        assert isinstance(response, ModelUnderTestResponse)
+        model_data = self._registered_model_data(data, invokers)
+        if response.warning:
+            print(response.warning)
+        return ModelUnderTest(
+            client=self.client,
+            api_key=self.api_key,
+            mut=response,
+            models=model_data,
+            scenario_cache=self.scenario_cache,
         )
-        okareo_client = Okareo(api_key="your_api_key")
-        generated_check = okareo_client.generate_check(spec)
 
-        # Inspect the generated check to ensure it meets your requirements
-        print(generated_check)
+    def get_model(self, name: str, version: str | int = "latest") -> ModelUnderTest:
+        """Fetch a model under test based on the name and version.
 
-        # Upload the generated check to Okareo to use in evaluations
-        toxicity_check = okareo.create_or_update_check(
-            name="toxicity_check",
-            description=generated_check.description,
-            check=ModelBasedCheck(  # type: ignore
-                prompt_template=check.generated_prompt,
-                check_type=CheckOutputType.PASS_FAIL,
-            ),
-        )
-        # Inspect the uploaded check
-        print(toxicity_check)
-        ```
+        Args:
+            name (str): The name of the model to fetch.
+            version (str | int, optional): The version of the model to fetch. Defaults to "latest".
         """
-        response = check_generate_v0_check_generate_post.sync(
-            client=self.client, api_key=self.api_key, body=create_check
+        response = get_model_under_test_by_name_and_version_v0_models_under_test_name_version_get.sync(
+            client=self.client, api_key=self.api_key, name=name, version=version
         )
+
         self.validate_response(response)
-        assert isinstance(response, EvaluatorGenerateResponse)
+        assert isinstance(response, ModelUnderTestResponse)
 
-        return response
+        if isinstance(response.models, ModelUnderTestResponseModelsType0):
+            model_data = response.models.to_dict()
+        else:
+            model_data = {}
 
-    def get_all_evaluators(self) -> List[EvaluatorBriefResponse]:
-        check_deprecation_warning()
-        return self.get_all_checks()
+        if response.warning:
+            print(response.warning)
 
-    def get_all_checks(
-        self, all_versions: bool = False
-    ) -> List[EvaluatorBriefResponse]:
+        return ModelUnderTest(
+            client=self.client,
+            api_key=self.api_key,
+            mut=response,
+            models=model_data,
+            scenario_cache=self.scenario_cache,
+        )
+
+    def create_scenario_set(
+        self, create_request: ScenarioSetCreate
+    ) -> ScenarioSetResponse:
         """
-        Fetch all available checks.
+        Create a new scenario set to use in an Okareo evaluation or as a seed for synthetic data generation.
 
         Args:
-            all_versions: If True, return all versions of every check (full
-                version history).  Defaults to False (latest version only).
+            create_request (ScenarioSetCreate): The request object containing scenario set details and seed data. The ScenarioSetCreate object should include:
 
         Returns:
-            List[EvaluatorBriefResponse]: A list of EvaluatorBriefResponse objects representing all available checks.
+            ScenarioSetResponse: The created ScenarioSetResponse object.
+
+        Raises:
+            ValueError: If the seed data is empty or if no response is received from the API.
+            TypeError: If the API response is an error.
 
         Example:
         ```python
-        checks = okareo_client.get_all_checks()
-        for check in checks:
-            print(check.name, check.id)
-
-        # Include full version history
-        all_checks = okareo_client.get_all_checks(all_versions=True)
+        seed_data = okareo_client.seed_data_from_list([
+            {"input": {"animal": "fish", "color": "red"}, "result": "red"},
+            {"input": {"animal": "dog", "color": "blue"}, "result": "blue"},
+            {"input": {"animal": "cat", "color": "green"}, "result": "green"}
+        ])
+        create_request = ScenarioSetCreate(name="My Scenario Set", seed_data=seed_data)
+        okareo_client.create_scenario_set(create_request)
         ```
         """
-        if all_versions:
-            resp = self.client.get_httpx_client().request(
-                method="get",
-                url="/v0/checks",
-                params={"all-versions": "true"},
-                headers={"api-key": self.api_key},
-            )
-            if resp.status_code not in (200, 201):
-                raise ValueError(
-                    f"Failed to fetch checks: {resp.status_code} {resp.text}"
-                )
-            return [EvaluatorBriefResponse.from_dict(item) for item in resp.json()]
+        if create_request.seed_data == [] or create_request.seed_data is None:
+            raise ValueError("Non-empty seed data is required to create a scenario set")
 
-        response = get_all_checks_v0_checks_get.sync(
-            client=self.client,
-            api_key=self.api_key,
+        create_request = self._with_client_project(create_request, as_uuid=True)
+        response = create_scenario_set_v0_scenario_sets_post.sync(
+            client=self.client, api_key=self.api_key, body=create_request
         )
-        self.validate_response(response)
-        assert isinstance(response, List)
 
+        self.validate_response(response)
+        assert isinstance(response, ScenarioSetResponse)
+        if response.warning:
+            print(response.warning)
         return response
 
-    def get_evaluator(self, evaluator_id: str) -> EvaluatorDetailedResponse:
-        check_deprecation_warning()
-        return self.get_check(evaluator_id)
-
-    def get_check(
+    def create_scenario_set_from_iterable(
         self,
-        check_id: Union[str, UUID],
-        version: Union[str, int, None] = None,
-    ) -> EvaluatorDetailedResponse:
+        name: str,
+        rows: Iterable[SeedDataRow],
+        chunk_size: int = DEFAULT_SCENARIO_CHUNK_SIZE,
+        max_workers: int = DEFAULT_SCENARIO_APPEND_WORKERS,
+        project_id: Union[Unset, str, UUID] = UNSET,
+    ) -> ScenarioSetResponse:
         """
-        Fetch details for a specific check by UUID or by name.
+        Create a scenario set from any iterable of rows — e.g. a generator over a
+        large generated dataset — without materializing it. The set is created
+        from the first `chunk_size` rows and the remaining chunks are appended
+        in order with `update_scenario_set`, one request at a time, while up to
+        `max_workers` upcoming chunks are serialized on a thread pool; rows are
+        only pulled from `rows` as chunks are needed.
 
         Args:
-            check_id: A check UUID (str or UUID object) **or** a check name
-                (str).  When a name is given the method resolves it to a UUID
-                via the list endpoint.
-            version: Optional version number or the string ``"latest"``.
-                Only used when *check_id* is a name.  ``None`` and
-                ``"latest"`` both resolve to the most recent version.
+            name (str): The name of the new scenario set.
+            rows (Iterable[SeedDataRow]): Dictionaries with 'input' and 'result' keys.
+            chunk_size (int, optional): Rows per request.
+            max_workers (int, optional): Most chunks serialized ahead of the one being sent.
+            project_id (Union[Unset, str, UUID], optional): The project for the scenario set.
 
         Returns:
-            EvaluatorDetailedResponse: The detailed response for the specified check.
+            ScenarioSetResponse: The created scenario set.
 
         Raises:
-            ValueError: If no check matches the given name/version.
+            ValueError: If `rows` is empty.
+            TypeError: If an API response is an error; chunks already sent stay in the set.
 
         Example:
         ```python
-        # By UUID (existing behaviour)
-        check = okareo_client.get_check("your_check_uuid")
-
-        # By name (latest version)
-        check = okareo_client.get_check("my_check")
-        check = okareo_client.get_check("my_check", version="latest")
-
-        # By name + pinned version
-        check = okareo_client.get_check("my_check", version=1)
+        rows = ({"input": q, "result": a} for q, a in generate_pairs())
+        scenario = okareo_client.create_scenario_set_from_iterable("Generated", rows)
         ```
         """
-        if isinstance(version, str) and version == "latest":
-            version = None
-
-        # If an explicit version is requested, treat check_id as a name.
-        if isinstance(version, int):
-            return self._get_check_by_name(str(check_id), version)
-
-        # Try to interpret as UUID first.
-        uuid_val: Optional[UUID] = None
-        if isinstance(check_id, UUID):
-            uuid_val = check_id
-        else:
-            try:
-                uuid_val = UUID(check_id)
-            except ValueError:
-                pass
-
-        if uuid_val is not None:
-            response = get_check_v0_check_check_id_get.sync(
-                client=self.client,
-                api_key=self.api_key,
-                check_id=uuid_val,
+        row_iter = iter(rows)
+        first = self.seed_data_from_list(list(itertools.islice(row_iter, chunk_size)))
+        scenario = self.create_scenario_set(
+            ScenarioSetCreate(
+                name=name,
+                seed_data=first,
+                project_id=(
+                    UUID(project_id) if isinstance(project_id, str) else project_id
+                ),
             )
-            self.validate_response(response)
-            assert isinstance(response, EvaluatorDetailedResponse)
-            return response
-
-        # It's a name — resolve to the latest version.
-        return self._get_check_by_name(str(check_id))
-
-    def _get_check_by_name(
-        self, name: str, version: Optional[int] = None
-    ) -> EvaluatorDetailedResponse:
-        """Resolve a check name (+ optional version) to a detailed response."""
-
-        all_checks = self.get_all_checks(all_versions=True)
-        matches = [c for c in all_checks if c.name == name]
-        if not matches:
-            raise ValueError(f"No check found with name '{name}'")
-        brief = self._select_check_by_version(
-            name=name, matches=matches, version=version
         )
-        return self.get_check(self._check_brief_id(brief, name))
+        if len(first) < chunk_size:
+            return scenario
 
-    def _read_check_version(self, row: EvaluatorBriefResponse) -> Optional[int]:
-        if isinstance(row.version, int):
-            return row.version
-        legacy = row.additional_properties.get("version")
-        if isinstance(legacy, int):
-            return legacy
-        return None
+        self._append_scenario_rows(
+            UUID(str(scenario.scenario_id)),
+            iter(lambda: list(itertools.islice(row_iter, chunk_size)), []),
+            max_workers,
+        )
+        return scenario
 
-    def _select_check_by_version(
+    def _append_scenario_rows(
         self,
-        name: str,
-        matches: List[EvaluatorBriefResponse],
-        version: Optional[int],
-    ) -> EvaluatorBriefResponse:
-        if version is None:
-            return max(
-                matches,
-                key=lambda row: self._read_check_version(row) or 0,
-            )
-
-        exact = [c for c in matches if self._read_check_version(c) == version]
-        if exact:
-            return exact[0]
-
-        available_versions = sorted(
-            value
-            for value in (self._read_check_version(c) for c in matches)
-            if value is not None
+        scenario_id: UUID,
+        chunks: Iterable[List[SeedDataRow]],
+        max_workers: int,
+    ) -> None:
+        """Append each chunk of rows to a scenario set with `update_scenario_set`,
+        one request at a time and in order, so the rows keep their order. Up to
+        `max_workers` chunks are serialized ahead on a thread pool while earlier
+        ones are sent; `chunks` itself is only iterated on the calling thread."""
+        max_workers = max(1, max_workers)
+        serialized: Deque[concurrent.futures.Future] = collections.deque()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="okareo-scenario-append"
+            ) as executor:
+                try:
+                    for chunk in chunks:
+                        serialized.append(
+                            executor.submit(self._scenario_update_body, chunk)
+                        )
+                        if len(serialized) > max_workers:
+                            self._put_scenario_rows(
+                                scenario_id, serialized.popleft().result()
+                            )
+                    while serialized:
+                        self._put_scenario_rows(
+                            scenario_id, serialized.popleft().result()
+                        )
+                finally:
+                    for future in serialized:
+                        future.cancel()
+        finally:
+            if self.scenario_cache is not None:
+                self.scenario_cache.invalidate(self.client._base_url, scenario_id)
+
+    def _scenario_update_body(self, rows: List[SeedDataRow]) -> bytes:
+        update = ScenarioSetUpdate(seed_data=self.seed_data_from_list(rows))
+        return json.dumps(update.to_dict()).encode()
+
+    def _put_scenario_rows(self, scenario_id: UUID, content: bytes) -> None:
+        response = self.client.get_httpx_client().request(
+            method="put",
+            url=f"/v0/scenario_sets/{scenario_id}",
+            content=content,
+            headers={"api-key": self.api_key, "Content-Type": "application/json"},
         )
-        raise ValueError(
-            f"No check found with name '{name}' and version {version}. "
-            f"Available versions: {available_versions}"
+        self.validate_response(
+            update_scenario_set_v0_scenario_sets_scenario_id_put._parse_response(
+                client=self.client, response=response
+            )
         )
 
-    def _check_brief_id(
-        self, brief: EvaluatorBriefResponse, name: str
-    ) -> Union[str, UUID]:
-        if isinstance(brief.id, (UUID, str)):
-            return brief.id
-        raise ValueError(f"Check '{name}' has no id")
+    def upload_scenario_set(
+        self,
+        scenario_name: str,
+        file_path: str,
+        project_id: Union[Unset, str, UUID] = UNSET,
+        validate: bool = True,
+        max_line_bytes: Optional[int] = None,
+        chunk_rows: Optional[int] = None,
+    ) -> ScenarioSetResponse:
+        """
+        Upload a file as a scenario set to use in an Okareo evaluation or as a seed for synthetic data generation.
 
-    def delete_evaluator(self, evaluator_id: str, evaluator_name: str) -> str:
-        check_deprecation_warning()
-        return self.delete_check(evaluator_id, evaluator_name)
+        The file is streamed. A `.jsonl` file is validated row by row while it
+        uploads, so a malformed row fails the upload locally with its line
+        number. A `.gz` file is read through a local decompressor, so it saves
+        disk space but is sent uncompressed.
 
-    def delete_check(self, check_id: Union[str, UUID], check_name: str) -> str:
-        """
-        Deletes a check identified by its ID and name.
+        With `chunk_rows`, a `.jsonl` file too large for one request is split:
+        the first `chunk_rows` rows create the scenario set and the rest are
+        appended to it in order, `chunk_rows` at a time, through
+        `update_scenario_set`. Appended rows need a "result" key, as in
+        `create_scenario_set`.
 
         Args:
-            check_id (str): The unique identifier of the check to delete.
-            check_name (str): The name of the check to delete.
+            scenario_name (str): The name to assign to the uploaded scenario set.
+            file_path (str): The path to the file to upload.
+            project_id (Union[Unset, str], optional): The project ID to associate with the scenario set.
+            validate (bool, optional): Check each JSONL row is a JSON object with an "input" key.
+            max_line_bytes (Optional[int], optional): Reject a JSONL row longer than this.
+            chunk_rows (Optional[int], optional): Most rows sent per request, for a `.jsonl` file.
 
         Returns:
-            str: A message indicating the result of the deletion.
+            ScenarioSetResponse: The created ScenarioSetResponse object.
+
+        Raises:
+            UnexpectedStatus: If the API returns an unexpected status.
+            TypeError: If the API response is an error.
+            ValueError: If a JSONL row is invalid, if `chunk_rows` is given for a file that is
+                not JSONL, or if no response is received from the API.
 
         Example:
         ```python
-        result = okareo_client.delete_check(check_id="abc123", check_name="MyCheck")
-        print(result)  # Output: Check deletion was successful
+        project_id = "your_project_id"  # Optional, can be None
+        okareo_client.upload_scenario_set(
+            scenario_name="My Uploaded Scenario Set",
+            file_path="/path/to/scenario_set_file.json",
+            project_id=project_id or None,
+        )
         ```
         """
-        check_delete_v0_check_check_id_delete.sync(
-            client=self.client,
-            api_key=self.api_key,
-            check_id=UUID(check_id) if isinstance(check_id, str) else check_id,
-            body=BodyCheckDeleteV0CheckCheckIdDelete.from_dict({"name": check_name}),
-        )
-        return "Check deletion was successful"
-
-    def create_or_update_check(
-        self,
-        name: str,
-        description: str,
-        check: BaseCheck,
-        tags: Optional[List[str]] = None,
-    ) -> EvaluatorDetailedResponse:
+        project_id = self._resolved_project_id(project_id)
+        try:
+            file_name = JsonlUploadReader.upload_name(file_path)
+            is_jsonl = file_name.endswith(".jsonl")
+            if chunk_rows is not None and not is_jsonl:
+                error_message = "chunk_rows can only split a .jsonl file"
+                print(error_message)
+                raise ValueError(error_message)
+
+            with JsonlUploadReader(
+                file_path,
+                max_line_bytes,
+                validate=validate and is_jsonl,
+                max_rows=chunk_rows,
+            ) as binary_io:
+                multipart_body = BodyScenarioSetsUploadV0ScenarioSetsUploadPost(
+                    name=scenario_name,
+                    project_id=(
+                        UUID(project_id)
+                        if isinstance(project_id, str)
+                        and not isinstance(project_id, Unset)
+                        else project_id
+                    ),
+                    file=File(file_name=file_name, payload=cast(BinaryIO, binary_io)),
+                )
+                response = scenario_sets_upload_v0_scenario_sets_upload_post.sync(
+                    client=self.client,
+                    api_key=self.api_key,
+                    body=multipart_body,
+                )
+                self.validate_response(response)
+                assert isinstance(response, ScenarioSetResponse)
+                if chunk_rows is not None:
+                    rows = cast(Iterator[SeedDataRow], binary_io.remaining_rows())
+                    self._append_scenario_rows(
+                        UUID(str(response.scenario_id)),
+                        iter(lambda: list(itertools.islice(rows, chunk_rows)), []),
+                        DEFAULT_SCENARIO_APPEND_WORKERS,
+                    )
+
+            if response.warning:
+                print(response.warning)
+            return response
+        except UnexpectedStatus as e:
+            print(e.content)
+            raise
+
+    @contextlib.contextmanager
+    def _stream_scenario_set(
+        self, scenario: Union[ScenarioSetResponse, str], headers: Dict[str, str]
+    ) -> Iterator[httpx.Response]:
+        scenario_id = scenario if isinstance(scenario, str) else scenario.scenario_id
+        with self.client.get_httpx_client().stream(
+            "GET",
+            f"/v0/scenario_sets_download/{scenario_id}",
+            headers={"accept": "application/json", "api-key": self.api_key, **headers},
+        ) as response:
+            if response.status_code >= 400 and response.status_code != 416:
+                response.read()
+                error_message = (
+                    f"Scenario set download failed: {response.status_code} "
+                    f"{response.text}"
+                )
+                print(error_message)
+                raise ValueError(error_message)
+            yield response
+
+    def download_scenario_set(
+        self,
+        scenario: Union[ScenarioSetResponse, str],
+        file_path: str = "",
+        progress: bool = False,
+        resume: bool = False,
+        compressed: bool = True,
+    ) -> DownloadedFile:
         """
-        Create or update an existing check. If the check with 'name' already exists, then this method will update the existing check. Otherwise, this method will create a new check.
+        Download a scenario set from Okareo to the client's local filesystem.
+
+        The file is streamed to disk in chunks, so its size is not limited by
+        memory.
 
         Args:
-            name (str): The unique name of the check to create or update.
-            description (str): A human-readable description of the check.
-            check (BaseCheck): An instance of BaseCheck containing the check configuration.
-            tags: Optional list of string tags to associate with the check.
+            scenario_set (ScenarioSetResponse): The scenario set to download.
+            file_path (str, optional): The path where the file will be saved. If not provided, uses scenario set name.
+            progress (bool, optional): Show a progress bar.
+            resume (bool, optional): If `file_path` already holds part of the
+                file (e.g. from an interrupted download), request only the rest.
+                Falls back to a full download if the server ignores the range.
+            compressed (bool, optional): Accept a gzip-encoded transfer. Always
+                off when resuming, since byte ranges refer to the raw file.
 
         Returns:
-            EvaluatorDetailedResponse: The detailed response from the evaluator after creating or updating the check.
-
-        Raises:
-            AssertionError: If the response is not an instance of EvaluatorDetailedResponse.
-            ValueError: If the response validation fails.
+            DownloadedFile: The path of the downloaded file, a `str`. It also has
+                a `name` attribute holding the path, for code written for the
+                closed file object this used to return.
 
         Example:
         ```python
-        from okareo.checks import CheckOutputType, ModelBasedCheck
+        file_path = okareo_client.download_scenario_set(create_scenario_set)
+        with open(file_path) as scenario_file:
+            for line in scenario_file:
+                print(line)
+        ```
+        """
+        headers: Dict[str, str] = {}
+        offset = 0
+        if resume and file_path != "" and os.path.exists(file_path):
+            offset = os.path.getsize(file_path)
+        if offset:
+            headers["range"] = f"bytes={offset}-"
+        if offset or not compressed:
+            headers["accept-encoding"] = "identity"
+        with self._stream_scenario_set(scenario, headers) as response:
+            filename = file_path
+            if filename == "":
+                filename = response.headers["content-disposition"].split('"')[1]
+            if response.status_code == 416:
+                # the requested range starts at the end: nothing left to fetch
+                return DownloadedFile(filename)
+            if response.status_code != 206:
+                offset = 0
+            total = response.headers.get("content-length")
+            with open(filename, "ab" if offset else "wb") as binary_file, tqdm(
+                total=int(total) + offset if total else None,
+                initial=offset,
+                desc="Downloading scenario set",
+                unit="B",
+                unit_scale=True,
+                disable=not progress,
+            ) as bar:
+                for chunk in response.iter_bytes():
+                    binary_file.write(chunk)
+                    # count bytes on the wire, which content-length describes
+                    bar.update(offset + response.num_bytes_downloaded - bar.n)
+            return DownloadedFile(filename)
+
+    def iter_scenario_set_rows(
+        self, scenario: Union[ScenarioSetResponse, str]
+    ) -> Iterator[Any]:
+        """
+        Stream a scenario set's rows without writing it to disk.
 
-        my_check = ModelBasedCheck(
-            prompt_template="Only output the number of words in the following text: {scenario_input} {generation}",
-            check_type=CheckOutputType.PASS_FAIL,
-        )
+        Args:
+            scenario (Union[ScenarioSetResponse, str]): The scenario set or its id.
 
-        response = okareo_client.create_or_update_check(
-            name="my_word_count_check",
-            description="Custom check for counting combined total number of words in input and output.",
-            check=my_check,
-            tags=["prod", "v1"],
-        )
+        Returns:
+            Iterator[Any]: Each JSONL row, parsed, as the download arrives.
 
-        print(response)
+        Example:
+        ```python
+        for row in okareo_client.iter_scenario_set_rows(scenario_id):
+            print(row["input"], row["result"])
         ```
         """
-        check_config = CheckCreateUpdateSchemaCheckConfigType0.from_dict(
-            check.check_config()
-        )
-        body = CheckCreateUpdateSchema(
-            name=name, description=description, check_config=check_config
-        )
-        # Provenance: Checks are shared org-wide, but the column records where the
-        # Check was authored — fill it from the client-level Project when set.
-        body = self._with_client_project(body, as_uuid=True)
-        if tags is not None:
-            body["tags"] = tags
-        response = check_create_or_update_v0_check_create_or_update_post.sync(
-            client=self.client,
-            api_key=self.api_key,
-            body=body,
-        )
-        self.validate_response(response)
-        assert isinstance(response, EvaluatorDetailedResponse)
-
-        return response
+        with self._stream_scenario_set(scenario, {}) as response:
+            for line in response.iter_lines():
+                if line.strip():
+                    yield json.loads(line)
 
-    def create_group(
+    def generate_scenarios(
         self,
+        source_scenario: Union[str, UUID, ScenarioSetResponse],
         name: str,
-        tags: Union[List[str], None] = None,
-        source: Union[dict, None] = None,
-    ) -> Any:
-        request_body = CreateGroupV0GroupsPostBodyType0()
-        if source:
-            request_body.additional_properties.update(source)
-        response = create_group_v0_groups_post.sync_detailed(
-            client=self.client,
-            body=request_body,
-            name=name,
-            tags=tags if tags is not None else UNSET,
-            api_key=self.api_key,
-        )
-        self.validate_response(response)
-
-        return json.loads(response.content)
-
-    def add_model_to_group(self, group: Any, model: Any) -> Any:
-        response = add_model_to_group_v0_groups_group_id_models_post.sync_detailed(
-            client=self.client,
-            group_id=group.get("id", ""),
-            model_id=model.mut_id,
-            api_key=self.api_key,
-        )
-        self.validate_response(response)
-        return response.parsed.additional_properties  # type: ignore
-
-    def create_trace_eval(self, group: Any, context_token: str) -> Any:
+        number_examples: int,
+        project_id: Union[Unset, str, UUID] = UNSET,
+        generation_type: Union[Unset, ScenarioType] = ScenarioType.REPHRASE_INVARIANT,
+    ) -> ScenarioSetResponse:
         """
-        Create a trace evaluation for a group.
+        Generate a synthetic scenario set based on an existing seed scenario.
 
         Args:
-            group_id (str): The ID of the group.
-            context_token (str): The context token for the trace.
+            source_scenario (Union[str, ScenarioSetResponse]): The source scenario set or its ID to generate from.
+            name (str): The name for the new generated scenario set.
+            number_examples (int): The number of synthetic examples to generate per seed scenario row.
+            project_id (Union[Unset, str], optional): The project ID to associate with the generated scenario set.
+            generation_type (Union[Unset, ScenarioType], optional): The type of scenario generation to use.
 
         Returns:
-            The created trace evaluation details.
+            ScenarioSetResponse: The generated synthetic scenario set.
 
         Raises:
-            OkareoAPIException: If the API request fails.
+            TypeError: If the API response is an error.
+            ValueError: If no response is received from the API.
+
+        Example:
+        ```python
+        source_scenario = "source_scenario_id"  # or ScenarioSetResponse object
+        generated_set = okareo_client.generate_scenarios(
+            source_scenario=source_scenario,
+            name="Generated Scenario Set",
+            number_examples=100,
+            project_id="your_project_id",
+            generation_type=ScenarioType.REPHRASE_INVARIANT
+        )
+        print(generated_set.app_link) # Prints the link to the generated scenario set
+        ```
         """
-        response = create_trace_eval_v0_groups_group_id_trace_eval_post.sync_detailed(
-            client=self.client,
-            group_id=group.get("id", ""),
-            context_token=context_token,
-            api_key=self.api_key,
+        project_id = self._resolved_project_id(project_id)
+        scenario_id = (
+            source_scenario.scenario_id
+            if isinstance(source_scenario, ScenarioSetResponse)
+            else source_scenario
+        )
+        return self.generate_scenario_set(
+            ScenarioSetGenerate(
+                source_scenario_id=(
+                    UUID(scenario_id) if isinstance(scenario_id, str) else scenario_id
+                ),
+                name=name,
+                number_examples=number_examples,
+                project_id=(
+                    UUID(project_id) if isinstance(project_id, str) else project_id
+                ),
+                generation_type=generation_type,
+            )
         )
-        self.validate_response(response)
-        return response.parsed
 
-    def evaluate(
-        self,
-        name: str,
-        test_run_type: TestRunType,
-        scenario_id: Union[Unset, str] = UNSET,
-        datapoint_ids: Union[Unset, list[str]] = UNSET,
-        filter_group_id: Union[Unset, str] = UNSET,
-        tags: Union[Unset, list[str]] = UNSET,
-        metrics_kwargs: Union[Dict[str, Any], Unset] = UNSET,
-        checks: Union[Unset, list[str]] = UNSET,
-    ) -> TestRunItem:
+    def generate_scenario_set(
+        self, create_request: ScenarioSetGenerate
+    ) -> ScenarioSetResponse:
         """
-        Evaluate datapoints using the specified parameters.
+        Generate a synthetic scenario set based on an existing seed scenario and a ScenarioSetGenerate object. Offers more controls than the comparable `generate_scenarios` method.
 
         Args:
-            scenario_id: ID of the scenario set
-            metrics_kwargs: Dictionary of metrics to be measured
-            name: Name of the test run
-            test_run_type: Type of test run
-            tags: Tags for filtering test runs
-            checks: List of checks to include
-            datapoint_ids: List of datapoint IDs to filter by
-            filter_group_id: ID of the datapoint filter group to apply
+            create_request (ScenarioSetGenerate): The request object specifying scenario generation parameters.
 
         Returns:
-            TestRunItem: The evaluation results as a TestRunItem object.
+            ScenarioSetResponse: The generated synthetic scenario set.
 
         Example:
         ```python
-        checks = ["model_refusal"]  # one or more checks to apply in the evaluation
-        test_run = okareo.evaluate(
-            name="My Test Run",
-            test_run_type=TestRunType.NL_GENERATION,
-            checks=checks,
-            datapoint_ids=["datapoint_id_1", "datapoint_id_2"],
+        generate_request = ScenarioSetGenerate(
+            source_scenario_id="seed_scenario_id",
+            name="My Synthetic Scenario Set",
+            number_examples=50,
+            project_id="your_project_id",
+            generation_type=ScenarioType.REPHRASE_INVARIANT,
         )
-        print(test_run.app_link)  # View link to eval results in Okareo app
+        generated_set = okareo_client.generate_scenario_set(generate_request)
+        print(generated_set.app_link)  # Prints the link to the generated scenario set
         ```
         """
-        return ModelUnderTest._evaluate_internal(
-            client=self.client,
-            api_key=self.api_key,
-            name=name,
-            test_run_type=test_run_type,
-            scenario_id=scenario_id,
-            datapoint_ids=datapoint_ids,
-            filter_group_id=filter_group_id,
-            tags=tags,
-            metrics_kwargs=metrics_kwargs,
-            checks=checks,
-        )
-
-    def create_or_update_driver(self, driver: Driver) -> Driver:
-        """Create or update a simulation driver by name.
+        # Convert BaseGenerationSchema class to the generated model type
+        if (
+            hasattr(create_request, "generation_schema")
+            and isinstance(create_request.generation_schema, type)
+            and hasattr(create_request.generation_schema, "to_dict")
+        ):
+            create_request.generation_schema = (
+                ScenarioSetGenerateGenerationSchemaType0.from_dict(
+                    create_request.generation_schema.to_dict()
+                )
+            )
 
-        Args:
-            driver: Driver definition to register. If a driver with the same
-                name already exists, it is updated.
+        create_request = self._with_client_project(create_request, as_uuid=True)
+        response = generate_scenario_set_v0_scenario_sets_generate_post.sync(
+            client=self.client, api_key=self.api_key, body=create_request
+        )
 
-        Returns:
-            Driver: The created or updated driver.
-        """
-        try:
-            if driver.temperature is not None:
-                driver.temperature = float(driver.temperature)
-        except ValueError as e:
-            raise ValueError(
-                f"Invalid driver_temperature value: {driver.temperature}. Must be a number."
-            ) from e
-        request_body = DriverModelSchema.from_dict(driver.to_dict())
-        # Provenance: Drivers are shared org-wide; the column records authorship.
-        # Fill the wire schema, not the Driver — Driver.to_dict() drops project_id.
-        request_body = self._with_client_project(request_body, as_uuid=True)
-        response = register_driver_model_v0_driver_post.sync(
-            client=self.client,
-            body=request_body,
-            api_key=self.api_key,
-        )
-        self.validate_response(response)
-        if not response:
-            print("Empty response from API")
-        assert (
-            response is not None
-            and not isinstance(response, HTTPValidationError)
-            and not isinstance(response, ErrorResponse)
-            and any(
-                isinstance(response, r)
-                for r in [DriverModelResponse, VoiceDriverModelResponse]
+        if self.validate_generate_scenario_response(response):
+            self.validate_response(response)
+            assert isinstance(response, ScenarioSetResponse)
+        else:
+            # return empty response
+            return ScenarioSetResponse(
+                project_id=(
+                    create_request.project_id
+                    if create_request.project_id
+                    else UUID(int=0)
+                ),
+                scenario_id=UNSET,
+                time_created=datetime.datetime.now(),
+                type_=(
+                    create_request.generation_type.value
+                    if create_request.generation_type
+                    else ""
+                ),
             )
-        )
-        assert response.name
 
-        # Explicitly construct driver response to avoid backwards compatibility issues
-        return Driver.from_response(response)
+        return response
 
-    def get_driver_by_name(self, driver_name: str) -> Driver:
-        """Retrieve a simulation driver by name.
+    def get_scenario_data_points(
+        self, scenario_id: Union[str, UUID], use_cache: bool = True
+    ) -> List[ScenarioDataPoinResponse]:
+        """
+        Fetch the scenario data points associated with a scenario set with scenario_id.
 
         Args:
-            driver_name: The name of the driver to retrieve.
+            scenario_id (str): The ID of the scenario set to fetch data points for.
+            use_cache (bool, optional): With a `scenario_cache`, pass False to
+                download anyway (the fresh copy replaces the cached one).
 
         Returns:
-            Driver: The driver with the specified name.
+            List[ScenarioDataPoinResponse]: A list of scenario data point responses associated with the scenario set.
+
+        Example:
+        ```python
+        okareo_client = Okareo(api_key="your_api_key")
+        scenario_id = "your_scenario_id"
+        data_points = okareo_client.get_scenario_data_points(scenario_id)
+        for dp in data_points:
+            print(dp.input_, dp.result)
+        ```
         """
-        response = get_driver_v0_driver_identifier_get.sync(
-            client=self.client,
-            api_key=self.api_key,
-            identifier=driver_name,
+        if self.scenario_cache is not None and use_cache:
+            cached = self.scenario_cache.get(
+                self.client._base_url, self.api_key, scenario_id
+            )
+            if cached is not None:
+                return cached
+        response = (
+            get_scenario_set_data_points_v0_scenario_data_points_scenario_id_get.sync(
+                client=self.client,
+                api_key=self.api_key,
+                scenario_id=(
+                    UUID(scenario_id) if isinstance(scenario_id, str) else scenario_id
+                ),
+            )
         )
+
         self.validate_response(response)
-        if not response:
-            print("Empty response from API")
-        assert (
-            response is not None
-            and not isinstance(response, HTTPValidationError)
-            and not isinstance(response, ErrorResponse)
-            and any(
-                isinstance(response, r)
-                for r in [DriverModelResponse, VoiceDriverModelResponse]
+        assert isinstance(response, List)
+        if self.scenario_cache is not None and response:
+            self.scenario_cache.put(
+                self.client._base_url, self.api_key, scenario_id, response
             )
-            and response.name
-        )
 
-        # Explicitly construct driver response to avoid backwards compatibility issues
-        return Driver.from_response(response)
+        return response
 
-    def create_or_update_target(
+    def find_test_data_points(
         self,
-        target: Target,
-        tags: Optional[List[str]] = None,
-        project_id: Optional[str] = None,
-        sensitive_fields: Union[List[str], None] = None,
-    ) -> Target:
-        """Create or update a simulation target by name.
+        test_data_point_payload: FindTestDataPointPayload,
+        fields: Optional[List[str]] = None,
+    ) -> List[Union[TestDataPointItem, FullDataPointItem]]:
+        """
+        Fetch the test run data points associated as specified in the payload.
 
         Args:
-            target: Target definition to register. If a target with the same
-                name already exists, it is updated.
+            test_data_point_payload (FindTestDataPointPayload): The payload specifying the test data point search criteria.
+            fields (Optional[List[str]]): Only decode these `FullDataPointItem`
+                attributes (plus the required `id`, `test_run_id`, `metric_type`
+                and `metric_value`); the rest stay UNSET.
 
         Returns:
-            Target: The created or updated target.
-        """
-        model_invoker = None
-        session_starter = None
-        session_ender = None
+            List[Union[TestDataPointItem, FullDataPointItem]]:
+                A list of test or full data point items.
 
-        data: dict[str, Any] = {
-            "models": {},
-            "name": target.name,
-            "tags": tags or [],
-            "update": True,
-            "sensitive_fields": sensitive_fields,
-        }
-        model = (
-            target.target if isinstance(target.target, dict) else target.target.params()
-        )
-        data["models"][model["type"]] = model
-        (
-            data,
-            model_invoker,
-            session_starter,
-            session_ender,
-        ) = self._get_custom_model_invoker(data)
-        project_id = self._resolved_project_id(project_id)
-        if project_id is not None:
-            data["project_id"] = project_id
-        request_body = ModelUnderTestSchema.from_dict(data)
-        response = register_model_v0_register_model_post.sync(
-            client=self.client, api_key=self.api_key, body=request_body
-        )
+        Raises:
+            TypeError: If the API response is an error.
 
-        self.validate_response(response)
-        assert isinstance(response, ModelUnderTestResponse) and response.name
-        if response.warning:
-            print(response.warning)
+        Example:
+        ```python
+        from okareo_api_client.models.find_test_data_point_payload import (
+            FindTestDataPointPayload,
+        )
 
-        model_data = data.get("models")
-        if model_invoker and isinstance(model_data, dict):
-            model_data = self._set_custom_model_invoker(
-                model_data, model_invoker, session_starter, session_ender
+        test_run_id = "your_test_run_id"  # Replace with your actual test run ID
+        payload = FindTestDataPointPayload(
+            test_run_id=test_run_id,
+        )
+        data_points = okareo_client.find_test_data_points(payload)
+        for dp in data_points:
+            print(dp)
+        ```
+        """
+        if fields is not None:
+            keys = projection_keys(FullDataPointItem, fields)
+            return decode_projected(
+                FullDataPointItem,
+                self._raw_rows(
+                    find_test_data_points_v0_find_test_data_points_post,
+                    test_data_point_payload,
+                    ok_status=201,
+                ),
+                keys,
             )
+        data = find_test_data_points_v0_find_test_data_points_post.sync(
+            client=self.client, api_key=self.api_key, body=test_data_point_payload
+        )
+        if not data:
+            return []
+        self.validate_response(data)
+        assert isinstance(data, list)
+        # TODO: Narrow this method return type to List[FullDataPointItem]
+        # and update downstream annotations/tests that still expect TestDataPointItem.
+        return cast(List[Union[TestDataPointItem, FullDataPointItem]], data)
 
-        # Explicitly construct target response to avoid backwards compatibility issues
-        assert isinstance(model_data, dict)
-        target_data = model_data[model["type"]]
-        assert isinstance(target_data, dict)
-
-        return Target.from_response(response, target_data)
+    def validate_generate_scenario_response(self, response: Any) -> bool:
+        if (
+            isinstance(response, ErrorResponse)
+            and _EMPTY_GENERATION_MESSAGE in response.detail[0]
+        ):
+            # TODO: parse 422 status code rather than string matching
+            # Generated scenario is empty. Raise warning rather than error.
+            warning_message = f"warning: {response.detail}"
+            print(warning_message)
+            warnings.warn(
+                warning_message,
+                category=UserWarning,
+                stacklevel=2,
+            )
+            return False
+        return True
 
-    def get_target_by_name(self, target_name: str) -> Target:
-        """Retrieve a simulation target by name.
+    def find_datapoints(
+        self,
+        datapoint_search: DatapointSearch,
+        fields: Optional[List[str]] = None,
+    ) -> List[DatapointListItem]:
+        """
+        Fetch the datapoints specified by a Datapoint Search.
 
         Args:
-            target_name: The name of the target to retrieve.
+            datapoint_search (DatapointSearch): The search criteria for fetching datapoints.
+            fields (Optional[List[str]]): Only decode these `DatapointListItem`
+                attributes (plus `id`); the rest stay UNSET.
 
         Returns:
-            Target: The target with the specified name.
+            List[DatapointListItem]: A list of datapoint items matching the search.
+
+        Raises:
+            TypeError: If the API response is an error.
+
+        Example:
+        ```python
+        from okareo_api_client.models.datapoint_search import DatapointSearch
+
+        ### Search based on a test run ID
+        test_run__id = "your_test_run_id"  # Replace with your actual test run ID
+        search = DatapointSearch(
+            test_run_id=test_run__id,
+        )
+        datapoints = okareo_client.find_datapoints(search)
+        for dp in datapoints:
+            print(dp)
+
+        ### Search based on a context token from a logger
+        logger_config = {
+            "api_key": "<API_KEY>",
+            "tags": ["logger-test"],
+            "context_token": random_string(10),
+        }
+        # Use the logger config to log completions from CrewAI or Autogen
+        ...
+
+        # Search for the logged datapoints by the context token
+        search = DatapointSearch(
+            context_token=context_token,
+        )
+        datapoints = okareo_client.find_datapoints(search)
+        for dp in datapoints:
+            print(dp)
+        ```
         """
-        response = get_target_model_by_name_v0_target_target_model_name_get.sync(
+        datapoint_search = self._with_client_project(datapoint_search)
+        if fields is not None:
+            keys = projection_keys(DatapointListItem, fields)
+            return decode_projected(
+                DatapointListItem,
+                self._raw_rows(
+                    get_datapoints_v0_find_datapoints_post, datapoint_search
+                ),
+                keys,
+            )
+        data = get_datapoints_v0_find_datapoints_post.sync(
             client=self.client,
             api_key=self.api_key,
-            target_model_name=target_name,
+            body=datapoint_search,
         )
-        self.validate_response(response)
-        if not response:
-            print("Empty response from API")
-        assert response is not None and isinstance(response, TargetModelResponse)
-
-        # Explicitly construct target response to avoid backwards compatibility issues
-        return Target.from_response(response)
+        if not data:
+            return []
+        self.validate_response(data)
+        assert isinstance(data, list)
+        return data
 
-    def run_simulation(
+    def iter_datapoints(
         self,
-        name: str,
-        scenario: Union[ScenarioSetResponse, str],
+        datapoint_search: DatapointSearch,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+        cursor: Optional[int] = None,
+    ) -> OffsetPager[DatapointListItem]:
+        """
+        Lazily iterate the datapoints of a Datapoint Search, fetching `page_size`
+        at a time through the search's `offset`/`limit` instead of holding every
+        match in memory.
+
+        Args:
+            datapoint_search (DatapointSearch): The search criteria. Its `offset`
+                and `limit`, if set, bound the whole iteration.
+            page_size (int): Datapoints requested per page.
+            prefetch (bool): Request the next page on a background thread while
+                the current one is consumed.
+            cursor (Optional[int]): Resume from the `cursor` of an earlier
+                iterator over the same search, e.g. after a network failure.
+
+        Returns:
+            OffsetPager[DatapointListItem]: An iterable whose `cursor` is the
+                offset of the next datapoint not yet yielded.
+
+        Example:
+        ```python
+        pages = okareo_client.iter_datapoints(DatapointSearch(mut_id=mut_id))
+        try:
+            for dp in pages:
+                handle(dp)
+        except httpx.HTTPError:
+            for dp in okareo_client.iter_datapoints(search, cursor=pages.cursor):
+                handle(dp)
+        ```
+        """
+        search = self._with_client_project(datapoint_search)
+        start = search.offset if isinstance(search.offset, int) else 0
+        end = start + search.limit if isinstance(search.limit, int) else None
+        offset = start if cursor is None else cursor
+
+        def fetch_page(page_offset: int, limit: int) -> List[DatapointListItem]:
+            page = copy.copy(search)
+            page.offset = page_offset
+            page.limit = limit
+            return self.find_datapoints(page)
+
+        return OffsetPager(
+            fetch_page,
+            page_size=page_size,
+            offset=offset,
+            limit=None if end is None else max(end - offset, 0),
+            prefetch=prefetch,
+        )
+
+    def find_datapoints_filter(
+        self,
+        datapoint_search: DatapointFilterSearchPayload,
+        fields: Optional[List[str]] = None,
+    ) -> List[DatapointListItem]:
+        """
+        Fetch the datapoints specified by a Datapoint Search.
+
+        Args:
+            datapoint_search (DatapointFilterSearchPayload): The search criteria for fetching datapoints.
+            fields (Optional[List[str]]): Only decode these `DatapointListItem`
+                attributes (plus `id`); the rest stay UNSET.
+
+        Returns:
+            List[DatapointListItem]: A list of datapoint items matching the search.
+
+        Raises:
+            TypeError: If the API response is an error.
+
+        Example:
+        ```python
+        from okareo_api_client.models.datapoint_filter_search_payload import DatapointFilterSearchPayload
+
+        ### Search based on a test run ID
+        test_run__id = "your_test_run_id"  # Replace with your actual test run ID
+        search = DatapointFilterSearchPayload(
+            test_run_id=test_run__id,
+        )
+        datapoints = okareo_client.find_datapoints(search)
+        for dp in datapoints:
+            print(dp)
+
+        ### Find datapoints based on filters on datapoints fields
+        from okareo_api_client.models.datapoint_filter_search_payload import DatapointFilterSearchPayload
+        from okareo_api_client.models.filter_condition import FilterCondition
+        from okareo_api_client.models.comparison_operator import ComparisonOperator
+
+        search = DatapointFilterSearchPayload(
+            filters=[FilterCondition(
+                field=DatapointField.TEST_RUN_ID,
+                operator=ComparisonOperator.EQUAL,
+                value="France"
+            )]
+        )
+        datapoints = okareo_client.find_datapoints_filter(search)
+        for dp in datapoints:
+            print(dp)
+        ```
+        """
+        datapoint_search = self._with_client_project(datapoint_search, as_uuid=True)
+        if fields is not None:
+            keys = projection_keys(DatapointListItem, fields)
+            return decode_projected(
+                DatapointListItem,
+                self._raw_rows(
+                    get_datapoints_filter_v0_find_datapoints_filter_post,
+                    datapoint_search,
+                ),
+                keys,
+            )
+        data = get_datapoints_filter_v0_find_datapoints_filter_post.sync(
+            client=self.client,
+            api_key=self.api_key,
+            body=datapoint_search,
+        )
+        if not data:
+            return []
+        self.validate_response(data)
+        assert isinstance(data, list)
+        return data
+
+    def _raw_rows(
+        self, endpoint: Any, body: Any, ok_status: int = 200
+    ) -> List[Dict[str, Any]]:
+        """Call a generated list endpoint, returning the undecoded JSON rows."""
+        response = self.client.get_httpx_client().request(
+            **endpoint._get_kwargs(body=body, api_key=self.api_key)
+        )
+        if response.status_code != ok_status:
+            # error bodies go through the generated parser, which raises or
+            # returns an ErrorResponse
+            self.validate_response(
+                endpoint._parse_response(client=self.client, response=response)
+            )
+        return response.json() or []
+
+    def find_datapoints_columns(
+        self, datapoint_search: DatapointSearch
+    ) -> DatapointColumns:
+        """
+        `find_datapoints`, decoded column-wise: rows stay plain JSON and each
+        field is only extracted (and optionally parsed) when read, which is much
+        faster than building a `DatapointListItem` per row for analytics over
+        many datapoints.
+
+        Args:
+            datapoint_search (DatapointSearch): The search criteria for fetching datapoints.
+
+        Returns:
+            DatapointColumns: The matching datapoints, by field.
+
+        Raises:
+            TypeError: If the API response is an error.
+        """
+        return DatapointColumns(
+            self._raw_rows(
+                get_datapoints_v0_find_datapoints_post,
+                self._with_client_project(datapoint_search),
+            )
+        )
+
+    def find_datapoints_filter_columns(
+        self, datapoint_search: DatapointFilterSearchPayload
+    ) -> DatapointColumns:
+        """
+        `find_datapoints_filter`, decoded column-wise like `find_datapoints_columns`.
+
+        Args:
+            datapoint_search (DatapointFilterSearchPayload): The filter criteria for fetching datapoints.
+
+        Returns:
+            DatapointColumns: The matching datapoints, by field.
+
+        Raises:
+            TypeError: If the API response is an error.
+        """
+        return DatapointColumns(
+            self._raw_rows(
+                get_datapoints_filter_v0_find_datapoints_filter_post,
+                self._with_client_project(datapoint_search, as_uuid=True),
+            )
+        )
+
+    def generate_evaluator(
+        self, create_evaluator: EvaluatorSpecRequest
+    ) -> EvaluatorGenerateResponse:
+        check_deprecation_warning()
+        return self.generate_check(create_evaluator)
+
+    def generate_check(
+        self, create_check: EvaluatorSpecRequest
+    ) -> EvaluatorGenerateResponse:
+        """
+        Generate the contents of a Check based on an EvaluatorSpecRequest. Can be used to generate a behavioral (model-based) or a deterministic (code-based) check. Check names must be unique within a project.
+
+        Args:
+            create_check (EvaluatorSpecRequest): The specification for the check to generate.
+
+        Returns:
+            EvaluatorGenerateResponse: The generated check response.
+
+        Example:
+        ```python
+        from okareo_api_client.models.evaluator_spec_request import EvaluatorSpecRequest
+        from okareo.okareo import OkareoClient, BaseCheck
+
+        # Generate a behavioral model-based check
+        spec = EvaluatorSpecRequest(
+            description="Checks if the output contains toxic language.",
+            requires_scenario_input=False,
+            requires_scenario_result=False,
+            output_data_type="bool", # bool, int, float
+        )
+        okareo_client = Okareo(api_key="your_api_key")
+        generated_check = okareo_client.generate_check(spec)
+
+        # Inspect the generated check to ensure it meets your requirements
+        print(generated_check)
+
+        # Upload the generated check to Okareo to use in evaluations
+        toxicity_check = okareo.create_or_update_check(
+            name="toxicity_check",
+            description=generated_check.description,
+            check=ModelBasedCheck(  # type: ignore
+                prompt_template=check.generated_prompt,
+                check_type=CheckOutputType.PASS_FAIL,
+            ),
+        )
+        # Inspect the uploaded check
+        print(toxicity_check)
+        ```
+        """
+        response = check_generate_v0_check_generate_post.sync(
+            client=self.client, api_key=self.api_key, body=create_check
+        )
+        self.validate_response(response)
+        assert isinstance(response, EvaluatorGenerateResponse)
+
+        return response
+
+    def get_all_evaluators(self) -> List[EvaluatorBriefResponse]:
+        check_deprecation_warning()
+        return self.get_all_checks()
+
+    def get_all_checks(
+        self, all_versions: bool = False
+    ) -> List[EvaluatorBriefResponse]:
+        """
+        Fetch all available checks.
+
+        Args:
+            all_versions: If True, return all versions of every check (full
+                version history).  Defaults to False (latest version only).
+
+        Returns:
+            List[EvaluatorBriefResponse]: A list of EvaluatorBriefResponse objects representing all available checks.
+
+        Example:
+        ```python
+        checks = okareo_client.get_all_checks()
+        for check in checks:
+            print(check.name, check.id)
+
+        # Include full version history
+        all_checks = okareo_client.get_all_checks(all_versions=True)
+        ```
+        """
+        if all_versions:
+            resp = self.client.get_httpx_client().request(
+                method="get",
+                url="/v0/checks",
+                params={"all-versions": "true"},
+                headers={"api-key": self.api_key},
+            )
+            if resp.status_code not in (200, 201):
+                raise ValueError(
+                    f"Failed to fetch checks: {resp.status_code} {resp.text}"
+                )
+            return [EvaluatorBriefResponse.from_dict(item) for item in resp.json()]
+
+        response = get_all_checks_v0_checks_get.sync(
+            client=self.client,
+            api_key=self.api_key,
+        )
+        self.validate_response(response)
+        assert isinstance(response, List)
+
+        return response
+
+    def get_evaluator(self, evaluator_id: str) -> EvaluatorDetailedResponse:
+        check_deprecation_warning()
+        return self.get_check(evaluator_id)
+
+    def get_check(
+        self,
+        check_id: Union[str, UUID],
+        version: Union[str, int, None] = None,
+    ) -> EvaluatorDetailedResponse:
+        """
+        Fetch details for a specific check by UUID or by name.
+
+        Args:
+            check_id: A check UUID (str or UUID object) **or** a check name
+                (str).  When a name is given the method resolves it to a UUID
+                via the list endpoint.
+            version: Optional version number or the string ``"latest"``.
+                Only used when *check_id* is a name.  ``None`` and
+                ``"latest"`` both resolve to the most recent version.
+
+        Returns:
+            EvaluatorDetailedResponse: The detailed response for the specified check.
+
+        Raises:
+            ValueError: If no check matches the given name/version.
+
+        Example:
+        ```python
+        # By UUID (existing behaviour)
+        check = okareo_client.get_check("your_check_uuid")
+
+        # By name (latest version)
+        check = okareo_client.get_check("my_check")
+        check = okareo_client.get_check("my_check", version="latest")
+
+        # By name + pinned version
+        check = okareo_client.get_check("my_check", version=1)
+        ```
+        """
+        if isinstance(version, str) and version == "latest":
+            version = None
+
+        # If an explicit version is requested, treat check_id as a name.
+        if isinstance(version, int):
+            return self._get_check_by_name(str(check_id), version)
+
+        # Try to interpret as UUID first.
+        uuid_val: Optional[UUID] = None
+        if isinstance(check_id, UUID):
+            uuid_val = check_id
+        else:
+            try:
+                uuid_val = UUID(check_id)
+            except ValueError:
+                pass
+
+        if uuid_val is not None:
+            response = get_check_v0_check_check_id_get.sync(
+                client=self.client,
+                api_key=self.api_key,
+                check_id=uuid_val,
+            )
+            self.validate_response(response)
+            assert isinstance(response, EvaluatorDetailedResponse)
+            return response
+
+        # It's a name — resolve to the latest version.
+        return self._get_check_by_name(str(check_id))
+
+    def _get_check_by_name(
+        self, name: str, version: Optional[int] = None
+    ) -> EvaluatorDetailedResponse:
+        """Resolve a check name (+ optional version) to a detailed response."""
+
+        all_checks = self.get_all_checks(all_versions=True)
+        matches = [c for c in all_checks if c.name == name]
+        if not matches:
+            raise ValueError(f"No check found with name '{name}'")
+        brief = self._select_check_by_version(
+            name=name, matches=matches, version=version
+        )
+        return self.get_check(self._check_brief_id(brief, name))
+
+    def delete_evaluator(self, evaluator_id: str, evaluator_name: str) -> str:
+        check_deprecation_warning()
+        return self.delete_check(evaluator_id, evaluator_name)
+
+    def delete_check(self, check_id: Union[str, UUID], check_name: str) -> str:
+        """
+        Deletes a check identified by its ID and name.
+
+        Args:
+            check_id (str): The unique identifier of the check to delete.
+            check_name (str): The name of the check to delete.
+
+        Returns:
+            str: A message indicating the result of the deletion.
+
+        Example:
+        ```python
+        result = okareo_client.delete_check(check_id="abc123", check_name="MyCheck")
+        print(result)  # Output: Check deletion was successful
+        ```
+        """
+        check_delete_v0_check_check_id_delete.sync(
+            client=self.client,
+            api_key=self.api_key,
+            check_id=UUID(check_id) if isinstance(check_id, str) else check_id,
+            body=BodyCheckDeleteV0CheckCheckIdDelete.from_dict({"name": check_name}),
+        )
+        return "Check deletion was successful"
+
+    def create_or_update_check(
+        self,
+        name: str,
+        description: str,
+        check: BaseCheck,
+        tags: Optional[List[str]] = None,
+    ) -> EvaluatorDetailedResponse:
+        """
+        Create or update an existing check. If the check with 'name' already exists, then this method will update the existing check. Otherwise, this method will create a new check.
+
+        Args:
+            name (str): The unique name of the check to create or update.
+            description (str): A human-readable description of the check.
+            check (BaseCheck): An instance of BaseCheck containing the check configuration.
+            tags: Optional list of string tags to associate with the check.
+
+        Returns:
+            EvaluatorDetailedResponse: The detailed response from the evaluator after creating or updating the check.
+
+        Raises:
+            AssertionError: If the response is not an instance of EvaluatorDetailedResponse.
+            ValueError: If the response validation fails.
+
+        Example:
+        ```python
+        from okareo.checks import CheckOutputType, ModelBasedCheck
+
+        my_check = ModelBasedCheck(
+            prompt_template="Only output the number of words in the following text: {scenario_input} {generation}",
+            check_type=CheckOutputType.PASS_FAIL,
+        )
+
+        response = okareo_client.create_or_update_check(
+            name="my_word_count_check",
+            description="Custom check for counting combined total number of words in input and output.",
+            check=my_check,
+            tags=["prod", "v1"],
+        )
+
+        print(response)
+        ```
+        """
+        response = check_create_or_update_v0_check_create_or_update_post.sync(
+            client=self.client,
+            api_key=self.api_key,
+            body=self._check_request(name, description, check, tags),
+        )
+        self.validate_response(response)
+        assert isinstance(response, EvaluatorDetailedResponse)
+
+        return response
+
+    def create_group(
+        self,
+        name: str,
+        tags: Union[List[str], None] = None,
+        source: Union[dict, None] = None,
+    ) -> Any:
+        request_body = CreateGroupV0GroupsPostBodyType0()
+        if source:
+            request_body.additional_properties.update(source)
+        response = create_group_v0_groups_post.sync_detailed(
+            client=self.client,
+            body=request_body,
+            name=name,
+            tags=tags if tags is not None else UNSET,
+            api_key=self.api_key,
+        )
+        self.validate_response(response)
+
+        return json.loads(response.content)
+
+    def add_model_to_group(self, group: Any, model: Any) -> Any:
+        response = add_model_to_group_v0_groups_group_id_models_post.sync_detailed(
+            client=self.client,
+            group_id=group.get("id", ""),
+            model_id=model.mut_id,
+            api_key=self.api_key,
+        )
+        self.validate_response(response)
+        return response.parsed.additional_properties  # type: ignore
+
+    def create_trace_eval(self, group: Any, context_token: str) -> Any:
+        """
+        Create a trace evaluation for a group.
+
+        Args:
+            group_id (str): The ID of the group.
+            context_token (str): The context token for the trace.
+
+        Returns:
+            The created trace evaluation details.
+
+        Raises:
+            OkareoAPIException: If the API request fails.
+        """
+        response = create_trace_eval_v0_groups_group_id_trace_eval_post.sync_detailed(
+            client=self.client,
+            group_id=group.get("id", ""),
+            context_token=context_token,
+            api_key=self.api_key,
+        )
+        self.validate_response(response)
+        return response.parsed
+
+    def evaluate(
+        self,
+        name: str,
+        test_run_type: TestRunType,
+        scenario_id: Union[Unset, str] = UNSET,
+        datapoint_ids: Union[Unset, list[str]] = UNSET,
+        filter_group_id: Union[Unset, str] = UNSET,
+        tags: Union[Unset, list[str]] = UNSET,
+        metrics_kwargs: Union[Dict[str, Any], Unset] = UNSET,
+        checks: Union[Unset, list[str]] = UNSET,
+    ) -> TestRunItem:
+        """
+        Evaluate datapoints using the specified parameters.
+
+        Args:
+            scenario_id: ID of the scenario set
+            metrics_kwargs: Dictionary of metrics to be measured
+            name: Name of the test run
+            test_run_type: Type of test run
+            tags: Tags for filtering test runs
+            checks: List of checks to include
+            datapoint_ids: List of datapoint IDs to filter by
+            filter_group_id: ID of the datapoint filter group to apply
+
+        Returns:
+            TestRunItem: The evaluation results as a TestRunItem object.
+
+        Example:
+        ```python
+        checks = ["model_refusal"]  # one or more checks to apply in the evaluation
+        test_run = okareo.evaluate(
+            name="My Test Run",
+            test_run_type=TestRunType.NL_GENERATION,
+            checks=checks,
+            datapoint_ids=["datapoint_id_1", "datapoint_id_2"],
+        )
+        print(test_run.app_link)  # View link to eval results in Okareo app
+        ```
+        """
+        return ModelUnderTest._evaluate_internal(
+            client=self.client,
+            api_key=self.api_key,
+            name=name,
+            test_run_type=test_run_type,
+            scenario_id=scenario_id,
+            datapoint_ids=datapoint_ids,
+            filter_group_id=filter_group_id,
+            tags=tags,
+            metrics_kwargs=metrics_kwargs,
+            checks=checks,
+        )
+
+    def _shared_scenario_data_points(
+        self, muts: List[ModelUnderTest], calls: List[Dict[str, Any]]
+    ) -> Dict[str, List[ScenarioDataPoinResponse]]:
+        """Download each scenario that a CustomModel run will invoke on, once."""
+        scenario_data_points: Dict[str, List[ScenarioDataPoinResponse]] = {}
+        for mut, arguments in zip(muts, calls):
+            assert isinstance(mut.models, dict)
+            if arguments["test_run_type"] == TestRunType.MULTI_TURN or not any(
+                model in mut.models for model in CUSTOM_MODEL_STRS
+            ):
+                continue
+            scenario_id = str(ModelUnderTest._scenario_id(arguments["scenario"]))
+            if scenario_id not in scenario_data_points:
+                scenario_data_points[scenario_id] = self.get_scenario_data_points(
+                    scenario_id, use_cache=arguments["use_cache"]
+                )
+        return scenario_data_points
+
+    def run_tests_parallel(
+        self,
+        runs: Sequence[Tuple[ModelUnderTest, Dict[str, Any]]],
+        max_concurrency: int = DEFAULT_PARALLEL_RUN_CONCURRENCY,
+        poll_interval: float = TEST_RUN_POLL_INTERVAL,
+        max_poll_interval: float = TEST_RUN_MAX_POLL_INTERVAL,
+        timeout: Optional[float] = None,
+    ) -> List[TestRunItem]:
+        """
+        Submit several test runs at once and wait for all of them, e.g. to compare
+        registered models on one scenario.
+
+        Each scenario is downloaded once and shared by every CustomModel run on it.
+        CustomModel invocations of all runs proceed together, at most `max_concurrency`
+        in flight across runs. The test runs are then polled in one loop whose interval
+        doubles from `poll_interval` up to `max_poll_interval` (see `wait_for_test_run`).
+
+        Args:
+            runs: Pairs of a registered model and the keyword arguments of its
+                `submit_test` call. `max_concurrency` defaults to this call's.
+            max_concurrency: Most CustomModel invocations in flight across all runs.
+            poll_interval: Seconds before the first status check.
+            max_poll_interval: Longest wait between status checks.
+            timeout: Seconds to wait for every run to finish. Defaults to None (no limit).
+
+        Returns:
+            List[TestRunItem]: The finished (or failed) test runs, in the order of `runs`.
+
+        Example:
+        ```python
+        test_runs = okareo.run_tests_parallel(
+            [
+                (mut_a, {"scenario": scenario, "name": "model A"}),
+                (mut_b, {"scenario": scenario, "name": "model B"}),
+            ],
+            max_concurrency=16,
+        )
+        for test_run in test_runs:
+            print(test_run.name, test_run.model_metrics)
+        ```
+        """
+        backoff = Backoff(poll_interval, max_poll_interval, timeout)
+        calls = []
+        for mut, kwargs in runs:
+            call = inspect.signature(mut.submit_test).bind(**kwargs)
+            call.apply_defaults()
+            if "max_concurrency" not in kwargs:
+                call.arguments["max_concurrency"] = max_concurrency
+            calls.append(call.arguments)
+
+        scenario_data_points = self._shared_scenario_data_points(
+            [mut for mut, _ in runs], calls
+        )
+        invocation_limit = threading.BoundedSemaphore(max(1, max_concurrency))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(len(runs), max_concurrency)),
+            thread_name_prefix="okareo-parallel-runs",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    mut._run_test_internal,
+                    run_test_method=mut._submit_endpoint(arguments["test_run_type"]),
+                    scenario_data_points=scenario_data_points.get(
+                        str(ModelUnderTest._scenario_id(arguments["scenario"]))
+                    ),
+                    invocation_limit=invocation_limit,
+                    **arguments,
+                )
+                for (mut, _), arguments in zip(runs, calls)
+            ]
+            test_runs: List[TestRunItem] = [future.result() for future in futures]
+            # the client-side CustomModel work of each run, to fail fast on its errors
+            submitted = [
+                test_run
+                for test_run in test_runs
+                if isinstance(test_run, SubmittedTestRun)
+            ]
+
+            etags: List[Optional[str]] = [None] * len(runs)
+
+            def refresh(index: int) -> None:
+                polled, etags[index] = runs[index][0]._poll_test_run(
+                    str(test_runs[index].id), etags[index]
+                )
+                test_runs[index] = polled or test_runs[index]
+
+            pending = [
+                index
+                for index, test_run in enumerate(test_runs)
+                if test_run.status not in TEST_RUN_DONE_STATUSES
+            ]
+            while pending:
+                delay = backoff.next_delay()
+                if delay is None:
+                    raise poll_timeout_error(test_runs[index].id for index in pending)
+                time.sleep(delay)
+                for submitted_run in submitted:
+                    if submitted_run.done() and submitted_run.exception() is not None:
+                        raise cast(BaseException, submitted_run.exception())
+                list(executor.map(refresh, pending))
+                pending = [
+                    index
+                    for index in pending
+                    if test_runs[index].status not in TEST_RUN_DONE_STATUSES
+                ]
+        return test_runs
+
+    def create_or_update_driver(self, driver: Driver) -> Driver:
+        """Create or update a simulation driver by name.
+
+        Args:
+            driver: Driver definition to register. If a driver with the same
+                name already exists, it is updated.
+
+        Returns:
+            Driver: The created or updated driver.
+        """
+        response = register_driver_model_v0_driver_post.sync(
+            client=self.client,
+            body=self._driver_request(driver),
+            api_key=self.api_key,
+        )
+        return self._driver_from_response(response)
+
+    def get_driver_by_name(self, driver_name: str) -> Driver:
+        """Retrieve a simulation driver by name.
+
+        Args:
+            driver_name: The name of the driver to retrieve.
+
+        Returns:
+            Driver: The driver with the specified name.
+        """
+        response = get_driver_v0_driver_identifier_get.sync(
+            client=self.client,
+            api_key=self.api_key,
+            identifier=driver_name,
+        )
+        return self._driver_from_response(response)
+
+    def create_or_update_target(
+        self,
+        target: Target,
+        tags: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
+        sensitive_fields: Union[List[str], None] = None,
+    ) -> Target:
+        """Create or update a simulation target by name.
+
+        Args:
+            target: Target definition to register. If a target with the same
+                name already exists, it is updated.
+
+        Returns:
+            Target: The created or updated target.
+        """
+        data, model_type, invokers = self._target_data(
+            target, tags, project_id, sensitive_fields
+        )
+        request_body = ModelUnderTestSchema.from_dict(data)
+        response = register_model_v0_register_model_post.sync(
+            client=self.client, api_key=self.api_key, body=request_body
+        )
+        return self._target_from_response(response, data, model_type, invokers)
+
+    def get_target_by_name(self, target_name: str) -> Target:
+        """Retrieve a simulation target by name.
+
+        Args:
+            target_name: The name of the target to retrieve.
+
+        Returns:
+            Target: The target with the specified name.
+        """
+        response = get_target_model_by_name_v0_target_target_model_name_get.sync(
+            client=self.client,
+            api_key=self.api_key,
+            target_model_name=target_name,
+        )
+        self.validate_response(response)
+        if not response:
+            print("Empty response from API")
+        assert response is not None and isinstance(response, TargetModelResponse)
+
+        # Explicitly construct target response to avoid backwards compatibility issues
+        return Target.from_response(response)
+
+    def run_simulation(
+        self,
+        name: str,
+        scenario: Union[ScenarioSetResponse, str],
         target: str | Target,
         driver: Optional[str | Driver] = None,
         checks: Optional[list[str]] = None,
@@ -1689,479 +2500,1467 @@ class Okareo:
         metrics_kwargs: Optional[dict] = None,
         calculate_metrics: bool = True,
         project_id: Optional[str] = None,
-        tags: Optional[list[str]] = None,
-        sensitive_fields: Union[List[str], None] = None,
-        submit: Optional[bool] = False,
+        tags: Optional[list[str]] = None,
+        sensitive_fields: Union[List[str], None] = None,
+        submit: Optional[bool] = False,
+        max_concurrent_turns: int = _DEFAULT_MAX_CONCURRENT_TURNS,
+        turn_timeout: Optional[float] = None,
+    ) -> TestRunItem:
+        """Run a multiturn simulation against a target.
+
+        This method resolves or creates the referenced driver and target,
+        builds Simulation parameters (including optional augmentation), and
+        executes either ModelUnderTest.run_test (blocking) or
+        ModelUnderTest.submit_test (async server-side) using
+        TestRunType.MULTI_TURN.
+
+        Parameter summary:
+        - ``name``: Name of the resulting test run.
+        - ``scenario``: Scenario set object or scenario set ID.
+        - ``target`` / ``driver``: Registered names or object definitions.
+        - ``checks``: Optional checks to execute.
+        - ``stop_check``, ``repeats``, ``max_turns``, ``first_turn``:
+          Turn-flow controls.
+        - ``checks_at_every_turn``, ``concurrent_ask_probability``,
+          ``turn_transition_time``: Runtime simulation controls.
+        - ``augmentation``: Optional augmentation settings.
+        - ``api_key`` / ``api_keys``: Provider credentials for target calls.
+        - ``metrics_kwargs`` / ``calculate_metrics``: Metrics configuration.
+        - ``project_id`` / ``tags`` / ``sensitive_fields``: Registration and
+          metadata controls.
+        - ``submit``: If True, submit asynchronously via
+          ModelUnderTest.submit_test.
+        - ``max_concurrent_turns`` / ``turn_timeout``: Client-side limits for a
+          CustomMultiturnTarget — turns invoked at once, and seconds allowed per
+          turn (see ModelUnderTest.run_test).
+
+        Returns a TestRunItem representing the created simulation test run.
+        """
+        project_id = self._resolved_project_id(project_id)
+        # create or update driver if needed
+        if isinstance(driver, Driver):
+            driver_model = self.create_or_update_driver(driver)
+        elif not driver:
+            driver_model = self.create_or_update_driver(Driver(name="default_driver"))
+        else:
+            driver_model = self.get_driver_by_name(driver)
+
+        # create or update target if needed
+        if isinstance(target, Target):
+            if isinstance(target.target, dict):
+                if (
+                    target.target["type"] == "custom_target"
+                    and "model_invoker" not in target.target
+                ):
+                    raise TypeError(
+                        "Cannot retrieve Target by name for CustomMultiturnTarget"
+                    )
+
+            target_model = self.create_or_update_target(
+                target, tags or [], project_id, sensitive_fields
+            )
+        else:
+            target_model = self.get_target_by_name(target)
+            assert isinstance(target_model.target, dict)
+            if target_model.target["type"] == "custom_target":
+                raise TypeError(
+                    "Cannot retrieve Target by name for CustomMultiturnTarget"
+                )
+
+        # create model with target
+        simulation_params = Simulation(
+            stop_check=stop_check,
+            repeats=repeats,
+            max_turns=max_turns,
+            first_turn=first_turn,
+            checks_at_every_turn=checks_at_every_turn,
+            concurrent_ask_probability=concurrent_ask_probability,
+            turn_transition_time=turn_transition_time,
+            augmentation=augmentation,
+        )
+
+        # create MUT object
+        assert isinstance(target_model.target, dict)
+        mut = ModelUnderTest(
+            client=self.client,
+            api_key=self.api_key,
+            mut=self._simulation_mut_response(target_model, project_id, tags),
+            models={target_model.target["type"]: target_model.target},
+            scenario_cache=self.scenario_cache,
+        )
+
+        # run_test
+        fn = mut.submit_test if submit else mut.run_test
+        return fn(
+            scenario=scenario,
+            name=name,
+            api_key=api_key if api_key else self.api_key,
+            api_keys=api_keys,
+            metrics_kwargs=metrics_kwargs,
+            test_run_type=TestRunType.MULTI_TURN,
+            calculate_metrics=calculate_metrics,
+            checks=checks,
+            simulation_params=simulation_params,
+            driver_id=str(driver_model.id) if driver_model.id else None,
+            max_concurrent_turns=max_concurrent_turns,
+            turn_timeout=turn_timeout,
+        )
+
+    def generate_driver_prompt(
+        self,
+        user_input: str,
+        prior_prompt: Optional[str] = None,
+        language: Optional[str] = None,
+        **driver_kwargs: Any,
+    ) -> Driver:
+        """Generate a structured driver prompt from a one-sentence description.
+
+        Args:
+            user_input: Natural language description of the caller persona.
+            prior_prompt: Optional existing prompt to refine.
+            language: BCP-47 language code (e.g. "en", "es", "fr-CA").
+            **driver_kwargs: Extra fields forwarded to the returned Driver
+                (e.g. voice_instructions, temperature, voice).
+
+        Returns:
+            A Driver with the AI-generated name and prompt_template.
+        """
+        payload: Dict[str, Any] = {"user_input": user_input}
+        if prior_prompt is not None:
+            payload["prior_prompt"] = prior_prompt
+        if language is not None:
+            payload["language"] = language
+        request_body = DriverPromptRequest.from_dict(payload)
+        response = generate_driver_prompt_v0_generate_driver_prompt_post.sync(
+            client=self.client,
+            body=request_body,
+            api_key=self.api_key,
+        )
+        self.validate_response(response)
+        assert isinstance(response, DriverPromptResponse)
+        return Driver(
+            name=response.suggested_name,
+            prompt_template=response.driver_prompt,
+            **driver_kwargs,
+        )
+
+    def find_test_runs(
+        self,
+        name: Optional[str] = None,
+        tags: Optional[list] = None,
+        project_id: Optional[str] = None,
+        return_model_metrics: bool = False,
+        mut_id: Optional[str] = None,
+        scenario_set_id: Optional[str] = None,
+    ) -> list:
+        """Find existing test runs for simulation/evaluation workflows.
+
+        Args:
+            name: Filter results to runs with this exact name (client-side).
+            tags: Filter results to runs with these tags (server-side).
+            project_id: Scope to a specific project.
+            return_model_metrics: Include model_metrics in the response.
+            mut_id: Filter results to runs of this model (server-side).
+            scenario_set_id: Filter results to runs on this scenario (server-side).
+
+        Returns:
+            List of test run dicts from the server.
+        """
+        project_id = self._resolved_project_id(project_id)
+        body: Dict[str, Any] = {"return_model_metrics": return_model_metrics}
+        if tags:
+            body["tags"] = tags
+        if project_id:
+            body["project_id"] = project_id
+        if mut_id:
+            body["mut_id"] = mut_id
+        if scenario_set_id:
+            body["scenario_set_id"] = scenario_set_id
+
+        resp = self.client.get_httpx_client().request(
+            method="post",
+            url="/v0/find_test_runs",
+            json=body,
+            headers={"api-key": self.api_key, "Content-Type": "application/json"},
+        )
+        if resp.status_code not in (200, 201):
+            raise ValueError(f"find_test_runs failed: {resp.status_code} {resp.text}")
+        response = resp.json()
+        assert isinstance(response, list)
+        if name:
+            response = [r for r in response if r.get("name") == name]
+        return response
+
+    def wait_for_test_runs(
+        self,
+        test_run_ids: Sequence[Union[str, UUID]],
+        timeout: Optional[float] = None,
+        poll_interval: float = TEST_RUN_POLL_INTERVAL,
+        max_poll_interval: float = TEST_RUN_MAX_POLL_INTERVAL,
+        project_id: Optional[str] = None,
+    ) -> List[TestRunItem]:
+        """Wait for several test runs to finish, checking them with one
+        `find_test_runs` request per model per round instead of one request per run.
+
+        Each run is fetched directly once up front, so an unknown ID raises right
+        away, and again when it is seen finished. Later rounds list only the runs
+        of the models being waited on; a run missing from its listing is fetched
+        directly. Rounds are spaced like `ModelUnderTest.wait_for_test_run`.
+
+        Args:
+            test_run_ids: IDs of the test runs to wait for.
+            timeout: Seconds to wait before raising TimeoutError. Defaults to None (no limit).
+            poll_interval: Seconds between the first two rounds.
+            max_poll_interval: Longest wait between rounds.
+            project_id: Project of the test runs; defaults to the client's.
+
+        Returns:
+            List[TestRunItem]: The test runs, with status FINISHED or FAILED, in the order of `test_run_ids`.
+        """
+        backoff = Backoff(poll_interval, max_poll_interval, timeout)
+        finished: Dict[str, TestRunItem] = {}
+        # test run id -> id of its model, which scopes the listing
+        pending: Dict[str, Optional[str]] = {}
+        for test_run_id in dict.fromkeys(str(i) for i in test_run_ids):
+            test_run = self._get_test_run(test_run_id)
+            if test_run.status in TEST_RUN_DONE_STATUSES:
+                finished[test_run_id] = test_run
+            else:
+                mut_id = test_run.mut_id
+                pending[test_run_id] = str(mut_id) if isinstance(mut_id, UUID) else None
+        while pending:
+            delay = backoff.next_delay()
+            if delay is None:
+                raise poll_timeout_error(sorted(pending))
+            time.sleep(delay)
+            for test_run_id, test_run in self._poll_test_runs(
+                pending, project_id
+            ).items():
+                finished[test_run_id] = test_run
+                del pending[test_run_id]
+        return [finished[str(test_run_id)] for test_run_id in test_run_ids]
+
+    def _poll_test_runs(
+        self, pending: Dict[str, Optional[str]], project_id: Optional[str]
+    ) -> Dict[str, TestRunItem]:
+        """The runs in `pending` that are done, fetched in full."""
+        statuses: Dict[str, Any] = {}
+        for mut_id in sorted({m for m in pending.values() if m}):
+            for row in self.find_test_runs(project_id=project_id, mut_id=mut_id):
+                statuses[str(row.get("id"))] = row.get("status")
+        finished: Dict[str, TestRunItem] = {}
+        for test_run_id in pending:
+            status = statuses.get(test_run_id)
+            if status is not None and status not in TEST_RUN_DONE_STATUSES:
+                continue
+            # done, or not in the listing: ask for the run itself
+            test_run = self._get_test_run(test_run_id)
+            if test_run.status in TEST_RUN_DONE_STATUSES:
+                finished[test_run_id] = test_run
+        return finished
+
+    def _get_test_run(self, test_run_id: str) -> TestRunItem:
+        response = get_test_run_v0_test_runs_test_run_id_get.sync(
+            client=self.client,
+            api_key=self.api_key,
+            test_run_id=UUID(test_run_id),
+        )
+        self.validate_response(response)
+        assert isinstance(response, TestRunItem)
+        return response
+
+    def re_evaluate(
+        self,
+        test_run_id: str,
+        checks: list,
+        name: Optional[str] = None,
+        tags: Optional[list] = None,
     ) -> TestRunItem:
-        """Run a multiturn simulation against a target.
+        """Re-evaluate an existing test run with different checks.
+
+        No new simulation or phone call is made. The existing conversation
+        data is re-scored with the specified checks.
+
+        Args:
+            test_run_id: ID of the source test run to re-evaluate.
+            checks: List of check names or IDs to apply.
+            name: Optional name for the new re-evaluated run.
+            tags: Optional tags for the new run.
+
+        Returns:
+            The newly created TestRunItem with re-evaluated results.
+        """
+        payload = ReEvaluatePayload(
+            check_ids=checks,
+            name=name if name else UNSET,
+            tags=tags if tags else UNSET,
+        )
+        response = re_evaluate_v0_test_runs_test_run_id_re_evaluate_post.sync(
+            client=self.client,
+            test_run_id=UUID(test_run_id),
+            body=payload,
+            api_key=self.api_key,
+        )
+        self.validate_response(response)
+        assert isinstance(response, TestRunItem)
+        return response
+
+    def _download_audio(
+        self,
+        url: str,
+        cache_key: str,
+        to_path: Union[str, "os.PathLike[str]", None],
+        use_cache: bool,
+        follow_redirects: bool = False,
+    ) -> Union[bytes, str]:
+        """GET an audio file through the `audio_cache` when there is one. With
+        `to_path` the body is streamed to that file and its path returned."""
+        base_url = self.client._base_url
+        cached = (
+            self.audio_cache.get(base_url, cache_key)
+            if self.audio_cache is not None and use_cache
+            else None
+        )
+        if cached is None:
+            with self.client.get_httpx_client().stream(
+                "GET",
+                url,
+                headers={"api-key": self.api_key},
+                follow_redirects=follow_redirects,
+                timeout=_AUDIO_DOWNLOAD_TIMEOUT,
+            ) as response:
+                response.raise_for_status()
+                if self.audio_cache is not None:
+                    cached = self.audio_cache.put(
+                        base_url, cache_key, response.iter_bytes()
+                    )
+                elif to_path is not None:
+                    write_stream(to_path, response.iter_bytes())
+                    return os.fspath(to_path)
+                else:
+                    return response.read()
+        if to_path is not None:
+            shutil.copyfile(cached, to_path)
+            return os.fspath(to_path)
+        return cached.read_bytes()
+
+    @overload
+    def download_call_recording(
+        self, call_sid: str, to_path: None = None, use_cache: bool = True
+    ) -> bytes: ...
+
+    @overload
+    def download_call_recording(
+        self,
+        call_sid: str,
+        to_path: Union[str, "os.PathLike[str]"],
+        use_cache: bool = True,
+    ) -> str: ...
+
+    def download_call_recording(
+        self,
+        call_sid: str,
+        to_path: Union[str, "os.PathLike[str]", None] = None,
+        use_cache: bool = True,
+    ) -> Union[bytes, str]:
+        """Download a voice call recording by its Twilio CallSid.
+
+        Args:
+            call_sid: The Twilio CallSid from datapoint metadata
+                (e.g. dp.model_metadata.additional_properties["call_sid"]).
+            to_path: Optional file to stream the recording to instead of
+                returning its bytes.
+            use_cache: With an `audio_cache`, pass False to download again.
+
+        Returns:
+            Raw WAV audio bytes, or `to_path` when given.
+        """
+        return self._download_audio(
+            f"/v0/voice/call_sid/{call_sid}",
+            f"call_sid/{call_sid}",
+            to_path,
+            use_cache,
+            follow_redirects=True,
+        )
+
+    def download_call_recordings(
+        self,
+        call_sids: List[str],
+        to_dir: Union[str, "os.PathLike[str]", None] = None,
+        max_workers: int = DEFAULT_AUDIO_DOWNLOAD_WORKERS,
+        use_cache: bool = True,
+    ) -> Dict[str, Union[bytes, str]]:
+        """Download many call recordings, `max_workers` at a time.
+
+        Args:
+            call_sids: Twilio CallSids of the recordings.
+            to_dir: Optional directory to stream each recording to, as
+                `<call_sid>.wav`, instead of returning the bytes.
+            max_workers: Number of recordings downloaded at once.
+            use_cache: With an `audio_cache`, pass False to download again.
+
+        Returns:
+            Dict of CallSid to WAV bytes, or to the file path with `to_dir`.
+        """
+        call_sids = list(dict.fromkeys(call_sids))
+
+        def download(call_sid: str) -> Union[bytes, str]:
+            to_path = os.path.join(to_dir, f"{call_sid}.wav") if to_dir else None
+            return self._download_audio(
+                f"/v0/voice/call_sid/{call_sid}",
+                f"call_sid/{call_sid}",
+                to_path,
+                use_cache,
+                follow_redirects=True,
+            )
+
+        if to_dir:
+            os.makedirs(to_dir, exist_ok=True)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_workers)
+        ) as executor:
+            recordings = list(
+                tqdm(
+                    executor.map(download, call_sids),
+                    total=len(call_sids),
+                    desc="Downloading call recordings",
+                )
+            )
+        return dict(zip(call_sids, recordings))
+
+    def upload_voice(
+        self,
+        file_path: Optional[str] = None,
+        file_bytes: Optional[bytes] = None,
+        project_id: Optional[str] = None,
+    ) -> VoiceUploadResponse:
+        """Upload a voice file for use in voice scenarios/simulations.
+
+        Provide either a local `file_path` or in-memory `file_bytes`.
+
+        Args:
+            file_path: Path to a local audio file.
+            file_bytes: Raw audio bytes.
+            project_id: Optional project ID to associate with the uploaded file.
+
+        Returns:
+            VoiceUploadResponse: Metadata including a downloadable `file_url`.
+
+        Raises:
+            ValueError: If neither `file_path` nor `file_bytes` is provided.
+        """
+        if not file_bytes and file_path:
+            return self._upload_voice_file(
+                file_path,
+                self._resolved_project_id(project_id),
+                DEFAULT_AUDIO_UPLOAD_ATTEMPTS,
+            )
+        if not file_bytes:
+            raise ValueError("Either file_path or file_bytes must be provided.")
+        audio_b64 = base64.b64encode(file_bytes).decode("utf-8")
+
+        project_id = self._resolved_project_id(project_id)
+        payload = {"audio": audio_b64}
+        if project_id:
+            payload["project_id"] = project_id
+        request_body = VoiceUploadRequest.from_dict(payload)
+        response = upload_voice_file_v0_voice_upload_post.sync(
+            client=self.client, api_key=self.api_key, body=request_body
+        )
+
+        self.validate_response(response)
+        assert isinstance(response, VoiceUploadResponse)
+
+        return response
+
+    def _request_with_retries(
+        self, description: str, max_attempts: int, **request_kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, retrying connection errors, 429s and 5xx responses
+        with backoff. The last response is returned whatever its status."""
+        backoff = Backoff(_REQUEST_RETRY_DELAY, _REQUEST_MAX_RETRY_DELAY)
+        for attempt in range(1, max_attempts + 1):
+            try:
+                response = self.client.get_httpx_client().request(**request_kwargs)
+            except httpx.TransportError as e:
+                if attempt == max_attempts:
+                    print(f"Failed to {description}: {str(e)}")
+                    raise
+            else:
+                if response.status_code < 500 and response.status_code != 429:
+                    break
+                if attempt == max_attempts:
+                    print(f"Failed to {description}: {response.status_code}")
+                    break
+            time.sleep(backoff.next_delay() or 0)
+        return response
+
+    def _upload_voice_file(
+        self, file_path: str, project_id: Optional[str], max_attempts: int
+    ) -> VoiceUploadResponse:
+        """Upload a local audio file with its base64 encoded while it is sent,
+        retrying connection errors, 429s and 5xx responses with backoff."""
+        body = Base64JsonBody(
+            file_path, "audio", {"project_id": project_id} if project_id else {}
+        )
+        response = self._request_with_retries(
+            f"upload {file_path}",
+            max_attempts,
+            method="post",
+            url="/v0/voice/upload",
+            content=body,
+            headers={
+                "api-key": self.api_key,
+                "Content-Type": "application/json",
+                "Content-Length": str(len(body)),
+            },
+        )
+        parsed = upload_voice_file_v0_voice_upload_post._parse_response(
+            client=self.client, response=response
+        )
+        self.validate_response(parsed)
+        assert isinstance(parsed, VoiceUploadResponse)
+        return parsed
+
+    @overload
+    def download_voice(
+        self, file_url: str, to_path: None = None, use_cache: bool = True
+    ) -> bytes: ...
+
+    @overload
+    def download_voice(
+        self,
+        file_url: str,
+        to_path: Union[str, "os.PathLike[str]"],
+        use_cache: bool = True,
+    ) -> str: ...
+
+    def download_voice(
+        self,
+        file_url: str,
+        to_path: Union[str, "os.PathLike[str]", None] = None,
+        use_cache: bool = True,
+    ) -> Union[bytes, str]:
+        """Download a voice file from Okareo.
+
+        Files are always stored as MP3 on the server.
+
+        Args:
+            file_url: The file URL returned by upload_voice()
+                      (e.g. https://api.okareo.com/v0/voice/file/{project_id}/{file_id}).
+            to_path: Optional file to stream the audio to instead of returning
+                its bytes.
+            use_cache: With an `audio_cache`, pass False to download again.
+
+        Returns:
+            Raw MP3 audio bytes, or `to_path` when given.
+        """
+        parts = file_url.rstrip("/").split("/")
+        file_id = parts[-1]
+        project_id = parts[-2]
+
+        return self._download_audio(
+            f"/v0/voice/file/{project_id}/{file_id}",
+            f"file/{project_id}/{file_id}",
+            to_path,
+            use_cache,
+        )
+
+    def create_scenario_set_with_audio_files(
+        self,
+        name: str,
+        data_list: List[Dict[str, str]],
+        project_id: Optional[Union[str, UUID]] = None,
+        max_workers: int = DEFAULT_AUDIO_UPLOAD_WORKERS,
+        max_attempts: int = DEFAULT_AUDIO_UPLOAD_ATTEMPTS,
+        manifest_path: Optional[str] = None,
+    ) -> ScenarioSetResponse:
+        """Upload local audio files and create a scenario set in one call.
+
+        Each item's 'input' field should be a local file path to a WAV or MP3
+        file. The file is uploaded to Okareo (coerced to MP3), and 'input' is
+        replaced with the returned file URL before creating the scenario.
 
-        This method resolves or creates the referenced driver and target,
-        builds Simulation parameters (including optional augmentation), and
-        executes either ModelUnderTest.run_test (blocking) or
-        ModelUnderTest.submit_test (async server-side) using
-        TestRunType.MULTI_TURN.
+        Files are uploaded `max_workers` at a time, each streamed from disk and
+        retried up to `max_attempts` times; files with identical content are
+        uploaded once. With `manifest_path`, every finished upload is appended
+        to that file, and a rerun after a failure only uploads what is missing.
 
-        Parameter summary:
-        - ``name``: Name of the resulting test run.
-        - ``scenario``: Scenario set object or scenario set ID.
-        - ``target`` / ``driver``: Registered names or object definitions.
-        - ``checks``: Optional checks to execute.
-        - ``stop_check``, ``repeats``, ``max_turns``, ``first_turn``:
-          Turn-flow controls.
-        - ``checks_at_every_turn``, ``concurrent_ask_probability``,
-          ``turn_transition_time``: Runtime simulation controls.
-        - ``augmentation``: Optional augmentation settings.
-        - ``api_key`` / ``api_keys``: Provider credentials for target calls.
-        - ``metrics_kwargs`` / ``calculate_metrics``: Metrics configuration.
-        - ``project_id`` / ``tags`` / ``sensitive_fields``: Registration and
-          metadata controls.
-        - ``submit``: If True, submit asynchronously via
-          ModelUnderTest.submit_test.
+        Args:
+            name: Scenario set name.
+            data_list: List of dicts with 'input' (local file path) and
+                       'result' (expected transcript string).
+            project_id: Optional project to associate files and scenario with.
+            max_workers: Number of files uploaded at once.
+            max_attempts: Attempts per file on connection errors, 429s and 5xx.
+            manifest_path: Optional JSONL file recording finished uploads.
 
-        Returns a TestRunItem representing the created simulation test run.
+        Returns:
+            ScenarioSetResponse from the created scenario set.
         """
+
         project_id = self._resolved_project_id(project_id)
-        # create or update driver if needed
-        if isinstance(driver, Driver):
-            driver_model = self.create_or_update_driver(driver)
-        elif not driver:
-            driver_model = self.create_or_update_driver(Driver(name="default_driver"))
-        else:
-            driver_model = self.get_driver_by_name(driver)
+        pid = str(project_id) if project_id else None
+        file_urls = self._upload_audio_files(
+            [item["input"] for item in data_list],
+            pid,
+            max_workers,
+            max_attempts,
+            UploadManifest(manifest_path) if manifest_path else None,
+        )
+        uploaded_data: List[SeedDataRow] = [
+            {"input": file_urls[item["input"]], "result": item["result"]}
+            for item in data_list
+        ]
 
-        # create or update target if needed
-        if isinstance(target, Target):
-            if isinstance(target.target, dict):
-                if (
-                    target.target["type"] == "custom_target"
-                    and "model_invoker" not in target.target
-                ):
-                    raise TypeError(
-                        "Cannot retrieve Target by name for CustomMultiturnTarget"
-                    )
+        seed_data = self.seed_data_from_list(uploaded_data)
+        create_request = ScenarioSetCreate(
+            name=name,
+            seed_data=seed_data,
+            project_id=UUID(str(project_id)) if project_id else UNSET,
+        )
+        return self.create_scenario_set(create_request)
 
-            target_model = self.create_or_update_target(
-                target, tags or [], project_id, sensitive_fields
+    def _upload_audio_files(
+        self,
+        file_paths: List[str],
+        project_id: Optional[str],
+        max_workers: int,
+        max_attempts: int,
+        manifest: Optional[UploadManifest],
+    ) -> Dict[str, str]:
+        """Upload each distinct file content once; returns path -> file URL.
+        Every upload is awaited and recorded before the first failure is raised."""
+        paths = list(dict.fromkeys(file_paths))
+        errors: List[Exception] = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_workers)
+        ) as executor:
+            digests = dict(zip(paths, executor.map(file_digest, paths)))
+            urls_by_digest: Dict[str, str] = {}
+            to_upload: Dict[str, str] = {}
+            for path, digest in digests.items():
+                file_url = manifest.get(digest, project_id) if manifest else None
+                if file_url is not None:
+                    urls_by_digest[digest] = file_url
+                else:
+                    to_upload.setdefault(digest, path)
+            futures = {
+                executor.submit(
+                    self._upload_voice_file, path, project_id, max_attempts
+                ): digest
+                for digest, path in to_upload.items()
+            }
+            for future in tqdm(
+                concurrent.futures.as_completed(futures),
+                total=len(futures),
+                desc="Uploading audio files",
+            ):
+                try:
+                    file_url = future.result().file_url
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                urls_by_digest[futures[future]] = file_url
+                if manifest is not None:
+                    manifest.record(futures[future], project_id, file_url)
+        if errors:
+            print(f"{len(errors)} of {len(futures)} audio uploads failed")
+            raise errors[0]
+        return {path: urls_by_digest[digest] for path, digest in digests.items()}
+
+    def ingest_conversations(
+        self,
+        project_id: Union[str, UUID, None] = None,
+        conversations: Optional[Iterable[Dict[str, Any]]] = None,
+        mut_id: Union[str, UUID, None] = None,
+        max_chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_INGEST_CHUNK_BYTES,
+        max_workers: int = DEFAULT_INGEST_WORKERS,
+        max_attempts: int = DEFAULT_INGEST_ATTEMPTS,
+    ) -> Dict[str, Any]:
+        """Ingest voice conversations for monitoring.
+
+        Accepts one or more conversations from voice platforms (Retell, Twilio, VAPI, etc.)
+        and enqueues them for async processing. Each conversation's turns will become
+        Datapoint rows, and configured monitors will automatically match and run checks.
+
+        This is the monitoring path, not the simulation path. No ScenarioSets are created.
+        The mut_id is optional - when omitted, datapoints are created without MUT association
+        and rely entirely on monitor/filter group matching.
+
+        Conversations are read from the iterable as they are sent, in requests of at
+        most `max_chunk_size` conversations and `max_chunk_bytes` of JSON (a larger
+        conversation goes alone), `max_workers` requests at a time. A request is
+        retried up to `max_attempts` times on connection errors, 429s and 5xx, and a
+        conversation whose `call_id` was already sent in this call is skipped.
+
+        Args:
+            project_id: Okareo project ID.
+            conversations: Iterable of conversation dictionaries, each containing:
+                - source_platform (str): Platform source ('retell', 'twilio', 'vapi', 'elevenlabs', or 'custom')
+                - call_id (str): Platform-specific call identifier
+                - context_token (str, optional): Context token for correlation (defaults to call_id)
+                - audio (dict, optional): Preferred audio shape with one of:
+                    - {"type": "url", "url": "https://..."}
+                    - {"type": "voice_file_id", "voice_file_id": "uuid"}
+                    - {"type": "inline_b64", "inline_b64": "..."}
+                - recording_url (str, optional): Legacy compatibility alias for audio URL
+                - recording_bytes_b64 (str, optional): Legacy compatibility alias for inline base64 audio
+                - transcript (list, optional): Pre-parsed transcript as list of turns with 'role' and 'content'
+                - diarization (bool, optional): When transcript is absent, controls whether Okareo runs diarization + ASR. Defaults to True.
+                - metadata (dict, optional): Platform-specific metadata
+                - tags (list, optional): Tags for monitor matching
+                - first_turn (str, optional): For audio-only diarization ('user' or 'assistant' spoke first, defaults to 'assistant')
+            mut_id: Optional model under test ID. If not provided, datapoints are created without MUT association (monitoring path).
+            max_chunk_size: Most conversations per request.
+            max_chunk_bytes: Most bytes of conversation JSON per request.
+            max_workers: Most requests in flight.
+            max_attempts: Attempts per request.
+
+        Returns:
+            Dict with 'status' and the list of 'conversations', each with its
+            'call_id' and 'status' — "failed" (with an 'error') when its request
+            failed, "duplicate" when skipped. 'status' is "partial" when some
+            requests failed.
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status for every request.
+
+        Example (monitoring-only, no MUT):
+        ```python
+        okareo.ingest_conversations(
+            project_id="your-project-id",
+            conversations=[
+                {
+                    "source_platform": "retell",
+                    "call_id": "call-123",
+                    "audio": {
+                        "type": "url",
+                        "url": "https://retell.ai/recordings/call-123.mp3",
+                    },
+                    "tags": ["support", "billing"],
+                    "metadata": {"customer_id": "cust-456"}
+                }
+            ]
+        )
+        ```
+
+        Example (with MUT association):
+        ```python
+        okareo.ingest_conversations(
+            project_id="your-project-id",
+            mut_id="your-mut-id",
+            conversations=[
+                {
+                    "source_platform": "custom",
+                    "call_id": "call-456",
+                    "transcript": [
+                        {"role": "user", "content": "Hello", "timestamp_ms": 0},
+                        {"role": "assistant", "content": "Hi, how can I help?", "timestamp_ms": 1000}
+                    ],
+                }
+            ]
+        )
+        ```
+        """
+        project_id = self._resolved_project_id(project_id)
+        if project_id is None:
+            raise ValueError(
+                "ingest_conversations requires a project_id — pass one per call or "
+                "set a client-level Project (Okareo(..., project=...) or set_project)."
             )
-        else:
-            target_model = self.get_target_by_name(target)
-            assert isinstance(target_model.target, dict)
-            if target_model.target["type"] == "custom_target":
-                raise TypeError(
-                    "Cannot retrieve Target by name for CustomMultiturnTarget"
+        if conversations is None:
+            raise ValueError("ingest_conversations requires conversations.")
+        payload = {"project_id": str(project_id)}
+
+        # Only include mut_id if provided
+        if mut_id is not None:
+            payload["mut_id"] = str(mut_id)
+        # the request body up to the conversations array, which is filled per chunk
+        body_prefix = (json.dumps(payload)[:-1] + ', "conversations": [').encode()
+
+        duplicates: List[Any] = []
+        sent: List[Tuple[List[Any], concurrent.futures.Future]] = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_workers)
+        ) as executor:
+            in_flight: Set[concurrent.futures.Future] = set()
+            for call_ids, chunk in json_chunks(
+                self._skip_duplicate_calls(conversations, duplicates),
+                max_chunk_size,
+                max_chunk_bytes,
+                key=lambda conversation: conversation.get("call_id"),
+            ):
+                # bounds how many encoded chunks are held at once
+                if len(in_flight) >= max(1, max_workers):
+                    _, in_flight = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                future = executor.submit(
+                    self._ingest_chunk,
+                    body_prefix + b", ".join(chunk) + b"]}",
+                    max_attempts,
                 )
+                in_flight.add(future)
+                sent.append((call_ids, future))
+        results = [
+            (call_ids, future.exception() or future.result())
+            for call_ids, future in sent
+        ]
+        if not results:
+            raise ValueError("ingest_conversations requires conversations.")
+        return self._ingest_report(results, duplicates)
 
-        # create model with target
-        simulation_params = Simulation(
-            stop_check=stop_check,
-            repeats=repeats,
-            max_turns=max_turns,
-            first_turn=first_turn,
-            checks_at_every_turn=checks_at_every_turn,
-            concurrent_ask_probability=concurrent_ask_probability,
-            turn_transition_time=turn_transition_time,
-            augmentation=augmentation,
+    @staticmethod
+    def _skip_duplicate_calls(
+        conversations: Iterable[Dict[str, Any]], duplicates: List[Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield each conversation whose call_id was not seen yet; the call_ids
+        of the others are appended to `duplicates`."""
+        seen: Set[Any] = set()
+        for conversation in conversations:
+            call_id = conversation.get("call_id")
+            if call_id is not None and call_id in seen:
+                duplicates.append(call_id)
+                continue
+            seen.add(call_id)
+            yield conversation
+
+    def _ingest_chunk(self, content: bytes, max_attempts: int) -> Dict[str, Any]:
+        response = self._request_with_retries(
+            "ingest conversations",
+            max_attempts,
+            method="post",
+            url="/v0/conversations/ingest",
+            headers={"api-key": self.api_key, "Content-Type": "application/json"},
+            content=content,
+            timeout=_INGEST_TIMEOUT,
         )
+        response.raise_for_status()
 
-        # create MUT object
-        dummy_response = ModelUnderTestResponse(
-            id=(
-                UUID(target_model.id)
-                if isinstance(target_model.id, str)
-                else (target_model.id if target_model.id else UUID(int=0))
-            ),
-            project_id=(
-                UUID(project_id)
-                if isinstance(project_id, str)
-                else (project_id if project_id else UUID(int=0))
+        json_response = response.json()
+        if not isinstance(json_response, dict):
+            raise TypeError("Expected JSON object response from conversations ingest")
+
+        return cast(Dict[str, Any], json_response)
+
+    @staticmethod
+    def _ingest_report(
+        results: List[Tuple[List[Any], Any]], duplicates: List[Any]
+    ) -> Dict[str, Any]:
+        """Merge the responses of the ingest requests into one status and the
+        list of conversations, each with its own status. Raises the first error
+        when every request failed."""
+        responses = [r for _, r in results if not isinstance(r, Exception)]
+        errors = [r for _, r in results if isinstance(r, Exception)]
+        if not responses:
+            raise errors[0]
+        conversations: List[Dict[str, Any]] = []
+        for call_ids, result in results:
+            if isinstance(result, Exception):
+                conversations.extend(
+                    {"call_id": call_id, "status": "failed", "error": str(result)}
+                    for call_id in call_ids
+                )
+            else:
+                conversations.extend(
+                    {"status": result.get("status"), **conversation}
+                    for conversation in result.get("conversations", [])
+                )
+        conversations.extend(
+            {"call_id": call_id, "status": "duplicate"} for call_id in duplicates
+        )
+        statuses = {response.get("status") for response in responses}
+        if errors:
+            print(f"{len(errors)} of {len(results)} ingest requests failed")
+        return {
+            "status": (
+                statuses.pop() if len(statuses) == 1 and not errors else "partial"
             ),
-            name=target_model.name,
-            tags=tags or [],
-            time_created=datetime.datetime.now().isoformat(),
-            version=1,
-        )
+            "conversations": conversations,
+        }
 
-        assert isinstance(target_model.target, dict)
-        mut = ModelUnderTest(
+
+class AsyncOkareo(_OkareoBase):
+    """asyncio counterpart of `Okareo`, built on the client's `httpx.AsyncClient`
+    so a service can fan out many Okareo calls on one event loop.
+
+    Construction does no I/O. The projects check and the `project` lookup that
+    `Okareo` does at construction happen in `connect()`, which every method
+    awaits on first use (or explicitly, e.g. at service startup). Use it as an
+    async context manager, or `await aclose()`, to release the connection pool.
+
+    Example:
+    ```python
+    async with AsyncOkareo(api_key="your_api_key") as okareo:
+        mut = await okareo.register_model(name="my-model", model=MyCustomModel("m"))
+        test_run = await mut.run_test(scenario=scenario_id, name="my run")
+    ```
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_path: str = BASE_URL,  # type: ignore
+        timeout: Optional[float] = None,
+        project: Union[str, UUID, None] = None,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        scenario_cache: Union[bool, ScenarioDataPointCache] = False,
+    ):
+        """
+        Args:
+            api_key: Your Okareo API key.
+            base_path: Okareo API base URL.
+            timeout: HTTP timeout in seconds. Defaults to None (no limit), since
+                calls such as `run_test` block until the server is done.
+            project: The Project this client works in — its **name** or its id.
+                Resolved and validated by `connect()`.
+            max_connections: Most connections open at once (None: unlimited).
+            max_keepalive_connections: Most idle connections kept for reuse, so
+                repeated calls skip the TCP and TLS handshake (None: unlimited).
+            keepalive_expiry: Seconds an idle connection is kept.
+            http2: Negotiate HTTP/2, multiplexing concurrent requests over one
+                connection. Requires ``pip install 'httpx[http2]'``.
+            scenario_cache: Keep downloaded scenario data points in a local
+                cache (True for the default one under ``~/.cache/okareo``, or a
+                `ScenarioDataPointCache`), so repeated test runs on a scenario
+                skip the download.
+        """
+        self.api_key = api_key
+        self.client = self._build_client(
+            base_path,
+            timeout,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            http2,
+        )
+        self.scenario_cache = self._resolve_scenario_cache(scenario_cache)
+        self.project_id: Optional[str] = None
+        self._project = project
+        self._connected = False
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def connect(self) -> "AsyncOkareo":
+        """Check connectivity and resolve the client-level Project. Runs once;
+        later calls return immediately."""
+        if self._connected:
+            return self
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if not self._connected:
+                projects = await self.get_projects()
+                if self._project is not None:
+                    self.project_id = self._resolve_project(self._project, projects)
+                self._connected = True
+        return self
+
+    async def aclose(self) -> None:
+        """Close the underlying `httpx.AsyncClient`."""
+        await self.client.get_async_httpx_client().aclose()
+
+    async def __aenter__(self) -> "AsyncOkareo":
+        return await self.connect()
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def get_projects(self) -> List[ProjectResponse]:
+        """
+        Get a list of all Okareo projects available to the user.
+
+        Returns:
+            List[ProjectResponse]: A list of ProjectResponse objects accessible to the user.
+        """
+        response = await get_all_projects_v0_projects_get.asyncio(
             client=self.client,
             api_key=self.api_key,
-            mut=dummy_response,
-            models={target_model.target["type"]: target_model.target},
         )
+        self.validate_response(response)
+        assert isinstance(response, List)
+        self._cache_projects(response)
 
-        # run_test
-        fn = mut.submit_test if submit else mut.run_test
-        return fn(
-            scenario=scenario,
-            name=name,
-            api_key=api_key if api_key else self.api_key,
-            api_keys=api_keys,
-            metrics_kwargs=metrics_kwargs,
-            test_run_type=TestRunType.MULTI_TURN,
-            calculate_metrics=calculate_metrics,
-            checks=checks,
-            simulation_params=simulation_params,
-            driver_id=str(driver_model.id) if driver_model.id else None,
-        )
+        return response
 
-    def generate_driver_prompt(
+    async def register_model(
         self,
-        user_input: str,
-        prior_prompt: Optional[str] = None,
-        language: Optional[str] = None,
-        **driver_kwargs: Any,
-    ) -> Driver:
-        """Generate a structured driver prompt from a one-sentence description.
-
-        Args:
-            user_input: Natural language description of the caller persona.
-            prior_prompt: Optional existing prompt to refine.
-            language: BCP-47 language code (e.g. "en", "es", "fr-CA").
-            **driver_kwargs: Extra fields forwarded to the returned Driver
-                (e.g. voice_instructions, temperature, voice).
+        name: str,
+        tags: Union[List[str], None] = None,
+        project_id: Union[str, UUID, None] = None,
+        model: Union[None, BaseModel, List[BaseModel]] = None,
+        update: bool = False,
+        sensitive_fields: Union[List[str], None] = None,
+    ) -> AsyncModelUnderTest:
+        """
+        Register a new Model Under Test (MUT) to use in an Okareo evaluation.
+        See `Okareo.register_model` for the arguments.
 
         Returns:
-            A Driver with the AI-generated name and prompt_template.
+            AsyncModelUnderTest: The registered model.
         """
-        payload: Dict[str, Any] = {"user_input": user_input}
-        if prior_prompt is not None:
-            payload["prior_prompt"] = prior_prompt
-        if language is not None:
-            payload["language"] = language
-        request_body = DriverPromptRequest.from_dict(payload)
-        response = generate_driver_prompt_v0_generate_driver_prompt_post.sync(
+        await self.connect()
+        data, invokers = self._register_model_data(
+            name, tags, project_id, model, update, sensitive_fields
+        )
+        response = await register_model_v0_register_model_post.asyncio(
             client=self.client,
-            body=request_body,
             api_key=self.api_key,
+            body=ModelUnderTestSchema.from_dict(data),
         )
+
         self.validate_response(response)
-        assert isinstance(response, DriverPromptResponse)
-        return Driver(
-            name=response.suggested_name,
-            prompt_template=response.driver_prompt,
-            **driver_kwargs,
+        assert isinstance(response, ModelUnderTestResponse)
+        model_data = self._registered_model_data(data, invokers)
+        if response.warning:
+            print(response.warning)
+        return AsyncModelUnderTest(
+            client=self.client,
+            api_key=self.api_key,
+            mut=response,
+            models=model_data,
+            scenario_cache=self.scenario_cache,
         )
 
-    def find_test_runs(
-        self,
-        name: Optional[str] = None,
-        tags: Optional[list] = None,
-        project_id: Optional[str] = None,
-        return_model_metrics: bool = False,
-    ) -> list:
-        """Find existing test runs for simulation/evaluation workflows.
-
-        Args:
-            name: Filter results to runs with this exact name (client-side).
-            tags: Filter results to runs with these tags (server-side).
-            project_id: Scope to a specific project.
-            return_model_metrics: Include model_metrics in the response.
+    async def create_scenario_set(
+        self, create_request: ScenarioSetCreate
+    ) -> ScenarioSetResponse:
+        """
+        Create a new scenario set. See `Okareo.create_scenario_set`.
 
         Returns:
-            List of test run dicts from the server.
+            ScenarioSetResponse: The created ScenarioSetResponse object.
         """
-        project_id = self._resolved_project_id(project_id)
-        body: Dict[str, Any] = {"return_model_metrics": return_model_metrics}
-        if tags:
-            body["tags"] = tags
-        if project_id:
-            body["project_id"] = project_id
+        if create_request.seed_data == [] or create_request.seed_data is None:
+            raise ValueError("Non-empty seed data is required to create a scenario set")
 
-        resp = self.client.get_httpx_client().request(
-            method="post",
-            url="/v0/find_test_runs",
-            json=body,
-            headers={"api-key": self.api_key, "Content-Type": "application/json"},
+        await self.connect()
+        create_request = self._with_client_project(create_request, as_uuid=True)
+        response = await create_scenario_set_v0_scenario_sets_post.asyncio(
+            client=self.client, api_key=self.api_key, body=create_request
         )
-        if resp.status_code not in (200, 201):
-            raise ValueError(f"find_test_runs failed: {resp.status_code} {resp.text}")
-        response = resp.json()
-        assert isinstance(response, list)
-        if name:
-            response = [r for r in response if r.get("name") == name]
+
+        self.validate_response(response)
+        assert isinstance(response, ScenarioSetResponse)
+        if response.warning:
+            print(response.warning)
         return response
 
-    def re_evaluate(
-        self,
-        test_run_id: str,
-        checks: list,
-        name: Optional[str] = None,
-        tags: Optional[list] = None,
-    ) -> TestRunItem:
-        """Re-evaluate an existing test run with different checks.
+    async def get_scenario_data_points(
+        self, scenario_id: Union[str, UUID], use_cache: bool = True
+    ) -> List[ScenarioDataPoinResponse]:
+        """
+        Fetch the scenario data points associated with a scenario set with scenario_id.
+        See `Okareo.get_scenario_data_points`.
 
-        No new simulation or phone call is made. The existing conversation
-        data is re-scored with the specified checks.
+        Returns:
+            List[ScenarioDataPoinResponse]: A list of scenario data point responses associated with the scenario set.
+        """
+        await self.connect()
+        if self.scenario_cache is not None and use_cache:
+            cached = await asyncio.to_thread(
+                self.scenario_cache.get,
+                self.client._base_url,
+                self.api_key,
+                scenario_id,
+            )
+            if cached is not None:
+                return cached
+        response = await get_scenario_set_data_points_v0_scenario_data_points_scenario_id_get.asyncio(
+            client=self.client,
+            api_key=self.api_key,
+            scenario_id=(
+                UUID(scenario_id) if isinstance(scenario_id, str) else scenario_id
+            ),
+        )
 
-        Args:
-            test_run_id: ID of the source test run to re-evaluate.
-            checks: List of check names or IDs to apply.
-            name: Optional name for the new re-evaluated run.
-            tags: Optional tags for the new run.
+        self.validate_response(response)
+        assert isinstance(response, List)
+        if self.scenario_cache is not None and response:
+            await asyncio.to_thread(
+                self.scenario_cache.put,
+                self.client._base_url,
+                self.api_key,
+                scenario_id,
+                response,
+            )
+
+        return response
+
+    async def find_datapoints(
+        self, datapoint_search: DatapointSearch
+    ) -> List[DatapointListItem]:
+        """
+        Fetch the datapoints specified by a Datapoint Search. See `Okareo.find_datapoints`.
 
         Returns:
-            The newly created TestRunItem with re-evaluated results.
+            List[DatapointListItem]: A list of datapoint items matching the search.
         """
-        payload = ReEvaluatePayload(
-            check_ids=checks,
-            name=name if name else UNSET,
-            tags=tags if tags else UNSET,
-        )
-        response = re_evaluate_v0_test_runs_test_run_id_re_evaluate_post.sync(
+        await self.connect()
+        datapoint_search = self._with_client_project(datapoint_search)
+        data = await get_datapoints_v0_find_datapoints_post.asyncio(
             client=self.client,
-            test_run_id=UUID(test_run_id),
-            body=payload,
             api_key=self.api_key,
+            body=datapoint_search,
+        )
+        if not data:
+            return []
+        self.validate_response(data)
+        assert isinstance(data, list)
+        return data
+
+    async def generate_check(
+        self, create_check: EvaluatorSpecRequest
+    ) -> EvaluatorGenerateResponse:
+        """
+        Generate the contents of a Check based on an EvaluatorSpecRequest. See `Okareo.generate_check`.
+
+        Returns:
+            EvaluatorGenerateResponse: The generated check response.
+        """
+        await self.connect()
+        response = await check_generate_v0_check_generate_post.asyncio(
+            client=self.client, api_key=self.api_key, body=create_check
         )
         self.validate_response(response)
-        assert isinstance(response, TestRunItem)
+        assert isinstance(response, EvaluatorGenerateResponse)
+
         return response
 
-    def download_call_recording(self, call_sid: str) -> bytes:
-        """Download a voice call recording by its Twilio CallSid.
+    async def get_all_checks(
+        self, all_versions: bool = False
+    ) -> List[EvaluatorBriefResponse]:
+        """
+        Fetch all available checks.
 
         Args:
-            call_sid: The Twilio CallSid from datapoint metadata
-                (e.g. dp.model_metadata.additional_properties["call_sid"]).
+            all_versions: If True, return all versions of every check (full
+                version history).  Defaults to False (latest version only).
 
         Returns:
-            Raw WAV audio bytes.
+            List[EvaluatorBriefResponse]: A list of EvaluatorBriefResponse objects representing all available checks.
         """
-        response = self.client.get_httpx_client().request(
-            method="get",
-            url=f"/v0/voice/call_sid/{call_sid}",
-            headers={"api-key": self.api_key},
-            follow_redirects=True,
-            timeout=120,
-        )
-        response.raise_for_status()
-        return response.content
+        await self.connect()
+        if all_versions:
+            resp = await self.client.get_async_httpx_client().request(
+                method="get",
+                url="/v0/checks",
+                params={"all-versions": "true"},
+                headers={"api-key": self.api_key},
+            )
+            if resp.status_code not in (200, 201):
+                raise ValueError(
+                    f"Failed to fetch checks: {resp.status_code} {resp.text}"
+                )
+            return [EvaluatorBriefResponse.from_dict(item) for item in resp.json()]
 
-    def upload_voice(
-        self,
-        file_path: Optional[str] = None,
-        file_bytes: Optional[bytes] = None,
-        project_id: Optional[str] = None,
-    ) -> VoiceUploadResponse:
-        """Upload a voice file for use in voice scenarios/simulations.
+        response = await get_all_checks_v0_checks_get.asyncio(
+            client=self.client,
+            api_key=self.api_key,
+        )
+        self.validate_response(response)
+        assert isinstance(response, List)
 
-        Provide either a local `file_path` or in-memory `file_bytes`.
+        return response
 
-        Args:
-            file_path: Path to a local audio file.
-            file_bytes: Raw audio bytes.
-            project_id: Optional project ID to associate with the uploaded file.
+    async def get_check(
+        self,
+        check_id: Union[str, UUID],
+        version: Union[str, int, None] = None,
+    ) -> EvaluatorDetailedResponse:
+        """
+        Fetch details for a specific check by UUID or by name. See `Okareo.get_check`.
 
         Returns:
-            VoiceUploadResponse: Metadata including a downloadable `file_url`.
+            EvaluatorDetailedResponse: The detailed response for the specified check.
 
         Raises:
-            ValueError: If neither `file_path` nor `file_bytes` is provided.
+            ValueError: If no check matches the given name/version.
         """
-        audio_data = None
-        if file_bytes:
-            audio_data = file_bytes
-        elif file_path:
-            with open(file_path, "rb") as audio_file:
-                audio_data = audio_file.read()
+        if isinstance(version, str) and version == "latest":
+            version = None
+
+        # If an explicit version is requested, treat check_id as a name.
+        if isinstance(version, int):
+            return await self._get_check_by_name(str(check_id), version)
+
+        uuid_val: Optional[UUID] = None
+        if isinstance(check_id, UUID):
+            uuid_val = check_id
         else:
-            raise ValueError("Either file_path or file_bytes must be provided.")
-        audio_b64 = base64.b64encode(audio_data).decode("utf-8")
+            try:
+                uuid_val = UUID(check_id)
+            except ValueError:
+                pass
 
-        project_id = self._resolved_project_id(project_id)
-        payload = {"audio": audio_b64}
-        if project_id:
-            payload["project_id"] = project_id
-        request_body = VoiceUploadRequest.from_dict(payload)
-        response = upload_voice_file_v0_voice_upload_post.sync(
-            client=self.client, api_key=self.api_key, body=request_body
-        )
+        if uuid_val is None:
+            return await self._get_check_by_name(str(check_id))
 
+        await self.connect()
+        response = await get_check_v0_check_check_id_get.asyncio(
+            client=self.client,
+            api_key=self.api_key,
+            check_id=uuid_val,
+        )
         self.validate_response(response)
-        assert isinstance(response, VoiceUploadResponse)
-
+        assert isinstance(response, EvaluatorDetailedResponse)
         return response
 
-    def download_voice(
-        self,
-        file_url: str,
-    ) -> bytes:
-        """Download a voice file from Okareo.
+    async def _get_check_by_name(
+        self, name: str, version: Optional[int] = None
+    ) -> EvaluatorDetailedResponse:
+        all_checks = await self.get_all_checks(all_versions=True)
+        matches = [c for c in all_checks if c.name == name]
+        if not matches:
+            raise ValueError(f"No check found with name '{name}'")
+        brief = self._select_check_by_version(
+            name=name, matches=matches, version=version
+        )
+        return await self.get_check(self._check_brief_id(brief, name))
 
-        Files are always stored as MP3 on the server.
+    async def delete_check(self, check_id: Union[str, UUID], check_name: str) -> str:
+        """
+        Deletes a check identified by its ID and name.
 
-        Args:
-            file_url: The file URL returned by upload_voice()
-                      (e.g. https://api.okareo.com/v0/voice/file/{project_id}/{file_id}).
+        Returns:
+            str: A message indicating the result of the deletion.
+        """
+        await self.connect()
+        await check_delete_v0_check_check_id_delete.asyncio(
+            client=self.client,
+            api_key=self.api_key,
+            check_id=UUID(check_id) if isinstance(check_id, str) else check_id,
+            body=BodyCheckDeleteV0CheckCheckIdDelete.from_dict({"name": check_name}),
+        )
+        return "Check deletion was successful"
+
+    async def create_or_update_check(
+        self,
+        name: str,
+        description: str,
+        check: BaseCheck,
+        tags: Optional[List[str]] = None,
+    ) -> EvaluatorDetailedResponse:
+        """
+        Create or update an existing check. See `Okareo.create_or_update_check`.
 
         Returns:
-            Raw MP3 audio bytes.
+            EvaluatorDetailedResponse: The detailed response from the evaluator after creating or updating the check.
         """
-        parts = file_url.rstrip("/").split("/")
-        file_id = parts[-1]
-        project_id = parts[-2]
-
-        response = self.client.get_httpx_client().request(
-            method="get",
-            url=f"/v0/voice/file/{project_id}/{file_id}",
-            headers={"api-key": self.api_key},
-            timeout=120,
+        await self.connect()
+        response = await check_create_or_update_v0_check_create_or_update_post.asyncio(
+            client=self.client,
+            api_key=self.api_key,
+            body=self._check_request(name, description, check, tags),
         )
-        response.raise_for_status()
+        self.validate_response(response)
+        assert isinstance(response, EvaluatorDetailedResponse)
 
-        return response.content
+        return response
 
-    def create_scenario_set_with_audio_files(
+    async def evaluate(
         self,
         name: str,
-        data_list: List[Dict[str, str]],
-        project_id: Optional[Union[str, UUID]] = None,
-    ) -> ScenarioSetResponse:
-        """Upload local audio files and create a scenario set in one call.
+        test_run_type: TestRunType,
+        scenario_id: Union[Unset, str] = UNSET,
+        datapoint_ids: Union[Unset, list[str]] = UNSET,
+        filter_group_id: Union[Unset, str] = UNSET,
+        tags: Union[Unset, list[str]] = UNSET,
+        metrics_kwargs: Union[Dict[str, Any], Unset] = UNSET,
+        checks: Union[Unset, list[str]] = UNSET,
+    ) -> TestRunItem:
+        """
+        Evaluate datapoints using the specified parameters. See `Okareo.evaluate`.
 
-        Each item's 'input' field should be a local file path to a WAV or MP3
-        file. The file is uploaded to Okareo (coerced to MP3), and 'input' is
-        replaced with the returned file URL before creating the scenario.
+        Returns:
+            TestRunItem: The evaluation results as a TestRunItem object.
+        """
+        await self.connect()
+        return await AsyncModelUnderTest._evaluate_internal(
+            client=self.client,
+            api_key=self.api_key,
+            name=name,
+            test_run_type=test_run_type,
+            scenario_id=scenario_id,
+            datapoint_ids=datapoint_ids,
+            filter_group_id=filter_group_id,
+            tags=tags,
+            metrics_kwargs=metrics_kwargs,
+            checks=checks,
+        )
 
-        Args:
-            name: Scenario set name.
-            data_list: List of dicts with 'input' (local file path) and
-                       'result' (expected transcript string).
-            project_id: Optional project to associate files and scenario with.
+    async def create_or_update_driver(self, driver: Driver) -> Driver:
+        """Create or update a simulation driver by name.
 
         Returns:
-            ScenarioSetResponse from the created scenario set.
+            Driver: The created or updated driver.
         """
+        await self.connect()
+        response = await register_driver_model_v0_driver_post.asyncio(
+            client=self.client,
+            body=self._driver_request(driver),
+            api_key=self.api_key,
+        )
+        return self._driver_from_response(response)
 
-        uploaded_data: List[SeedDataRow] = []
-        project_id = self._resolved_project_id(project_id)
-        pid = str(project_id) if project_id else None
-        for item in tqdm(data_list, desc="Uploading audio files"):
-            upload_response = self.upload_voice(
-                file_path=item["input"],
-                project_id=pid,
-            )
-            uploaded_data.append(
-                {
-                    "input": upload_response.file_url,
-                    "result": item["result"],
-                }
-            )
+    async def get_driver_by_name(self, driver_name: str) -> Driver:
+        """Retrieve a simulation driver by name.
 
-        seed_data = self.seed_data_from_list(uploaded_data)
-        create_request = ScenarioSetCreate(
-            name=name,
-            seed_data=seed_data,
-            project_id=UUID(str(project_id)) if project_id else UNSET,
+        Returns:
+            Driver: The driver with the specified name.
+        """
+        await self.connect()
+        response = await get_driver_v0_driver_identifier_get.asyncio(
+            client=self.client,
+            api_key=self.api_key,
+            identifier=driver_name,
         )
-        return self.create_scenario_set(create_request)
+        return self._driver_from_response(response)
 
-    def ingest_conversations(
+    async def create_or_update_target(
         self,
-        project_id: Union[str, UUID, None] = None,
-        conversations: Optional[List[Dict[str, Any]]] = None,
-        mut_id: Union[str, UUID, None] = None,
-    ) -> Dict[str, Any]:
-        """Ingest voice conversations for monitoring.
-
-        Accepts one or more conversations from voice platforms (Retell, Twilio, VAPI, etc.)
-        and enqueues them for async processing. Each conversation's turns will become
-        Datapoint rows, and configured monitors will automatically match and run checks.
+        target: Target,
+        tags: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
+        sensitive_fields: Union[List[str], None] = None,
+    ) -> Target:
+        """Create or update a simulation target by name.
 
-        This is the monitoring path, not the simulation path. No ScenarioSets are created.
-        The mut_id is optional - when omitted, datapoints are created without MUT association
-        and rely entirely on monitor/filter group matching.
+        Returns:
+            Target: The created or updated target.
+        """
+        await self.connect()
+        data, model_type, invokers = self._target_data(
+            target, tags, project_id, sensitive_fields
+        )
+        response = await register_model_v0_register_model_post.asyncio(
+            client=self.client,
+            api_key=self.api_key,
+            body=ModelUnderTestSchema.from_dict(data),
+        )
+        return self._target_from_response(response, data, model_type, invokers)
 
-        Args:
-            project_id: Okareo project ID.
-            conversations: List of conversation dictionaries, each containing:
-                - source_platform (str): Platform source ('retell', 'twilio', 'vapi', 'elevenlabs', or 'custom')
-                - call_id (str): Platform-specific call identifier
-                - context_token (str, optional): Context token for correlation (defaults to call_id)
-                - audio (dict, optional): Preferred audio shape with one of:
-                    - {"type": "url", "url": "https://..."}
-                    - {"type": "voice_file_id", "voice_file_id": "uuid"}
-                    - {"type": "inline_b64", "inline_b64": "..."}
-                - recording_url (str, optional): Legacy compatibility alias for audio URL
-                - recording_bytes_b64 (str, optional): Legacy compatibility alias for inline base64 audio
-                - transcript (list, optional): Pre-parsed transcript as list of turns with 'role' and 'content'
-                - diarization (bool, optional): When transcript is absent, controls whether Okareo runs diarization + ASR. Defaults to True.
-                - metadata (dict, optional): Platform-specific metadata
-                - tags (list, optional): Tags for monitor matching
-                - first_turn (str, optional): For audio-only diarization ('user' or 'assistant' spoke first, defaults to 'assistant')
-            mut_id: Optional model under test ID. If not provided, datapoints are created without MUT association (monitoring path).
+    async def get_target_by_name(self, target_name: str) -> Target:
+        """Retrieve a simulation target by name.
 
         Returns:
-            Dict with 'status' and list of conversation identifiers.
+            Target: The target with the specified name.
+        """
+        await self.connect()
+        response = (
+            await get_target_model_by_name_v0_target_target_model_name_get.asyncio(
+                client=self.client,
+                api_key=self.api_key,
+                target_model_name=target_name,
+            )
+        )
+        self.validate_response(response)
+        if not response:
+            print("Empty response from API")
+        assert response is not None and isinstance(response, TargetModelResponse)
 
-        Raises:
-            httpx.HTTPStatusError: If the API returns an error status.
+        # Explicitly construct target response to avoid backwards compatibility issues
+        return Target.from_response(response)
 
-        Example (monitoring-only, no MUT):
-        ```python
-        okareo.ingest_conversations(
-            project_id="your-project-id",
-            conversations=[
-                {
-                    "source_platform": "retell",
-                    "call_id": "call-123",
-                    "audio": {
-                        "type": "url",
-                        "url": "https://retell.ai/recordings/call-123.mp3",
-                    },
-                    "tags": ["support", "billing"],
-                    "metadata": {"customer_id": "cust-456"}
-                }
-            ]
-        )
-        ```
+    async def run_simulation(
+        self,
+        name: str,
+        scenario: Union[ScenarioSetResponse, str],
+        target: str | Target,
+        driver: Optional[str | Driver] = None,
+        checks: Optional[list[str]] = None,
+        stop_check: Union[StopConfig, dict, None] = None,
+        repeats: Optional[int] = 1,
+        max_turns: Optional[int] = 5,
+        first_turn: Optional[str] = "target",
+        checks_at_every_turn: Optional[bool] = False,
+        concurrent_ask_probability: Optional[float] = 0.0,
+        turn_transition_time: Optional[int] = 1000,
+        augmentation: Optional[Union[Augmentation, dict[str, Any]]] = None,
+        api_key: Optional[str] = None,
+        api_keys: Optional[dict] = None,
+        metrics_kwargs: Optional[dict] = None,
+        calculate_metrics: bool = True,
+        project_id: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+        sensitive_fields: Union[List[str], None] = None,
+        submit: Optional[bool] = False,
+        max_concurrent_turns: int = _DEFAULT_MAX_CONCURRENT_TURNS,
+        turn_timeout: Optional[float] = None,
+    ) -> TestRunItem:
+        """Run a multiturn simulation against a target. See `Okareo.run_simulation`
+        for the parameters.
 
-        Example (with MUT association):
-        ```python
-        okareo.ingest_conversations(
-            project_id="your-project-id",
-            mut_id="your-mut-id",
-            conversations=[
-                {
-                    "source_platform": "custom",
-                    "call_id": "call-456",
-                    "transcript": [
-                        {"role": "user", "content": "Hello", "timestamp_ms": 0},
-                        {"role": "assistant", "content": "Hi, how can I help?", "timestamp_ms": 1000}
-                    ],
-                }
-            ]
-        )
-        ```
+        Returns a TestRunItem representing the created simulation test run.
         """
+        await self.connect()
         project_id = self._resolved_project_id(project_id)
-        if project_id is None:
-            raise ValueError(
-                "ingest_conversations requires a project_id — pass one per call or "
-                "set a client-level Project (Okareo(..., project=...) or set_project)."
+        if isinstance(driver, Driver):
+            driver_model = await self.create_or_update_driver(driver)
+        elif not driver:
+            driver_model = await self.create_or_update_driver(
+                Driver(name="default_driver")
             )
-        if conversations is None:
-            raise ValueError("ingest_conversations requires conversations.")
-        payload = {
-            "project_id": str(project_id),
-            "conversations": conversations,
-        }
+        else:
+            driver_model = await self.get_driver_by_name(driver)
 
-        # Only include mut_id if provided
-        if mut_id is not None:
-            payload["mut_id"] = str(mut_id)
+        if isinstance(target, Target):
+            if isinstance(target.target, dict):
+                if (
+                    target.target["type"] == "custom_target"
+                    and "model_invoker" not in target.target
+                ):
+                    raise TypeError(
+                        "Cannot retrieve Target by name for CustomMultiturnTarget"
+                    )
 
-        response = self.client.get_httpx_client().request(
-            method="post",
-            url="/v0/conversations/ingest",
-            headers={"api-key": self.api_key, "Content-Type": "application/json"},
-            json=payload,
-            timeout=120,
+            target_model = await self.create_or_update_target(
+                target, tags or [], project_id, sensitive_fields
+            )
+        else:
+            target_model = await self.get_target_by_name(target)
+            assert isinstance(target_model.target, dict)
+            if target_model.target["type"] == "custom_target":
+                raise TypeError(
+                    "Cannot retrieve Target by name for CustomMultiturnTarget"
+                )
+
+        simulation_params = Simulation(
+            stop_check=stop_check,
+            repeats=repeats,
+            max_turns=max_turns,
+            first_turn=first_turn,
+            checks_at_every_turn=checks_at_every_turn,
+            concurrent_ask_probability=concurrent_ask_probability,
+            turn_transition_time=turn_transition_time,
+            augmentation=augmentation,
         )
-        response.raise_for_status()
 
-        json_response = response.json()
-        if not isinstance(json_response, dict):
-            raise TypeError("Expected JSON object response from conversations ingest")
+        assert isinstance(target_model.target, dict)
+        mut = AsyncModelUnderTest(
+            client=self.client,
+            api_key=self.api_key,
+            mut=self._simulation_mut_response(target_model, project_id, tags),
+            models={target_model.target["type"]: target_model.target},
+            scenario_cache=self.scenario_cache,
+        )
 
-        return cast(Dict[str, Any], json_response)
+        fn = mut.submit_test if submit else mut.run_test
+        return await fn(
+            scenario=scenario,
+            name=name,
+            api_key=api_key if api_key else self.api_key,
+            api_keys=api_keys,
+            metrics_kwargs=metrics_kwargs,
+            test_run_type=TestRunType.MULTI_TURN,
+            calculate_metrics=calculate_metrics,
+            checks=checks,
+            simulation_params=simulation_params,
+            driver_id=str(driver_model.id) if driver_model.id else None,
+            max_concurrent_turns=max_concurrent_turns,
+            turn_timeout=turn_timeout,
+        )
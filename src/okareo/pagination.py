@@ -0,0 +1,84 @@
+import concurrent.futures
+from typing import Callable, Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 1000
+
+
+class OffsetPager(Generic[T]):
+    """Lazily iterate a server-side list through `offset`/`limit` pages.
+
+    `fetch_page(offset, limit)` is called once per page, so only one page (two
+    with `prefetch`) is held in memory at a time. With `prefetch` the next page
+    is requested on a background thread while the current one is consumed.
+
+    `cursor` is the offset of the next item not yet yielded; after a failure,
+    pass it back as the starting offset to resume without repeating items.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int], List[T]],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> None:
+        """
+        Arguments:
+            fetch_page: Returns up to `limit` items starting at `offset`.
+            page_size: Items requested per page.
+            offset: Offset of the first item to yield.
+            limit: Most items to yield in total (None: until the list ends).
+            prefetch: Request the next page while the current one is consumed.
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be positive, got {page_size}")
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._start = offset
+        self._end = None if limit is None else offset + limit
+        self._prefetch = prefetch
+        self.cursor = offset
+
+    def _page_limit(self, offset: int) -> int:
+        if self._end is None:
+            return self._page_size
+        return min(self._page_size, self._end - offset)
+
+    def __iter__(self) -> Iterator[T]:
+        executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        if self._prefetch:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="okareo-prefetch"
+            )
+        offset = self.cursor
+        pending: Optional[concurrent.futures.Future] = None
+        try:
+            while self._page_limit(offset) > 0:
+                limit = self._page_limit(offset)
+                if pending is not None:
+                    page = pending.result()
+                    pending = None
+                else:
+                    page = self._fetch_page(offset, limit)
+                if len(page) > limit and self._end is not None:
+                    # the server ignored limit; never yield past the caller's own
+                    page = page[:limit]
+                # a short page is the last one, and so is an oversized one: the
+                # server ignored limit and sent everything that is left
+                last_page = len(page) != limit
+                offset += len(page)
+                if executor is not None and not last_page:
+                    next_limit = self._page_limit(offset)
+                    if next_limit > 0:
+                        pending = executor.submit(self._fetch_page, offset, next_limit)
+                for item in page:
+                    self.cursor += 1
+                    yield item
+                if last_page:
+                    return
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
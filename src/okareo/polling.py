@@ -0,0 +1,51 @@
+import random
+import time
+from typing import Iterable, Optional
+
+TEST_RUN_POLL_INTERVAL = 1.0
+TEST_RUN_MAX_POLL_INTERVAL = 30.0
+TEST_RUN_DONE_STATUSES = ("FINISHED", "FAILED")
+
+_DEFAULT_JITTER = 0.1
+
+
+class Backoff:
+    """Waits between status checks: `initial` seconds, doubling up to `maximum`.
+
+    Each wait is spread by up to `jitter` (a fraction) either way, so clients
+    polling the same runs drift apart instead of checking in lockstep. With a
+    `timeout` the last wait ends on the deadline, after which `next_delay`
+    returns None.
+    """
+
+    def __init__(
+        self,
+        initial: float = TEST_RUN_POLL_INTERVAL,
+        maximum: float = TEST_RUN_MAX_POLL_INTERVAL,
+        timeout: Optional[float] = None,
+        jitter: float = _DEFAULT_JITTER,
+    ) -> None:
+        if initial <= 0 or maximum < initial:
+            raise ValueError(
+                f"need 0 < initial <= maximum, got initial={initial}, maximum={maximum}"
+            )
+        self._interval = initial
+        self._maximum = maximum
+        self._jitter = jitter
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+
+    def next_delay(self) -> Optional[float]:
+        """Seconds to wait before the next check, or None past the deadline."""
+        delay = self._interval * random.uniform(1 - self._jitter, 1 + self._jitter)
+        self._interval = min(self._interval * 2, self._maximum)
+        if self._deadline is None:
+            return delay
+        remaining = self._deadline - time.monotonic()
+        return min(delay, remaining) if remaining > 0 else None
+
+
+def poll_timeout_error(test_run_ids: Iterable[object]) -> TimeoutError:
+    error_message = "Timed out waiting for test runs: " + ", ".join(
+        str(test_run_id) for test_run_id in test_run_ids
+    )
+    return TimeoutError(error_message)
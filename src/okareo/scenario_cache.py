@@ -0,0 +1,173 @@
+import collections
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Optional, OrderedDict, Tuple, Union
+from uuid import UUID
+
+from okareo_api_client.models.scenario_data_poin_response import (
+    ScenarioDataPoinResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_MEMORY_ENTRIES = 8
+_DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+
+def _default_directory() -> Path:
+    if os.environ.get("OKAREO_CACHE_DIR"):
+        return Path(os.environ["OKAREO_CACHE_DIR"])
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "okareo"
+
+
+class ScenarioDataPointCache:
+    """Scenario data points by scenario_id: an in-memory LRU of up to
+    `max_memory_entries` scenarios in front of gzipped JSON files under
+    `directory` (default `$OKAREO_CACHE_DIR`, else `~/.cache/okareo`).
+
+    Scenario sets do not change once created, so an entry never expires; the
+    least recently used files are removed once they take more than
+    `max_disk_bytes`. Entries are kept apart per API base URL and per API key
+    (stored hashed), so a client only reads back what its own key downloaded. A
+    disk error only costs the cache hit — it is logged and the caller downloads
+    as usual.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        max_memory_entries: int = _DEFAULT_MAX_MEMORY_ENTRIES,
+        max_disk_bytes: int = _DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        self.directory = Path(directory) if directory else _default_directory()
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: OrderedDict[
+            Tuple[str, str, str], List[ScenarioDataPoinResponse]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _server(base_url: str) -> str:
+        return hashlib.sha256(base_url.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _key(
+        base_url: str, api_key: str, scenario_id: Union[str, UUID]
+    ) -> Tuple[str, str, str]:
+        credential = hashlib.sha256(api_key.encode()).hexdigest()[:32]
+        return (ScenarioDataPointCache._server(base_url), credential, str(scenario_id))
+
+    def _path(self, key: Tuple[str, str, str]) -> Path:
+        server, credential, scenario_id = key
+        return (
+            self.directory
+            / "scenarios"
+            / server
+            / credential
+            / f"{scenario_id}.json.gz"
+        )
+
+    def _remember(
+        self, key: Tuple[str, str, str], points: List[ScenarioDataPoinResponse]
+    ) -> None:
+        with self._lock:
+            self._memory[key] = points
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(
+        self, base_url: str, api_key: str, scenario_id: Union[str, UUID]
+    ) -> Optional[List[ScenarioDataPoinResponse]]:
+        """The data points of a scenario cached for `api_key`, or None on a miss."""
+        key = self._key(base_url, api_key, scenario_id)
+        with self._lock:
+            points = self._memory.get(key)
+            if points is not None:
+                self._memory.move_to_end(key)
+                return list(points)
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as cache_file:
+                rows = json.load(cache_file)
+            os.utime(path)  # recency for eviction
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable scenario cache file %s: %s", path, e)
+            return None
+        points = [ScenarioDataPoinResponse.from_dict(row) for row in rows]
+        self._remember(key, points)
+        return list(points)
+
+    def put(
+        self,
+        base_url: str,
+        api_key: str,
+        scenario_id: Union[str, UUID],
+        points: List[ScenarioDataPoinResponse],
+    ) -> None:
+        """Cache the data points of a scenario for `api_key`, in memory and on disk."""
+        key = self._key(base_url, api_key, scenario_id)
+        self._remember(key, list(points))
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write then rename, so a concurrent reader never sees half a file
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as raw, gzip.open(
+                raw, "wt", encoding="utf-8"
+            ) as f:
+                json.dump([point.to_dict() for point in points], f)
+            os.replace(tmp_name, path)
+            self._evict()
+        except OSError as e:
+            logger.warning("Could not write scenario cache file %s: %s", path, e)
+
+    def _evict(self) -> None:
+        files = [
+            (entry.stat().st_mtime, entry.stat().st_size, entry)
+            for entry in (self.directory / "scenarios").glob("*/*/*.json.gz")
+        ]
+        total = sum(size for _, size, _ in files)
+        for _, size, entry in sorted(files, key=lambda f: f[0]):
+            if total <= self.max_disk_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def invalidate(self, base_url: str, scenario_id: Union[str, UUID]) -> None:
+        """Drop one scenario from memory and disk, for every API key."""
+        server, scenario_id = self._server(base_url), str(scenario_id)
+        with self._lock:
+            for key in [
+                k for k in self._memory if k[0] == server and k[2] == scenario_id
+            ]:
+                del self._memory[key]
+        for path in (self.directory / "scenarios" / server).glob(
+            f"*/{scenario_id}.json.gz"
+        ):
+            path.unlink(missing_ok=True)
+
+
+_default_cache: Optional[ScenarioDataPointCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_scenario_cache() -> ScenarioDataPointCache:
+    """The process-wide cache used by `Okareo(..., scenario_cache=True)`."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ScenarioDataPointCache()
+        return _default_cache
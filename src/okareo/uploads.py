@@ -0,0 +1,237 @@
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+# a multiple of 3, so every chunk but the last encodes without base64 padding
+_BASE64_CHUNK_BYTES = 3 * 256 * 1024
+_DIGEST_CHUNK_BYTES = 1024 * 1024
+
+
+class JsonlUploadReader:
+    """File-like wrapper that validates a JSONL scenario file line by line as
+    httpx streams it into a multipart upload, so a bad row fails the upload
+    without reading the file twice or holding it in memory.
+
+    Each non-blank line must be a JSON object with an "input" key, and no longer
+    than `max_line_bytes` when given. A `.gz` file is decompressed on the fly.
+    With `validate=False` the content is passed through unchecked.
+
+    With `max_rows`, reading stops after that many rows, at a line boundary;
+    `remaining_rows` then yields the rest of the file, parsed and checked the
+    same way.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        max_line_bytes: Optional[int] = None,
+        validate: bool = True,
+        max_rows: Optional[int] = None,
+    ) -> None:
+        self.name = file_path
+        self._source: Union[gzip.GzipFile, BinaryIO] = (
+            gzip.GzipFile(file_path, "rb")
+            if file_path.endswith(".gz")
+            else open(file_path, "rb")
+        )
+        self._max_line_bytes = max_line_bytes
+        self._validate = validate
+        self._max_rows = max_rows
+        self._buffer = bytearray()
+        self._line_number = 0
+        self._eof = False
+        self.rows = 0
+
+    @staticmethod
+    def upload_name(file_path: str) -> str:
+        """The file name to send: a `.gz` suffix is dropped, since the content is
+        uploaded decompressed."""
+        name = os.path.basename(file_path)
+        return name[: -len(".gz")] if name.endswith(".gz") else name
+
+    def _fail(self, reason: str) -> NoReturn:
+        error_message = f"{self.name}, line {self._line_number}: {reason}"
+        print(error_message)
+        raise ValueError(error_message)
+
+    def _parse(self, line: bytes) -> Any:
+        try:
+            return json.loads(line)
+        except ValueError as e:
+            self._fail(f"not valid JSON ({e})")
+
+    def _check(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """Count `line` and, when validating, parse and check it; returns the
+        parsed row, if any."""
+        if not self._validate:
+            if line.strip():
+                self.rows += 1
+            return None
+        if self._max_line_bytes is not None and len(line) > self._max_line_bytes:
+            self._fail(f"line is longer than {self._max_line_bytes} bytes")
+        if not line.strip():
+            return None
+        row = self._parse(line)
+        if not isinstance(row, dict) or "input" not in row:
+            self._fail('each row must be a JSON object with an "input" key')
+        self.rows += 1
+        return cast(Dict[str, Any], row)
+
+    def _readline(self) -> bytes:
+        if not self._validate or self._max_line_bytes is None:
+            return self._source.readline()
+        # one byte past the limit is enough to tell the line is too long
+        return self._source.readline(self._max_line_bytes + 1)
+
+    def _chunk_full(self) -> bool:
+        return self._max_rows is not None and self.rows >= self._max_rows
+
+    def read(self, size: int = -1) -> bytes:
+        while (
+            not self._eof
+            and not self._chunk_full()
+            and (size < 0 or len(self._buffer) < size)
+        ):
+            line = self._readline()
+            if not line:
+                self._eof = True
+                if self._validate and self.rows == 0:
+                    self._fail("the file has no scenario rows")
+                break
+            self._line_number += 1
+            self._check(line)
+            self._buffer += line
+        if size < 0 or size >= len(self._buffer):
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            chunk = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return chunk
+
+    def remaining_rows(self) -> Iterator[Dict[str, Any]]:
+        """The rows after the ones `read` returned, one dict per line."""
+        while line := self._readline():
+            self._line_number += 1
+            row = self._check(line)
+            if row is None and line.strip():
+                row = self._parse(line)
+            if row is not None:
+                yield row
+
+    def close(self) -> None:
+        self._source.close()
+
+    def __enter__(self) -> "JsonlUploadReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class Base64JsonBody:
+    """JSON request body `{key: "<base64 of the file>", **fields}` that is encoded
+    while httpx sends it, so uploading a file holds one chunk in memory instead of
+    the file and its base64 copy. Iterating again rereads the file, so the same
+    body can be resent on a retry; `len()` is the exact encoded size."""
+
+    def __init__(self, file_path: str, key: str, fields: Dict[str, Any]) -> None:
+        self.file_path = file_path
+        self._prefix = (json.dumps({key: ""})[:-2]).encode()
+        self._suffix = (
+            '"' + (", " + json.dumps(fields)[1:] if fields else "}")
+        ).encode()
+
+    def __len__(self) -> int:
+        encoded = 4 * ((os.path.getsize(self.file_path) + 2) // 3)
+        return len(self._prefix) + encoded + len(self._suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._prefix
+        with open(self.file_path, "rb") as source:
+            while chunk := source.read(_BASE64_CHUNK_BYTES):
+                yield base64.b64encode(chunk)
+        yield self._suffix
+
+
+def file_digest(file_path: str) -> str:
+    """SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as source:
+        while chunk := source.read(_DIGEST_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadManifest:
+    """Append-only JSONL record of finished uploads, keyed by content digest and
+    Project, so an interrupted batch of uploads can be rerun and only sends the
+    files that did not make it. A line cut short by a crash is ignored."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._file_urls: Dict[Tuple[str, Optional[str]], str] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as manifest:
+                for line in manifest:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    key = (entry["sha256"], entry.get("project_id"))
+                    self._file_urls[key] = entry["file_url"]
+
+    def get(self, digest: str, project_id: Optional[str]) -> Optional[str]:
+        return self._file_urls.get((digest, project_id))
+
+    def record(self, digest: str, project_id: Optional[str], file_url: str) -> None:
+        line = json.dumps(
+            {"sha256": digest, "project_id": project_id, "file_url": file_url}
+        )
+        with self._lock:
+            self._file_urls[(digest, project_id)] = file_url
+            with open(self.path, "a", encoding="utf-8") as manifest:
+                manifest.write(line + "\n")
+
+
+def json_chunks(
+    items: Iterable[Any],
+    max_count: int,
+    max_bytes: int,
+    key: Callable[[Any], Any] = lambda item: None,
+) -> Iterator[Tuple[List[Any], List[bytes]]]:
+    """JSON-encode `items` one at a time and group the encodings into chunks of
+    at most `max_count` items and `max_bytes` bytes, each yielded with the `key`
+    of its items. An item larger than `max_bytes` on its own gets a chunk by
+    itself."""
+    keys: List[Any] = []
+    chunk: List[bytes] = []
+    size = 0
+    for item in items:
+        encoded = json.dumps(item).encode()
+        if chunk and (len(chunk) >= max_count or size + len(encoded) > max_bytes):
+            yield keys, chunk
+            keys, chunk, size = [], [], 0
+        keys.append(key(item))
+        chunk.append(encoded)
+        size += len(encoded)
+    if chunk:
+        yield keys, chunk